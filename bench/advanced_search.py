@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Compares the advanced search with the query it replaced, one EXISTS per condition.
+
+Random search forms are made from the tags, series, languages, formats and title words of the
+library. Each form is searched both ways as the given user, the found ids have to be the same:
+
+    python bench/advanced_search.py /tmp/library-10k --forms 200
+
+The old way loads all found books, the new way the ids and the books of the first page. The time to
+build the id sets once per library generation is reported separately.
+"""
+
+from __future__ import division, print_function, unicode_literals
+import argparse
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import time
+
+from werkzeug.datastructures import MultiDict
+
+from routes import percentile, setup_app
+
+
+def sample_values(library):
+    conn = sqlite3.connect(os.path.join(library, 'metadata.db'))
+    try:
+        def column(sql):
+            return [row[0] for row in conn.execute(sql)]
+        words = set()
+        for title in column('SELECT title FROM books LIMIT 2000'):
+            words.update(word.lower() for word in title.split() if len(word) > 3)
+        return {
+            'tag': column('SELECT DISTINCT tag FROM books_tags_link'),
+            'serie': column('SELECT DISTINCT series FROM books_series_link'),
+            'language': column('SELECT DISTINCT lang_code FROM books_languages_link'),
+            'extension': column('SELECT DISTINCT format FROM data'),
+            'word': sorted(words),
+            'author': column('SELECT name FROM authors LIMIT 200'),
+        }
+    finally:
+        conn.close()
+
+
+def random_form(rng, values):
+    '''Arguments of the search form with two to five conditions.'''
+    form = MultiDict([('author_name', ''), ('book_title', ''), ('publisher', '')])
+    choices = ['include_tag', 'include_tag', 'exclude_tag', 'include_serie', 'exclude_serie',
+               'include_language', 'exclude_language', 'include_extension', 'exclude_extension',
+               'ratinghigh', 'ratinglow', 'book_title', 'author_name']
+    for name in rng.sample(choices, rng.randint(2, 5)):
+        kind = name.split('_', 1)[-1]
+        if kind in values and values[kind]:
+            form.add(name, str(rng.choice(values[kind])))
+        elif name in ('ratinghigh', 'ratinglow'):
+            form[name] = str(rng.randint(1, 5))
+        elif name == 'book_title' and values['word']:
+            form[name] = rng.choice(values['word'])
+        elif name == 'author_name' and values['author']:
+            form[name] = rng.choice(values['author']).split()[-1][:4]
+    return form
+
+
+def old_query(db, args):
+    '''The query of the advanced search before the id sets, with the exclude language condition fixed.'''
+    from flask_login import current_user
+    from sqlalchemy.sql.expression import func, not_
+    from cps.helper import common_filters, lcase
+
+    db.session.connection().connection.connection.create_function("lower", 1, lcase)
+    q = db.session.query(db.Books).filter(common_filters())
+    author_name = (args.get("author_name") or '').strip().lower().replace(',', '|')
+    book_title = (args.get("book_title") or '').strip().lower()
+    if author_name:
+        q = q.filter(db.Books.authors.any(func.lower(db.Authors.name).ilike("%" + author_name + "%")))
+    if book_title:
+        q = q.filter(func.lower(db.Books.title).ilike("%" + book_title + "%"))
+    for tag in args.getlist('include_tag'):
+        q = q.filter(db.Books.tags.any(db.Tags.id == tag))
+    for tag in args.getlist('exclude_tag'):
+        q = q.filter(not_(db.Books.tags.any(db.Tags.id == tag)))
+    for serie in args.getlist('include_serie'):
+        q = q.filter(db.Books.series.any(db.Series.id == serie))
+    for serie in args.getlist('exclude_serie'):
+        q = q.filter(not_(db.Books.series.any(db.Series.id == serie)))
+    for extension in args.getlist('include_extension'):
+        q = q.filter(db.Books.data.any(db.Data.format == extension))
+    for extension in args.getlist('exclude_extension'):
+        q = q.filter(not_(db.Books.data.any(db.Data.format == extension)))
+    if current_user.filter_language() == "all":
+        for language in args.getlist('include_language'):
+            q = q.filter(db.Books.languages.any(db.Languages.id == language))
+        for language in args.getlist('exclude_language'):
+            q = q.filter(not_(db.Books.languages.any(db.Languages.id == language)))
+    if args.get("ratinglow"):
+        q = q.filter(db.Books.ratings.any(db.Ratings.rating <= int(args.get("ratinglow")) * 2))
+    if args.get("ratinghigh"):
+        q = q.filter(db.Books.ratings.any(db.Ratings.rating >= int(args.get("ratinghigh")) * 2))
+    return q
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Advanced search with id sets against the EXISTS query')
+    parser.add_argument('library', help='calibre library directory')
+    parser.add_argument('--forms', type=int, default=100, help='random search forms')
+    parser.add_argument('--seed', type=int, default=1, help='seed of the random forms')
+    parser.add_argument('--settings-dir', help='directory of app.db (default a temporary directory)')
+    parser.add_argument('--user', default='admin', help='name of the user to search as')
+    args = parser.parse_args()
+
+    values = sample_values(args.library)
+    rng = random.Random(args.seed)
+    forms = [random_form(rng, values) for __ in range(args.forms)]
+
+    settings_dir = args.settings_dir or tempfile.mkdtemp(prefix='cw-bench-')
+    try:
+        app, __ = setup_app(args.library, settings_dir)
+        from flask_login import login_user
+        from cps import config, db, ub
+        from cps.book_index import book_ids
+        from cps.search import advanced_search_ids
+
+        old_times, new_times, mismatches, found = [], [], [], []
+        with app.test_request_context():
+            login_user(ub.session.query(ub.User).filter(ub.User.nickname == args.user).one())
+            cc = db.session.query(db.Custom_Columns)\
+                .filter(db.Custom_Columns.datatype.notin_(db.cc_exceptions)).all()
+            start = time.time()
+            book_ids.visible()
+            build = time.time() - start
+            per_page = int(config.config_books_per_page)
+            for form in forms:
+                start = time.time()
+                old = set(book.id for book in old_query(db, form).all())
+                old_times.append(time.time() - start)
+                db.session.expunge_all()
+
+                start = time.time()
+                ids = advanced_search_ids(form, cc)
+                db.session.query(db.Books).filter(db.Books.id.in_(ids[:per_page])).all()
+                new_times.append(time.time() - start)
+                db.session.expunge_all()
+
+                found.append(len(ids))
+                if old != set(ids):
+                    mismatches.append((form.to_dict(flat=False), len(old), len(ids)))
+    finally:
+        if not args.settings_dir:
+            shutil.rmtree(settings_dir, ignore_errors=True)
+
+    print('%s: %d forms, %.0f books found on average, id sets built in %.1fms'
+          % (args.library, len(forms), sum(found) / len(found), build * 1000))
+    print('%-8s %9s %9s %9s %9s' % ('', 'p50', 'p95', 'max', 'total'))
+    for name, times in (('exists', old_times), ('id sets', new_times)):
+        print('%-8s %7.1fms %7.1fms %7.1fms %8.2fs' % (name, percentile(times, 50) * 1000,
+                                                       percentile(times, 95) * 1000, max(times) * 1000,
+                                                       sum(times)))
+    if mismatches:
+        print('\n%d forms found different books:' % len(mismatches))
+        for form, old, new in mismatches[:10]:
+            print('  %s: %d -> %d' % (form, old, new))
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Compares the pages of the book lists from the catalog snapshot with the pages from the database.
+
+Needs NumPy. The library is copied to a temporary directory, every sort of the lists is read with
+every filter (all books, best rated, one rating, format and language) both ways, and the ids and
+totals have to be the same:
+
+    python bench/catalog.py /tmp/library-10k --pages 5
+
+Then some books of the copy are changed, added and removed, and the updated snapshot has to be the
+same as a new one.
+"""
+
+from __future__ import division, print_function, unicode_literals
+import argparse
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+
+from routes import percentile, setup_app
+
+
+def change_library(library, count):
+    '''Changes the timestamp of count books, removes count books and copies count books as new ones.'''
+    conn = sqlite3.connect(os.path.join(library, 'metadata.db'))
+    try:
+        # calibre's triggers use functions of calibre
+        conn.create_function('title_sort', 1, lambda title: title)
+        conn.create_function('uuid4', 0, lambda: None)
+        ids = [row[0] for row in conn.execute('SELECT id FROM books ORDER BY id')]
+        step = max(len(ids) // (3 * count), 1)
+        changed, removed, copied = ids[::step][:count], ids[1::step][:count], ids[2::step][:count]
+        for book in changed:
+            conn.execute("UPDATE books SET timestamp = '2001-01-01 00:00:00+00:00', "
+                         "last_modified = '2030-01-01 00:00:00+00:00' WHERE id = ?", (book,))
+        for book in removed:
+            for table in ('books_tags_link', 'books_languages_link', 'books_ratings_link', 'data'):
+                conn.execute('DELETE FROM %s WHERE %s = ?' % (table, 'book'), (book,))
+            conn.execute('DELETE FROM books WHERE id = ?', (book,))
+        for book in copied:
+            cursor = conn.execute("INSERT INTO books (title, sort, timestamp, pubdate, series_index, author_sort, "
+                                  "path, has_cover, last_modified) SELECT title, sort, "
+                                  "'2031-01-01 00:00:00+00:00', pubdate, series_index, author_sort, path || '-copy', "
+                                  "has_cover, last_modified FROM books WHERE id = ?", (book,))
+            for table, column in (('books_languages_link', 'lang_code'), ('books_ratings_link', 'rating')):
+                conn.execute('INSERT INTO %s (book, %s) SELECT ?, %s FROM %s WHERE book = ?'
+                             % (table, column, column, table), (cursor.lastrowid, book))
+        conn.commit()
+        return len(changed) + len(removed) + len(copied)
+    finally:
+        conn.close()
+
+
+def list_filters(db):
+    rating = db.session.query(db.Ratings).first()
+    data = db.session.query(db.Data).first()
+    language = db.session.query(db.Languages).first()
+    filters = [('all', True, {}),
+               ('rated', db.Books.ratings.any(db.Ratings.rating > 9), {'rating_above': 9})]
+    if rating:
+        filters.append(('rating', db.Books.ratings.any(db.Ratings.id == rating.id), {'rating': rating.rating}))
+    if data:
+        filters.append(('format', db.Books.data.any(db.Data.format == data.format), {'book_format': data.format}))
+    if language:
+        filters.append(('language', db.Books.languages.any(db.Languages.lang_code == language.lang_code),
+                        {'language': language.lang_code}))
+    return filters
+
+
+def compare(db, catalog, pages, per_page):
+    '''Times and compares all sorts and filters, returns the times and the differences.'''
+    from cps.catalog import SORTS
+    from cps.helper import common_filters
+
+    columns = {'timestamp': db.Books.timestamp, 'pubdate': db.Books.pubdate, 'sort': db.Books.sort}
+    sql_times, catalog_times, differences = [], [], []
+    for sort, order in sorted(SORTS.items()):
+        sql_order = [columns[name].desc() if descending else columns[name] for name, descending in order]
+        for name, db_filter, catalog_filter in list_filters(db):
+            for page in range(1, pages + 1):
+                start = time.time()
+                query = db.session.query(db.Books.id).filter(db_filter).filter(common_filters())
+                total = query.count()
+                ids = [row.id for row in query.order_by(*(sql_order + [db.Books.id]))
+                       .offset(per_page * (page - 1)).limit(per_page)]
+                sql_times.append(time.time() - start)
+                start = time.time()
+                found = catalog.page(order, page, per_page, **catalog_filter)
+                catalog_times.append(time.time() - start)
+                if found != (ids, total):
+                    differences.append('%s %s page %d: %d books, %d in the snapshot'
+                                       % (sort, name, page, total, found[1]))
+    return sql_times, catalog_times, differences
+
+
+def print_times(sql_times, catalog_times):
+    print('%-9s %9s %9s %9s' % ('', 'p50', 'p95', 'max'))
+    for name, times in (('database', sql_times), ('snapshot', catalog_times)):
+        print('%-9s %7.2fms %7.2fms %7.2fms' % (name, percentile(times, 50) * 1000, percentile(times, 95) * 1000,
+                                                 max(times) * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Book list pages from the catalog snapshot against the database')
+    parser.add_argument('library', help='calibre library directory')
+    parser.add_argument('--pages', type=int, default=3, help='pages read per sort and filter')
+    parser.add_argument('--changes', type=int, default=20, help='books changed, removed and added each')
+    parser.add_argument('--settings-dir', help='directory of app.db (default a temporary directory)')
+    parser.add_argument('--user', default='admin', help='name of the user to read the lists as')
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix='cw-bench-')
+    library = os.path.join(work_dir, 'library')
+    shutil.copytree(args.library, library, ignore=shutil.ignore_patterns('*.epub', '*.pdf', '*.jpg'))
+    settings_dir = args.settings_dir or os.path.join(work_dir, 'settings')
+    if not os.path.isdir(settings_dir):
+        os.makedirs(settings_dir)
+    failed = False
+    try:
+        app, __ = setup_app(library, settings_dir)
+        from flask_login import login_user
+        from cps import config, db, ub
+        from cps.catalog import CatalogSnapshot, use_numpy
+        if not use_numpy:
+            raise SystemExit('NumPy is not installed')
+
+        catalog = CatalogSnapshot()
+        per_page = int(config.config_books_per_page)
+        with app.test_request_context():
+            login_user(ub.session.query(ub.User).filter(ub.User.nickname == args.user).one())
+            start = time.time()
+            catalog.refresh()
+            build = time.time() - start
+            sql_times, catalog_times, differences = compare(db, catalog, args.pages, per_page)
+            print('%s: %d books, snapshot built in %.0fms, %s' % (args.library, catalog.get_stats()['books'],
+                                                                  build * 1000, catalog.get_stats()))
+            print_times(sql_times, catalog_times)
+
+            changes = change_library(library, args.changes)
+            start = time.time()
+            catalog.refresh()
+            update = time.time() - start
+            db.session.expire_all()
+            __, __, after = compare(db, catalog, args.pages, per_page)
+            print('\n%d books changed, snapshot updated in %.0fms, %d updates'
+                  % (changes, update * 1000, catalog.get_stats()['updates']))
+            differences.extend(after)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    if differences:
+        print('\n%d pages differ:' % len(differences))
+        print('\n'.join('  ' + line for line in differences[:20]))
+        failed = True
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Measures the throughput of a running Calibre-Web instance under concurrent requests.
+
+Start Calibre-Web once with "Maximum concurrent requests" set to 0 and once with e.g. 8, and run
+against both instances:
+
+    python bench/concurrency.py http://localhost:8083/opds/new /opds/search/a --concurrency 16 \\
+        --requests 400 --user admin:admin123
+"""
+
+from __future__ import division, print_function, unicode_literals
+import argparse
+import threading
+import time
+
+import requests
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def run(urls, concurrency, total, auth=None, timeout=60):
+    latencies = []
+    statuses = {}
+    lock = threading.Lock()
+    counter = [0]
+
+    def client():
+        session = requests.Session()
+        session.auth = auth
+        while True:
+            with lock:
+                if counter[0] >= total:
+                    return
+                url = urls[counter[0] % len(urls)]
+                counter[0] += 1
+            start = time.time()
+            try:
+                status = session.get(url, timeout=timeout).status_code
+            except requests.RequestException as ex:
+                status = type(ex).__name__
+            duration = time.time() - start
+            with lock:
+                latencies.append(duration)
+                statuses[status] = statuses.get(status, 0) + 1
+
+    threads = [threading.Thread(target=client) for __ in range(concurrency)]
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.time() - start
+    return {
+        'requests': len(latencies),
+        'elapsed': elapsed,
+        'throughput': len(latencies) / elapsed if elapsed else 0.0,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99),
+        'statuses': statuses,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Concurrent request throughput of a Calibre-Web instance')
+    parser.add_argument('url', help='base url, e.g. http://localhost:8083/opds')
+    parser.add_argument('paths', nargs='*', default=[''], help='paths requested in turn, relative to url')
+    parser.add_argument('--concurrency', type=int, default=16, help='number of parallel clients')
+    parser.add_argument('--requests', type=int, default=400, help='total number of requests')
+    parser.add_argument('--user', help='user:password for basic authentication')
+    parser.add_argument('--warmup', type=int, default=10, help='requests sent before measuring')
+    args = parser.parse_args()
+
+    base = args.url.rstrip('/')
+    urls = [base + '/' + p.lstrip('/') if p else base for p in args.paths]
+    auth = tuple(args.user.split(':', 1)) if args.user else None
+
+    if args.warmup:
+        run(urls, 1, args.warmup, auth)
+    result = run(urls, args.concurrency, args.requests, auth)
+    print('%d requests, %d clients in %.2fs: %.1f req/s' %
+          (result['requests'], args.concurrency, result['elapsed'], result['throughput']))
+    print('latency p50 %.1fms  p95 %.1fms  p99 %.1fms' %
+          (result['p50'] * 1000, result['p95'] * 1000, result['p99'] * 1000))
+    print('status codes: %s' % ', '.join('%s: %d' % (k, v) for k, v in sorted(result['statuses'].items(),
+                                                                              key=lambda i: str(i[0]))))
+
+
+if __name__ == '__main__':
+    main()
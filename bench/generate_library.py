@@ -0,0 +1,466 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Generates a synthetic calibre library (metadata.db plus book folders) for benchmarks.
+
+The distributions roughly follow real libraries: a few prolific authors and many with one book,
+some books with several authors, popular and rare tags, series of different lengths, mostly
+english books and one custom column of every calibre datatype. The same seed always generates
+the same library.
+
+    python bench/generate_library.py /tmp/library-10k --books 10000
+    python bench/generate_library.py /tmp/library-1m --books 1000000 --no-files
+"""
+
+from __future__ import division, print_function, unicode_literals
+import argparse
+import bisect
+import os
+import random
+import sqlite3
+import struct
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+
+SCHEMA = '''
+CREATE TABLE books (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL DEFAULT 'Unknown' COLLATE NOCASE,
+    sort TEXT COLLATE NOCASE, timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP, pubdate TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    series_index REAL NOT NULL DEFAULT 1.0, author_sort TEXT COLLATE NOCASE, isbn TEXT DEFAULT "" COLLATE NOCASE,
+    lccn TEXT DEFAULT "" COLLATE NOCASE, path TEXT NOT NULL DEFAULT "", flags INTEGER NOT NULL DEFAULT 1,
+    uuid TEXT, has_cover BOOL DEFAULT 0, last_modified TIMESTAMP NOT NULL DEFAULT "2000-01-01 00:00:00+00:00");
+CREATE TABLE authors (id INTEGER PRIMARY KEY, name TEXT NOT NULL COLLATE NOCASE, sort TEXT COLLATE NOCASE,
+    link TEXT NOT NULL DEFAULT "", UNIQUE(name));
+CREATE TABLE books_authors_link (id INTEGER PRIMARY KEY, book INTEGER NOT NULL, author INTEGER NOT NULL,
+    UNIQUE(book, author));
+CREATE TABLE tags (id INTEGER PRIMARY KEY, name TEXT NOT NULL COLLATE NOCASE, UNIQUE (name));
+CREATE TABLE books_tags_link (id INTEGER PRIMARY KEY, book INTEGER NOT NULL, tag INTEGER NOT NULL, UNIQUE(book, tag));
+CREATE TABLE series (id INTEGER PRIMARY KEY, name TEXT NOT NULL COLLATE NOCASE, sort TEXT COLLATE NOCASE,
+    UNIQUE (name));
+CREATE TABLE books_series_link (id INTEGER PRIMARY KEY, book INTEGER NOT NULL, series INTEGER NOT NULL, UNIQUE(book));
+CREATE TABLE ratings (id INTEGER PRIMARY KEY, rating INTEGER CHECK(rating > -1 AND rating < 11), UNIQUE (rating));
+CREATE TABLE books_ratings_link (id INTEGER PRIMARY KEY, book INTEGER NOT NULL, rating INTEGER NOT NULL,
+    UNIQUE(book, rating));
+CREATE TABLE languages (id INTEGER PRIMARY KEY, lang_code TEXT NOT NULL COLLATE NOCASE, UNIQUE(lang_code));
+CREATE TABLE books_languages_link (id INTEGER PRIMARY KEY, book INTEGER NOT NULL, lang_code INTEGER NOT NULL,
+    item_order INTEGER NOT NULL DEFAULT 0, UNIQUE(book, lang_code));
+CREATE TABLE publishers (id INTEGER PRIMARY KEY, name TEXT NOT NULL COLLATE NOCASE, sort TEXT COLLATE NOCASE,
+    UNIQUE(name));
+CREATE TABLE books_publishers_link (id INTEGER PRIMARY KEY, book INTEGER NOT NULL, publisher INTEGER NOT NULL,
+    UNIQUE(book));
+CREATE TABLE data (id INTEGER PRIMARY KEY, book INTEGER NOT NULL, format TEXT NOT NULL COLLATE NOCASE,
+    uncompressed_size INTEGER NOT NULL, name TEXT NOT NULL, UNIQUE(book, format));
+CREATE TABLE comments (id INTEGER PRIMARY KEY, book INTEGER NOT NULL, text TEXT NOT NULL COLLATE NOCASE, UNIQUE(book));
+CREATE TABLE identifiers (id INTEGER PRIMARY KEY, book INTEGER NOT NULL, type TEXT NOT NULL DEFAULT "isbn" COLLATE NOCASE,
+    val TEXT NOT NULL COLLATE NOCASE, UNIQUE(book, type));
+CREATE TABLE custom_columns (id INTEGER PRIMARY KEY AUTOINCREMENT, label TEXT NOT NULL, name TEXT NOT NULL,
+    datatype TEXT NOT NULL, mark_for_delete BOOL DEFAULT 0 NOT NULL, editable BOOL DEFAULT 1 NOT NULL,
+    display TEXT DEFAULT "{}" NOT NULL, is_multiple BOOL DEFAULT 0 NOT NULL, normalized BOOL NOT NULL,
+    UNIQUE(label));
+CREATE INDEX authors_idx ON books (author_sort COLLATE NOCASE);
+CREATE INDEX books_idx ON books (sort COLLATE NOCASE);
+CREATE INDEX books_authors_link_aidx ON books_authors_link (author);
+CREATE INDEX books_authors_link_bidx ON books_authors_link (book);
+CREATE INDEX books_tags_link_aidx ON books_tags_link (tag);
+CREATE INDEX books_tags_link_bidx ON books_tags_link (book);
+CREATE INDEX books_series_link_aidx ON books_series_link (series);
+CREATE INDEX books_series_link_bidx ON books_series_link (book);
+CREATE INDEX books_ratings_link_aidx ON books_ratings_link (rating);
+CREATE INDEX books_ratings_link_bidx ON books_ratings_link (book);
+CREATE INDEX books_languages_link_aidx ON books_languages_link (lang_code);
+CREATE INDEX books_languages_link_bidx ON books_languages_link (book);
+CREATE INDEX books_publishers_link_aidx ON books_publishers_link (publisher);
+CREATE INDEX books_publishers_link_bidx ON books_publishers_link (book);
+CREATE INDEX comments_idx ON comments (book);
+CREATE INDEX data_idx ON data (book);
+CREATE INDEX series_idx ON series (name COLLATE NOCASE);
+CREATE INDEX tags_idx ON tags (name COLLATE NOCASE);
+'''
+
+# label, name, datatype, is_multiple, normalized, display
+CUSTOM_COLUMNS = (
+    ('genre', 'Genre', 'text', 1, 1, '{"is_names": false}'),
+    ('shelf', 'Shelf', 'text', 0, 1, '{}'),
+    ('status', 'Status', 'enumeration', 0, 1, '{"enum_values": ["new", "reading", "read", "abandoned"]}'),
+    ('myrating', 'My Rating', 'rating', 0, 1, '{}'),
+    ('pages', 'Pages', 'int', 0, 0, '{}'),
+    ('price', 'Price', 'float', 0, 0, '{}'),
+    ('owned', 'Owned', 'bool', 0, 0, '{}'),
+    ('finished', 'Finished', 'datetime', 0, 0, '{}'),
+    ('notes', 'Notes', 'comments', 0, 0, '{}'),
+    ('universe', 'Universe', 'series', 0, 1, '{}'),
+)
+
+LANGUAGES = (('eng', 70), ('deu', 8), ('fra', 6), ('spa', 5), ('ita', 3), ('nld', 2), ('rus', 2), ('jpn', 2),
+             ('pol', 1), ('swe', 1))
+FORMATS = (('EPUB', 80), ('PDF', 25), ('MOBI', 15), ('AZW3', 5), ('CBZ', 3), ('FB2', 2))
+ARTICLES = ('The', 'A', 'An')
+
+_WORDS = ('night', 'river', 'shadow', 'garden', 'empire', 'winter', 'silver', 'secret', 'stone', 'dragon', 'city',
+          'ocean', 'forest', 'glass', 'fire', 'crown', 'storm', 'letter', 'house', 'island', 'machine', 'star',
+          'journey', 'memory', 'summer', 'wolf', 'queen', 'mirror', 'bridge', 'song', 'tower', 'silence', 'road',
+          'heart', 'war', 'light', 'dream', 'child', 'stranger', 'map', 'clock', 'mountain', 'harbor', 'ghost')
+_FIRST = ('Anna', 'Ben', 'Clara', 'David', 'Elena', 'Felix', 'Grace', 'Hugo', 'Ines', 'Jonas', 'Kira', 'Leon',
+          'Maria', 'Noah', 'Olga', 'Paul', 'Rosa', 'Sam', 'Tara', 'Victor', 'Wen', 'Yuki', 'Zoe', 'Omar')
+_LAST = ('Adams', 'Berg', 'Castillo', 'Dubois', 'Eriksen', 'Fischer', 'Garcia', 'Hoffmann', 'Ivanova', 'Jensen',
+         'Kowalski', 'Lindqvist', 'Moreau', 'Nakamura', 'Olsen', 'Petrov', 'Quinn', 'Rossi', 'Schmidt', 'Tanaka',
+         'Urban', 'Vargas', 'Weber', 'Young', 'Zimmermann')
+
+
+def _weighted(rnd, choices):
+    total = sum(weight for __, weight in choices)
+    pick = rnd.uniform(0, total)
+    for value, weight in choices:
+        pick -= weight
+        if pick <= 0:
+            return value
+    return choices[-1][0]
+
+
+class _Zipf(object):
+    '''Picks ids 1..size, id n is picked 1/n^exponent times as often as id 1 (popular authors, tags, ...).'''
+
+    def __init__(self, rnd, size, exponent=1.0):
+        self.rnd = rnd
+        self.cumulated = []
+        total = 0.0
+        for rank in range(1, size + 1):
+            total += 1.0 / rank ** exponent
+            self.cumulated.append(total)
+
+    def pick(self):
+        return bisect.bisect_left(self.cumulated, self.rnd.uniform(0, self.cumulated[-1])) + 1
+
+
+def _title(rnd, index):
+    words = rnd.sample(_WORDS, rnd.randint(1, 3))
+    title = ' '.join(word.capitalize() for word in words)
+    if rnd.random() < 0.3:
+        title = '%s %s' % (rnd.choice(ARTICLES), title)
+    # titles repeat in big libraries, the number keeps paths and searches unique enough
+    return '%s %d' % (title, index)
+
+
+def _title_sort(title):
+    for article in ARTICLES:
+        if title.startswith(article + ' '):
+            return '%s, %s' % (title[len(article) + 1:], article)
+    return title
+
+
+def _bit_writer():
+    state = {'bits': 0, 'count': 0, 'data': bytearray()}
+
+    def write(value, length):
+        for shift in range(length - 1, -1, -1):
+            state['bits'] = (state['bits'] << 1) | ((value >> shift) & 1)
+            state['count'] += 1
+            if state['count'] == 8:
+                state['data'].append(state['bits'])
+                if state['bits'] == 0xFF:
+                    state['data'].append(0)
+                state['bits'] = state['count'] = 0
+
+    def flush():
+        while state['count']:
+            write(1, 1)
+        return bytes(state['data'])
+    return write, flush
+
+
+def solid_jpeg(width, height, gray):
+    '''Baseline grayscale JPEG of one colour, valid for every decoder and only a few hundred bytes.'''
+    blocks = ((width + 7) // 8) * ((height + 7) // 8)
+    dc = 8 * (gray - 128)
+    category = abs(dc).bit_length()
+    write, flush = _bit_writer()
+    for block in range(blocks):
+        if block == 0 and category:
+            write(0b10, 2)  # DC difference of the first block
+            write(dc if dc > 0 else dc + (1 << category) - 1, category)
+        else:
+            write(0, 1)  # DC difference 0
+        write(0, 1)  # end of block, no AC coefficients
+    scan = flush()
+
+    def segment(marker, payload):
+        return struct.pack('>BBH', 0xFF, marker, len(payload) + 2) + payload
+    # DC table: category 0 -> "0", category of the first block -> "10"; AC table: end of block -> "0"
+    dc_table = struct.pack('>B16B', 0x00, 1, 1, *([0] * 14)) + struct.pack('>BB', 0, category)
+    ac_table = struct.pack('>B16B', 0x10, 1, *([0] * 15)) + struct.pack('>B', 0)
+    return (b'\xff\xd8' +
+            segment(0xDB, b'\x00' + b'\x01' * 64) +
+            segment(0xC0, struct.pack('>BHHBBBB', 8, height, width, 1, 1, 0x11, 0)) +
+            segment(0xC4, dc_table + ac_table) +
+            segment(0xDA, struct.pack('>BBBBBB', 1, 1, 0x00, 0, 63, 0)) +
+            scan + b'\xff\xd9')
+
+
+def _sql_time(value):
+    return value.strftime('%Y-%m-%d %H:%M:%S+00:00')
+
+
+class LibraryGenerator(object):
+
+    def __init__(self, library_dir, books, seed=1, files=True, file_size=4096, batch_size=10000):
+        self.library_dir = library_dir
+        self.books = books
+        self.rnd = random.Random(seed)
+        self.files = files
+        self.file_size = file_size
+        self.batch_size = batch_size
+        self.authors = max(books // 6, 5)
+        self.tags = max(min(books // 20, 3000), 20)
+        self.series = max(books // 25, 3)
+        self.publishers = max(min(books // 50, 1000), 5)
+        self.cover = solid_jpeg(96, 128, 160)
+        self.author_ids = _Zipf(self.rnd, self.authors, 0.8)
+        self.tag_ids = _Zipf(self.rnd, self.tags, 1.0)
+        self.series_ids = _Zipf(self.rnd, self.series, 0.5)
+        self.publisher_ids = _Zipf(self.rnd, self.publishers, 1.0)
+
+    def run(self):
+        if not os.path.isdir(self.library_dir):
+            os.makedirs(self.library_dir)
+        path = os.path.join(self.library_dir, 'metadata.db')
+        if os.path.exists(path):
+            raise SystemExit('%s already exists' % path)
+        conn = sqlite3.connect(path)
+        conn.execute('PRAGMA journal_mode = OFF')
+        conn.execute('PRAGMA synchronous = OFF')
+        conn.executescript(SCHEMA)
+        self._lookup_tables(conn)
+        custom_columns = self._custom_columns(conn)
+        rows = self._empty_rows(custom_columns)
+        start = time.time()
+        for book_id in range(1, self.books + 1):
+            self._book(book_id, rows, custom_columns)
+            if book_id % self.batch_size == 0:
+                self._flush(conn, rows)
+                print('%d books, %.1fs' % (book_id, time.time() - start), file=sys.stderr)
+        self._flush(conn, rows)
+        conn.execute('ANALYZE')
+        conn.commit()
+        conn.close()
+        print('Generated %d books by %d authors in %s (%.1fs)' % (self.books, self.authors, self.library_dir,
+                                                                 time.time() - start))
+
+    def _lookup_tables(self, conn):
+        rnd = self.rnd
+        authors = []
+        names = set()
+        while len(authors) < self.authors:
+            first, last = rnd.choice(_FIRST), rnd.choice(_LAST)
+            name = '%s %s' % (first, last)
+            if name in names:
+                name = '%s %s. %s' % (first, chr(65 + len(names) % 26), last)
+                name = name if name not in names else '%s %d' % (name, len(names))
+            names.add(name)
+            authors.append((len(authors) + 1, name, '%s, %s' % (name.rsplit(' ', 1)[1], name.rsplit(' ', 1)[0])))
+        conn.executemany('INSERT INTO authors (id, name, sort) VALUES (?, ?, ?)', authors)
+        self.author_names = dict((author_id, name) for author_id, name, __ in authors)
+        self.author_sorts = dict((author_id, sort) for author_id, __, sort in authors)
+
+        conn.executemany('INSERT INTO tags (id, name) VALUES (?, ?)',
+                         [(i + 1, '%s %d' % (rnd.choice(_WORDS).capitalize(), i)) for i in range(self.tags)])
+        series = [(i + 1, 'Saga of the %s %d' % (rnd.choice(_WORDS).capitalize(), i)) for i in range(self.series)]
+        conn.executemany('INSERT INTO series (id, name, sort) VALUES (?, ?, ?)',
+                         [(i, name, name) for i, name in series])
+        publishers = ['%s Press %d' % (rnd.choice(_LAST), i) for i in range(self.publishers)]
+        conn.executemany('INSERT INTO publishers (id, name, sort) VALUES (?, ?, ?)',
+                         [(i + 1, name, name) for i, name in enumerate(publishers)])
+        conn.executemany('INSERT INTO ratings (id, rating) VALUES (?, ?)', [(i + 1, i * 2) for i in range(6)])
+        conn.executemany('INSERT INTO languages (id, lang_code) VALUES (?, ?)',
+                         [(i + 1, code) for i, (code, __) in enumerate(LANGUAGES)])
+        self.language_ids = dict((code, i + 1) for i, (code, __) in enumerate(LANGUAGES))
+        # books of a series are numbered in order of appearance
+        self.series_index = {}
+
+    def _custom_columns(self, conn):
+        columns = []
+        for column_id, (label, name, datatype, is_multiple, normalized, display) in enumerate(CUSTOM_COLUMNS, 1):
+            conn.execute('INSERT INTO custom_columns (id, label, name, datatype, is_multiple, normalized, display) '
+                         'VALUES (?, ?, ?, ?, ?, ?, ?)', (column_id, label, name, datatype, is_multiple, normalized,
+                                                          display))
+            table = 'custom_column_%d' % column_id
+            link = 'books_custom_column_%d_link' % column_id
+            values = []
+            if normalized:
+                value_type = 'INT' if datatype == 'rating' else 'TEXT'
+                conn.execute('CREATE TABLE %s (id INTEGER PRIMARY KEY AUTOINCREMENT, value %s NOT NULL%s, '
+                             'link TEXT NOT NULL DEFAULT "", UNIQUE(value))'
+                             % (table, value_type, ' COLLATE NOCASE' if value_type == 'TEXT' else ''))
+                extra = ', extra REAL' if datatype == 'series' else ''
+                conn.execute('CREATE TABLE %s (id INTEGER PRIMARY KEY AUTOINCREMENT, book INTEGER NOT NULL, '
+                             'value INTEGER NOT NULL%s, UNIQUE(book, value))' % (link, extra))
+                conn.execute('CREATE INDEX %s_aidx ON %s (value)' % (link, link))
+                conn.execute('CREATE INDEX %s_bidx ON %s (book)' % (link, link))
+                if datatype == 'enumeration':
+                    values = ['new', 'reading', 'read', 'abandoned']
+                elif datatype == 'rating':
+                    values = [i * 2 for i in range(6)]
+                elif datatype == 'series':
+                    values = ['%s Cycle' % word.capitalize() for word in _WORDS[:20]]
+                else:
+                    values = ['%s %s' % (label.capitalize(), word) for word in _WORDS]
+                conn.executemany('INSERT INTO %s (id, value) VALUES (?, ?)' % table,
+                                 [(i + 1, value) for i, value in enumerate(values)])
+            else:
+                value_type = {'int': 'INT', 'float': 'REAL', 'bool': 'BOOL', 'datetime': 'TIMESTAMP'}.get(datatype,
+                                                                                                        'TEXT')
+                conn.execute('CREATE TABLE %s (id INTEGER PRIMARY KEY AUTOINCREMENT, book INTEGER, value %s NOT NULL, '
+                             'UNIQUE(book))' % (table, value_type))
+                conn.execute('CREATE INDEX %s_idx ON %s (book)' % (table, table))
+            columns.append((column_id, datatype, is_multiple, normalized, len(values)))
+        return columns
+
+    @staticmethod
+    def _empty_rows(custom_columns):
+        rows = dict((name, []) for name in ('books', 'authors', 'tags', 'series', 'ratings', 'languages',
+                                            'publishers', 'data', 'comments', 'identifiers'))
+        for column in custom_columns:
+            rows['cc%d' % column[0]] = []
+        return rows
+
+    def _book(self, book_id, rows, custom_columns):
+        rnd = self.rnd
+        title = _title(rnd, book_id)
+        author_count = _weighted(rnd, ((1, 85), (2, 12), (3, 3)))
+        authors = []
+        while len(authors) < author_count:
+            author_id = self.author_ids.pick()
+            if author_id not in authors:
+                authors.append(author_id)
+        first_author = self.author_names[authors[0]]
+        path = '%s/%s (%d)' % (first_author, title, book_id)
+        added = datetime(2010, 1, 1) + timedelta(seconds=rnd.randint(0, 10 * 365 * 86400))
+        published = datetime(1900, 1, 1) + timedelta(days=rnd.randint(0, 120 * 365))
+
+        series_id, series_index = None, 1.0
+        if rnd.random() < 0.3:
+            series_id = self.series_ids.pick()
+            series_index = self.series_index[series_id] = self.series_index.get(series_id, 0) + 1
+        has_cover = rnd.random() < 0.9
+
+        rows['books'].append((book_id, title, _title_sort(title), _sql_time(added), _sql_time(published),
+                              float(series_index), ' & '.join(self.author_sorts[a] for a in authors), path,
+                              str(uuid.UUID(int=rnd.getrandbits(128))), int(has_cover), _sql_time(added)))
+        rows['authors'].extend((book_id, author_id) for author_id in authors)
+        tags = set(self.tag_ids.pick() for __ in range(_weighted(rnd, ((0, 10), (1, 20), (2, 25),
+                                                                                       (3, 20), (5, 15), (8, 10)))))
+        rows['tags'].extend((book_id, tag) for tag in tags)
+        if series_id:
+            rows['series'].append((book_id, series_id))
+        if rnd.random() < 0.6:
+            rows['ratings'].append((book_id, rnd.randint(1, 6)))
+        rows['languages'].append((book_id, self.language_ids[_weighted(rnd, LANGUAGES)]))
+        if rnd.random() < 0.8:
+            rows['publishers'].append((book_id, self.publisher_ids.pick()))
+        if rnd.random() < 0.7:
+            rows['comments'].append((book_id, '<p>%s.</p>' % ' '.join(rnd.choice(_WORDS)
+                                                                      for __ in range(rnd.randint(20, 200)))))
+        rows['identifiers'].append((book_id, 'isbn', '978%010d' % rnd.randint(0, 9999999999)))
+
+        file_name = '%s - %s' % (title, first_author)
+        formats = set([_weighted(rnd, FORMATS)])
+        if rnd.random() < 0.3:
+            formats.add(_weighted(rnd, FORMATS))
+        for book_format in formats:
+            rows['data'].append((book_id, book_format, self.file_size, file_name))
+
+        for column_id, datatype, is_multiple, normalized, values in custom_columns:
+            if rnd.random() < 0.4:
+                continue
+            if normalized:
+                picks = set(rnd.randint(1, values) for __ in range(rnd.randint(1, 3) if is_multiple else 1))
+                for value in picks:
+                    row = (book_id, value, float(rnd.randint(1, 10))) if datatype == 'series' else (book_id, value)
+                    rows['cc%d' % column_id].append(row)
+            else:
+                value = {'int': lambda: rnd.randint(20, 1500),
+                         'float': lambda: round(rnd.uniform(0.99, 49.99), 2),
+                         'bool': lambda: rnd.random() < 0.5,
+                         'datetime': lambda: _sql_time(added + timedelta(days=rnd.randint(1, 900))),
+                         'comments': lambda: '<p>%s</p>' % ' '.join(rnd.sample(_WORDS, 8))}[datatype]()
+                rows['cc%d' % column_id].append((book_id, value))
+
+        if self.files:
+            self._write_files(path, file_name, formats, has_cover)
+
+    def _write_files(self, path, file_name, formats, has_cover):
+        book_dir = os.path.join(self.library_dir, *path.split('/'))
+        if not os.path.isdir(book_dir):
+            os.makedirs(book_dir)
+        content = (b'calibre-web benchmark book ' * (self.file_size // 27 + 1))[:self.file_size]
+        for book_format in formats:
+            with open(os.path.join(book_dir, '%s.%s' % (file_name, book_format.lower())), 'wb') as book_file:
+                book_file.write(content)
+        if has_cover:
+            with open(os.path.join(book_dir, 'cover.jpg'), 'wb') as cover:
+                cover.write(self.cover)
+
+    @staticmethod
+    def _flush(conn, rows):
+        statements = {
+            'books': 'INSERT INTO books (id, title, sort, timestamp, pubdate, series_index, author_sort, path, uuid, '
+                     'has_cover, last_modified) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            'authors': 'INSERT INTO books_authors_link (book, author) VALUES (?, ?)',
+            'tags': 'INSERT INTO books_tags_link (book, tag) VALUES (?, ?)',
+            'series': 'INSERT INTO books_series_link (book, series) VALUES (?, ?)',
+            'ratings': 'INSERT INTO books_ratings_link (book, rating) VALUES (?, ?)',
+            'languages': 'INSERT INTO books_languages_link (book, lang_code) VALUES (?, ?)',
+            'publishers': 'INSERT INTO books_publishers_link (book, publisher) VALUES (?, ?)',
+            'data': 'INSERT INTO data (book, format, uncompressed_size, name) VALUES (?, ?, ?, ?)',
+            'comments': 'INSERT INTO comments (book, text) VALUES (?, ?)',
+            'identifiers': 'INSERT INTO identifiers (book, type, val) VALUES (?, ?, ?)',
+        }
+        for name, values in rows.items():
+            if not values:
+                continue
+            if name.startswith('cc'):
+                column_id = int(name[2:])
+                if len(values[0]) == 3:
+                    statement = ('INSERT INTO books_custom_column_%d_link (book, value, extra) VALUES (?, ?, ?)'
+                                 % column_id)
+                elif CUSTOM_COLUMNS[column_id - 1][4]:
+                    statement = 'INSERT INTO books_custom_column_%d_link (book, value) VALUES (?, ?)' % column_id
+                else:
+                    statement = 'INSERT INTO custom_column_%d (book, value) VALUES (?, ?)' % column_id
+            else:
+                statement = statements[name]
+            conn.executemany(statement, values)
+            del values[:]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic calibre library')
+    parser.add_argument('library', help='directory of the new library')
+    parser.add_argument('--books', type=int, default=1000, help='number of books (default 1000)')
+    parser.add_argument('--seed', type=int, default=1, help='random seed, the same seed generates the same library')
+    parser.add_argument('--no-files', dest='files', action='store_false',
+                        help="don't write book files and covers (only metadata.db)")
+    parser.add_argument('--file-size', type=int, default=4096, help='size of the dummy book files in bytes')
+    args = parser.parse_args()
+    LibraryGenerator(args.library, args.books, args.seed, args.files, args.file_size).run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,431 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Measures the metadata extraction of uploaded books (EPUB, FB2, PDF, CBZ and CBT).
+
+A corpus of generated books in several sizes is written once to --corpus and reused, the large size
+contains image heavy EPUBs, a 1000 page PDF and a 500 MB CBZ:
+
+    python bench/parsers.py --sizes small,medium,large --repeat 5
+
+Every book is parsed in a new process with the function the upload uses (uploader._parse_metadata).
+Time is reported for the whole parse and for its stages (xml parsing, cover extraction, ...), stage
+times include nested stages. Peak memory is the tracemalloc peak of Python allocations and the growth
+of the resident set size, which includes libraries like lxml, but not ImageMagick's delegates.
+"""
+
+from __future__ import division, print_function, unicode_literals
+import argparse
+import base64
+import io
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import struct
+import sys
+import tarfile
+import tempfile
+import time
+import zipfile
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+from generate_library import solid_jpeg
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# pages/chapters and image sizes of the corpus
+SIZES = {
+    'small': {'epub': (5, 2, 50 * 1024), 'fb2': (20, 1, 50 * 1024), 'pdf': (10,),
+              'cbz': (20, 200 * 1024), 'cbt': (20, 200 * 1024)},
+    'medium': {'epub': (50, 50, 200 * 1024), 'fb2': (200, 20, 200 * 1024), 'pdf': (100,),
+               'cbz': (100, 1024 * 1024), 'cbt': (100, 1024 * 1024)},
+    'large': {'epub': (200, 400, 500 * 1024), 'fb2': (1000, 100, 500 * 1024), 'pdf': (1000,),
+              'cbz': (500, 1024 * 1024), 'cbt': (200, 1024 * 1024)},
+}
+
+_WORDS = ('lorem', 'ipsum', 'dolor', 'sit', 'amet', 'river', 'night', 'garden', 'stone', 'winter', 'letter',
+          'window', 'shadow', 'silver', 'harbour', 'dragon')
+
+
+def _paragraphs(rnd, count):
+    return [' '.join(rnd.choice(_WORDS) for __ in range(rnd.randint(40, 120))).capitalize() + '.'
+            for __ in range(count)]
+
+
+def page_image(size, gray=128):
+    '''A JPEG of about size bytes, padded with random (incompressible) comment segments like a real scan.'''
+    image = solid_jpeg(600, 800, gray)
+    padding = []
+    remaining = size - len(image)
+    while remaining > 4:
+        chunk = min(remaining - 4, 65533)
+        padding.append(struct.pack('>BBH', 0xFF, 0xFE, chunk + 2) + os.urandom(chunk))
+        remaining -= chunk + 4
+    return image[:2] + b''.join(padding) + image[2:]
+
+
+def write_epub(path, chapters, images, image_size, rnd):
+    manifest = ['<item id="cover-image" href="images/cover.jpg" media-type="image/jpeg"/>']
+    spine = []
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as epub:
+        epub.writestr('mimetype', 'application/epub+zip', zipfile.ZIP_STORED)
+        epub.writestr('META-INF/container.xml',
+                      '<?xml version="1.0"?><container version="1.0" '
+                      'xmlns="urn:oasis:names:tc:opendocument:xmlns:container"><rootfiles>'
+                      '<rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>'
+                      '</rootfiles></container>')
+        # images are stored, deflating jpegs gains nothing
+        epub.writestr('OEBPS/images/cover.jpg', page_image(image_size, 90), zipfile.ZIP_STORED)
+        for index in range(images):
+            epub.writestr('OEBPS/images/image%d.jpg' % index, page_image(image_size), zipfile.ZIP_STORED)
+            manifest.append('<item id="image%d" href="images/image%d.jpg" media-type="image/jpeg"/>'
+                            % (index, index))
+        for index in range(chapters):
+            body = ''.join('<p>%s</p>' % p for p in _paragraphs(rnd, 30))
+            if index < images:
+                body += '<img src="images/image%d.jpg" alt=""/>' % index
+            epub.writestr('OEBPS/chapter%d.xhtml' % index,
+                          '<?xml version="1.0" encoding="utf-8"?><html xmlns="http://www.w3.org/1999/xhtml">'
+                          '<head><title>Chapter %d</title></head><body><h1>Chapter %d</h1>%s</body></html>'
+                          % (index, index, body))
+            manifest.append('<item id="chapter%d" href="chapter%d.xhtml" media-type="application/xhtml+xml"/>'
+                            % (index, index))
+            spine.append('<itemref idref="chapter%d"/>' % index)
+        epub.writestr('OEBPS/content.opf',
+                      '<?xml version="1.0" encoding="utf-8"?>'
+                      '<package xmlns="http://www.idpf.org/2007/opf" version="2.0" unique-identifier="id">'
+                      '<metadata xmlns:dc="http://purl.org/dc/elements/1.1/" '
+                      'xmlns:opf="http://www.idpf.org/2007/opf">'
+                      '<dc:title>Benchmark Book</dc:title><dc:creator>Anna Adams</dc:creator>'
+                      '<dc:creator>Ben Berg</dc:creator><dc:language>en</dc:language>'
+                      '<dc:subject>Fiction</dc:subject><dc:subject>Fantasy</dc:subject>'
+                      '<dc:description>%s</dc:description><dc:identifier id="id">bench</dc:identifier>'
+                      '<meta name="calibre:series" content="Benchmarks"/>'
+                      '<meta name="calibre:series_index" content="2"/><meta name="cover" content="cover-image"/>'
+                      '</metadata><manifest>%s</manifest><spine>%s</spine></package>'
+                      % (_paragraphs(rnd, 1)[0], ''.join(manifest), ''.join(spine)))
+
+
+def write_fb2(path, sections, images, image_size, rnd):
+    with io.open(path, 'w', encoding='utf-8') as fb2:
+        fb2.write('<?xml version="1.0" encoding="utf-8"?>\n'
+                  '<FictionBook xmlns="http://www.gribuser.ru/xml/fictionbook/2.0" '
+                  'xmlns:l="http://www.w3.org/1999/xlink"><description><title-info>'
+                  '<genre>fantasy</genre><author><first-name>Anna</first-name><middle-name>M.</middle-name>'
+                  '<last-name>Adams</last-name></author><author><first-name>Ben</first-name>'
+                  '<last-name>Berg</last-name></author><book-title>Benchmark Book</book-title>'
+                  '<coverpage><image l:href="#cover.jpg"/></coverpage><lang>en</lang></title-info>'
+                  '<publish-info><book-name>Benchmark Book</book-name></publish-info></description><body>')
+        for index in range(sections):
+            fb2.write('<section><title><p>Chapter %d</p></title>%s</section>'
+                      % (index, ''.join('<p>%s</p>' % p for p in _paragraphs(rnd, 20))))
+        fb2.write('</body>')
+        for index in range(images):
+            name = 'cover.jpg' if index == 0 else 'image%d.jpg' % index
+            fb2.write('<binary id="%s" content-type="image/jpeg">%s</binary>'
+                      % (name, base64.b64encode(page_image(image_size)).decode('ascii')))
+        fb2.write('</FictionBook>')
+
+
+def write_pdf(path, pages, rnd):
+    '''A PDF with one page of text per page, written without any PDF library.'''
+    objects = {1: b'<< /Type /Catalog /Pages 2 0 R >>',
+               3: b'<< /Title (Benchmark Book) /Author (Anna Adams) /Subject (A generated book) >>',
+               4: b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>'}
+    kids = []
+    for page in range(pages):
+        page_id, content_id = 5 + page * 2, 6 + page * 2
+        lines = [w.encode('ascii') for w in _paragraphs(rnd, 1)[0].split()]
+        text = b'BT /F1 11 Tf 50 780 Td 14 TL ' + b' '.join(b'(%s) Tj T*' % word for word in lines[:45]) + b' ET'
+        objects[content_id] = b'<< /Length %d >>\nstream\n%s\nendstream' % (len(text), text)
+        objects[page_id] = (b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents %d 0 R '
+                            b'/Resources << /Font << /F1 4 0 R >> >> >>' % content_id)
+        kids.append(b'%d 0 R' % page_id)
+    objects[2] = b'<< /Type /Pages /Count %d /Kids [%s] >>' % (pages, b' '.join(kids))
+
+    with open(path, 'wb') as pdf:
+        pdf.write(b'%PDF-1.4\n')
+        offsets = {}
+        for number in sorted(objects):
+            offsets[number] = pdf.tell()
+            pdf.write(b'%d 0 obj\n%s\nendobj\n' % (number, objects[number]))
+        xref = pdf.tell()
+        pdf.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1))
+        for number in sorted(objects):
+            pdf.write(b'%010d 00000 n \n' % offsets[number])
+        pdf.write(b'trailer\n<< /Size %d /Root 1 0 R /Info 3 0 R >>\nstartxref\n%d\n%%%%EOF\n'
+                  % (len(objects) + 1, xref))
+
+
+_COMIC_INFO = ('<?xml version="1.0"?><ComicInfo><Title>Benchmark Comic</Title><Series>Benchmarks</Series>'
+               '<Number>3</Number><Writer>Anna Adams</Writer><LanguageISO>en</LanguageISO>'
+               '<Summary>A generated comic</Summary></ComicInfo>')
+
+
+def write_cbz(path, pages, image_size, rnd):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_STORED) as cbz:
+        cbz.writestr('ComicInfo.xml', _COMIC_INFO)
+        for page in range(pages):
+            cbz.writestr('page%04d.jpg' % page, page_image(image_size))
+
+
+def write_cbt(path, pages, image_size, rnd):
+    with tarfile.open(path, 'w') as cbt:
+        for name, data in [('ComicInfo.xml', _COMIC_INFO.encode('utf-8'))] + \
+                [('page%04d.jpg' % page, page_image(image_size)) for page in range(pages)]:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            cbt.addfile(info, io.BytesIO(data))
+
+
+def write_book(path, fmt, size, seed):
+    rnd = random.Random(seed)
+    parameters = SIZES[size][fmt]
+    writer = {'epub': write_epub, 'fb2': write_fb2, 'pdf': write_pdf, 'cbz': write_cbz, 'cbt': write_cbt}[fmt]
+    writer(path, *(parameters + (rnd,)))
+
+
+def build_corpus(corpus_dir, sizes, formats, seed, regenerate=False):
+    if not os.path.isdir(corpus_dir):
+        os.makedirs(corpus_dir)
+    books = []
+    for size in sizes:
+        for fmt in formats:
+            path = os.path.join(corpus_dir, '%s-%s.%s' % (size, fmt, fmt))
+            if regenerate or not os.path.isfile(path):
+                start = time.time()
+                write_book(path + '.part', fmt, size, seed)
+                os.rename(path + '.part', path)
+                print('generated %s (%.1f MB) in %.1fs' % (path, os.path.getsize(path) / 1024 / 1024,
+                                                           time.time() - start), file=sys.stderr)
+            books.append((size, fmt, path))
+    return books
+
+
+class StageRecorder(object):
+    '''Wraps functions of the parsers to measure the time and memory spent in them.'''
+
+    def __init__(self, trace_memory):
+        self.trace_memory = trace_memory and hasattr(tracemalloc, 'reset_peak')
+        self.times = {}
+        self.peaks = {}
+        self.max_peak = 0
+        self._patched = []
+
+    def patch(self, stage, owner, name):
+        original = getattr(owner, name, None)
+        if original is None:
+            return
+        recorder = self
+
+        def wrapper(*args, **kwargs):
+            if recorder.trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                recorder.max_peak = max(recorder.max_peak, peak)
+                tracemalloc.reset_peak()
+            start = time.time()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                recorder.times[stage] = recorder.times.get(stage, 0.0) + time.time() - start
+                if recorder.trace_memory:
+                    __, peak = tracemalloc.get_traced_memory()
+                    recorder.max_peak = max(recorder.max_peak, peak)
+                    recorder.peaks[stage] = max(recorder.peaks.get(stage, 0), peak - current)
+        self._patched.append((owner, name, original))
+        setattr(owner, name, wrapper)
+
+    def restore(self):
+        for owner, name, original in reversed(self._patched):
+            setattr(owner, name, original)
+        self._patched = []
+
+
+def _patch_stages(recorder, fmt, uploader, comic):
+    '''The stages of every parser, parsers which are not available are skipped by StageRecorder.patch.'''
+    if fmt in ('epub', 'fb2'):
+        epub = uploader._epub() if fmt == 'epub' else uploader._fb2()
+        if epub:
+            recorder.patch('xml parsing', epub.etree, 'fromstring')
+        if fmt == 'epub' and epub:
+            recorder.patch('cover extraction', epub, 'extractCover')
+            recorder.patch('language lookup', epub.isoLanguages, 'get')
+    elif fmt == 'pdf':
+        pdf_reader = uploader._pdf_reader()
+        if pdf_reader:
+            recorder.patch('pdf parsing', pdf_reader[0], '__init__')
+            recorder.patch('document info', pdf_reader[0], 'getDocumentInfo')
+        recorder.patch('cover rendering', uploader, 'pdf_preview')
+    else:
+        recorder.patch('cover extraction', comic, 'extractCover')
+        if comic.comic_api():
+            recorder.patch('comic metadata', comic.comic_api()[0], 'readMetadata')
+
+
+def _rss_peak():
+    if resource is None:
+        return None
+    # kilobytes on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _setup_cps(settings_dir):
+    # cps reads the location of its databases from the command line when it's imported
+    sys.argv = [sys.argv[0], '-p', os.path.join(settings_dir, 'app.db'),
+                '-g', os.path.join(settings_dir, 'gdrive.db')]
+    sys.path.insert(0, BASE_DIR)
+    sys.path.insert(1, os.path.join(BASE_DIR, 'vendor'))
+    from cps import uploader, comic, logger
+    logger.setup(logger.LOG_TO_STDERR, logger.logging.WARNING)
+    return uploader, comic
+
+
+def parse_book(settings_dir, fmt, path, repeat, results):
+    '''Runs in a new process, so the resident set size belongs to this book only.'''
+    uploader, comic = _setup_cps(settings_dir)
+    loaded = {'epub': uploader._epub, 'fb2': uploader._fb2, 'pdf': uploader._pdf_reader,
+              'cbz': comic.comic_api, 'cbt': comic.comic_api}[fmt]()
+    work_dir = tempfile.mkdtemp(prefix='cw-parse-')
+    try:
+        # the parsers write covers next to the book, keep them out of the corpus
+        book = os.path.join(work_dir, os.path.basename(path))
+        try:
+            os.symlink(path, book)
+        except (AttributeError, OSError):
+            shutil.copy(path, book)
+        extension = '.' + fmt
+
+        durations = []
+        stages = {}
+        meta = None
+        for __ in range(repeat):
+            recorder = StageRecorder(False)
+            _patch_stages(recorder, fmt, uploader, comic)
+            start = time.time()
+            try:
+                meta = uploader._parse_metadata(book, 'original', extension)
+            finally:
+                durations.append(time.time() - start)
+                recorder.restore()
+            for stage, duration in recorder.times.items():
+                stages.setdefault(stage, []).append(duration)
+
+        # a separate run for memory, tracing slows everything down
+        rss_before = _rss_peak()
+        recorder = StageRecorder(True)
+        _patch_stages(recorder, fmt, uploader, comic)
+        if tracemalloc:
+            tracemalloc.start()
+        try:
+            uploader._parse_metadata(book, 'original', extension)
+        finally:
+            recorder.restore()
+            if tracemalloc:
+                peak = max(tracemalloc.get_traced_memory()[1], recorder.max_peak)
+                tracemalloc.stop()
+            else:
+                peak = None
+        rss_after = _rss_peak()
+
+        durations.sort()
+        results.put({
+            'library': bool(loaded),
+            'title': meta.title if meta else None,
+            'cover': bool(meta and meta.cover),
+            'min': durations[0],
+            'median': durations[len(durations) // 2],
+            'stages': dict((stage, sorted(values)[len(values) // 2]) for stage, values in stages.items()),
+            'peak': peak,
+            'stage_peaks': recorder.peaks,
+            'rss_growth': rss_after - rss_before if rss_before is not None else None,
+        })
+    except Exception as ex:
+        results.put({'error': '%s: %s' % (type(ex).__name__, ex)})
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def _mb(value):
+    return '%7.1fMB' % (value / 1024 / 1024) if value is not None else '%9s' % '-'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time and memory of the metadata parsers used for uploads')
+    parser.add_argument('--corpus', default=os.path.join(tempfile.gettempdir(), 'cw-parser-corpus'),
+                        help='directory of the generated books, reused by later runs')
+    parser.add_argument('--sizes', default='small,medium', help='comma separated: small, medium, large')
+    parser.add_argument('--formats', default='epub,fb2,pdf,cbz,cbt', help='comma separated formats')
+    parser.add_argument('--repeat', type=int, default=3, help='timed parses per book')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--regenerate', action='store_true', help='write the corpus again')
+    parser.add_argument('--settings-dir', help='directory of app.db (default a temporary directory)')
+    parser.add_argument('--json', help='save the results as json file')
+    args = parser.parse_args()
+
+    books = build_corpus(args.corpus, args.sizes.split(','), args.formats.split(','), args.seed, args.regenerate)
+    settings_dir = args.settings_dir or tempfile.mkdtemp(prefix='cw-bench-')
+    results = []
+    try:
+        for size, fmt, path in books:
+            queue = multiprocessing.Queue()
+            process = multiprocessing.Process(target=parse_book, args=(settings_dir, fmt, path, args.repeat, queue))
+            process.start()
+            result = queue.get()
+            process.join()
+            result.update(size=size, format=fmt, file_size=os.path.getsize(path))
+            results.append(result)
+    finally:
+        if not args.settings_dir:
+            shutil.rmtree(settings_dir, ignore_errors=True)
+
+    print('%-8s %-5s %9s %9s %9s %9s %9s  %s' % ('size', 'fmt', 'file', 'median', 'min', 'py peak', 'rss +',
+                                                 'stages (median, py peak)'))
+    for result in results:
+        if 'error' in result:
+            print('%-8s %-5s %s' % (result['size'], result['format'], result['error']))
+            continue
+        stages = ', '.join('%s %.1fms%s' % (stage, duration * 1000,
+                                            ' %.1fMB' % (result['stage_peaks'][stage] / 1024 / 1024)
+                                            if stage in result['stage_peaks'] else '')
+                           for stage, duration in sorted(result['stages'].items()))
+        if not result['library']:
+            stages = 'parser library not installed, %s' % (stages or 'no stages')
+        print('%-8s %-5s %s %7.1fms %7.1fms %s %s  %s' % (
+            result['size'], result['format'], _mb(result['file_size']), result['median'] * 1000,
+            result['min'] * 1000, _mb(result['peak']), _mb(result['rss_growth']), stages))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
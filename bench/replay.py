@@ -0,0 +1,283 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Replays the requests of a Calibre-Web access log against a test instance.
+
+Both the gevent and the tornado access log format are read. The requests are sent with the timing of
+the log (divided by --speedup, 0 sends them as fast as the clients can), client addresses of the log
+are mapped to the given users, which log in with basic authentication:
+
+    python bench/replay.py access.log http://localhost:8083 --user alice:secret --user bob:secret \\
+        --concurrency 32 --speedup 4
+
+Only GET and HEAD requests are replayed, requests changing the library or the settings (deleting
+books, editing shelves, shutdown, ...) are skipped, see --exclude.
+"""
+
+from __future__ import division, print_function, unicode_literals
+import argparse
+import json
+import re
+import threading
+import time
+from collections import namedtuple, OrderedDict
+from datetime import datetime
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+import requests
+
+
+# 127.0.0.1 - - [2020-05-01 12:00:00] "GET /opds HTTP/1.1" 200 1234 0.012345
+GEVENT_LINE = re.compile(r'^(?P<client>\S+) - - \[(?P<time>[^\]]+)\] "(?P<method>[A-Z]+) (?P<path>\S+)[^"]*" '
+                         r'(?P<status>\d{3}) \S+ (?P<duration>[\d.]+)')
+# [2020-05-01 12:00:00,123] 200 GET /opds (127.0.0.1) 12.34ms
+TORNADO_LINE = re.compile(r'^\[(?P<time>[^\]]+)\] (?P<status>\d{3}) (?P<method>[A-Z]+) (?P<path>\S+) '
+                          r'\((?P<client>[^)]*)\) (?P<duration>[\d.]+)ms')
+
+DEFAULT_METHODS = 'GET,HEAD'
+DEFAULT_EXCLUDE = (r'^/(shutdown|logout|reconnect|delete/|send/|shelf/(add|massadd|remove|delete)/|gdrive/|admin/'
+                   r'|ajax/(toggle|delete|canceltask)|import_ldap_users)')
+
+_NUMBER = re.compile(r'^\d+$')
+
+Entry = namedtuple('Entry', 'offset, client, method, path, status, duration')
+
+
+def _parse_time(value):
+    for time_format in ('%Y-%m-%d %H:%M:%S,%f', '%Y-%m-%d %H:%M:%S'):
+        try:
+            return datetime.strptime(value, time_format)
+        except ValueError:
+            pass
+    return None
+
+
+def parse_line(line):
+    '''Returns (time, client, method, path, status, duration in seconds) of a log line, None if it's no request.'''
+    match = GEVENT_LINE.match(line)
+    if match:
+        duration = float(match.group('duration'))
+    else:
+        match = TORNADO_LINE.match(line)
+        if not match:
+            return None
+        duration = float(match.group('duration')) / 1000
+    return (_parse_time(match.group('time')), match.group('client'), match.group('method'), match.group('path'),
+            int(match.group('status')), duration)
+
+
+def read_log(filenames, methods, exclude, limit=None):
+    entries = []
+    start = None
+    skipped = 0
+    for filename in filenames:
+        with open(filename) as f:
+            for line in f:
+                parsed = parse_line(line)
+                if parsed is None:
+                    continue
+                logged, client, method, path, status, duration = parsed
+                if method not in methods or exclude.search(path):
+                    skipped += 1
+                    continue
+                if start is None:
+                    start = logged
+                # lines without a readable time are sent together with the previous one
+                offset = (logged - start).total_seconds() if logged and start else \
+                    (entries[-1].offset if entries else 0)
+                entries.append(Entry(max(offset, 0), client, method, path, status, duration))
+                if limit and len(entries) >= limit:
+                    return entries, skipped
+    return entries, skipped
+
+
+def endpoint(method, path):
+    '''Groups requests by route: ids become <id>, search terms <term>, static files are one group.'''
+    path = path.split('?', 1)[0]
+    if path.startswith('/static/'):
+        return method + ' /static/*'
+    segments = path.split('/')
+    for index, segment in enumerate(segments):
+        if _NUMBER.match(segment):
+            segments[index] = '<id>'
+        elif index and segments[index - 1] == 'search' and segment:
+            segments[index] = '<term>'
+    return method + ' ' + '/'.join(segments)
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+class Replay(object):
+    def __init__(self, base_url, entries, users, concurrency, speedup, timeout=60):
+        self.base_url = base_url.rstrip('/')
+        self.entries = entries
+        self.users = users or [None]
+        self.concurrency = concurrency
+        self.speedup = speedup
+        self.timeout = timeout
+        self.results = []
+        self.lag = []
+        self._lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=concurrency * 2)
+        self._clients = {}
+        self._local = threading.local()
+
+    def _user(self, client):
+        # the same client of the log is always the same user, so per user caches behave as in production
+        with self._lock:
+            if client not in self._clients:
+                self._clients[client] = self.users[len(self._clients) % len(self.users)]
+            return self._clients[client]
+
+    def _session(self, user):
+        sessions = getattr(self._local, 'sessions', None)
+        if sessions is None:
+            sessions = self._local.sessions = {}
+        if user not in sessions:
+            sessions[user] = requests.Session()
+            sessions[user].auth = user
+        return sessions[user]
+
+    def _send(self, entry):
+        session = self._session(self._user(entry.client))
+        start = time.time()
+        try:
+            response = session.request(entry.method, self.base_url + entry.path, timeout=self.timeout,
+                                       allow_redirects=False)
+            status = response.status_code
+        except requests.RequestException as ex:
+            status = type(ex).__name__
+        duration = time.time() - start
+        with self._lock:
+            self.results.append((endpoint(entry.method, entry.path), status, duration, entry))
+
+    def _worker(self):
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                return
+            self._send(entry)
+
+    def run(self):
+        workers = [threading.Thread(target=self._worker) for __ in range(self.concurrency)]
+        for worker in workers:
+            worker.daemon = True
+            worker.start()
+        start = time.time()
+        for entry in self.entries:
+            if self.speedup:
+                due = start + entry.offset / self.speedup
+                delay = due - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+                # behind schedule, all clients are busy with slower responses than in the log
+                self.lag.append(max(-delay, 0))
+            self._queue.put(entry)
+        for __ in workers:
+            self._queue.put(None)
+        for worker in workers:
+            worker.join()
+        return time.time() - start
+
+
+def summarize(results, elapsed):
+    groups = OrderedDict()
+    for name, status, duration, entry in sorted(results, key=lambda r: r[0]):
+        groups.setdefault(name, []).append((status, duration, entry))
+
+    def stats(items):
+        durations = [duration for __, duration, __ in items]
+        errors = sum(1 for status, __, __ in items if not isinstance(status, int) or status >= 500)
+        changed = sum(1 for status, __, entry in items if status != entry.status)
+        return {
+            'requests': len(items),
+            'throughput': len(items) / elapsed if elapsed else 0.0,
+            'p50': percentile(durations, 50),
+            'p95': percentile(durations, 95),
+            'p99': percentile(durations, 99),
+            'logged_p50': percentile([entry.duration for __, __, entry in items], 50),
+            'error_rate': errors / len(items),
+            'changed_status': changed,
+        }
+
+    return stats([item for items in groups.values() for item in items]), \
+        OrderedDict((name, stats(items)) for name, items in groups.items())
+
+
+def print_summary(total, endpoints, elapsed, lag, skipped):
+    print('%d requests in %.1fs: %.1f req/s, error rate %.2f%%, %d with another status than logged'
+          % (total['requests'], elapsed, total['throughput'], total['error_rate'] * 100, total['changed_status']))
+    print('latency p50 %.1fms  p95 %.1fms  p99 %.1fms (logged p50 %.1fms), %d log entries skipped'
+          % (total['p50'] * 1000, total['p95'] * 1000, total['p99'] * 1000, total['logged_p50'] * 1000, skipped))
+    if lag:
+        print('behind the log schedule: p95 %.1fms, max %.1fms' % (percentile(lag, 95) * 1000, max(lag) * 1000))
+    print('\n%-45s %7s %8s %9s %9s %9s %9s %7s' % ('endpoint', 'count', 'req/s', 'p50', 'p95', 'p99', 'logged',
+                                                   'errors'))
+    for name, result in sorted(endpoints.items(), key=lambda e: e[1]['requests'], reverse=True):
+        print('%-45s %7d %8.1f %7.1fms %7.1fms %7.1fms %7.1fms %6.1f%%' % (
+            name[:45], result['requests'], result['throughput'], result['p50'] * 1000, result['p95'] * 1000,
+            result['p99'] * 1000, result['logged_p50'] * 1000, result['error_rate'] * 100))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay a Calibre-Web access log against a test instance')
+    parser.add_argument('logfile', nargs='+', help='access log(s) of the gevent or tornado server, oldest first')
+    parser.add_argument('url', help='base url of the test instance, e.g. http://localhost:8083')
+    parser.add_argument('--user', action='append', default=[],
+                        help='user:password for basic authentication, repeat for several users')
+    parser.add_argument('--concurrency', type=int, default=16, help='number of parallel clients')
+    parser.add_argument('--speedup', type=float, default=1.0,
+                        help='replay the log this many times faster, 0 sends without pauses')
+    parser.add_argument('--limit', type=int, help='replay at most this many requests')
+    parser.add_argument('--methods', default=DEFAULT_METHODS, help='replayed request methods (default GET,HEAD)')
+    parser.add_argument('--exclude', default=DEFAULT_EXCLUDE, help='regular expression of paths not replayed')
+    parser.add_argument('--timeout', type=float, default=60, help='timeout per request in seconds')
+    parser.add_argument('--json', help='save the results as json file')
+    args = parser.parse_args()
+
+    entries, skipped = read_log(args.logfile, args.methods.upper().split(','), re.compile(args.exclude),
+                                args.limit)
+    if not entries:
+        raise SystemExit('No requests to replay in %s' % ', '.join(args.logfile))
+    users = [tuple(user.split(':', 1)) for user in args.user]
+
+    replay = Replay(args.url, entries, users, args.concurrency, args.speedup, args.timeout)
+    elapsed = replay.run()
+    total, endpoints = summarize(replay.results, elapsed)
+    print_summary(total, endpoints, elapsed, replay.lag, skipped)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'url': args.url, 'logfiles': args.logfile, 'concurrency': args.concurrency,
+                       'speedup': args.speedup, 'elapsed': elapsed, 'total': total, 'endpoints': endpoints},
+                      f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
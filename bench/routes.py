@@ -0,0 +1,287 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Measures latency and database queries of the main routes with the Flask test client.
+
+No server is started, the application runs in this process against a calibre library (e.g. one made
+with generate_library.py) and a fresh settings database in a temporary directory:
+
+    python bench/generate_library.py /tmp/library-10k --books 10000
+    python bench/routes.py /tmp/library-10k --save-baseline baseline-10k.json
+    # change something
+    python bench/routes.py /tmp/library-10k --baseline baseline-10k.json
+
+With --baseline, routes which got slower than the tolerance or run more queries are reported and the
+exit code is 1.
+"""
+
+from __future__ import division, print_function, unicode_literals
+import argparse
+import base64
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def sample_library(library):
+    '''Picks ids and words for the routes from the library, preferring well populated ones.'''
+    conn = sqlite3.connect(os.path.join(library, 'metadata.db'))
+    try:
+        def scalar(sql, default=None):
+            row = conn.execute(sql).fetchone()
+            return row[0] if row and row[0] is not None else default
+
+        sample = {
+            'books': scalar('SELECT count(*) FROM books', 0),
+            'book': scalar('SELECT id FROM books WHERE has_cover = 1 ORDER BY id LIMIT 1',
+                           scalar('SELECT min(id) FROM books', 1)),
+            'author': scalar('SELECT author FROM books_authors_link GROUP BY author ORDER BY count(*) DESC LIMIT 1', 1),
+            'tag': scalar('SELECT tag FROM books_tags_link GROUP BY tag ORDER BY count(*) DESC LIMIT 1', 1),
+            'series': scalar('SELECT series FROM books_series_link GROUP BY series ORDER BY count(*) DESC LIMIT 1', 1),
+        }
+        download = conn.execute('SELECT book, lower(format) FROM data ORDER BY book LIMIT 1').fetchone()
+        sample['download'] = download or (sample['book'], 'epub')
+        # the most common word of the titles, a search with many results
+        words = {}
+        for (title,) in conn.execute('SELECT title FROM books LIMIT 5000'):
+            for word in title.split():
+                if len(word) > 3:
+                    words[word.lower()] = words.get(word.lower(), 0) + 1
+        sample['word'] = max(words, key=words.get) if words else 'the'
+        return sample
+    finally:
+        conn.close()
+
+
+def build_routes(sample):
+    '''(name, path, opds) tuples, opds routes are requested with basic authentication.'''
+    book_id, fmt = sample['download']
+    return [
+        ('index', '/', False),
+        ('index_page_5', '/page/5', False),
+        ('books_abc', '/abc/stored/', False),
+        ('author_list', '/author', False),
+        # page 1 of author 1 is redirected to /author/stored/, the default arguments of the route
+        ('author_books_page_2', '/author/stored/%d/2' % sample['author'], False),
+        ('category_list', '/category', False),
+        ('series_list', '/series', False),
+        ('search', '/search?query=%s' % sample['word'], False),
+        # the search form always sends these fields, even if they are empty
+        ('advanced_search', '/advanced_search?author_name=&publisher=&book_title=%s&include_tag=%d'
+         % (sample['word'], sample['tag']), False),
+        ('cover', '/cover/%d' % sample['book'], False),
+        ('download', '/download/%d/%s' % (book_id, fmt), False),
+        ('opds_root', '/opds', True),
+        ('opds_new', '/opds/new', True),
+        ('opds_author_list', '/opds/author', True),
+        ('opds_author_books', '/opds/author/%d' % sample['author'], True),
+        ('opds_series_books', '/opds/series/%d' % sample['series'], True),
+        ('opds_search', '/opds/search/%s' % sample['word'], True),
+        ('opds_download', '/opds/download/%d/%s/' % (book_id, fmt), True),
+    ]
+
+
+class QueryCounter(object):
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def attach(self, engine):
+        from sqlalchemy import event
+        event.listen(engine, 'after_cursor_execute', self)
+
+
+def setup_app(library, settings_dir):
+    # cps reads the location of its databases from the command line when it's imported
+    sys.argv = [sys.argv[0], '-p', os.path.join(settings_dir, 'app.db'),
+                '-g', os.path.join(settings_dir, 'gdrive.db')]
+    sys.path.insert(0, BASE_DIR)
+    sys.path.insert(1, os.path.join(BASE_DIR, 'vendor'))
+
+    from cps import create_app, config, db, ub, logger
+    from cps.opds import opds
+    from cps.web import web
+    from cps.jinjia import jinjia
+    from cps.about import about
+    from cps.shelf import shelf
+    from cps.admin import admi
+    from cps.gdrive import gdrive
+    from cps.editbooks import editbook
+
+    app = create_app()
+    for blueprint in (web, opds, jinjia, about, shelf, admi, gdrive, editbook):
+        app.register_blueprint(blueprint)
+    # the request log of every benchmark request would dominate the output
+    logger.setup(logger.LOG_TO_STDERR, logger.logging.WARNING)
+
+    config.config_calibre_dir = os.path.abspath(library)
+    config.save()
+    if not db.setup_db(config):
+        raise SystemExit('%s is not a calibre library' % library)
+
+    counter = QueryCounter()
+    counter.attach(db.engine)
+    counter.attach(ub.session.bind)
+    return app, counter
+
+
+def measure(client, path, headers, counter, repeat, warmup):
+    for __ in range(warmup):
+        client.get(path, headers=headers)
+    latencies = []
+    queries = []
+    statuses = {}
+    for __ in range(repeat):
+        counter.count = 0
+        start = time.time()
+        response = client.get(path, headers=headers)
+        # covers and downloads are streamed, the response has to be consumed to be complete
+        response.get_data()
+        latencies.append(time.time() - start)
+        queries.append(counter.count)
+        response.close()
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+    return {
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99),
+        'mean': sum(latencies) / len(latencies),
+        'queries': sum(queries) / len(queries),
+        'statuses': dict((str(k), v) for k, v in statuses.items()),
+    }
+
+
+def compare(results, baseline, tolerance):
+    '''Returns the regressions against the baseline as readable lines.'''
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if result['p50'] > base['p50'] * (1 + tolerance):
+            regressions.append('%s: p50 %.1fms -> %.1fms (%+.0f%%)' % (
+                name, base['p50'] * 1000, result['p50'] * 1000, (result['p50'] / base['p50'] - 1) * 100))
+        if result['p95'] > base['p95'] * (1 + tolerance):
+            regressions.append('%s: p95 %.1fms -> %.1fms (%+.0f%%)' % (
+                name, base['p95'] * 1000, result['p95'] * 1000, (result['p95'] / base['p95'] - 1) * 100))
+        if result['queries'] > base['queries']:
+            regressions.append('%s: queries %.1f -> %.1f' % (name, base['queries'], result['queries']))
+        if set(result['statuses']) != set(base['statuses']):
+            regressions.append('%s: status codes %s -> %s' % (name, sorted(base['statuses']),
+                                                              sorted(result['statuses'])))
+    return regressions
+
+
+def print_results(results, baseline):
+    print('%-20s %9s %9s %9s %8s  %s' % ('route', 'p50', 'p95', 'p99', 'queries', 'status'))
+    for name, result in results.items():
+        line = '%-20s %7.1fms %7.1fms %7.1fms %8.1f  %s' % (
+            name, result['p50'] * 1000, result['p95'] * 1000, result['p99'] * 1000, result['queries'],
+            ','.join(sorted(result['statuses'])))
+        base = baseline.get(name)
+        if base and base['p50']:
+            line += '  (p50 %+.0f%%, queries %+.1f)' % ((result['p50'] / base['p50'] - 1) * 100,
+                                                       result['queries'] - base['queries'])
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Latency and queries of the main Calibre-Web routes')
+    parser.add_argument('library', help='calibre library directory')
+    parser.add_argument('--requests', type=int, default=20, help='measured requests per route')
+    parser.add_argument('--warmup', type=int, default=2, help='requests per route before measuring')
+    parser.add_argument('--routes', help='comma separated names of the routes to measure (default all)')
+    parser.add_argument('--baseline', help='json file of an earlier run to compare with')
+    parser.add_argument('--save-baseline', help='save the results as json file')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='allowed slowdown against the baseline (default 0.2 = 20%%)')
+    parser.add_argument('--settings-dir', help='directory of app.db (default a temporary directory)')
+    parser.add_argument('--user', default='admin:admin123', help='user:password to log in with')
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['routes']
+
+    sample = sample_library(args.library)
+    routes = build_routes(sample)
+    if args.routes:
+        names = args.routes.split(',')
+        routes = [route for route in routes if route[0] in names]
+
+    settings_dir = args.settings_dir or tempfile.mkdtemp(prefix='cw-bench-')
+    try:
+        app, counter = setup_app(args.library, settings_dir)
+        username, password = args.user.split(':', 1)
+        basic_auth = {'Authorization': 'Basic ' + base64.b64encode(
+            ('%s:%s' % (username, password)).encode('utf-8')).decode('ascii')}
+
+        results = {}
+        with app.test_client() as client:
+            response = client.post('/login', data={'username': username, 'password': password,
+                                                       'next': '/'})
+            if response.status_code != 302:
+                raise SystemExit('Login as %s failed' % username)
+            for name, path, opds in routes:
+                results[name] = measure(client, path, basic_auth if opds else None, counter,
+                                        args.requests, args.warmup)
+                results[name]['path'] = path
+    finally:
+        if not args.settings_dir:
+            shutil.rmtree(settings_dir, ignore_errors=True)
+
+    print('%s: %d books, %d requests per route' % (args.library, sample['books'], args.requests))
+    print_results(results, baseline)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump({'library': os.path.abspath(args.library), 'books': sample['books'],
+                       'python': platform.python_version(), 'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+                       'routes': results}, f, indent=2, sort_keys=True)
+
+    if baseline:
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print('\nRegressions against %s:' % args.baseline)
+            print('\n'.join('  ' + line for line in regressions))
+            sys.exit(1)
+        print('\nNo regressions against %s' % args.baseline)
+
+
+if __name__ == '__main__':
+    main()
@@ -20,6 +20,85 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 import sys
 import os
+import time
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+try:
+    from thread import get_ident
+except ImportError:
+    from threading import get_ident
+
+
+class StartupProfiler(object):
+    '''Measures the import time of every module loaded during startup and the time until the first request.
+
+    Enabled with the --profile-startup command line option, it has to be installed before anything of
+    calibre-web is imported.
+    '''
+    def __init__(self):
+        self.start = time.time()
+        self.imports_done = None
+        self.timings = {}
+        self._stack = []
+        self._thread = get_ident()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    @staticmethod
+    def _resolve_name(name, globals_, level):
+        if not level or not globals_:
+            return name
+        package = globals_.get('__package__') or globals_.get('__name__', '')
+        if '__path__' not in globals_ and not globals_.get('__package__'):
+            package = package.rpartition('.')[0]
+        base = package.rsplit('.', level - 1)[0]
+        return base + '.' + name if name else base
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if get_ident() != self._thread:
+            return self._original_import(name, globals, locals, fromlist, level)
+        module_name = self._resolve_name(name, globals, level)
+        new_modules = [module_name] if module_name not in sys.modules else []
+        for item in fromlist or ():
+            if item != '*' and module_name + '.' + item not in sys.modules:
+                new_modules.append(module_name + '.' + item)
+        if not new_modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        self._stack.append(0.0)
+        started = time.time()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.time() - started
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            # names from the fromlist may be attributes instead of submodules
+            key = ', '.join(m for m in new_modules if m in sys.modules) or module_name
+            cumulated, own = self.timings.get(key, (0.0, 0.0))
+            self.timings[key] = (cumulated + elapsed, own + elapsed - children)
+
+    def stop_imports(self):
+        builtins.__import__ = self._original_import
+        self.imports_done = time.time()
+
+    def report_imports(self, limit=30):
+        lines = ['Startup import profile (%d modules, %.3f s until application was created):'
+                 % (len(self.timings), self.imports_done - self.start),
+                 '%10s %10s  %s' % ('cumulated', 'self', 'module')]
+        for key, (cumulated, own) in sorted(self.timings.items(), key=lambda x: x[1][0], reverse=True)[:limit]:
+            lines.append('%9.1fms %9.1fms  %s' % (cumulated * 1000, own * 1000, key))
+        print('\n'.join(lines), file=sys.stderr)
+
+    def report_first_request(self):
+        print('Time to first request: %.3f s' % (time.time() - self.start), file=sys.stderr)
+
+
+# has to be evaluated before calibre-web is imported to catch all imports
+startup_profiler = StartupProfiler() if '--profile-startup' in sys.argv else None
 
 
 # Insert local directories into path
@@ -60,6 +139,10 @@ def main():
     app.register_blueprint(editbook)
     if oauth_available:
         app.register_blueprint(oauth)
+    if startup_profiler:
+        startup_profiler.stop_imports()
+        startup_profiler.report_imports()
+        app.before_first_request(startup_profiler.report_first_request)
     success = web_server.start()
     sys.exit(0 if success else 1)
 
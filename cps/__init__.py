@@ -33,9 +33,13 @@ from flask_login import LoginManager
 from flask_babel import Babel
 from flask_principal import Principal
 
-from . import logger, cache_buster, cli, config_sql, ub, db, services
+from . import logger, cache_buster, cli, config_sql, ub, db, services, constants, metrics, query_monitor, \
+    shared_state
 from .reverseproxy import ReverseProxied
 from .server import WebServer
+from .search_store import SearchResultStore
+from .credential_cache import CredentialCache
+from .user_cache import UserCache
 
 
 mimetypes.init()
@@ -67,7 +71,9 @@ ub.init_db(cli.settingspath)
 # pylint: disable=no-member
 config = config_sql.load_configuration(ub.session)
 
-searched_ids = {}
+searched_ids = SearchResultStore()
+basic_auth_cache = CredentialCache()
+cached_users = UserCache()
 web_server = WebServer()
 
 babel = Babel()
@@ -77,7 +83,10 @@ log = logger.create()
 
 
 def create_app():
-    app.wsgi_app = ReverseProxied(app.wsgi_app)
+    app.wsgi_app = metrics.MetricsMiddleware(ReverseProxied(app.wsgi_app))
+    app.before_request(reload_config)
+    app.before_request(metrics.record_endpoint)
+    app.teardown_request(query_monitor.check_request)
     # For python2 convert path to unicode
     if sys.version_info < (3, 0):
         app.static_folder = app.static_folder.decode('utf-8')
@@ -92,21 +101,39 @@ def create_app():
     app.secret_key = os.getenv('SECRET_KEY', 'A0Zr98j/3yX R~XHH!jmN]LWX/,?RT')
 
     web_server.init_app(app, config)
-    db.setup_db(config)
+    query_monitor.configure(config.config_slow_query_threshold, config.config_repeated_query_limit)
+    if db.setup_db(config):
+        # built before the server processes are forked, so they share it until the library changes
+        from .catalog import catalog
+        catalog.refresh()
+        db.session.remove()
 
     babel.init_app(app)
     _BABEL_TRANSLATIONS.update(str(item) for item in babel.list_translations())
     _BABEL_TRANSLATIONS.add('en')
 
-    if services.ldap:
+    # optional services are only imported if they are configured
+    if config.config_login_type == constants.LOGIN_LDAP and services.ldap:
         services.ldap.init_app(app, config)
-    if services.goodreads_support:
+    if config.config_use_goodreads and services.goodreads_support:
         services.goodreads_support.connect(config.config_goodreads_api_key,
                                            config.config_goodreads_api_secret,
                                            config.config_use_goodreads)
 
     return app
 
+
+def reload_config():
+    '''Loads the configuration again if another process of the pre-fork server saved it.'''
+    if not shared_state.config_outdated():
+        return
+    calibre_dir = config.config_calibre_dir
+    config.reload()
+    query_monitor.configure(config.config_slow_query_threshold, config.config_repeated_query_limit)
+    if config.config_calibre_dir != calibre_dir:
+        db.setup_db(config)
+    log.debug('Configuration saved by another process loaded')
+
 @babel.localeselector
 def get_locale():
     # if a user is logged in, use the locale from the user settings
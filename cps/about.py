@@ -48,28 +48,34 @@ from . import services
 about = flask.Blueprint('about', __name__)
 
 
-_VERSIONS = OrderedDict(
-    Platform = ' '.join(platform.uname()),
-    Python=sys.version,
-    WebServer=server.VERSION,
-    Flask=flask.__version__,
-    Flask_Login=flask_loginVersion,
-    Flask_Principal=flask_principal.__version__,
-    Werkzeug=werkzeug.__version__,
-    Babel=babel.__version__,
-    Jinja2=jinja2.__version__,
-    Requests=requests.__version__,
-    SqlAlchemy=sqlalchemy.__version__,
-    pySqlite=sqlite3.version,
-    SQLite=sqlite3.sqlite_version,
-    iso639=isoLanguages.__version__,
-    pytz=pytz.__version__,
-    Unidecode = unidecode_version,
-    Flask_SimpleLDAP =  u'installed' if bool(services.ldap) else u'not installed',
-    Goodreads = u'installed' if bool(services.goodreads_support) else u'not installed',
+_VERSIONS = OrderedDict()
 
-)
-_VERSIONS.update(uploader.get_versions())
+
+def _get_versions():
+    # collecting the versions imports all optional libraries, so it's done on the first visit of the stats page
+    if not _VERSIONS:
+        _VERSIONS.update(OrderedDict(
+            Platform = ' '.join(platform.uname()),
+            Python=sys.version,
+            WebServer=server.VERSION,
+            Flask=flask.__version__,
+            Flask_Login=flask_loginVersion,
+            Flask_Principal=flask_principal.__version__,
+            Werkzeug=werkzeug.__version__,
+            Babel=babel.__version__,
+            Jinja2=jinja2.__version__,
+            Requests=requests.__version__,
+            SqlAlchemy=sqlalchemy.__version__,
+            pySqlite=sqlite3.version,
+            SQLite=sqlite3.sqlite_version,
+            iso639=isoLanguages.__version__,
+            pytz=pytz.__version__,
+            Unidecode = unidecode_version,
+            Flask_SimpleLDAP =  u'installed' if bool(services.ldap) else u'not installed',
+            Goodreads = u'installed' if bool(services.goodreads_support) else u'not installed',
+        ))
+        _VERSIONS.update(uploader.get_versions())
+    return _VERSIONS
 
 
 @about.route("/stats")
@@ -79,6 +85,7 @@ def stats():
     authors = db.session.query(db.Authors).count()
     categorys = db.session.query(db.Tags).count()
     series = db.session.query(db.Series).count()
-    _VERSIONS['ebook converter'] = _(converter.get_version())
-    return render_title_template('stats.html', bookcounter=counter, authorcounter=authors, versions=_VERSIONS,
+    versions = _get_versions()
+    versions['ebook converter'] = _(converter.get_version())
+    return render_title_template('stats.html', bookcounter=counter, authorcounter=authors, versions=versions,
                                  categorycounter=categorys, seriecounter=series, title=_(u"Statistics"), page="stat")
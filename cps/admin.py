@@ -37,8 +37,8 @@ from sqlalchemy import and_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.sql.expression import func
 
-from . import constants, logger, helper, services
-from . import db, ub, web_server, get_locale, config, updater_thread, babel, gdriveutils
+from . import constants, logger, helper, services, metrics, worker, query_monitor, profiler, memory
+from . import db, ub, web_server, get_locale, config, updater_thread, babel, gdriveutils, basic_auth_cache
 from .helper import speaking_language, check_valid_domain, send_test_mail, reset_password, generate_password_hash
 from .gdriveutils import is_gdrive_ready, gdrive_support
 from .web import admin_required, render_title_template, before_request, unconfigured, login_required_if_no_ano
@@ -293,6 +293,11 @@ def _configuration_update_helper():
         gdriveutils.deleteDatabaseOnChange()
 
     reboot_required |= _config_int("config_port")
+    reboot_required |= _config_int("config_max_concurrency")
+    reboot_required |= _config_int("config_request_queue_size")
+    reboot_required |= _config_int("config_download_concurrency")
+    reboot_required |= _config_int("config_blocking_threshold")
+    reboot_required |= _config_int("config_server_processes")
 
     reboot_required |= _config_string("config_keyfile")
     if config.config_keyfile and not os.path.isfile(config.config_keyfile):
@@ -389,6 +394,11 @@ def _configuration_update_helper():
     if not logger.is_valid_logfile(config.config_access_logfile):
         return _configuration_result('Access Logfile location is not valid, please enter correct path', gdriveError)
 
+    _config_int("config_slow_query_threshold")
+    _config_int("config_repeated_query_limit")
+    query_monitor.configure(config.config_slow_query_threshold, config.config_repeated_query_limit)
+    _config_string("config_profile_dir")
+
     # Rarfile Content configuration
     _config_string("config_rarfile_location")
     unrar_status = helper.check_unrar(config.config_rarfile_location)
@@ -568,6 +578,7 @@ def edit_user(user_id):
                                                          ub.User.id != content.id)).count():
                 ub.session.query(ub.User).filter(ub.User.id == content.id).delete()
                 ub.session.commit()
+                basic_auth_cache.invalidate(content.id)
                 flash(_(u"User '%(nick)s' deleted", nick=content.nickname), category="success")
                 return redirect(url_for('admin.admin'))
             else:
@@ -634,6 +645,7 @@ def edit_user(user_id):
                 content.kindle_mail = to_save["kindle_mail"]
         try:
             ub.session.commit()
+            basic_auth_cache.invalidate(content.id)
             flash(_(u"User '%(nick)s' updated", nick=content.nickname), category="success")
         except IntegrityError:
             ub.session.rollback()
@@ -691,6 +703,91 @@ def send_logfile(logtype):
         return ""
 
 
+@admi.route("/admin/profiles")
+@login_required
+@admin_required
+def view_profiles():
+    return render_title_template("profiles.html", title=_(u"Request profiles"), page="profiles",
+                                 profiles=profiler.list_profiles(config.config_profile_dir),
+                                 profile_dir=profiler.get_profile_dir(config.config_profile_dir))
+
+
+@admi.route("/admin/profiles/<name>")
+@login_required
+@admin_required
+def send_profile(name):
+    if not name.endswith(profiler.PROFILE_EXTENSION):
+        abort(404)
+    return send_from_directory(profiler.get_profile_dir(config.config_profile_dir), name, as_attachment=True)
+
+
+@admi.route("/admin/memory", methods=["GET", "POST"])
+@login_required
+@admin_required
+def view_memory():
+    if request.method == "POST":
+        action = request.form.get("action")
+        if action == "start":
+            memory.start(request.form.get("frames", 1, type=int))
+        elif action == "stop":
+            memory.stop()
+        elif action == "snapshot":
+            if memory.take_snapshot() is None:
+                flash(_(u"Start tracing memory allocations first"), category="error")
+        elif action == "clear":
+            memory.clear_snapshots()
+        return redirect(url_for('admin.view_memory'))
+    return render_title_template("memory.html", title=_(u"Memory diagnostics"), page="memory",
+                                 report=memory.report(), max_frames=memory.MAX_FRAMES)
+
+
+@admi.route("/admin/memory/json")
+@login_required
+@admin_required
+def export_memory():
+    response = make_response(json.dumps(memory.report(), indent=2))
+    response.headers["Content-Type"] = "application/json; charset=utf-8"
+    response.headers["Content-Disposition"] = "attachment; filename=memory-%d.json" % os.getpid()
+    return response
+
+
+@admi.route("/ajax/serverstats")
+@login_required
+@admin_required
+def get_server_stats():
+    response = make_response(json.dumps(web_server.get_load_stats()))
+    response.headers["Content-Type"] = "application/json; charset=utf-8"
+    return response
+
+
+def _update_server_metrics():
+    stats = web_server.get_load_stats()
+    metrics.SERVER_POOL_SIZE.set(stats['pool_size'] or 0)
+    metrics.SERVER_POOL_USED.set(stats['pool_used'] or 0)
+    for name, slots in stats['slots'].items():
+        metrics.SLOTS_ACTIVE.set(slots['active'], slots=name)
+        metrics.SLOTS_QUEUED.set(slots['queue_depth'], slots=name)
+
+    task_status = {worker.STAT_WAITING: 'waiting', worker.STAT_STARTED: 'started',
+                   worker.STAT_FINISH_SUCCESS: 'finished', worker.STAT_FAIL: 'failed'}
+    counts = dict((status, 0) for status in task_status.values())
+    for task in worker.get_taskstatus():
+        counts[task_status.get(task['stat'], 'waiting')] += 1
+    for status, count in counts.items():
+        metrics.WORKER_TASKS.set(count, status=status)
+
+
+# Prometheus scrape target, use basic authentication of an admin user
+@admi.route("/metrics")
+@login_required
+@admin_required
+def get_metrics():
+    _update_server_metrics()
+    response = make_response(metrics.render())
+    response.headers["Content-Type"] = metrics.CONTENT_TYPE
+    return response
+
+
 @admi.route("/get_update_status", methods=['GET'])
 @login_required_if_no_ano
 def get_update_status():
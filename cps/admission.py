@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import division, print_function, unicode_literals
+import threading
+
+from werkzeug.wsgi import ClosingIterator
+
+from . import logger, metrics
+
+
+log = logger.create()
+
+# seconds a queued request waits for a free slot before it's rejected
+QUEUE_TIMEOUT = 30
+# seconds clients are asked to wait before retrying a rejected request
+RETRY_AFTER = 5
+
+PRIORITY_PAGE = 'page'
+PRIORITY_DOWNLOAD = 'download'
+
+# requests starting with one of these paths are served from the download slots (if configured)
+_DOWNLOAD_PATHS = ('/download/', '/opds/download/', '/show/', '/cover/', '/opds/cover', '/opds/thumb', '/static/')
+
+
+def request_priority(environ):
+    path = environ.get('PATH_INFO', '')
+    return PRIORITY_DOWNLOAD if path.startswith(_DOWNLOAD_PATHS) else PRIORITY_PAGE
+
+
+class _Slots(object):
+    '''A fixed number of request slots with a bounded queue of waiting requests in front of them.'''
+
+    def __init__(self, name, limit, queue_size, semaphore_class):
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.active = 0
+        self.waiting = 0
+        self.rejected = 0
+        self.served = 0
+        self._semaphore = semaphore_class(limit)
+        self._lock = threading.Lock()
+        # exported from the start, so rate() has a value before the first rejection
+        metrics.SLOTS_REJECTED.inc(0, slots=name)
+
+    def _reject(self):
+        self.rejected += 1
+        metrics.SLOTS_REJECTED.inc(slots=self.name)
+        return False
+
+    def acquire(self):
+        if not self._semaphore.acquire(blocking=False):
+            with self._lock:
+                if self.waiting >= self.queue_size:
+                    return self._reject()
+                self.waiting += 1
+            acquired = self._semaphore.acquire(timeout=QUEUE_TIMEOUT)
+            with self._lock:
+                self.waiting -= 1
+                if not acquired:
+                    return self._reject()
+        with self._lock:
+            self.active += 1
+        return True
+
+    def release(self):
+        with self._lock:
+            self.active -= 1
+            self.served += 1
+        self._semaphore.release()
+
+    def get_stats(self):
+        return {'limit': self.limit, 'queue_size': self.queue_size, 'active': self.active,
+                'queue_depth': self.waiting, 'rejected': self.rejected, 'served': self.served}
+
+
+class AdmissionControl(object):
+    """WSGI middleware limiting the number of requests handled at the same time.
+
+    Requests exceeding the limit wait in a bounded queue, if the queue is full (or a request waited
+    QUEUE_TIMEOUT seconds) the request is answered immediately with 503 and a Retry-After header,
+    instead of piling up more work on the database.
+    Downloads and covers can get their own slots, so long running transfers don't block page rendering.
+    """
+
+    def __init__(self, application, max_concurrency, queue_size, download_concurrency=0,
+                 semaphore_class=threading.BoundedSemaphore):
+        self.app = application
+        self.slots = {PRIORITY_PAGE: _Slots(PRIORITY_PAGE, max_concurrency, queue_size, semaphore_class)}
+        if download_concurrency:
+            self.slots[PRIORITY_DOWNLOAD] = _Slots(PRIORITY_DOWNLOAD, download_concurrency, queue_size,
+                                                   semaphore_class)
+        else:
+            self.slots[PRIORITY_DOWNLOAD] = self.slots[PRIORITY_PAGE]
+
+    def __call__(self, environ, start_response):
+        slots = self.slots[request_priority(environ)]
+        if not slots.acquire():
+            log.debug("Rejecting request %s, %s queue is full", environ.get('PATH_INFO'), slots.name)
+            start_response('503 Service Unavailable', [('Content-Type', 'text/plain; charset=utf-8'),
+                                                       ('Retry-After', str(RETRY_AFTER))])
+            return [b'Server is busy, please retry later']
+        try:
+            app_iter = self.app(environ, start_response)
+        except Exception:
+            slots.release()
+            raise
+        # the slot is held until the response is sent completely (file downloads are streamed)
+        return ClosingIterator(app_iter, slots.release)
+
+    def get_stats(self):
+        stats = {}
+        for priority, slots in self.slots.items():
+            if slots.name == priority:
+                stats[priority] = slots.get_stats()
+        return stats
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Keeps blocking calls (SQLite, file system, image processing) off the gevent event loop.
+
+gevent is not monkey patched, so a slow query or a large zip file stops every other greenlet.
+run_blocking() executes such calls on the threadpool of the gevent hub while the calling greenlet
+waits, without gevent (or outside the server's event loop) the function is simply called.
+
+The SQLite engines keep a pool of connections. Every greenlet has its own session, which checks out
+its own connection, so the pool never makes a greenlet wait for a connection: that would block the
+loop. Connections opened before the server processes were forked are left to the main process.
+A statement waiting for the lock of another connection waits in its greenlet, not in the threadpool.
+"""
+
+from __future__ import division, print_function, unicode_literals
+import os
+import sqlite3
+import threading
+import time
+
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.pool import QueuePool
+
+try:
+    import gevent
+    from gevent.hub import get_hub
+    _GEVENT = True
+except ImportError:
+    _GEVENT = False
+
+from . import logger
+
+
+log = logger.create()
+
+_loop_thread = None
+_blocked = {'count': 0, 'last': None}
+
+
+def enable():
+    '''Called by the gevent server, from now on blocking calls on the server thread are offloaded.'''
+    global _loop_thread
+    if _GEVENT:
+        _loop_thread = threading.current_thread()
+
+
+def is_enabled():
+    return _loop_thread is not None
+
+
+def _offload():
+    if _loop_thread is None or threading.current_thread() is not _loop_thread:
+        return False
+    # the hub itself can't wait for the threadpool
+    return gevent.getcurrent() is not get_hub()
+
+
+def run_blocking(func, *args, **kwargs):
+    if not _offload():
+        return func(*args, **kwargs)
+    return get_hub().threadpool.apply(func, args, kwargs)
+
+
+# Every greenlet gets its own SQLAlchemy session, otherwise a greenlet waiting for a query could see
+# another greenlet committing or rolling back the shared session
+session_scope = gevent.getcurrent if _GEVENT else None
+
+
+def _direct_call(func, *args):
+    return func(*args)
+
+
+# rows read at once when a cursor is iterated
+FETCH_SIZE = 100
+
+
+class _Cursor(object):
+    def __init__(self, cursor, run, wait):
+        self._cursor = cursor
+        self._run = run
+        self._wait = wait
+
+    # like sqlite3, the cursor itself is returned
+    def execute(self, *args):
+        self._wait(self._cursor.execute, *args)
+        return self
+
+    def executemany(self, *args):
+        self._wait(self._cursor.executemany, *args)
+        return self
+
+    def fetchone(self):
+        return self._run(self._cursor.fetchone)
+
+    def fetchall(self):
+        return self._run(self._cursor.fetchall)
+
+    def fetchmany(self, *args):
+        return self._run(self._cursor.fetchmany, *args)
+
+    def __iter__(self):
+        # each step of the statement reads the database, rows are fetched in batches off the event loop
+        rows = self.fetchmany(FETCH_SIZE)
+        while rows:
+            for row in rows:
+                yield row
+            rows = self.fetchmany(FETCH_SIZE)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class _Connection(object):
+    '''sqlite3 connection whose statements are executed with run_blocking().
+
+    Statements and commits, which may have to wait for a lock, are retried by _wait_for_locks().
+    '''
+
+    def __init__(self, connection, run):
+        self.__dict__['_connection'] = connection
+        self.__dict__['_run'] = run
+        self.__dict__['_wait'] = _wait_for_locks(run)
+
+    def cursor(self, *args):
+        return _Cursor(self._connection.cursor(*args), self._run, self._wait)
+
+    def commit(self):
+        return self._wait(self._connection.commit)
+
+    def rollback(self):
+        return self._run(self._connection.rollback)
+
+    def offload(self):
+        '''Execute with run_blocking() from now on.'''
+        self.__dict__['_run'] = run_blocking
+        self.__dict__['_wait'] = _wait_for_locks(run_blocking)
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._connection, name, value)
+
+
+# connections kept open per database, more are opened when needed and closed when they are returned
+POOL_SIZE = 5
+# seconds a statement waits for the lock of another connection, the default of sqlite3.connect()
+BUSY_TIMEOUT = 5.0
+
+
+def _remember_pid(dbapi_connection, connection_record):
+    connection_record.info['pid'] = os.getpid()
+
+
+def _check_pid(dbapi_connection, connection_record, connection_proxy):
+    pid = connection_record.info['pid']
+    if pid != os.getpid():
+        # dropped without closing it, closing would release the SQLite file locks of this process
+        connection_record.connection = connection_proxy.connection = None
+        raise exc.DisconnectionError('Connection opened by process %d' % pid)
+
+
+def _offload_connection(dbapi_connection, connection_record):
+    # after SQLAlchemy initialized the dialect on the first connection, see sqlite_creator()
+    if isinstance(dbapi_connection, _Connection):
+        dbapi_connection.offload()
+
+
+def create_sqlite_engine(database, **kwargs):
+    '''Engine of a SQLite database used by greenlets, the threadpool and forked server processes.'''
+    engine = create_engine(u'sqlite:///{0}'.format(database), creator=sqlite_creator(database),
+                           poolclass=QueuePool, pool_size=POOL_SIZE, max_overflow=-1, **kwargs)
+    event.listen(engine, 'connect', _remember_pid)
+    event.listen(engine, 'connect', _offload_connection)
+    event.listen(engine, 'checkout', _check_pid)
+    return engine
+
+
+def _wait_for_locks(run):
+    '''run, retrying while the database is locked by another connection.
+
+    SQLite's own busy handler would wait in the thread of the threadpool. With all threads waiting
+    like that, the greenlet holding the lock couldn't finish its transaction until they all time out.
+    '''
+    def retry(func, *args):
+        deadline = time.time() + BUSY_TIMEOUT
+        delay = 0.001
+        while True:
+            try:
+                return run(func, *args)
+            except sqlite3.OperationalError as ex:
+                if str(ex) != 'database is locked' or time.time() >= deadline:
+                    raise
+            if run is run_blocking and _offload():
+                gevent.sleep(delay)
+            else:
+                time.sleep(delay)
+            delay = min(delay * 2, 0.05)
+    return retry
+
+
+def sqlite_creator(database):
+    '''Connection factory for create_engine(creator=...), connections may be used by the threadpool.
+
+    SQLAlchemy initializes the dialect on the first connection while holding a thread lock, a greenlet
+    switch in between would deadlock the next greenlet waiting for that lock. Connections execute
+    directly until the connect event of create_sqlite_engine(), which comes after the initialization.
+    '''
+    def connect():
+        if not _GEVENT:
+            return sqlite3.connect(database, check_same_thread=False)
+        # no busy handler, _wait_for_locks() waits
+        connection = sqlite3.connect(database, check_same_thread=False, timeout=0)
+        return _Connection(connection, _direct_call)
+    return connect
+
+
+def _event_loop_blocked(event):
+    if not isinstance(event, gevent.events.EventLoopBlocked):
+        return
+    _blocked['count'] += 1
+    if _blocked['last'] == str(event.greenlet):
+        # still the same greenlet, it was already reported in the last interval
+        return
+    _blocked['last'] = str(event.greenlet)
+    log.warning("Event loop was blocked for more than %d ms by %s\n%s", event.blocking_time * 1000,
+                event.greenlet, '\n'.join(line for line in event.info if line))
+
+
+def monitor_event_loop(threshold):
+    '''Log the stack of greenlets keeping the event loop busy for longer than threshold milliseconds.'''
+    if not _GEVENT or not threshold:
+        return
+    try:
+        import gevent.events
+        gevent.config.max_blocking_time = threshold / 1000
+        gevent.config.monitor_thread = True
+        if hasattr(gevent.config, 'print_blocking_reports'):
+            gevent.config.print_blocking_reports = False
+        gevent.events.subscribers.append(_event_loop_blocked)
+        get_hub().start_periodic_monitoring_thread()
+    except (ImportError, AttributeError) as ex:
+        log.warning('Monitoring the event loop needs gevent 1.3 or later: %s', ex)
+
+
+def get_stats():
+    return {'offloading': is_enabled(),
+            'threadpool_size': get_hub().threadpool.size if is_enabled() else None,
+            'event_loop_blocked': _blocked['count'],
+            'event_loop_blocked_last': _blocked['last']}
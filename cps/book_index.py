@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""The ids of the books of every tag, series, language, format and rating.
+
+The sets are read from the link tables in one go and kept until the library generation changes, so
+filters like "has tag 3 but not tag 5, in series 7, as epub" are set operations in memory instead of a
+correlated EXISTS query per condition. Bool and int custom columns are read on first use. The
+reverse mapping, book id to tags, series, languages and formats, counts the facets of a set of books.
+"""
+
+from __future__ import division, print_function, unicode_literals
+import threading
+
+from flask_login import current_user
+from sqlalchemy.sql.expression import select
+
+from . import config, db, metrics
+from .feed_snapshots import library_generation
+
+
+TAG = 'tag'
+SERIES = 'series'
+LANGUAGE = 'language'
+FORMAT = 'format'
+RATING = 'rating'
+FACETS = (TAG, SERIES, LANGUAGE, FORMAT, RATING)
+
+_EMPTY = frozenset()
+
+
+def _group(rows, keys=None):
+    '''key -> ids of the books, and book id -> keys into keys if given.'''
+    groups = {}
+    for book, key in rows:
+        groups.setdefault(key, set()).add(book)
+        if keys is not None:
+            keys.setdefault(book, []).append(key)
+    return dict((key, frozenset(books)) for key, books in groups.items())
+
+
+class _Sets(object):
+
+    def __init__(self, session):
+        self.all = frozenset(row[0] for row in session.execute(select([db.Books.id])))
+        # facet -> book id -> keys, not for ratings
+        self.keys = dict((facet, {}) for facet in (TAG, SERIES, LANGUAGE, FORMAT))
+        self.facets = {
+            TAG: _group(session.execute(select([db.books_tags_link.c.book, db.books_tags_link.c.tag])),
+                        self.keys[TAG]),
+            SERIES: _group(session.execute(select([db.books_series_link.c.book, db.books_series_link.c.series])),
+                           self.keys[SERIES]),
+            LANGUAGE: _group(session.execute(select([db.books_languages_link.c.book,
+                                                     db.books_languages_link.c.lang_code])),
+                             self.keys[LANGUAGE]),
+            FORMAT: _group(session.execute(select([db.Data.book, db.Data.format])), self.keys[FORMAT]),
+            # by rating value (0-10), not by id of the ratings table
+            RATING: _group(session.execute(select([db.books_ratings_link.c.book, db.Ratings.rating])
+                                              .where(db.books_ratings_link.c.rating == db.Ratings.id))),
+        }
+        self.tag_names = dict((row[1], row[0]) for row in session.execute(select([db.Tags.id, db.Tags.name])))
+        self.language_codes = dict((row[1], row[0]) for row in
+                                   session.execute(select([db.Languages.id, db.Languages.lang_code])))
+        self.custom_columns = {}
+
+
+class BookIdIndex(object):
+
+    def __init__(self):
+        self._sets = None
+        self._generation = None
+        self._lock = threading.Lock()
+        self._builds = 0
+
+    def _get(self):
+        generation = library_generation()
+        sets = self._sets
+        hit = sets is not None and self._generation == generation
+        metrics.cache_access('book_index', hit)
+        if hit:
+            return sets
+        sets = _Sets(db.session)
+        with self._lock:
+            self._sets, self._generation = sets, generation
+            self._builds += 1
+        return sets
+
+    def all(self):
+        return self._get().all
+
+    def get(self, facet, key):
+        '''Ids of the books with this tag/series/language id, format or rating value.'''
+        return self._get().facets[facet].get(key, _EMPTY)
+
+    def facet(self, facet):
+        '''key -> ids of the books for all keys of the facet.'''
+        return self._get().facets[facet]
+
+    def count(self, facet, ids):
+        '''key -> number of the books of ids with that key, for the keys of any of them.'''
+        keys = self._get().keys[facet]
+        counts = {}
+        for book in ids:
+            for key in keys.get(book, ()):
+                counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def ratings_between(self, low=None, high=None):
+        '''Ids of the books with a rating (0-10) between low and high, both included.'''
+        ids = set()
+        for rating, books in self._get().facets[RATING].items():
+            if (low is None or rating >= low) and (high is None or rating <= high):
+                ids.update(books)
+        return ids
+
+    def custom_column(self, cc_id, value):
+        '''Ids of the books with this value in a bool or int custom column.'''
+        sets = self._get()
+        values = sets.custom_columns.get(cc_id)
+        if values is None:
+            table = db.cc_classes[cc_id].__table__
+            values = _group(db.session.execute(select([table.c.book, table.c.value])))
+            sets.custom_columns[cc_id] = values
+        return values.get(value, _EMPTY)
+
+    def visible(self):
+        '''Ids of the books the current user may see, the same as common_filters().'''
+        sets = self._get()
+        ids = sets.all
+        if current_user.filter_language() != "all":
+            ids = ids & sets.facets[LANGUAGE].get(sets.language_codes.get(current_user.filter_language()), _EMPTY)
+        if not current_user.mature_content:
+            for name in config.mature_content_tags():
+                tag_id = sets.tag_names.get(name)
+                if tag_id is not None:
+                    ids = ids - sets.facets[TAG].get(tag_id, _EMPTY)
+        return ids
+
+    def get_stats(self):
+        sets = self._sets
+        return {'books': len(sets.all) if sets else 0, 'builds': self._builds,
+                'ids': sum(len(books) for facet in sets.facets.values() for books in facet.values())
+                if sets else 0}
+
+
+book_ids = BookIdIndex()
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Columns of all books as NumPy arrays, for sorting, filtering and paging the book lists.
+
+The snapshot holds per book the id, the ranks of timestamp, pubdate and sort (in the order SQLite
+sorts the strings), the rating, has_cover, whether it has a mature content tag, and bit masks of its
+languages and formats. A page of a list is then an ordering permutation, kept per order, filtered
+with a boolean mask, and only the books of the page are read from the database.
+
+The snapshot is built when the server starts. When metadata.db changes, the last_modified values
+are compared and only the added, changed and removed books are read again, unless there are too
+many of them. Without NumPy page() returns None and the lists are read from the database as before.
+"""
+
+from __future__ import division, print_function, unicode_literals
+import threading
+
+try:
+    import numpy
+    use_numpy = True
+except ImportError:
+    use_numpy = False
+
+from flask_login import current_user
+from sqlalchemy.sql.expression import select, func
+
+from . import config, db, logger, metrics
+from .feed_snapshots import library_generation
+
+
+log = logger.create()
+
+# sort parameter of the book lists -> order of the snapshot, (column, descending) pairs
+SORTS = {
+    'new': (('timestamp', True),),
+    'old': (('timestamp', False),),
+    'abc': (('sort', False),),
+    'zyx': (('sort', True),),
+    'pubnew': (('pubdate', True),),
+    'pubold': (('pubdate', False),),
+}
+
+# share of added, changed and removed books up to which the snapshot is updated instead of rebuilt
+MAX_CHANGED = 0.25
+
+# ids per IN (...) when reading changed books
+_CHUNK = 500
+
+_STRINGS = ('timestamp', 'pubdate', 'sort')
+
+
+def _ranks(values):
+    '''Ranks of the strings in the order of SQLite, NULL before all strings.'''
+    ranks = numpy.zeros(len(values), dtype=numpy.int64)
+    if len(values):
+        present = numpy.array([value is not None for value in values], dtype=bool)
+        __, inverse = numpy.unique(numpy.array([value or '' for value in values], dtype=object),
+                                   return_inverse=True)
+        ranks[present] = inverse.reshape(-1)[present] + 1
+    return ranks
+
+
+def _masks(ids, pairs, bits):
+    '''Bit masks of the keys of each book, bits maps the keys to bit numbers and gets the new keys.'''
+    position = dict((book, number) for number, book in enumerate(ids))
+    rows = []
+    for book, key in pairs:
+        if book in position:
+            bit = bits.setdefault(key, len(bits))
+            rows.append((position[book], bit))
+    masks = numpy.zeros((len(ids), _words(bits)), dtype=numpy.uint64)
+    for number, bit in rows:
+        masks[number, bit // 64] |= numpy.uint64(1) << numpy.uint64(bit % 64)
+    return masks
+
+
+def _words(bits):
+    return max(1, (len(bits) + 63) // 64)
+
+
+def _widen(masks, words):
+    if masks.shape[1] >= words:
+        return masks
+    return numpy.hstack((masks, numpy.zeros((masks.shape[0], words - masks.shape[1]), dtype=numpy.uint64)))
+
+
+def _where_book(statement, column, ids):
+    return statement if ids is None else statement.where(column.in_(ids))
+
+
+class _Columns(object):
+
+    def __init__(self, calibre_dir, mature_tags):
+        self.calibre_dir = calibre_dir
+        self.mature_tags = mature_tags
+        self.languages = {}
+        self.formats = {}
+        # order -> permutation of the rows
+        self._orders = {}
+
+    @classmethod
+    def read(cls, session, calibre_dir, mature_tags, ids=None, languages=None, formats=None):
+        '''The columns of all books, or of the books with ids, adding their keys to languages and formats.'''
+        columns = cls(calibre_dir, mature_tags)
+        columns.languages = languages if languages is not None else {}
+        columns.formats = formats if formats is not None else {}
+        books, ratings, book_languages, book_formats, mature = [], {}, [], [], set()
+        for chunk in ([ids[i:i + _CHUNK] for i in range(0, len(ids), _CHUNK)] if ids is not None else [None]):
+            books.extend(session.execute(_where_book(
+                select([db.Books.id, db.Books.timestamp, db.Books.pubdate, db.Books.sort, db.Books.last_modified,
+                        db.Books.has_cover]), db.Books.id, chunk)))
+            ratings.update(session.execute(_where_book(
+                select([db.books_ratings_link.c.book, func.max(db.Ratings.rating)])
+                .where(db.books_ratings_link.c.rating == db.Ratings.id)
+                .group_by(db.books_ratings_link.c.book), db.books_ratings_link.c.book, chunk)).fetchall())
+            book_languages.extend(session.execute(_where_book(
+                select([db.books_languages_link.c.book, db.Languages.lang_code])
+                .where(db.books_languages_link.c.lang_code == db.Languages.id), db.books_languages_link.c.book,
+                chunk)))
+            book_formats.extend(session.execute(_where_book(select([db.Data.book, db.Data.format]), db.Data.book,
+                                                            chunk)))
+            mature.update(row[0] for row in session.execute(_where_book(
+                select([db.books_tags_link.c.book])
+                .where(db.books_tags_link.c.tag == db.Tags.id).where(db.Tags.name.in_(mature_tags)),
+                db.books_tags_link.c.book, chunk)))
+        books.sort(key=lambda row: row[0])
+        book_ids = [row[0] for row in books]
+        columns.ids = numpy.array(book_ids, dtype=numpy.int64)
+        for number, name in enumerate(_STRINGS, 1):
+            setattr(columns, name, numpy.array([row[number] for row in books], dtype=object))
+        columns.last_modified = numpy.array([row[4] for row in books], dtype=object)
+        columns.has_cover = numpy.array([bool(row[5]) for row in books], dtype=bool)
+        # -1 for books without rating, 0 is a rating as well
+        columns.rating = numpy.array([ratings.get(book, -1) for book in book_ids], dtype=numpy.int16)
+        columns.mature = numpy.array([book in mature for book in book_ids], dtype=bool)
+        columns.language_masks = _masks(book_ids, book_languages, columns.languages)
+        columns.format_masks = _masks(book_ids, book_formats, columns.formats)
+        columns.rank()
+        return columns
+
+    def rank(self):
+        self.ranks = dict((name, _ranks(getattr(self, name).tolist())) for name in _STRINGS)
+        self._orders = {}
+
+    def merge(self, changed, removed):
+        '''A new snapshot without the books removed and with the books of changed.'''
+        keep = ~numpy.isin(self.ids, numpy.array(list(removed) + changed.ids.tolist(), dtype=numpy.int64))
+        merged = _Columns(self.calibre_dir, self.mature_tags)
+        merged.languages, merged.formats = changed.languages, changed.formats
+        order = numpy.argsort(numpy.concatenate((self.ids[keep], changed.ids)), kind='stable')
+        for name in ('ids', 'last_modified', 'has_cover', 'rating', 'mature') + _STRINGS:
+            setattr(merged, name, numpy.concatenate((getattr(self, name)[keep], getattr(changed, name)))[order])
+        for name, bits in (('language_masks', merged.languages), ('format_masks', merged.formats)):
+            words = _words(bits)
+            setattr(merged, name, numpy.vstack((_widen(getattr(self, name)[keep], words),
+                                                _widen(getattr(changed, name), words)))[order])
+        merged.rank()
+        return merged
+
+    def has(self, masks, bits, key):
+        bit = bits.get(key)
+        if bit is None:
+            return numpy.zeros(len(self.ids), dtype=bool)
+        return ((masks[:, bit // 64] >> numpy.uint64(bit % 64)) & numpy.uint64(1)) == 1
+
+    def ordering(self, order):
+        '''Rows sorted by order, a tuple of (column, descending) pairs, and by id.'''
+        permutation = self._orders.get(order)
+        if permutation is None:
+            # lexsort sorts by the last key first
+            keys = [self.ids] + [-self.ranks[name] if descending else self.ranks[name]
+                                 for name, descending in reversed(order)]
+            permutation = numpy.lexsort(keys)
+            self._orders[order] = permutation
+        return permutation
+
+
+class CatalogSnapshot(object):
+
+    def __init__(self, max_changed=MAX_CHANGED):
+        self.max_changed = max_changed
+        self._columns = None
+        self._generation = None
+        self._lock = threading.Lock()
+        self._builds = 0
+        self._updates = 0
+
+    def refresh(self):
+        '''The snapshot of the current library generation, None without NumPy or library.'''
+        if not use_numpy or not config.config_calibre_dir or db.session is None:
+            return None
+        generation = library_generation()
+        columns = self._columns
+        hit = columns is not None and self._generation == generation
+        metrics.cache_access('catalog', hit)
+        if hit:
+            return columns
+        columns = self._update(columns)
+        with self._lock:
+            self._columns, self._generation = columns, generation
+        return columns
+
+    def _update(self, old):
+        mature_tags = tuple(config.mature_content_tags())
+        if old is None or old.calibre_dir != config.config_calibre_dir or old.mature_tags != mature_tags:
+            return self._build(mature_tags)
+        current = dict(db.session.execute(select([db.Books.id, db.Books.last_modified])).fetchall())
+        known = dict(zip(old.ids.tolist(), old.last_modified.tolist()))
+        changed = [book for book, modified in current.items() if book not in known or known[book] != modified]
+        removed = [book for book in known if book not in current]
+        if not changed and not removed:
+            return old
+        if len(changed) + len(removed) > self.max_changed * max(len(current), 1):
+            return self._build(mature_tags)
+        columns = old.merge(_Columns.read(db.session, old.calibre_dir, mature_tags, sorted(changed),
+                                          dict(old.languages), dict(old.formats)), removed)
+        with self._lock:
+            self._updates += 1
+        log.debug('Catalog snapshot updated: %d books changed, %d removed', len(changed), len(removed))
+        return columns
+
+    def _build(self, mature_tags):
+        columns = _Columns.read(db.session, config.config_calibre_dir, mature_tags)
+        with self._lock:
+            self._builds += 1
+        log.debug('Catalog snapshot of %d books built', len(columns.ids))
+        return columns
+
+    def page(self, order, page, per_page, rating=None, rating_above=None, book_format=None, language=None):
+        '''Ids of the books of one page of the visible books and the number of all, None without NumPy.
+
+        order is a tuple of (column, descending) pairs, see SORTS, the filters are a rating value,
+        a rating the books have to be rated above, a format and a language code.
+        '''
+        columns = self.refresh()
+        if columns is None:
+            return None
+        visible = numpy.ones(len(columns.ids), dtype=bool)
+        if not current_user.mature_content:
+            visible &= ~columns.mature
+        if current_user.filter_language() != "all":
+            visible &= columns.has(columns.language_masks, columns.languages, current_user.filter_language())
+        if rating is not None:
+            visible &= columns.rating == rating
+        if rating_above is not None:
+            visible &= columns.rating > rating_above
+        if book_format is not None:
+            visible &= columns.has(columns.format_masks, columns.formats, book_format)
+        if language is not None:
+            visible &= columns.has(columns.language_masks, columns.languages, language)
+        permutation = columns.ordering(tuple(order))
+        rows = permutation[visible[permutation]]
+        offset = per_page * (page - 1)
+        return columns.ids[rows[offset:offset + per_page]].tolist(), len(rows)
+
+    def get_stats(self):
+        columns = self._columns
+        if columns is None:
+            return {'available': use_numpy, 'books': 0, 'builds': self._builds, 'updates': self._updates}
+        return {'available': use_numpy, 'books': len(columns.ids), 'builds': self._builds,
+                'updates': self._updates, 'orders': len(columns._orders),
+                'bytes': sum(array.nbytes for array in (columns.ids, columns.has_cover, columns.rating,
+                                                        columns.mature, columns.language_masks,
+                                                        columns.format_masks)) +
+                sum(ranks.nbytes for ranks in columns.ranks.values())}
+
+
+catalog = CatalogSnapshot()
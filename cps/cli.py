@@ -45,6 +45,8 @@ parser.add_argument('-v', '--version', action='version', help='Shows version num
                     version=version_info())
 parser.add_argument('-i', metavar='ip-adress', help='Server IP-Adress to listen')
 parser.add_argument('-s', metavar='user:pass', help='Sets specific username to new password')
+parser.add_argument('--profile-startup', action='store_true',
+                    help='Reports the import time per module and the time until the first request')
 args = parser.parse_args()
 
 if sys.version_info < (3, 0):
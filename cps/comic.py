@@ -19,6 +19,8 @@
 
 from __future__ import division, print_function, unicode_literals
 import os
+import zipfile
+import tarfile
 
 from . import logger, isoLanguages
 from .constants import BookMeta
@@ -27,18 +29,25 @@ from .constants import BookMeta
 log = logger.create()
 
 
-try:
-    from comicapi.comicarchive import ComicArchive, MetaDataStyle
-    use_comic_meta = True
-except ImportError as e:
-    log.debug('cannot import comicapi, extracting comic metadata will not work: %s', e)
-    import zipfile
-    import tarfile
-    use_comic_meta = False
+# comicapi is imported on first use, False means it is not available
+_COMIC_API = None
+
+
+def comic_api():
+    global _COMIC_API
+    if _COMIC_API is None:
+        try:
+            from comicapi.comicarchive import ComicArchive, MetaDataStyle
+            _COMIC_API = (ComicArchive, MetaDataStyle)
+        except ImportError as e:
+            log.debug('cannot import comicapi, extracting comic metadata will not work: %s', e)
+            _COMIC_API = False
+    return _COMIC_API
 
 
 def extractCover(tmp_file_name, original_file_extension):
-    if use_comic_meta:
+    if comic_api():
+        ComicArchive = comic_api()[0]
         archive = ComicArchive(tmp_file_name)
         cover_data = None
         for index, name in enumerate(archive.getPageNameList()):
@@ -79,7 +88,8 @@ def extractCover(tmp_file_name, original_file_extension):
 
 
 def get_comic_info(tmp_file_path, original_file_name, original_file_extension):
-    if use_comic_meta:
+    if comic_api():
+        ComicArchive, MetaDataStyle = comic_api()
         archive = ComicArchive(tmp_file_path)
         if archive.seemsToBeAComicArchive():
             if archive.hasMetadata(MetaDataStyle.CIX):
@@ -25,7 +25,7 @@ import sys
 from sqlalchemy import exc, Column, String, Integer, SmallInteger, Boolean
 from sqlalchemy.ext.declarative import declarative_base
 
-from . import constants, cli, logger
+from . import constants, cli, logger, shared_state
 
 
 log = logger.create()
@@ -49,6 +49,11 @@ class _Settings(_Base):
     config_port = Column(Integer, default=constants.DEFAULT_PORT)
     config_certfile = Column(String)
     config_keyfile = Column(String)
+    config_max_concurrency = Column(Integer, default=0)
+    config_request_queue_size = Column(Integer, default=50)
+    config_download_concurrency = Column(Integer, default=0)
+    config_blocking_threshold = Column(Integer, default=0)
+    config_server_processes = Column(Integer, default=1)
 
     config_calibre_web_title = Column(String, default=u'Calibre-Web')
     config_books_per_page = Column(Integer, default=60)
@@ -63,6 +68,9 @@ class _Settings(_Base):
     config_logfile = Column(String)
     config_access_log = Column(SmallInteger, default=0)
     config_access_logfile = Column(String)
+    config_slow_query_threshold = Column(Integer, default=0)
+    config_repeated_query_limit = Column(Integer, default=0)
+    config_profile_dir = Column(String)
 
     config_uploading = Column(SmallInteger, default=0)
     config_anonbrowse = Column(SmallInteger, default=0)
@@ -246,6 +254,11 @@ class _ConfigSQL(object):
 
         logger.setup(self.config_logfile, self.config_log_level)
 
+    def reload(self):
+        '''Load the configuration values saved by another process.'''
+        self._settings = None
+        self.load()
+
     def save(self):
         '''Apply all configuration values to the underlying storage.'''
         s = self._read_from_storage()  # type: _Settings
@@ -260,6 +273,7 @@ class _ConfigSQL(object):
         self._session.merge(s)
         self._session.commit()
         self.load()
+        shared_state.config_saved()
 
     def invalidate(self):
         log.warning("invalidating configuration")
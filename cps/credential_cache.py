@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Remembers recently verified Basic authentication credentials.
+
+OPDS readers send username and password with every feed page and cover, checking the salted password
+hash each time costs more CPU than serving the request. Verified credentials are kept for MAX_AGE
+seconds under an HMAC of username and password with a random key of this process, neither the
+password nor something it could be guessed from offline is kept. An entry is only valid as long as
+the password hash of the user is unchanged, so changing the password invalidates it at once (in every
+process), failed checks are never cached.
+"""
+
+from __future__ import division, print_function, unicode_literals
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from werkzeug.security import check_password_hash
+
+from . import metrics
+
+
+# seconds a verified password is trusted without checking the hash again
+MAX_AGE = 120
+MAX_ENTRIES = 1000
+
+
+def _encode(value):
+    return value.encode('utf-8') if not isinstance(value, bytes) else value
+
+
+class CredentialCache(object):
+
+    def __init__(self, max_entries=MAX_ENTRIES, max_age=MAX_AGE):
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._secret = os.urandom(32)
+        # hmac -> (verified at, user id, password hash of the user), oldest first
+        self._verified = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _key(self, username, password):
+        return hmac.new(self._secret, _encode(username.lower()) + b'\0' + _encode(password),
+                        hashlib.sha256).digest()
+
+    def check_password(self, user, username, password):
+        '''Same as check_password_hash(user.password, password), username is the name the user logged in with.'''
+        key = self._key(username, password)
+        password_hash = str(user.password)
+        now = time.time()
+        with self._lock:
+            entry = self._verified.get(key)
+            hit = entry is not None and entry[0] >= now - self.max_age \
+                and entry[1] == user.id and entry[2] == password_hash
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+        metrics.cache_access('basic_auth', hit)
+        if hit:
+            return True
+
+        if not check_password_hash(password_hash, password):
+            return False
+        with self._lock:
+            self._verified.pop(key, None)
+            self._verified[key] = (now, user.id, password_hash)
+            self._expire(now)
+        return True
+
+    def invalidate(self, user_id=None):
+        '''Forgets the credentials of a user, of all users without user_id.'''
+        with self._lock:
+            if user_id is None:
+                self._verified.clear()
+                return
+            for key in [key for key, entry in self._verified.items() if entry[1] == user_id]:
+                del self._verified[key]
+
+    def _expire(self, now):
+        oldest = now - self.max_age
+        while self._verified:
+            key, (verified, __, __) = next(iter(self._verified.items()))
+            if verified >= oldest and len(self._verified) <= self.max_entries:
+                break
+            del self._verified[key]
+
+    def get_stats(self):
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {'entries': len(self._verified), 'hits': self._hits, 'misses': self._misses,
+                    'hit_rate': self._hits / lookups if lookups else None}
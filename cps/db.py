@@ -23,12 +23,14 @@ import os
 import re
 import ast
 
-from sqlalchemy import create_engine
 from sqlalchemy import Table, Column, ForeignKey
 from sqlalchemy import String, Integer, Boolean
 from sqlalchemy.orm import relationship, sessionmaker, scoped_session
 from sqlalchemy.ext.declarative import declarative_base
 
+from . import query_monitor
+from .blocking import create_sqlite_engine, session_scope
+
 
 session = None
 cc_exceptions = ['datetime', 'comments', 'float', 'composite', 'series']
@@ -339,10 +341,8 @@ def setup_db(config):
         return False
 
     try:
-        engine = create_engine('sqlite:///{0}'.format(dbpath),
-                               echo=False,
-                               isolation_level="SERIALIZABLE",
-                               connect_args={'check_same_thread': False})
+        engine = create_sqlite_engine(dbpath, echo=False, isolation_level="SERIALIZABLE")
+        query_monitor.instrument_engine(engine, 'calibre')
         conn = engine.connect()
     except:
         config.invalidate()
@@ -397,10 +397,11 @@ def setup_db(config):
 
 
     global session
-    Session = scoped_session(sessionmaker(autocommit=False,
-                                             autoflush=False,
-                                             bind=engine))
-    session = Session()
+    # thread (or greenlet) local sessions
+    session = scoped_session(sessionmaker(autocommit=False,
+                                          autoflush=False,
+                                          bind=engine),
+                             scopefunc=session_scope)
     return True
 
 
@@ -194,6 +194,7 @@ def delete_book(book_id, book_format):
                 db.session.query(db.Books).filter(db.Books.id == book_id).delete()
             else:
                 db.session.query(db.Data).filter(db.Data.book == book.id).filter(db.Data.format == book_format).delete()
+                book.last_modified = datetime.datetime.utcnow()
             db.session.commit()
         else:
             # book not found
@@ -352,6 +353,7 @@ def upload_single_file(request, book, book_id):
             else:
                 db_format = db.Data(book_id, file_ext.upper(), file_size, file_name)
                 db.session.add(db_format)
+                book.last_modified = datetime.datetime.utcnow()
                 db.session.commit()
                 db.update_title_sort(config)
 
@@ -516,6 +518,8 @@ def edit_book(book_id):
             # handle cc data
             edit_cc_data(book_id, book, to_save)
 
+            # like calibre, lets the catalog snapshot find the changed book
+            book.last_modified = datetime.datetime.utcnow()
             db.session.commit()
             if config.config_use_google_drive:
                 gdriveutils.updateGdriveCalibreFromLocal()
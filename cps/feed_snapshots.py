@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Rendered OPDS feeds, kept until the library changes.
+
+Readers request the same navigation and catalog feeds again and again. A feed only depends on the
+library, the settings and the visibility profile of the user (language filter, mature content, guest
+or not, locale), so it's rendered once per profile and url and then served as bytes with an ETag.
+
+The library generation is the modification time and size of metadata.db (and its WAL file), so
+changes made by calibre or another server process are noticed as well. Snapshots of an older
+generation are still served, while a background thread renders them again as the user who requested
+them, most recently used first. Only the id of that user is kept, not the credentials of the request.
+"""
+
+from __future__ import division, print_function, unicode_literals
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+from flask import request, g, current_app, make_response
+from flask_login import current_user, login_user
+
+from . import config, db, ub, logger, metrics, get_locale, cached_users
+
+
+log = logger.create()
+
+# bytes of rendered feeds kept, the least recently used ones are dropped first
+MAX_SIZE = 32 * 1024 * 1024
+
+# request environment keys needed to render the feed again, not the socket, the input stream or credentials
+_ENVIRON_KEYS = ('REQUEST_METHOD', 'SCRIPT_NAME', 'PATH_INFO', 'QUERY_STRING', 'SERVER_NAME', 'SERVER_PORT',
+                 'SERVER_PROTOCOL', 'REMOTE_ADDR', 'HTTP_HOST', 'HTTP_ACCEPT_LANGUAGE', 'HTTP_X_FORWARDED_FOR',
+                 'HTTP_X_SCRIPT_NAME', 'HTTP_X_SCHEME', 'HTTP_X_FORWARDED_HOST', 'wsgi.url_scheme')
+
+
+def library_generation():
+    '''Changes whenever metadata.db or the settings the feeds depend on are changed.'''
+    stats = []
+    if config.config_calibre_dir:
+        path = os.path.join(config.config_calibre_dir, 'metadata.db')
+        for name in (path, path + '-wal'):
+            try:
+                stat = os.stat(name)
+                stats.append((stat.st_mtime, stat.st_size))
+            except OSError:
+                stats.append(None)
+    return (config.config_calibre_dir, tuple(stats), config.config_calibre_web_title,
+            config.config_books_per_page, tuple(config.mature_content_tags()))
+
+
+def _profile():
+    return (current_user.is_anonymous, current_user.filter_language(), bool(current_user.mature_content),
+            str(get_locale()), request.script_root)
+
+
+class _Snapshot(object):
+    __slots__ = ('data', 'etag', 'content_type', 'generation', 'render')
+
+    def __init__(self, data, content_type, generation, render):
+        self.data = data
+        self.etag = hashlib.sha1(data).hexdigest()
+        self.content_type = content_type
+        self.generation = generation
+        self.render = render
+
+
+class FeedSnapshotStore(object):
+
+    def __init__(self, max_size=MAX_SIZE):
+        self.max_size = max_size
+        # (profile, url) -> _Snapshot, least recently used first
+        self._snapshots = OrderedDict()
+        self._size = 0
+        self._generation = None
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._queued = set()
+        self._thread = None
+        self._hits = 0
+        self._stale = 0
+        self._misses = 0
+
+    def snapshot(self, func):
+        '''Decorator for feeds which only depend on the library and the visibility profile of the user.'''
+        @wraps(func)
+        def decorated(*args, **kwargs):
+            key = (_profile(), request.full_path)
+            generation = library_generation()
+            self._check_generation(generation)
+            with self._lock:
+                snapshot = self._snapshots.get(key)
+                if snapshot is not None:
+                    self._snapshots.pop(key)
+                    self._snapshots[key] = snapshot
+                    if snapshot.generation == generation:
+                        self._hits += 1
+                    else:
+                        self._stale += 1
+                else:
+                    self._misses += 1
+            metrics.cache_access('opds_feeds', snapshot is not None)
+            if snapshot is None:
+                response = func(*args, **kwargs)
+                render = (current_app._get_current_object(), func, args, kwargs,
+                          dict((name, request.environ[name]) for name in _ENVIRON_KEYS if name in request.environ),
+                          None if current_user.is_anonymous else current_user.id)
+                snapshot = self._store(key, response, generation, render)
+                if snapshot is None:
+                    return response
+            elif snapshot.generation != generation:
+                self._schedule(key)
+            response = make_response(snapshot.data)
+            response.headers['Content-Type'] = snapshot.content_type
+            response.headers['Cache-Control'] = 'private, no-cache'
+            response.set_etag(snapshot.etag)
+            return response.make_conditional(request)
+        return decorated
+
+    def _store(self, key, response, generation, render):
+        if response.status_code != 200 or response.is_streamed:
+            return None
+        snapshot = _Snapshot(response.get_data(), response.headers.get('Content-Type'), generation, render)
+        with self._lock:
+            old = self._snapshots.pop(key, None)
+            if old is not None:
+                self._size -= len(old.data)
+            self._snapshots[key] = snapshot
+            self._size += len(snapshot.data)
+            while self._size > self.max_size and self._snapshots:
+                __, dropped = self._snapshots.popitem(last=False)
+                self._size -= len(dropped.data)
+        return snapshot
+
+    def _check_generation(self, generation):
+        with self._lock:
+            if generation == self._generation:
+                return
+            changed = self._generation is not None
+            self._generation = generation
+            # most recently used first
+            keys = list(reversed(self._snapshots.keys())) if changed else []
+        for key in keys:
+            self._schedule(key)
+
+    def _schedule(self, key):
+        with self._lock:
+            if key in self._queued:
+                return
+            self._queued.add(key)
+            # started on first use, after the server processes were forked
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='feed snapshots')
+                self._thread.daemon = True
+                self._thread.start()
+        self._queue.put(key)
+
+    def _run(self):
+        while True:
+            key = self._queue.get()
+            try:
+                self._render(key)
+            except Exception as ex:
+                log.error('Rendering feed %s failed: %s', key[1], ex)
+            finally:
+                with self._lock:
+                    self._queued.discard(key)
+
+    def _render(self, key):
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+        if snapshot is None:
+            return
+        app, func, args, kwargs, environ, user_id = snapshot.render
+        with app.request_context(environ):
+            try:
+                generation = library_generation()
+                if snapshot.generation == generation:
+                    return
+                if user_id is not None:
+                    user = cached_users.get(user_id)
+                    if user is None:
+                        self._remove(key)
+                        return
+                    login_user(user)
+                g.user = current_user._get_current_object()
+                # the user was changed in the meantime
+                if _profile() != key[0]:
+                    self._remove(key)
+                    return
+                self._store(key, make_response(func(*args, **kwargs)), generation, snapshot.render)
+            finally:
+                if db.session is not None:
+                    db.session.remove()
+                if ub.session is not None:
+                    ub.session.remove()
+
+    def _remove(self, key):
+        with self._lock:
+            snapshot = self._snapshots.pop(key, None)
+            if snapshot is not None:
+                self._size -= len(snapshot.data)
+
+    def clear(self):
+        with self._lock:
+            self._snapshots.clear()
+            self._size = 0
+
+    def get_stats(self):
+        with self._lock:
+            lookups = self._hits + self._stale + self._misses
+            return {'entries': len(self._snapshots), 'bytes': self._size, 'hits': self._hits,
+                    'stale_hits': self._stale, 'misses': self._misses, 'queued': len(self._queued),
+                    'hit_rate': (self._hits + self._stale) / lookups if lookups else None}
+
+
+opds_feeds = FeedSnapshotStore()
@@ -39,7 +39,8 @@ from babel.units import format_unit
 from flask import send_from_directory, make_response, redirect, abort
 from flask_babel import gettext as _
 from flask_login import current_user
-from sqlalchemy.sql.expression import true, false, and_, or_, text, func
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.expression import true, false, and_, or_, text, func, distinct
 from werkzeug.datastructures import Headers
 from werkzeug.security import generate_password_hash
 
@@ -60,8 +61,10 @@ try:
 except ImportError:
     use_PIL = False
 
-from . import logger, config, get_locale, db, ub, isoLanguages, worker
+from . import logger, config, get_locale, db, ub, isoLanguages, worker, basic_auth_cache
 from . import gdriveutils as gd
+from .blocking import run_blocking
+from .catalog import catalog
 from .constants import STATIC_DIR as _STATIC_DIR
 from .pagination import Pagination
 from .subproc_wrapper import process_wait
@@ -268,27 +271,44 @@ def get_sorted_author(value):
     return value2
 
 
+def _delete_book_formats(path, book_format):
+    for file in os.listdir(path):
+        if file.upper().endswith("."+book_format):
+            os.remove(os.path.join(path, file))
+
+
+def _delete_book_dir(path):
+    if len(next(os.walk(path))[1]):
+        return False
+    shutil.rmtree(path, ignore_errors=True)
+    return True
+
+
 # Deletes a book fro the local filestorage, returns True if deleting is successfull, otherwise false
 def delete_book_file(book, calibrepath, book_format=None):
     # check that path is 2 elements deep, check that target path has no subfolders
     if book.path.count('/') == 1:
         path = os.path.join(calibrepath, book.path)
         if book_format:
-            for file in os.listdir(path):
-                if file.upper().endswith("."+book_format):
-                    os.remove(os.path.join(path, file))
+            run_blocking(_delete_book_formats, path, book_format)
         else:
             if os.path.isdir(path):
-                if len(next(os.walk(path))[1]):
+                if not run_blocking(_delete_book_dir, path):
                     log.error("Deleting book %s failed, path has subfolders: %s", book.id, book.path)
                     return False
-                shutil.rmtree(path, ignore_errors=True)
                 return True
             else:
                 log.error("Deleting book %s failed, book path not valid: %s", book.id, book.path)
                 return False
 
 
+def _move_files(path, new_path):
+    for dir_name, __, file_list in os.walk(path):
+        for file in file_list:
+            os.renames(os.path.join(dir_name, file),
+                       os.path.join(new_path + dir_name[len(path):], file))
+
+
 def update_dir_structure_file(book_id, calibrepath, first_author):
     localbook = db.session.query(db.Books).filter(db.Books.id == book_id).first()
     path = os.path.join(calibrepath, localbook.path)
@@ -309,10 +329,7 @@ def update_dir_structure_file(book_id, calibrepath, first_author):
                 os.renames(path, new_title_path)
             else:
                 log.info("Copying title: %s into existing: %s", path, new_title_path)
-                for dir_name, __, file_list in os.walk(path):
-                    for file in file_list:
-                        os.renames(os.path.join(dir_name, file),
-                                   os.path.join(new_title_path + dir_name[len(path):], file))
+                run_blocking(_move_files, path, new_title_path)
             path = new_title_path
             localbook.path = localbook.path.split('/')[0] + '/' + new_titledir
         except OSError as ex:
@@ -420,6 +437,7 @@ def reset_password(user_id):
         return (2, None)
     try:
         ub.session.commit()
+        basic_auth_cache.invalidate(user_id)
         send_registration_mail(existing_user.email, existing_user.nickname, password, True)
         return (1, existing_user.nickname)
     except Exception:
@@ -506,6 +524,13 @@ def save_cover_from_filestorage(filepath, saved_filename, img):
     return True
 
 
+def _convert_to_jpeg(stream):
+    im = PILImage.open(stream).convert('RGB')
+    tmp_bytesio = io.BytesIO()
+    im.save(tmp_bytesio, format='JPEG')
+    return tmp_bytesio.getvalue()
+
+
 # saves book cover to gdrive or locally
 def save_cover(img, book_path):
     content_type = img.headers.get('content-type')
@@ -517,13 +542,9 @@ def save_cover(img, book_path):
         # convert to jpg because calibre only supports jpg
         if content_type in ('image/png', 'image/webp'):
             if hasattr(img,'stream'):
-                imgc = PILImage.open(img.stream)
+                img._content = run_blocking(_convert_to_jpeg, img.stream)
             else:
-                imgc = PILImage.open(io.BytesIO(img.content))
-            im = imgc.convert('RGB')
-            tmp_bytesio = io.BytesIO()
-            im.save(tmp_bytesio, format='JPEG')
-            img._content = tmp_bytesio.getvalue()
+                img._content = run_blocking(_convert_to_jpeg, io.BytesIO(img.content))
     else:
         if content_type not in ('image/jpeg'):
             log.error("Only jpg/jpeg files are supported as coverfile")
@@ -686,7 +707,7 @@ def tags_filters():
 
 # Creates for all stored languages a translated speaking name in the array for the UI
 def speaking_language(languages=None):
-    if not languages:
+    if languages is None:
         languages = db.session.query(db.Languages).all()
     for lang in languages:
         try:
@@ -715,9 +736,12 @@ def order_authors(entry):
     sort_authors = entry.author_sort.split('&')
     authors_ordered = list()
     error = False
+    # the authors of the book are loaded already, e.g. by book_list_options()
+    loaded = dict((author.sort, author) for author in entry.authors)
     for auth in sort_authors:
         # ToDo: How to handle not found authorname
-        result = db.session.query(db.Authors).filter(db.Authors.sort == auth.lstrip().strip()).first()
+        result = loaded.get(auth.strip()) or \
+            db.session.query(db.Authors).filter(db.Authors.sort == auth.lstrip().strip()).first()
         if not result:
             error = True
             break
@@ -727,46 +751,76 @@ def order_authors(entry):
     return entry
 
 
+# Relationships of the books shown by the book lists and the OPDS feeds
+BOOK_LIST_RELATIONSHIPS = ('authors', 'ratings', 'data', 'languages', 'tags', 'publishers', 'comments')
+
+
+def book_list_options():
+    '''Query options loading the relationships of a page of books with one query each instead of one per book.'''
+    return [selectinload(getattr(db.Books, name)) for name in BOOK_LIST_RELATIONSHIPS]
+
+
 # Fill indexpage with all requested data from database
-def fill_indexpage(page, database, db_filter, order, *join):
+def random_books():
     if current_user.show_detail_random():
-        randm = db.session.query(db.Books).filter(common_filters())\
+        return db.session.query(db.Books).options(*book_list_options()).filter(common_filters())\
             .order_by(func.random()).limit(config.config_random_books)
-    else:
-        randm = false()
+    return false()
+
+
+def fill_indexpage(page, database, db_filter, order, *join):
+    randm = random_books()
     off = int(int(config.config_books_per_page) * (page - 1))
     pagination = Pagination(page, config.config_books_per_page,
-                            len(db.session.query(database).filter(db_filter).filter(common_filters()).all()))
-    entries = db.session.query(database).join(*join, isouter=True).filter(db_filter).filter(common_filters()).\
-        order_by(*order).offset(off).limit(config.config_books_per_page).all()
+                            db.session.query(database).filter(db_filter).filter(common_filters()).count())
+    entries = db.session.query(database).options(*book_list_options()).join(*join, isouter=True)\
+        .filter(db_filter).filter(common_filters()).order_by(*order).offset(off).limit(config.config_books_per_page)\
+        .all()
     for book in entries:
         book = order_authors(book)
     return entries, randm, pagination
 
 
-def get_typeahead(database, query, replace=('',''), tag_filter=true()):
-    db.session.connection().connection.connection.create_function("lower", 1, lcase)
-    entries = db.session.query(database).filter(tag_filter).filter(func.lower(database.name).ilike("%" + query + "%")).all()
-    json_dumps = json.dumps([dict(name=r.name.replace(*replace)) for r in entries])
-    return json_dumps
+def fill_catalog_page(page, db_filter, order, catalog_order, **catalog_filter):
+    '''fill_indexpage for a book list the catalog snapshot can sort and filter, from the database without NumPy.
+
+    catalog_order and catalog_filter are the order and the filters of catalog.page() which match order and
+    db_filter.
+    '''
+    per_page = int(config.config_books_per_page)
+    found = catalog.page(catalog_order, page, per_page, **catalog_filter)
+    if found is None:
+        return fill_indexpage(page, db.Books, db_filter, order)
+    ids, total = found
+    entries = db.session.query(db.Books).options(*book_list_options()).filter(db.Books.id.in_(ids)).all() \
+        if ids else []
+    position = dict((book_id, number) for number, book_id in enumerate(ids))
+    entries.sort(key=lambda book: position[book.id])
+    for book in entries:
+        order_authors(book)
+    return entries, random_books(), Pagination(page, per_page, total)
+
+
+def aggregate_query(entities, group_column, *join):
+    '''Query of entities having books visible to the current user, one row per value of group_column.
+
+    join are the tables between the entities and db.Books, e.g. the link table.
+    '''
+    # the table the joins start from, entities[0] may also be a column of it
+    query = db.session.query(*entities).select_from(getattr(entities[0], 'class_', entities[0]))
+    for table in join:
+        query = query.join(table)
+    return query.join(db.Books).filter(common_filters()).group_by(group_column)
 
-# read search results from calibre-database and return it (function is used for feed and simple search
-def get_search_results(term):
-    db.session.connection().connection.connection.create_function("lower", 1, lcase)
-    q = list()
-    authorterms = re.split("[, ]+", term)
-    for authorterm in authorterms:
-        q.append(db.Books.authors.any(func.lower(db.Authors.name).ilike("%" + authorterm + "%")))
 
-    db.Books.authors.any(func.lower(db.Authors.name).ilike("%" + term + "%"))
+def fill_aggregate_page(query, group_column, order, offset, per_page=None):
+    '''One page of an aggregate_query starting at offset, counted and limited in the database.'''
+    per_page = int(per_page or config.config_books_per_page)
+    offset = max(int(offset or 0), 0)
+    total = query.group_by(None).order_by(None).with_entities(func.count(distinct(group_column))).scalar()
+    entries = query.order_by(*order).offset(offset).limit(per_page).all()
+    return entries, Pagination(offset // per_page + 1, per_page, total)
 
-    return db.session.query(db.Books).filter(common_filters()).filter(
-        or_(db.Books.tags.any(func.lower(db.Tags.name).ilike("%" + term + "%")),
-            db.Books.series.any(func.lower(db.Series.name).ilike("%" + term + "%")),
-            db.Books.authors.any(and_(*q)),
-            db.Books.publishers.any(func.lower(db.Publishers.name).ilike("%" + term + "%")),
-            func.lower(db.Books.title).ilike("%" + term + "%")
-            )).all()
 
 def get_cc_columns():
     tmpcc = db.session.query(db.Custom_Columns).filter(db.Custom_Columns.datatype.notin_(db.cc_exceptions)).all()
@@ -17,8 +17,12 @@
 #   along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 from __future__ import division, print_function, unicode_literals
+import os
+import io
+import json
 
-from .iso_language_names import LANGUAGE_NAMES as _LANGUAGE_NAMES
+from . import metrics
+from .constants import LANGUAGE_NAMES_DIR as _LANGUAGE_NAMES_DIR
 
 
 try:
@@ -47,8 +51,30 @@ except ImportError:
             return _copy_fields(pyc_languages.get(name=name))
 
 
+# translated language names, loaded per locale on first use from language_names/<locale>.json
+_LANGUAGE_NAMES = {}
+
+
+def _load_language_names(locale):
+    names_file = os.path.join(_LANGUAGE_NAMES_DIR, '%s.json' % os.path.basename(locale))
+    try:
+        with io.open(names_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+
+
 def get_language_names(locale):
-    return _LANGUAGE_NAMES.get(locale)
+    locale = str(locale)
+    cached = locale in _LANGUAGE_NAMES
+    metrics.cache_access('language_names', cached)
+    if not cached:
+        _LANGUAGE_NAMES[locale] = _load_language_names(locale)
+    return _LANGUAGE_NAMES[locale]
+
+
+def get_loaded_locales():
+    return list(_LANGUAGE_NAMES.keys())
 
 
 def get_language_name(locale, lang_code):
@@ -1,5895 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
-#   Copyright (C) 2019 OzzieIsaacs, pwr
-# Licensed under GLPv3. See the project's LICENSE file for details.
-
-# pylint: disable=too-many-lines,bad-continuation
-
-from __future__ import unicode_literals
-
-
-# map iso639 language codes to language names, translated
-
-LANGUAGE_NAMES = {
-    "pl": {
-        "aar": "afarski",
-        "abk": "abchaski",
-        "ace": "aczineski",
-        "ach": "aczoli",
-        "ada": "adangme",
-        "ady": "adygejski",
-        "afh": "afrihili",
-        "afr": "afrykanerski",
-        "ain": "ajnoski (Japonia)",
-        "aka": "akan",
-        "akk": "akadyjski",
-        "ale": "aleucki",
-        "alt": "ałtajski południowy",
-        "amh": "amharski",
-        "ang": "Staroangielski (ok. 450-1100)",
-        "anp": "angika",
-        "ara": "arabski",
-        "arc": "aramejski oficjalny (700-300 p.n.e.)",
-        "arg": "aragoński",
-        "arn": "araukański",
-        "arp": "arapaho",
-        "arw": "arawak",
-        "asm": "asamski",
-        "ast": "asturyjski",
-        "ava": "awarski",
-        "ave": "awestyjski",
-        "awa": "awadhi",
-        "aym": "ajmara",
-        "aze": "azerski",
-        "bak": "baszkirski",
-        "bal": "baluczi",
-        "bam": "bambara",
-        "ban": "balijski",
-        "bas": "basa (Kamerun)",
-        "bej": "bedża",
-        "bel": "białoruski",
-        "bem": "bemba (Zambia)",
-        "ben": "bengalski",
-        "bho": "bhodźpuri",
-        "bik": "bikol",
-        "bin": "edo",
-        "bis": "bislama",
-        "bla": "siksika",
-        "bod": "tybetański",
-        "bos": "bośniacki",
-        "bra": "bradź",
-        "bre": "bretoński",
-        "bua": "buriacki",
-        "bug": "bugijski",
-        "bul": "bułgarski",
-        "byn": "blin",
-        "cad": "kaddo",
-        "car": "karaibski galibi",
-        "cat": "kataloński",
-        "ceb": "cebuański",
-        "ces": "czeski",
-        "cha": "czamorro",
-        "chb": "czibcza",
-        "che": "czeczeński",
-        "chg": "czagatajski",
-        "chk": "chuuk",
-        "chm": "maryjski (Rosja)",
-        "chn": "żargon chinoocki",
-        "cho": "czoktaw",
-        "chp": "chipewyan",
-        "chr": "czerokeski",
-        "chu": "starosłowiański",
-        "chv": "czuwaski",
-        "chy": "czejeński",
-        "cop": "koptyjski",
-        "cor": "kornijski",
-        "cos": "korsykański",
-        "cre": "kri",
-        "crh": "krymskotatarski",
-        "csb": "kaszubski",
-        "cym": "walijski",
-        "dak": "dakota",
-        "dan": "duński",
-        "dar": "dargwijski",
-        "del": "delaware",
-        "den": "slavey (atapaskański)",
-        "deu": "niemiecki",
-        "dgr": "dogrib",
-        "din": "dinka",
-        "div": "malediwski; divehi",
-        "doi": "dogri (makrojęzyk)",
-        "dsb": "dolnołużycki",
-        "dua": "duala",
-        "dum": "holenderski średniowieczny (ok. 1050-1350)",
-        "dyu": "diula",
-        "dzo": "dzongka",
-        "efi": "efik",
-        "egy": "egipski (starożytny)",
-        "eka": "ekajuk",
-        "ell": "grecki współczesny (1453-)",
-        "elx": "elamicki",
-        "eng": "Angielski",
-        "enm": "angielski średniowieczny (1100-1500)",
-        "epo": "esperanto",
-        "est": "estoński",
-        "eus": "baskijski",
-        "ewe": "ewe",
-        "ewo": "ewondo",
-        "fan": "fang (Gwinea Równikowa)",
-        "fao": "farerski",
-        "fas": "perski",
-        "fat": "fanti",
-        "fij": "fidżyjski",
-        "fil": "pilipino",
-        "fin": "fiński",
-        "fon": "fon",
-        "fra": "francuski",
-        "frm": "francuski średniowieczny (ok. 1400-1600)",
-        "fro": "starofrancuski (842-ok. 1400)",
-        "frr": "północnofryzyjski",
-        "frs": "wschodniofryzyjski",
-        "fry": "zachodniofryzyjski",
-        "ful": "fulani",
-        "fur": "friulski",
-        "gaa": "ga",
-        "gay": "gayo",
-        "gba": "gbaya (Republika Środkowoafrykańska)",
-        "gez": "gyyz",
-        "gil": "gilbertański",
-        "gla": "szkocki gaelicki",
-        "gle": "irlandzki",
-        "glg": "galicyjski",
-        "glv": "manx",
-        "gmh": "średnio-wysoko-niemiecki (ok. 1050-1500)",
-        "goh": "staro-wysoko-niemiecki (ok. 750-1050)",
-        "gon": "gondi",
-        "gor": "gorontalo",
-        "got": "gocki",
-        "grb": "grebo",
-        "grc": "grecki starożytny (do 1453)",
-        "grn": "guarani",
-        "gsw": "niemiecki szwajcarski",
-        "guj": "gudźarati",
-        "gwi": "gwichʼin",
-        "hai": "haida",
-        "hat": "kreolski haitański",
-        "hau": "hausa",
-        "haw": "hawajski",
-        "heb": "hebrajski",
-        "her": "herero",
-        "hil": "hiligajnon",
-        "hin": "hindi",
-        "hit": "hetycki",
-        "hmn": "hmong",
-        "hmo": "hiri motu",
-        "hrv": "chorwacki",
-        "hsb": "górnołużycki",
-        "hun": "węgierski",
-        "hup": "hupa",
-        "hye": "ormiański",
-        "iba": "ibanag",
-        "ibo": "ibo",
-        "ido": "ido",
-        "iii": "syczuański",
-        "iku": "inuktitut",
-        "ile": "interlingue",
-        "ilo": "ilokano",
-        "ina": "interlingua (Międzynarodowe Stowarzyszenie Języka Pomocniczego)",
-        "ind": "indonezyjski",
-        "inh": "inguski",
-        "ipk": "inupiaq",
-        "isl": "islandzki",
-        "ita": "włoski",
-        "jav": "jawajski",
-        "jbo": "lojban",
-        "jpn": "japoński",
-        "jpr": "judeo-perski",
-        "jrb": "judeoarabski",
-        "kaa": "karakałpacki",
-        "kab": "kabylski",
-        "kac": "kaczin",
-        "kal": "kalaallisut",
-        "kam": "kamba (Kenia)",
-        "kan": "kannada",
-        "kas": "kaszmirski",
-        "kat": "gruziński",
-        "kau": "kanuri",
-        "kaw": "kawi",
-        "kaz": "kazaski",
-        "kbd": "kabardyjski",
-        "kha": "khasi",
-        "khm": "środkowokhmerski",
-        "kho": "chotański",
-        "kik": "kikiju",
-        "kin": "ruanda",
-        "kir": "kirgiski",
-        "kmb": "kimbundu",
-        "kok": "konkani (makrojęzyk)",
-        "kom": "komi",
-        "kon": "kongo",
-        "kor": "koreański",
-        "kos": "kosrae",
-        "kpe": "kpelle",
-        "krc": "karaczajsko-bałkarski",
-        "krl": "karelski",
-        "kru": "kurukh",
-        "kua": "kwanyama",
-        "kum": "kumycki",
-        "kur": "kurdyjski",
-        "kut": "kutenai",
-        "lad": "ladino",
-        "lah": "lahnda",
-        "lam": "lamba",
-        "lao": "laotański",
-        "lat": "łaciński",
-        "lav": "łotewski",
-        "lez": "lezgiński",
-        "lim": "limburgijski",
-        "lin": "lingala",
-        "lit": "litewski",
-        "lol": "mongo",
-        "loz": "lozi",
-        "ltz": "luksemburski",
-        "lua": "luba-lulua",
-        "lub": "luba-katanga",
-        "lug": "luganda",
-        "lui": "luiseno",
-        "lun": "lunda",
-        "luo": "luo (Kenia i Tanzania)",
-        "lus": "lushai",
-        "mad": "madurajski",
-        "mag": "magahi",
-        "mah": "marshalski",
-        "mai": "maithili",
-        "mak": "makasar",
-        "mal": "malajalam",
-        "man": "mandingo",
-        "mar": "marathi",
-        "mas": "masajski",
-        "mdf": "moksza",
-        "mdr": "mandar",
-        "men": "mende (Sierra Leone)",
-        "mga": "irlandzki średniowieczny (900-1200)",
-        "mic": "micmac",
-        "min": "minangkabau",
-        "mis": "języki niezakodowane",
-        "mkd": "macedoński",
-        "mlg": "malgaski",
-        "mlt": "maltański",
-        "mnc": "mandżurski",
-        "mni": "manipuri",
-        "moh": "mohawk",
-        "mon": "mongolski",
-        "mos": "mossi",
-        "mri": "maoryski",
-        "msa": "malajski (makrojęzyk)",
-        "mul": "wiele języków",
-        "mus": "krik",
-        "mwl": "mirandyjski",
-        "mwr": "marwari",
-        "mya": "birmański",
-        "myv": "erzja",
-        "nap": "neapolitański",
-        "nau": "nauruański",
-        "nav": "navaho",
-        "nbl": "ndebele południowy",
-        "nde": "ndebele północny",
-        "ndo": "ndonga",
-        "nds": "German; Low",
-        "nep": "nepalski",
-        "new": "newarski",
-        "nia": "nias",
-        "niu": "niue",
-        "nld": "holenderski",
-        "nno": "norweski Nynorsk",
-        "nob": "norweski Bokmål",
-        "nog": "nogajski",
-        "non": "staronordyjski",
-        "nor": "norweski",
-        "nqo": "n’ko",
-        "nso": "sotho północny",
-        "nwc": "newarski klasyczny",
-        "nya": "njandża",
-        "nym": "nyamwezi",
-        "nyn": "nyankole",
-        "nyo": "nyoro",
-        "nzi": "nzema",
-        "oci": "okcytański (po 1500)",
-        "oji": "odżibwe",
-        "ori": "orija",
-        "orm": "oromo",
-        "osa": "osage",
-        "oss": "osetyjski",
-        "ota": "turecki otomański (1500-1928)",
-        "pag": "pangasino",
-        "pal": "pahlawi",
-        "pam": "pampango",
-        "pan": "pendżabski",
-        "pap": "papiamento",
-        "pau": "palau",
-        "peo": "staroperski (ok. 600-400 p.n.e)",
-        "phn": "fenicki",
-        "pli": "pali",
-        "pol": "Polski",
-        "pon": "pohnpei",
-        "por": "portugalski",
-        "pro": "prowansalski średniowieczny (do 1500)",
-        "pus": "paszto",
-        "que": "keczua",
-        "raj": "radźasthani",
-        "rap": "rapanui",
-        "rar": "maoryski Wysp Cooka",
-        "roh": "retoromański",
-        "rom": "romski",
-        "ron": "rumuński",
-        "run": "rundi",
-        "rup": "arumuński",
-        "rus": "rosyjski",
-        "sad": "sandawe",
-        "sag": "sango",
-        "sah": "jakucki",
-        "sam": "samarytański aramejski",
-        "san": "sanskryt",
-        "sas": "sasak",
-        "sat": "santali",
-        "scn": "sycylijski",
-        "sco": "scots",
-        "sel": "selkupski",
-        "sga": "staroirlandzki (do 900)",
-        "shn": "szan",
-        "sid": "sidamo",
-        "sin": "syngaleski",
-        "slk": "słowacki",
-        "slv": "słoweński",
-        "sma": "południowolapoński",
-        "sme": "północnolapoński",
-        "smj": "lapoński lule",
-        "smn": "lapoński inari",
-        "smo": "samoański",
-        "sms": "lapoński skolt",
-        "sna": "shona",
-        "snd": "sindhi",
-        "snk": "soninke",
-        "sog": "sogdiański",
-        "som": "somalijski",
-        "sot": "sotho południowy",
-        "spa": "hiszpański",
-        "sqi": "albański",
-        "srd": "sardyński",
-        "srn": "sranan tongo",
-        "srp": "serbski",
-        "srr": "serer",
-        "ssw": "suazi",
-        "suk": "sukuma",
-        "sun": "sundajski",
-        "sus": "susu",
-        "sux": "sumeryjski",
-        "swa": "suahili (makrojęzyk)",
-        "swe": "szwedzki",
-        "syc": "syryjski klasyczny",
-        "syr": "syryjski",
-        "tah": "tahitański",
-        "tam": "tamilski",
-        "tat": "tatarski",
-        "tel": "telugu",
-        "tem": "temne",
-        "ter": "tereno",
-        "tet": "tetum",
-        "tgk": "tadżycki",
-        "tgl": "tagalski",
-        "tha": "tajski",
-        "tig": "tigre",
-        "tir": "tigrinia",
-        "tiv": "tiw",
-        "tkl": "tokelau",
-        "tlh": "klingoński",
-        "tli": "tlingit",
-        "tmh": "tuareski",
-        "tog": "tongański (Nyasa)",
-        "ton": "tongański (Wyspy Tonga)",
-        "tpi": "tok pisin",
-        "tsi": "tsimszian",
-        "tsn": "tswana",
-        "tso": "tsonga",
-        "tuk": "turkmeński",
-        "tum": "tumbuka",
-        "tur": "turecki",
-        "tvl": "tuvalu",
-        "twi": "twi",
-        "tyv": "tuwiński",
-        "udm": "udmurcki",
-        "uga": "ugarycki",
-        "uig": "ujgurski",
-        "ukr": "ukraiński",
-        "umb": "umbundu",
-        "und": "nieokreślony",
-        "urd": "urdu",
-        "uzb": "uzbecki",
-        "vai": "wai",
-        "ven": "venda",
-        "vie": "wietnamski",
-        "vol": "wolapik",
-        "vot": "wotycki",
-        "wal": "walamo",
-        "war": "warajski (Filipiny)",
-        "was": "washo",
-        "wln": "waloński",
-        "wol": "wolof",
-        "xal": "kałmucki",
-        "xho": "xhosa",
-        "yao": "yao",
-        "yap": "japski",
-        "yid": "jidysz",
-        "yor": "joruba",
-        "zap": "zapotecki",
-        "zbl": "bliss",
-        "zen": "zenaga",
-        "zha": "zhuang",
-        "zho": "chiński",
-        "zul": "zuluski",
-        "zun": "zuni",
-        "zxx": "brak kontekstu językowego",
-        "zza": "zazaki"
-    },
-    "nl": {
-        "aar": "Afar; Hamitisch",
-        "abk": "Abchazisch",
-        "ace": "Achinees",
-        "ach": "Acholi",
-        "ada": "Adangme",
-        "ady": "Adyghe",
-        "afh": "Afrihili",
-        "afr": "Afrikaans",
-        "ain": "Ainu (Japan)",
-        "aka": "Akaans",
-        "akk": "Akkadiaans",
-        "ale": "Aleut",
-        "alt": "Altajs; zuidelijk",
-        "amh": "Amhaars; Amharisch",
-        "ang": "Engels; oud (ca. 450-1100)",
-        "anp": "Angika",
-        "ara": "Arabisch",
-        "arc": "Aramees; officieel (700-300 B.C.)",
-        "arg": "Aragonees",
-        "arn": "Mapudungun",
-        "arp": "Arapaho",
-        "arw": "Arawak",
-        "asm": "Assamees; Assami",
-        "ast": "Asturisch",
-        "ava": "Avaars; Awari",
-        "ave": "Avestisch",
-        "awa": "Awadhi",
-        "aym": "Aymara",
-        "aze": "Azerbeidzjaans",
-        "bak": "Basjkiers; Basjkirisch",
-        "bal": "Balutsji; Baluchi",
-        "bam": "Bambara",
-        "ban": "Balinees",
-        "bas": "Basa (Kameroen)",
-        "bej": "Beja",
-        "bel": "Wit-Russisch; Belarussisch",
-        "bem": "Bemba (Zambia)",
-        "ben": "Bengaals",
-        "bho": "Bhojpuri",
-        "bik": "Bikol",
-        "bin": "Bini; Edo",
-        "bis": "Bislama",
-        "bla": "Siksika",
-        "bod": "Tibetaans",
-        "bos": "Bosnisch",
-        "bra": "Braj",
-        "bre": "Bretons; Bretoens",
-        "bua": "Boeriaats",
-        "bug": "Buginees",
-        "bul": "Bulgaars",
-        "byn": "Bilin",
-        "cad": "Caddo",
-        "car": "Caribische talen",
-        "cat": "Catalaans",
-        "ceb": "Cebuano",
-        "ces": "Tsjechisch",
-        "cha": "Chamorro",
-        "chb": "Tsjibtsja",
-        "che": "Tsjetsjeens",
-        "chg": "Chagatai",
-        "chk": "Chukees",
-        "chm": "Mari (Rusland)",
-        "chn": "Chinook-jargon",
-        "cho": "Choctaw",
-        "chp": "Chipewyaans",
-        "chr": "Cherokee",
-        "chu": "Slavisch; oud (kerk)",
-        "chv": "Tsjoevasjisch",
-        "chy": "Cheyenne",
-        "cop": "Koptisch",
-        "cor": "Cornisch",
-        "cos": "Corsicaans",
-        "cre": "Cree",
-        "crh": "Turks; Crimean",
-        "csb": "Kasjoebiaans",
-        "cym": "Welsh",
-        "dak": "Dakota",
-        "dan": "Deens",
-        "dar": "Dargwa",
-        "del": "Delaware",
-        "den": "Slavisch (Athapascaans)",
-        "deu": "Duits",
-        "dgr": "Dogrib",
-        "din": "Dinka",
-        "div": "Divehi",
-        "doi": "Dogri",
-        "dsb": "Sorbisch; lager",
-        "dua": "Duala",
-        "dum": "Nederlands; middel (ca. 1050-1350)",
-        "dyu": "Dyula",
-        "dzo": "Dzongkha",
-        "efi": "Efikisch",
-        "egy": "Egyptisch (antiek)",
-        "eka": "Ekajuk",
-        "ell": "Grieks; Modern (1453-)",
-        "elx": "Elamitisch",
-        "eng": "Engels",
-        "enm": "Engels; middel (1100-1500)",
-        "epo": "Esperanto",
-        "est": "Estlands",
-        "eus": "Baskisch",
-        "ewe": "Ewe",
-        "ewo": "Ewondo",
-        "fan": "Fang",
-        "fao": "Faeröers",
-        "fas": "Perzisch",
-        "fat": "Fanti",
-        "fij": "Fijisch",
-        "fil": "Filipijns",
-        "fin": "Fins",
-        "fon": "Fon",
-        "fra": "Frans",
-        "frm": "Frans; middel (ca. 1400-1600)",
-        "fro": "Frans; oud (842-ca. 1400)",
-        "frr": "Fries; noordelijk (Duitsland)",
-        "frs": "Fries; oostelijk (Duitsland)",
-        "fry": "Fries",
-        "ful": "Fulah",
-        "fur": "Friulisch",
-        "gaa": "Ga",
-        "gay": "Gayo",
-        "gba": "Gbaya (Centraal Afrikaanse Republiek)",
-        "gez": "Ge'ez",
-        "gil": "Gilbertees",
-        "gla": "Keltisch; schots",
-        "gle": "Iers",
-        "glg": "Galiciaans",
-        "glv": "Manx",
-        "gmh": "Duits; middel hoog (ca. 1050-1500)",
-        "goh": "Duits; oud hoog (ca. 750-1050)",
-        "gon": "Gondi",
-        "gor": "Gorontalo",
-        "got": "Gothisch",
-        "grb": "Grebo",
-        "grc": "Grieks; antiek (tot 1453)",
-        "grn": "Guarani",
-        "gsw": "Duits; Zwitserland",
-        "guj": "Gujarati",
-        "gwi": "Gwichʼin",
-        "hai": "Haida",
-        "hat": "Creools; Haïtiaans",
-        "hau": "Hausa",
-        "haw": "Hawaiiaans",
-        "heb": "Hebreeuws",
-        "her": "Herero",
-        "hil": "Hiligainoons",
-        "hin": "Hindi",
-        "hit": "Hittitisch",
-        "hmn": "Hmong",
-        "hmo": "Hiri Motu",
-        "hrv": "Kroatisch",
-        "hsb": "Servisch; hoger",
-        "hun": "Hongaars",
-        "hup": "Hupa",
-        "hye": "Armeens",
-        "iba": "Ibaans",
-        "ibo": "Igbo",
-        "ido": "Ido",
-        "iii": "Yi; Sichuan - Nuosu",
-        "iku": "Inuktitut",
-        "ile": "Interlingue",
-        "ilo": "Iloko",
-        "ina": "Interlingua (International Auxiliary Language Association)",
-        "ind": "Indonesisch",
-        "inh": "Ingoesjetisch",
-        "ipk": "Inupiak",
-        "isl": "IJslands",
-        "ita": "Italiaans",
-        "jav": "Javaans",
-        "jbo": "Lojbaans",
-        "jpn": "Japans",
-        "jpr": "Joods-Perzisch",
-        "jrb": "Joods-Arabisch",
-        "kaa": "Kara-Kalpak",
-        "kab": "Kabyle",
-        "kac": "Katsjin",
-        "kal": "Groenlands",
-        "kam": "Kamba (Kenya)",
-        "kan": "Kannada; Kanara; Kanarees",
-        "kas": "Kashmiri",
-        "kat": "Georgisch",
-        "kau": "Kanuri",
-        "kaw": "Kawi",
-        "kaz": "Kazachs",
-        "kbd": "Kabardisch; Tsjerkessisch",
-        "kha": "Khasi",
-        "khm": "Khmer, Cambodjaans",
-        "kho": "Khotanees",
-        "kik": "Kikuyu",
-        "kin": "Kinyarwanda",
-        "kir": "Kirgizisch",
-        "kmb": "Kimbundu",
-        "kok": "Konkani",
-        "kom": "Komi",
-        "kon": "Kikongo",
-        "kor": "Koreaans",
-        "kos": "Kosraeaans",
-        "kpe": "Kpelle",
-        "krc": "Karatsjay-Balkar",
-        "krl": "Karelisch",
-        "kru": "Kurukh",
-        "kua": "Kuanyama",
-        "kum": "Kumyk",
-        "kur": "Koerdisch",
-        "kut": "Kutenaïsch",
-        "lad": "Ladino",
-        "lah": "Lahnda",
-        "lam": "Lamba",
-        "lao": "Laotiaans",
-        "lat": "Latijn",
-        "lav": "Lets",
-        "lez": "Lezghiaans",
-        "lim": "Limburgs",
-        "lin": "Lingala",
-        "lit": "Litouws",
-        "lol": "Mongo",
-        "loz": "Lozi",
-        "ltz": "Luxemburgs",
-        "lua": "Luba-Lulua",
-        "lub": "Luba-Katanga",
-        "lug": "Luganda",
-        "lui": "Luiseno",
-        "lun": "Lunda",
-        "luo": "Luo (Kenia en Tanzania)",
-        "lus": "Lushai",
-        "mad": "Madurees",
-        "mag": "Magahisch",
-        "mah": "Marshallees",
-        "mai": "Maithili",
-        "mak": "Makasar",
-        "mal": "Malayalam",
-        "man": "Mandingo",
-        "mar": "Marathi",
-        "mas": "Masai",
-        "mdf": "Moksja",
-        "mdr": "Mandars",
-        "men": "Mende",
-        "mga": "Iers; middel (900-1200)",
-        "mic": "Mi'kmaq; Micmac",
-        "min": "Minangkabau",
-        "mis": "Niet-gecodeerde talen",
-        "mkd": "Macedonisch",
-        "mlg": "Malagassisch",
-        "mlt": "Maltees",
-        "mnc": "Manchu",
-        "mni": "Manipuri",
-        "moh": "Mohawk",
-        "mon": "Mongools",
-        "mos": "Mossisch",
-        "mri": "Maori",
-        "msa": "Maleis",
-        "mul": "Meerdere talen",
-        "mus": "Creek",
-        "mwl": "Mirandees",
-        "mwr": "Marwari",
-        "mya": "Burmees",
-        "myv": "Erzya",
-        "nap": "Napolitaans",
-        "nau": "Nauruaans",
-        "nav": "Navajo",
-        "nbl": "Ndebele; zuid",
-        "nde": "Ndebele; noord",
-        "ndo": "Ndonga",
-        "nds": "Duits; Laag",
-        "nep": "Nepalees",
-        "new": "Newari; Nepal",
-        "nia": "Nias",
-        "niu": "Niueaans",
-        "nld": "Nederlands",
-        "nno": "Noors; Nynorsk",
-        "nob": "Noors; Bokmål",
-        "nog": "Nogai",
-        "non": "Noors; oud",
-        "nor": "Noors",
-        "nqo": "N'Ko",
-        "nso": "Pedi; Sepedi; Noord-Sothotisch",
-        "nwc": "Newari; Klassiek Nepal",
-        "nya": "Nyanja",
-        "nym": "Nyamwezi",
-        "nyn": "Nyankools",
-        "nyo": "Nyoro",
-        "nzi": "Nzima",
-        "oci": "Occitaans (na 1500)",
-        "oji": "Ojibwa",
-        "ori": "Oriya",
-        "orm": "Oromo",
-        "osa": "Osaags",
-        "oss": "Ossetisch",
-        "ota": "Turks; ottomaans (1500-1928)",
-        "pag": "Pangasinaans",
-        "pal": "Pehlevi",
-        "pam": "Pampanga",
-        "pan": "Punjabi",
-        "pap": "Papiamento",
-        "pau": "Palauaans",
-        "peo": "Perzisch; oud (ca. 600-400 B.C.)",
-        "phn": "Foenisisch",
-        "pli": "Pali",
-        "pol": "Pools",
-        "pon": "Pohnpeiaans",
-        "por": "Portugees",
-        "pro": "Provençaals; oud (tot 1500)",
-        "pus": "Poesjto",
-        "que": "Quechua",
-        "raj": "Rajasthani",
-        "rap": "Rapanui",
-        "rar": "Rarotongan; Cookeilanden Maori",
-        "roh": "Reto-Romaans",
-        "rom": "Romani",
-        "ron": "Roemeens",
-        "run": "Rundi",
-        "rup": "Roemeens; Macedo-",
-        "rus": "Russisch",
-        "sad": "Sandawe",
-        "sag": "Sangho",
-        "sah": "Jakoets",
-        "sam": "Aramees; Samaritaans",
-        "san": "Sanskriet",
-        "sas": "Sasaaks",
-        "sat": "Santali",
-        "scn": "Siciliaans",
-        "sco": "Schots",
-        "sel": "Sulkoeps",
-        "sga": "Iers; oud (tot 900)",
-        "shn": "Sjaans",
-        "sid": "Sidamo",
-        "sin": "Sinhala",
-        "slk": "Slowaaks",
-        "slv": "Sloveens",
-        "sma": "Samisch; zuid, Laps; zuid",
-        "sme": "Samisch; noord, Laps; noord",
-        "smj": "Lule Sami",
-        "smn": "Sami; Inari, Laps; Inari",
-        "smo": "Samoaans",
-        "sms": "Sami; Skolt, Laps; Skolt",
-        "sna": "Shona",
-        "snd": "Sindhi",
-        "snk": "Soninke",
-        "sog": "Sogdiaans",
-        "som": "Somalisch",
-        "sot": "Sothaans; zuidelijk",
-        "spa": "Spaans",
-        "sqi": "Albanees",
-        "srd": "Sardinisch",
-        "srn": "Sranan Tongo",
-        "srp": "Servisch",
-        "srr": "Serer",
-        "ssw": "Swati",
-        "suk": "Sukuma",
-        "sun": "Soendanees; Sundanees",
-        "sus": "Susu",
-        "sux": "Sumerisch",
-        "swa": "Swahili",
-        "swe": "Zweeds",
-        "syc": "Syriac; Klassiek",
-        "syr": "Syrisch",
-        "tah": "Tahitisch",
-        "tam": "Tamil",
-        "tat": "Tataars",
-        "tel": "Telugu",
-        "tem": "Timne",
-        "ter": "Tereno",
-        "tet": "Tetum",
-        "tgk": "Tadzjieks",
-        "tgl": "Tagalog",
-        "tha": "Thai",
-        "tig": "Tigre",
-        "tir": "Tigrinya",
-        "tiv": "Tiv",
-        "tkl": "Tokelau",
-        "tlh": "Klingon; tlhIngan-Hol",
-        "tli": "Tlingit",
-        "tmh": "Tamasjek",
-        "tog": "Tonga (Nyasa)",
-        "ton": "Tonga (Tonga-eilanden)",
-        "tpi": "Tok Pisin",
-        "tsi": "Tsimsjiaans",
-        "tsn": "Tswana",
-        "tso": "Tsonga",
-        "tuk": "Turkmeens",
-        "tum": "Tumbuka",
-        "tur": "Turks",
-        "tvl": "Tuvalu",
-        "twi": "Twi",
-        "tyv": "Tuviniaans",
-        "udm": "Udmurts",
-        "uga": "Ugaritisch",
-        "uig": "Oeigoers; Oejgoers",
-        "ukr": "Oekraïens",
-        "umb": "Umbundu",
-        "und": "Onbepaald",
-        "urd": "Urdu",
-        "uzb": "Oezbeeks",
-        "vai": "Vai",
-        "ven": "Venda",
-        "vie": "Vietnamees",
-        "vol": "Volapük",
-        "vot": "Votisch",
-        "wal": "Walamo",
-        "war": "Waray (Filipijns)",
-        "was": "Wasjo",
-        "wln": "Waals",
-        "wol": "Wolof",
-        "xal": "Kalmyk",
-        "xho": "Xhosa",
-        "yao": "Yao",
-        "yap": "Yapees",
-        "yid": "Jiddisch",
-        "yor": "Yoruba",
-        "zap": "Zapotec",
-        "zbl": "Blissymbolen",
-        "zen": "Zenaga",
-        "zha": "Zhuang, Tsjoeang",
-        "zho": "Chinees",
-        "zul": "Zoeloe",
-        "zun": "Zuni",
-        "zxx": "Geen linguïstische inhoud",
-        "zza": "Zaza"
-    },
-    "fr": {
-        "aar": "afar",
-        "abk": "abkhaze",
-        "ace": "at-chinois",
-        "ach": "acoli",
-        "ada": "adangme",
-        "ady": "adyguéen",
-        "afh": "afrihili",
-        "afr": "Afrikaans",
-        "ain": "aïnou (Japon)",
-        "aka": "akan",
-        "akk": "akkadien",
-        "ale": "aléoute",
-        "alt": "altaï méridional",
-        "amh": "amharique",
-        "ang": "anglo-saxon (environ 450-1100)",
-        "anp": "angika",
-        "ara": "arabe",
-        "arc": "araméen officiel (700-300 A.C.)",
-        "arg": "aragonais",
-        "arn": "mapudungun",
-        "arp": "arapaho",
-        "arw": "arawak",
-        "asm": "assamais",
-        "ast": "asturien",
-        "ava": "avar",
-        "ave": "avestique",
-        "awa": "awadhi",
-        "aym": "aymara",
-        "aze": "azéri",
-        "bak": "bachkir",
-        "bal": "baloutchi",
-        "bam": "bambara",
-        "ban": "balinais",
-        "bas": "basa (Cameroun)",
-        "bej": "beja",
-        "bel": "biélorusse",
-        "bem": "bemba (Zambie)",
-        "ben": "bengali",
-        "bho": "bhojpuri",
-        "bik": "bikol",
-        "bin": "bini",
-        "bis": "bislama",
-        "bla": "pied-noir",
-        "bod": "tibétain",
-        "bos": "bosniaque",
-        "bra": "braj",
-        "bre": "breton",
-        "bua": "bouriate",
-        "bug": "buginais",
-        "bul": "bulgare",
-        "byn": "bilin",
-        "cad": "caddo",
-        "car": "carib; Galibi",
-        "cat": "catalan",
-        "ceb": "cébuan",
-        "ces": "tchèque",
-        "cha": "chamorro",
-        "chb": "chibcha",
-        "che": "thétchène",
-        "chg": "chagatai",
-        "chk": "chuukese",
-        "chm": "mari (Russie)",
-        "chn": "chinook; jargon",
-        "cho": "choctaw",
-        "chp": "chipewyan",
-        "chr": "cherokee",
-        "chu": "slavon; ancien",
-        "chv": "tchouvache",
-        "chy": "cheyenne",
-        "cop": "copte",
-        "cor": "cornish",
-        "cos": "corse",
-        "cre": "cri",
-        "crh": "turc de Crimée",
-        "csb": "kachoubien",
-        "cym": "gallois",
-        "dak": "dakota",
-        "dan": "danois",
-        "dar": "dargwa",
-        "del": "delaware",
-        "den": "esclave (athapascan)",
-        "deu": "allemand",
-        "dgr": "dogrib",
-        "din": "dinka",
-        "div": "dhivehi",
-        "doi": "dogri (macrolangue)",
-        "dsb": "bas-sorbien",
-        "dua": "duala",
-        "dum": "néerlandais moyen (environ 1050-1350)",
-        "dyu": "dioula",
-        "dzo": "dzongkha",
-        "efi": "efik",
-        "egy": "égyptien ancien",
-        "eka": "ekajuk",
-        "ell": "grec moderne (après 1453)",
-        "elx": "élamite",
-        "eng": "anglais",
-        "enm": "anglais moyen (1100-1500)",
-        "epo": "espéranto",
-        "est": "estonien",
-        "eus": "basque",
-        "ewe": "ewe",
-        "ewo": "ewondo",
-        "fan": "fang (Guinée Équatoriale)",
-        "fao": "féroéen",
-        "fas": "persan",
-        "fat": "fanti",
-        "fij": "fidjien",
-        "fil": "filipino",
-        "fin": "finnois",
-        "fon": "fon-gbe",
-        "fra": "Français",
-        "frm": "français moyen (environ 1400-1600)",
-        "fro": "ancien français (842 à environ 1400)",
-        "frr": "frison septentrional",
-        "frs": "frison oriental",
-        "fry": "frison occidental",
-        "ful": "fulah",
-        "fur": "frioulan",
-        "gaa": "ga",
-        "gay": "gayo",
-        "gba": "gbaya (République Centrafricaine)",
-        "gez": "geez",
-        "gil": "gilbertese",
-        "gla": "gaélique écossais",
-        "gle": "irlandais",
-        "glg": "galicien",
-        "glv": "manx",
-        "gmh": "allemand; moyen haut (environ 1050-1500)",
-        "goh": "allemand; vieux haut (environ 750-1050)",
-        "gon": "gondi",
-        "gor": "gorontalo",
-        "got": "gothique",
-        "grb": "grebo",
-        "grc": "grec ancien (jusqu'à 1453)",
-        "grn": "guarani",
-        "gsw": "allemand de Suisse",
-        "guj": "gujarati",
-        "gwi": "gwichʼin",
-        "hai": "haida",
-        "hat": "créole haïtien",
-        "hau": "hausa",
-        "haw": "hawaïen",
-        "heb": "hébreu",
-        "her": "herero",
-        "hil": "hiligaynon",
-        "hin": "hindi",
-        "hit": "hittite",
-        "hmn": "hmong",
-        "hmo": "hiri Motu",
-        "hrv": "croate",
-        "hsb": "haut-sorbien",
-        "hun": "hongrois",
-        "hup": "hupa",
-        "hye": "arménien",
-        "iba": "iban",
-        "ibo": "igbo",
-        "ido": "ido",
-        "iii": "yi de Sichuan",
-        "iku": "inuktitut",
-        "ile": "interlingue",
-        "ilo": "iloko",
-        "ina": "interlingua (association pour une langue auxiliaire internationale)",
-        "ind": "indonésien",
-        "inh": "ingouche",
-        "ipk": "inupiaq",
-        "isl": "islandais",
-        "ita": "italien",
-        "jav": "javanais",
-        "jbo": "lojban",
-        "jpn": "japonais",
-        "jpr": "judéo-persan",
-        "jrb": "judéo-arabe",
-        "kaa": "kara-kalpak",
-        "kab": "kabyle",
-        "kac": "kachin",
-        "kal": "kalaallisut",
-        "kam": "kamba (Kenya)",
-        "kan": "kannada",
-        "kas": "cachemiri",
-        "kat": "géorgien",
-        "kau": "kanuri",
-        "kaw": "kawi",
-        "kaz": "kazakh",
-        "kbd": "kabardian",
-        "kha": "khasi",
-        "khm": "khmer central",
-        "kho": "khotanais",
-        "kik": "kikuyu",
-        "kin": "kinyarwanda",
-        "kir": "kirghize",
-        "kmb": "kimbundu",
-        "kok": "konkani (macrolangue)",
-        "kom": "komi",
-        "kon": "kongo",
-        "kor": "coréen",
-        "kos": "kosraéen",
-        "kpe": "kpelle",
-        "krc": "karachay-balkar",
-        "krl": "carélien",
-        "kru": "kurukh",
-        "kua": "kuanyama",
-        "kum": "kumyk",
-        "kur": "kurde",
-        "kut": "kutenai",
-        "lad": "ladino",
-        "lah": "lahnda",
-        "lam": "lamba",
-        "lao": "lao",
-        "lat": "latin",
-        "lav": "letton",
-        "lez": "lezghian",
-        "lim": "limbourgeois",
-        "lin": "lingala",
-        "lit": "lituanien",
-        "lol": "mongo",
-        "loz": "lozi",
-        "ltz": "luxembourgeois",
-        "lua": "luba-lulua",
-        "lub": "luba-katanga",
-        "lug": "ganda",
-        "lui": "luiseno",
-        "lun": "lunda",
-        "luo": "luo (Kenya et Tanzanie)",
-        "lus": "lushai",
-        "mad": "madurais",
-        "mag": "magahi",
-        "mah": "marshallais",
-        "mai": "maithili",
-        "mak": "makassar",
-        "mal": "malayalam",
-        "man": "mandingue",
-        "mar": "marathi",
-        "mas": "massaï",
-        "mdf": "moksha",
-        "mdr": "mandar",
-        "men": "mende (Sierra Léone)",
-        "mga": "irlandais intermédiaire (900-1200)",
-        "mic": "micmaque",
-        "min": "minangkabau",
-        "mis": "Langues non codées",
-        "mkd": "macédonien",
-        "mlg": "malgache",
-        "mlt": "maltais",
-        "mnc": "mandchou",
-        "mni": "manipuri",
-        "moh": "mohawk",
-        "mon": "mongol",
-        "mos": "mossi",
-        "mri": "maori",
-        "msa": "malais (macrolangue)",
-        "mul": "Langues multiples",
-        "mus": "creek",
-        "mwl": "mirandais",
-        "mwr": "marwari",
-        "mya": "birman",
-        "myv": "erzya",
-        "nap": "napolitain",
-        "nau": "nauru",
-        "nav": "navajo",
-        "nbl": "ndebele méridional",
-        "nde": "ndebele septentrional",
-        "ndo": "ndonga",
-        "nds": "Allemand; Bas",
-        "nep": "népalais",
-        "new": "bhasa; Népal",
-        "nia": "nias",
-        "niu": "niuéen",
-        "nld": "néerlandais",
-        "nno": "norvégien nynorsk",
-        "nob": "norvégien bokmål",
-        "nog": "nogaï",
-        "non": "norse ancien",
-        "nor": "norvégien",
-        "nqo": "n'Ko",
-        "nso": "sotho septentrional",
-        "nwc": "newari ancien",
-        "nya": "nyanja",
-        "nym": "nyamwezi",
-        "nyn": "nyankole",
-        "nyo": "nyoro",
-        "nzi": "nzima",
-        "oci": "occitan (après 1500)",
-        "oji": "ojibwa",
-        "ori": "oriya",
-        "orm": "oromo",
-        "osa": "osage",
-        "oss": "ossétien",
-        "ota": "turc ottoman (1500-1928)",
-        "pag": "pangasinan",
-        "pal": "pahlavi",
-        "pam": "pampangan",
-        "pan": "pendjabi",
-        "pap": "papiamento",
-        "pau": "palauéen",
-        "peo": "perse ancien (environ 600-400 avant J.-C.)",
-        "phn": "phénicien",
-        "pli": "pali",
-        "pol": "polonais",
-        "pon": "pohnpeien",
-        "por": "portugais",
-        "pro": "provençal ancien (jusqu'à 1500)",
-        "pus": "pushto",
-        "que": "quechua",
-        "raj": "rajasthani",
-        "rap": "rapanui",
-        "rar": "maori des Îles Cook",
-        "roh": "romanche",
-        "rom": "romany",
-        "ron": "roumain",
-        "run": "rundi",
-        "rup": "macédo-roumain",
-        "rus": "russe",
-        "sad": "sandawe",
-        "sag": "sango",
-        "sah": "iakoute",
-        "sam": "aramaïque samaritain",
-        "san": "sanskrit",
-        "sas": "sasak",
-        "sat": "santali",
-        "scn": "sicilien",
-        "sco": "écossais",
-        "sel": "selkup",
-        "sga": "irlandais ancien (jusqu'à 900)",
-        "shn": "shan",
-        "sid": "sidamo",
-        "sin": "sinhala",
-        "slk": "slovaque",
-        "slv": "slovène",
-        "sma": "sami méridional",
-        "sme": "sami septentrional",
-        "smj": "sami de Lule",
-        "smn": "sami d'Inari",
-        "smo": "samoan",
-        "sms": "sami de Skolt",
-        "sna": "shona",
-        "snd": "sindhi",
-        "snk": "soninke",
-        "sog": "sogdien",
-        "som": "somali",
-        "sot": "sotho méridional",
-        "spa": "espagnol",
-        "sqi": "albanais",
-        "srd": "sarde",
-        "srn": "sranan Tongo",
-        "srp": "serbe",
-        "srr": "serer",
-        "ssw": "swati",
-        "suk": "sukuma",
-        "sun": "sundanais",
-        "sus": "susu",
-        "sux": "sumérien",
-        "swa": "swahili (macrolangue)",
-        "swe": "suédois",
-        "syc": "syriaque classique",
-        "syr": "syriaque",
-        "tah": "tahitien",
-        "tam": "tamoul",
-        "tat": "tatar",
-        "tel": "télougou",
-        "tem": "timne",
-        "ter": "tereno",
-        "tet": "tetum",
-        "tgk": "tadjik",
-        "tgl": "tagalog",
-        "tha": "thai",
-        "tig": "tigre",
-        "tir": "tigrigna",
-        "tiv": "tiv",
-        "tkl": "tokelau",
-        "tlh": "klingon",
-        "tli": "tlingit",
-        "tmh": "tamacheq",
-        "tog": "tonga (Nyasa)",
-        "ton": "tonga (Îles Tonga)",
-        "tpi": "tok Pisin",
-        "tsi": "tsimshien",
-        "tsn": "tswana",
-        "tso": "tsonga",
-        "tuk": "turkmène",
-        "tum": "tumbuka",
-        "tur": "turc",
-        "tvl": "tuvalu",
-        "twi": "twi",
-        "tyv": "tuvinien",
-        "udm": "udmurt",
-        "uga": "ougaritique",
-        "uig": "ouïghour",
-        "ukr": "ukrainien",
-        "umb": "umbundu",
-        "und": "indéterminé",
-        "urd": "ourdou",
-        "uzb": "ouszbek",
-        "vai": "vai",
-        "ven": "venda",
-        "vie": "vietnamien",
-        "vol": "volapük",
-        "vot": "votique",
-        "wal": "wolaytta",
-        "war": "waray (Philippines)",
-        "was": "washo",
-        "wln": "wallon",
-        "wol": "wolof",
-        "xal": "kalmouke",
-        "xho": "xhosa",
-        "yao": "yao",
-        "yap": "yapese",
-        "yid": "yiddish",
-        "yor": "yoruba",
-        "zap": "zapotèque",
-        "zbl": "blissymbols",
-        "zen": "zenaga",
-        "zha": "zhuang",
-        "zho": "chinois",
-        "zul": "zoulou",
-        "zun": "zuni",
-        "zxx": "pas de contenu linguistique",
-        "zza": "zaza"
-    },
-    "hu": {
-        "aar": "Afar",
-        "abk": "Abház",
-        "ace": "Akinéz",
-        "ach": "Acoli",
-        "ada": "Adangme",
-        "ady": "Adyghe",
-        "afh": "Afrihili",
-        "afr": "Afrikaans",
-        "ain": "ainu (Japán)",
-        "aka": "akan",
-        "akk": "akkád",
-        "ale": "aleut",
-        "alt": "altáji; déli",
-        "amh": "amhara",
-        "ang": "angol; óangol (kb. 450-1100)",
-        "anp": "angika",
-        "ara": "arab",
-        "arc": "arámi; hivatalos (i.e. 700- i.e. 300)",
-        "arg": "aragóniai",
-        "arn": "Mapudungun",
-        "arp": "arapaho",
-        "arw": "arawak",
-        "asm": "asszámi",
-        "ast": "Asturian",
-        "ava": "avar",
-        "ave": "avesztai",
-        "awa": "avádi",
-        "aym": "ajmara",
-        "aze": "azeri",
-        "bak": "baskír",
-        "bal": "baluchi",
-        "bam": "bambara",
-        "ban": "balinéz",
-        "bas": "Basa (Cameroon)",
-        "bej": "beja",
-        "bel": "belarusz",
-        "bem": "Bemba (Zambia)",
-        "ben": "bengáli",
-        "bho": "bhodzspuri",
-        "bik": "bikol",
-        "bin": "bini",
-        "bis": "biszlama",
-        "bla": "szikszika",
-        "bod": "tibeti",
-        "bos": "bosnyák",
-        "bra": "bradzs",
-        "bre": "breton",
-        "bua": "burját",
-        "bug": "buginéz",
-        "bul": "bolgár",
-        "byn": "Bilin",
-        "cad": "caddo",
-        "car": "Carib; Galibi",
-        "cat": "katalán",
-        "ceb": "cebuano",
-        "ces": "cseh",
-        "cha": "csamorro",
-        "chb": "csibcsa",
-        "che": "csecsen",
-        "chg": "chagati",
-        "chk": "csukéz",
-        "chm": "Mari (Russia)",
-        "chn": "chinook zsargon",
-        "cho": "csoktó",
-        "chp": "csippeva",
-        "chr": "cserokí",
-        "chu": "szláv; ószláv",
-        "chv": "csuvas",
-        "chy": "csejen",
-        "cop": "kopt",
-        "cor": "cornwalli",
-        "cos": "korzikai",
-        "cre": "cree",
-        "crh": "Turkish; Crimean",
-        "csb": "kasubi",
-        "cym": "velszi",
-        "dak": "dakota",
-        "dan": "dán",
-        "dar": "dargwa",
-        "del": "delavár",
-        "den": "Szolga (atapaszkán)",
-        "deu": "német",
-        "dgr": "dogrib",
-        "din": "dinka",
-        "div": "Dhivehi",
-        "doi": "Dogri (macrolanguage)",
-        "dsb": "Sorbian; Lower",
-        "dua": "duala",
-        "dum": "Dutch; Middle (ca. 1050-1350)",
-        "dyu": "djula",
-        "dzo": "dzongka",
-        "efi": "efik",
-        "egy": "óegyiptomi",
-        "eka": "ekajuk",
-        "ell": "modern görög (1453-)",
-        "elx": "elamita",
-        "eng": "angol",
-        "enm": "angol; középkori (1100-1500)",
-        "epo": "eszperantó",
-        "est": "észt",
-        "eus": "Baszk",
-        "ewe": "ewe",
-        "ewo": "ewondo",
-        "fan": "Fang (Equatorial Guinea)",
-        "fao": "Feröeri",
-        "fas": "perzsa",
-        "fat": "fanti",
-        "fij": "fidzsi",
-        "fil": "Filipino",
-        "fin": "finn",
-        "fon": "fon",
-        "fra": "francia",
-        "frm": "French; Middle (ca. 1400-1600)",
-        "fro": "francia; ófrancia (842- kb. 1400)",
-        "frr": "Frisian; Northern",
-        "frs": "Frisian; Eastern",
-        "fry": "Frisian; Western",
-        "ful": "fula",
-        "fur": "friul",
-        "gaa": "ga",
-        "gay": "gajo",
-        "gba": "Gbaya (Central African Republic)",
-        "gez": "gíz",
-        "gil": "gilberti",
-        "gla": "Gaelic; Scottish",
-        "gle": "ír",
-        "glg": "galíciai",
-        "glv": "manx",
-        "gmh": "German; Middle High (ca. 1050-1500)",
-        "goh": "német; ónémet (kb. 750-1050)",
-        "gon": "gondi",
-        "gor": "gorontalo",
-        "got": "gót",
-        "grb": "grebo",
-        "grc": "ógörög (1453-ig)",
-        "grn": "guarani",
-        "gsw": "German; Swiss",
-        "guj": "gudzsarati",
-        "gwi": "Gwichʼin",
-        "hai": "haida",
-        "hat": "Creole; Haitian",
-        "hau": "hausza",
-        "haw": "hawaii",
-        "heb": "héber",
-        "her": "herero",
-        "hil": "hiligajnon",
-        "hin": "hindi",
-        "hit": "hettita",
-        "hmn": "hmong",
-        "hmo": "hiri motu",
-        "hrv": "horvát",
-        "hsb": "Sorbian; Upper",
-        "hun": "Magyar",
-        "hup": "hupa",
-        "hye": "örmény",
-        "iba": "iba",
-        "ibo": "igbo",
-        "ido": "ido",
-        "iii": "Yi; Sichuan",
-        "iku": "inuktitut",
-        "ile": "interlingva",
-        "ilo": "iloko",
-        "ina": "interlingva (Nemzetközi Segédnyelv Egyesület)",
-        "ind": "indonéz",
-        "inh": "ingus",
-        "ipk": "inupiak",
-        "isl": "izlandi",
-        "ita": "olasz",
-        "jav": "jávai",
-        "jbo": "lodzsban",
-        "jpn": "japán",
-        "jpr": "judeo-perzsa",
-        "jrb": "judeo-arab",
-        "kaa": "kara-kalpak",
-        "kab": "kabile",
-        "kac": "kachin",
-        "kal": "Kalaallisut",
-        "kam": "Kamba (Kenya)",
-        "kan": "kannada",
-        "kas": "kasmíri",
-        "kat": "grúz",
-        "kau": "kanuri",
-        "kaw": "kawi",
-        "kaz": "kazah",
-        "kbd": "kabardi",
-        "kha": "kazi",
-        "khm": "Khmer; Central",
-        "kho": "kotáni",
-        "kik": "kikuyu",
-        "kin": "kinyarwanda",
-        "kir": "kirgiz",
-        "kmb": "kimbundu",
-        "kok": "Konkani (macrolanguage)",
-        "kom": "komi",
-        "kon": "kongo",
-        "kor": "koreai",
-        "kos": "koszrai",
-        "kpe": "kpelle",
-        "krc": "karacsai-balkar",
-        "krl": "kareliai",
-        "kru": "kuruk",
-        "kua": "kuanyama",
-        "kum": "kumyk",
-        "kur": "kurd",
-        "kut": "kutenai",
-        "lad": "ladino",
-        "lah": "landa",
-        "lam": "lamba",
-        "lao": "lao",
-        "lat": "latin",
-        "lav": "lett",
-        "lez": "lezgi",
-        "lim": "Limburgan",
-        "lin": "lingala",
-        "lit": "litván",
-        "lol": "mongo",
-        "loz": "lozi",
-        "ltz": "Luxembourgish",
-        "lua": "luba-lulua",
-        "lub": "luba-katanga",
-        "lug": "ganda",
-        "lui": "luisendo",
-        "lun": "lunda",
-        "luo": "luo (Kenya és Tanzánia)",
-        "lus": "lushai",
-        "mad": "maduri",
-        "mag": "magahi",
-        "mah": "Marshallese",
-        "mai": "maithili",
-        "mak": "makasar",
-        "mal": "malajalam",
-        "man": "mandingo",
-        "mar": "marathi",
-        "mas": "maszáj",
-        "mdf": "moksa",
-        "mdr": "mandar",
-        "men": "Mende (Sierra Leone)",
-        "mga": "közép-ír (900-1200)",
-        "mic": "Mi'kmaq",
-        "min": "minangkabau",
-        "mis": "Uncoded languages",
-        "mkd": "macedón",
-        "mlg": "malagasy",
-        "mlt": "máltai",
-        "mnc": "manchu",
-        "mni": "manipuri",
-        "moh": "mohawk",
-        "mon": "mongol",
-        "mos": "mossi",
-        "mri": "maori",
-        "msa": "Malay (macrolanguage)",
-        "mul": "több nyelv",
-        "mus": "creek",
-        "mwl": "mirandese",
-        "mwr": "marwari",
-        "mya": "burmai",
-        "myv": "erzija",
-        "nap": "nápolyi",
-        "nau": "nauru",
-        "nav": "Navajo",
-        "nbl": "ndebele (déli)",
-        "nde": "ndebele (északi)",
-        "ndo": "ndonga",
-        "nds": "German; Low",
-        "nep": "nepáli",
-        "new": "Bhasa; Nepal",
-        "nia": "nias",
-        "niu": "niuei",
-        "nld": "holland",
-        "nno": "norvég (nynorsk)",
-        "nob": "Norwegian Bokmål",
-        "nog": "nogai",
-        "non": "norvég; ónorvég",
-        "nor": "norvég",
-        "nqo": "N'Ko",
-        "nso": "sotho (északi)",
-        "nwc": "newari; ónewari",
-        "nya": "Nyanja",
-        "nym": "nyamwezi",
-        "nyn": "nyankole",
-        "nyo": "nyoro",
-        "nzi": "nzima",
-        "oci": "Occitan (post 1500)",
-        "oji": "odzsibwa",
-        "ori": "orija",
-        "orm": "oromo",
-        "osa": "oszage",
-        "oss": "Ossetian",
-        "ota": "török (ottomán) (1500-1928)",
-        "pag": "pangasini",
-        "pal": "pahlavi",
-        "pam": "pampanga",
-        "pan": "Panjabi",
-        "pap": "papiamento",
-        "pau": "palaui",
-        "peo": "Persian; Old (ca. 600-400 B.C.)",
-        "phn": "főníciai",
-        "pli": "pali",
-        "pol": "lengyel",
-        "pon": "ponpei",
-        "por": "portugál",
-        "pro": "provanszál; ó (1500-ig)",
-        "pus": "pushto",
-        "que": "kecsua",
-        "raj": "radzsasztani",
-        "rap": "rapanui",
-        "rar": "Maori; Cook Islands",
-        "roh": "Romansh",
-        "rom": "roma",
-        "ron": "román",
-        "run": "rundi",
-        "rup": "Romanian; Macedo-",
-        "rus": "orosz",
-        "sad": "sandawe",
-        "sag": "szango",
-        "sah": "jakut",
-        "sam": "arámi; szamaritánus",
-        "san": "szankszrit",
-        "sas": "szaszak",
-        "sat": "szantáli",
-        "scn": "friuli",
-        "sco": "skót",
-        "sel": "szelkup",
-        "sga": "ír; óír (900-ig)",
-        "shn": "shan",
-        "sid": "szidamo",
-        "sin": "Sinhala",
-        "slk": "szlovák",
-        "slv": "szlovén",
-        "sma": "Sami; Southern",
-        "sme": "Sami; Northern",
-        "smj": "lule szami",
-        "smn": "Sami; Inari",
-        "smo": "szamoai",
-        "sms": "Sami; Skolt",
-        "sna": "shona",
-        "snd": "szindi",
-        "snk": "soninke",
-        "sog": "sogdi",
-        "som": "szomáli",
-        "sot": "sotho; déli",
-        "spa": "spanyol",
-        "sqi": "albán",
-        "srd": "szardíniai",
-        "srn": "Sranan Tongo",
-        "srp": "szerb",
-        "srr": "serer",
-        "ssw": "swati",
-        "suk": "sukuma",
-        "sun": "szundanéz",
-        "sus": "susu",
-        "sux": "sumér",
-        "swa": "Swahili (macrolanguage)",
-        "swe": "svéd",
-        "syc": "Syriac; Classical",
-        "syr": "szír",
-        "tah": "tahiti",
-        "tam": "tamil",
-        "tat": "tatár",
-        "tel": "telugu",
-        "tem": "timne",
-        "ter": "tereno",
-        "tet": "tetum",
-        "tgk": "tadzsik",
-        "tgl": "tagalog",
-        "tha": "thai",
-        "tig": "tigre",
-        "tir": "tigrinya",
-        "tiv": "tiv",
-        "tkl": "tokelau",
-        "tlh": "Klingon",
-        "tli": "tlingit",
-        "tmh": "tamasek",
-        "tog": "tonga (nyasza)",
-        "ton": "tonga (Tonga-szigetek)",
-        "tpi": "tok pisin",
-        "tsi": "cimsi",
-        "tsn": "tswana",
-        "tso": "tsonga",
-        "tuk": "türkmén",
-        "tum": "tumbuka",
-        "tur": "török",
-        "tvl": "tuvalu",
-        "twi": "twi",
-        "tyv": "tuvini",
-        "udm": "udmurt",
-        "uga": "uragi",
-        "uig": "ujgur",
-        "ukr": "ukrán",
-        "umb": "umbundu",
-        "und": "ismeretlen",
-        "urd": "urdu",
-        "uzb": "üzbég",
-        "vai": "vai",
-        "ven": "venda",
-        "vie": "vietnami",
-        "vol": "volapük",
-        "vot": "vót",
-        "wal": "Wolaytta",
-        "war": "Waray (Philippines)",
-        "was": "washo",
-        "wln": "vallon",
-        "wol": "wolof",
-        "xal": "Kalmyk",
-        "xho": "xhosa",
-        "yao": "yao",
-        "yap": "jap",
-        "yid": "jiddis",
-        "yor": "joruba",
-        "zap": "Zapoték",
-        "zbl": "Blissymbols",
-        "zen": "zenaga",
-        "zha": "zsuang",
-        "zho": "kínai",
-        "zul": "Zulu",
-        "zun": "zuni",
-        "zxx": "No linguistic content",
-        "zza": "Zaza"
-    },
-    "ru": {
-        "aar": "Афар",
-        "abk": "Абхазский",
-        "ace": "Ачехский",
-        "ach": "Ачоли",
-        "ada": "Адангме",
-        "ady": "Адыгейский",
-        "afh": "Африхили",
-        "afr": "Африкаанс",
-        "ain": "Ainu (Japan)",
-        "aka": "Акан",
-        "akk": "Аккадский",
-        "ale": "Алеутский",
-        "alt": "Altai; Southern",
-        "amh": "Амхарский (Амаринья)",
-        "ang": "English; Old (ca. 450-1100)",
-        "anp": "Анжика",
-        "ara": "Арабский",
-        "arc": "Арамейский; Официальный",
-        "arg": "Арагонский",
-        "arn": "Mapudungun",
-        "arp": "Арапахо",
-        "arw": "Аравакский",
-        "asm": "Ассамский",
-        "ast": "Астурийский",
-        "ava": "Аварский",
-        "ave": "Авестийский",
-        "awa": "Авадхи",
-        "aym": "Аймара",
-        "aze": "Азербайджанский",
-        "bak": "Башкирский",
-        "bal": "Baluchi",
-        "bam": "Бамбара",
-        "ban": "Балийский",
-        "bas": "Баса (Камерун)",
-        "bej": "Беджа",
-        "bel": "Белорусский",
-        "bem": "Бемба (Замбия)",
-        "ben": "Бенгальский",
-        "bho": "Бходжпури",
-        "bik": "Бикольский",
-        "bin": "Бини",
-        "bis": "Бислама",
-        "bla": "Сиксика",
-        "bod": "Тибетский",
-        "bos": "Боснийский",
-        "bra": "Браун",
-        "bre": "Бретонский",
-        "bua": "Бурятский",
-        "bug": "Бугийский",
-        "bul": "Болгарский",
-        "byn": "Bilin",
-        "cad": "Каддо",
-        "car": "Carib; Galibi",
-        "cat": "Каталанский",
-        "ceb": "Себуано",
-        "ces": "Чешский",
-        "cha": "Чаморро",
-        "chb": "Чибча",
-        "che": "Чеченский",
-        "chg": "Чагатайский",
-        "chk": "Трукский",
-        "chm": "Марийский (Россия)",
-        "chn": "Чинук жаргон",
-        "cho": "Чоктав",
-        "chp": "Чипевианский",
-        "chr": "Чероки",
-        "chu": "Slavonic; Old",
-        "chv": "Чувашский",
-        "chy": "Чейенн",
-        "cop": "Коптский",
-        "cor": "Корнский",
-        "cos": "Корсиканский",
-        "cre": "Кри",
-        "crh": "Turkish; Crimean",
-        "csb": "Кашубианский",
-        "cym": "Уэльский (Валлийский)",
-        "dak": "Дакота",
-        "dan": "Датский",
-        "dar": "Даргва",
-        "del": "Делаварский",
-        "den": "Атапачские языки",
-        "deu": "Немецкий",
-        "dgr": "Догриб",
-        "din": "Динка",
-        "div": "Dhivehi",
-        "doi": "Dogri (macrolanguage)",
-        "dsb": "Sorbian; Lower",
-        "dua": "Дуала",
-        "dum": "Dutch; Middle (ca. 1050-1350)",
-        "dyu": "Диула (Дьюла)",
-        "dzo": "Дзонг-кэ",
-        "efi": "Эфик",
-        "egy": "Древнеегипетский",
-        "eka": "Экаджук",
-        "ell": "Новогреческий (с 1453)",
-        "elx": "Эламский",
-        "eng": "Английский",
-        "enm": "Среднеанглийский (1100-1500)",
-        "epo": "Эсперанто",
-        "est": "Эстонский",
-        "eus": "Баскский",
-        "ewe": "Эве",
-        "ewo": "Эвондо",
-        "fan": "Fang (Equatorial Guinea)",
-        "fao": "Фарерский",
-        "fas": "Персидский",
-        "fat": "Фанти",
-        "fij": "Фиджийский",
-        "fil": "Filipino",
-        "fin": "Финский",
-        "fon": "Фон",
-        "fra": "Французский",
-        "frm": "French; Middle (ca. 1400-1600)",
-        "fro": "French; Old (842-ca. 1400)",
-        "frr": "Frisian; Northern",
-        "frs": "Frisian; Eastern",
-        "fry": "Frisian; Western",
-        "ful": "Фулах",
-        "fur": "Фриулианский",
-        "gaa": "Га",
-        "gay": "Гайо",
-        "gba": "Gbaya (Central African Republic)",
-        "gez": "Геэз",
-        "gil": "Гильбертский",
-        "gla": "Gaelic; Scottish",
-        "gle": "Ирландский",
-        "glg": "Galician",
-        "glv": "Мэнкский",
-        "gmh": "German; Middle High (ca. 1050-1500)",
-        "goh": "German; Old High (ca. 750-1050)",
-        "gon": "Гонди",
-        "gor": "Горонтало",
-        "got": "Готский",
-        "grb": "Гребо",
-        "grc": "Древнегреческий (по 1453)",
-        "grn": "Гуарани",
-        "gsw": "German; Swiss",
-        "guj": "Гуджарати",
-        "gwi": "Gwichʼin",
-        "hai": "Хайда",
-        "hat": "Creole; Haitian",
-        "hau": "Хауса",
-        "haw": "Гавайский",
-        "heb": "Иврит",
-        "her": "Гереро",
-        "hil": "Хилигайнон",
-        "hin": "Хинди",
-        "hit": "Хиттит",
-        "hmn": "Хмонг",
-        "hmo": "Хири Моту",
-        "hrv": "Хорватский",
-        "hsb": "Sorbian; Upper",
-        "hun": "Венгерский",
-        "hup": "Хупа",
-        "hye": "Армянский",
-        "iba": "Ибанский",
-        "ibo": "Игбо",
-        "ido": "Идо",
-        "iii": "Yi; Sichuan",
-        "iku": "Инуктитут",
-        "ile": "Интерлингве",
-        "ilo": "Илоко",
-        "ina": "Интерлингва (Ассоциация международного вспомогательного языка)",
-        "ind": "Индонезийский",
-        "inh": "Ингушский",
-        "ipk": "Инулиак",
-        "isl": "Исландский",
-        "ita": "Итальянский",
-        "jav": "Яванский",
-        "jbo": "Лоджбан",
-        "jpn": "Японский",
-        "jpr": "Еврейско-персидский",
-        "jrb": "Еврейско-арабский",
-        "kaa": "Каракалпакский",
-        "kab": "Кабильский",
-        "kac": "Качинский",
-        "kal": "Kalaallisut",
-        "kam": "Kamba (Kenya)",
-        "kan": "Каннада",
-        "kas": "Кашмири",
-        "kat": "Грузинский",
-        "kau": "Канури",
-        "kaw": "Кави",
-        "kaz": "Казахский",
-        "kbd": "Кабардинский",
-        "kha": "Кхаси",
-        "khm": "Khmer; Central",
-        "kho": "Хотанский",
-        "kik": "Кикуйю",
-        "kin": "Киньяруанда",
-        "kir": "Киргизский",
-        "kmb": "Кимбунду",
-        "kok": "Konkani (macrolanguage)",
-        "kom": "Коми",
-        "kon": "Конго",
-        "kor": "Корейский",
-        "kos": "Косраинский",
-        "kpe": "Кпелле",
-        "krc": "Карачаево-балкарский",
-        "krl": "Карельский",
-        "kru": "Курух",
-        "kua": "Киньяма",
-        "kum": "Кумыкский",
-        "kur": "Курдский",
-        "kut": "Кутенаи",
-        "lad": "Ладино",
-        "lah": "Лахнда",
-        "lam": "Ламба",
-        "lao": "Лаосский",
-        "lat": "Латинский",
-        "lav": "Латвийский",
-        "lez": "Лезгинский",
-        "lim": "Limburgan",
-        "lin": "Лингала",
-        "lit": "Литовский",
-        "lol": "Монго",
-        "loz": "Лози",
-        "ltz": "Luxembourgish",
-        "lua": "Луба-Лулуа",
-        "lub": "Луба-Катанга",
-        "lug": "Ганда",
-        "lui": "Луисеньо",
-        "lun": "Лунда",
-        "luo": "Луо (Кения и Танзания)",
-        "lus": "Лушай",
-        "mad": "Мадурский",
-        "mag": "Магахи",
-        "mah": "Marshallese",
-        "mai": "Майтхили",
-        "mak": "Макассарский",
-        "mal": "Малаялам",
-        "man": "Мандинго",
-        "mar": "Маратхи",
-        "mas": "Масаи",
-        "mdf": "Мокшанский",
-        "mdr": "Мандарский",
-        "men": "Mende (Sierra Leone)",
-        "mga": "Среднеирландский (900-1200)",
-        "mic": "Mi'kmaq",
-        "min": "Минангкабау",
-        "mis": "Uncoded languages",
-        "mkd": "Македонский",
-        "mlg": "Малагаси",
-        "mlt": "Мальтийский",
-        "mnc": "Манчу",
-        "mni": "Манипури",
-        "moh": "Мохаук",
-        "mon": "Монгольский",
-        "mos": "Моей",
-        "mri": "Маори",
-        "msa": "Malay (macrolanguage)",
-        "mul": "Разных семей языки",
-        "mus": "Крик",
-        "mwl": "Мирандские",
-        "mwr": "Марвари",
-        "mya": "Бирманский",
-        "myv": "Эрзянский",
-        "nap": "Неаполитанский",
-        "nau": "Науру",
-        "nav": "Navajo",
-        "nbl": "Ндебеле южный",
-        "nde": "Ндебеле северный",
-        "ndo": "Ндунга",
-        "nds": "German; Low",
-        "nep": "Непальский",
-        "new": "Bhasa; Nepal",
-        "nia": "Ниас",
-        "niu": "Ниуэ",
-        "nld": "Нидерландский",
-        "nno": "Норвежский Нюнорск",
-        "nob": "Norwegian Bokmål",
-        "nog": "Ногайский",
-        "non": "Старонорвежский",
-        "nor": "Норвежский",
-        "nqo": "Н'ко",
-        "nso": "Sotho; Northern",
-        "nwc": "Newari; Old",
-        "nya": "Nyanja",
-        "nym": "Ньямвези",
-        "nyn": "Ньянколе",
-        "nyo": "Ньоро",
-        "nzi": "Нзима",
-        "oci": "Occitan (post 1500)",
-        "oji": "Оджибва",
-        "ori": "Ория",
-        "orm": "Оромо",
-        "osa": "Оседжи",
-        "oss": "Ossetian",
-        "ota": "Турецкий; Отомангский (1500-1928)",
-        "pag": "Пангасинан",
-        "pal": "Пехлевийский",
-        "pam": "Пампанга",
-        "pan": "Panjabi",
-        "pap": "Папьяменто",
-        "pau": "Палау",
-        "peo": "Persian; Old (ca. 600-400 B.C.)",
-        "phn": "Финикийский",
-        "pli": "Пали",
-        "pol": "Польский",
-        "pon": "Фонпейский",
-        "por": "Португальский",
-        "pro": "Старопровансальский (по 1500)",
-        "pus": "Пушту",
-        "que": "Кечуа",
-        "raj": "Раджастхани",
-        "rap": "Рапаню",
-        "rar": "Maori; Cook Islands",
-        "roh": "Romansh",
-        "rom": "Цыганский",
-        "ron": "Румынский",
-        "run": "Рунди",
-        "rup": "Romanian; Macedo-",
-        "rus": "Русский",
-        "sad": "Сандаве",
-        "sag": "Санго",
-        "sah": "Якутский",
-        "sam": "Aramaic; Samaritan",
-        "san": "Санскрит",
-        "sas": "Сасакский",
-        "sat": "Сантали",
-        "scn": "Сицилийский",
-        "sco": "Шотландский",
-        "sel": "Селкапский",
-        "sga": "Староирландский (по 900)",
-        "shn": "Шанский",
-        "sid": "Сидама",
-        "sin": "Сингальский",
-        "slk": "Словацкий",
-        "slv": "Словенский",
-        "sma": "Sami; Southern",
-        "sme": "Sami; Northern",
-        "smj": "Люле-саамский",
-        "smn": "Sami; Inari",
-        "smo": "Самоанский",
-        "sms": "Sami; Skolt",
-        "sna": "Шона",
-        "snd": "Синдхи",
-        "snk": "Сонинк",
-        "sog": "Согдийский",
-        "som": "Сомали",
-        "sot": "Сото Южный",
-        "spa": "Испанский",
-        "sqi": "Албанский",
-        "srd": "Сардинский",
-        "srn": "Sranan Tongo",
-        "srp": "Сербский",
-        "srr": "Серер",
-        "ssw": "Свати",
-        "suk": "Сукума",
-        "sun": "Сунданский",
-        "sus": "Сусу",
-        "sux": "Шумерский",
-        "swa": "Swahili (macrolanguage)",
-        "swe": "Шведский",
-        "syc": "Syriac; Classical",
-        "syr": "Сирийский",
-        "tah": "Таитянский",
-        "tam": "Тамильский",
-        "tat": "Татарский",
-        "tel": "Телугу",
-        "tem": "Темне",
-        "ter": "Терено",
-        "tet": "Тетумский",
-        "tgk": "Таджикский",
-        "tgl": "Тагалог",
-        "tha": "Таи",
-        "tig": "Тигре",
-        "tir": "Тигринья",
-        "tiv": "Тив",
-        "tkl": "Токелау",
-        "tlh": "Klingon",
-        "tli": "Тлингит",
-        "tmh": "Тамашек",
-        "tog": "Тонга (Ньяса)",
-        "ton": "Тонга (острова Тонга)",
-        "tpi": "Ток Писин",
-        "tsi": "Цимшиан",
-        "tsn": "Тсвана",
-        "tso": "Тсонга",
-        "tuk": "Туркменский",
-        "tum": "Тумбука",
-        "tur": "Турецкий",
-        "tvl": "Тувалу",
-        "twi": "Тви",
-        "tyv": "Тувинский",
-        "udm": "Удмуртский",
-        "uga": "Угаритский",
-        "uig": "Уйгурский",
-        "ukr": "Украинский",
-        "umb": "Умбунду",
-        "und": "Неидентифицированный",
-        "urd": "Урду",
-        "uzb": "Узбекский",
-        "vai": "Ваи",
-        "ven": "Венда",
-        "vie": "Вьетнамский",
-        "vol": "Волапюк",
-        "vot": "Вотик",
-        "wal": "Wolaytta",
-        "war": "Waray (Philippines)",
-        "was": "Вашо",
-        "wln": "Валлун",
-        "wol": "Волоф",
-        "xal": "Kalmyk",
-        "xho": "Коса",
-        "yao": "Яо",
-        "yap": "Яапийский",
-        "yid": "Идиш",
-        "yor": "Йоруба",
-        "zap": "Сапотекский",
-        "zbl": "Blissymbols",
-        "zen": "Зенагский",
-        "zha": "Чжуанский",
-        "zho": "Китайский",
-        "zul": "Зулусский",
-        "zun": "Зуньи",
-        "zxx": "Нет языкового содержимого",
-        "zza": "Зазаки"
-    },
-    "zh_Hans_CN": {
-        "aar": "阿法尔语",
-        "abk": "阿布哈兹语",
-        "ace": "亚齐语",
-        "ach": "阿乔利语",
-        "ada": "阿当梅语",
-        "ady": "阿迪格语",
-        "afh": "阿弗里希利语",
-        "afr": "南非荷兰语",
-        "ain": "阿伊努语（日本）",
-        "aka": "阿坎语",
-        "akk": "阿卡德语",
-        "ale": "阿留申语",
-        "alt": "阿尔泰语（南）",
-        "amh": "阿姆哈拉语",
-        "ang": "英语（上古，约 450-1100）",
-        "anp": "安吉卡语",
-        "ara": "阿拉伯语",
-        "arc": "阿拉米语（官方，公元前 700-300）",
-        "arg": "阿拉贡语",
-        "arn": "阿劳坎语",
-        "arp": "阿拉帕霍语",
-        "arw": "阿拉瓦克语",
-        "asm": "阿萨姆语",
-        "ast": "阿斯图里亚斯语",
-        "ava": "阿瓦尔语",
-        "ave": "阿维斯陀语",
-        "awa": "阿瓦德语",
-        "aym": "艾马拉语",
-        "aze": "阿塞拜疆语",
-        "bak": "巴什基尔语",
-        "bal": "俾路支语",
-        "bam": "班巴拉语",
-        "ban": "巴厘语",
-        "bas": "巴萨语（喀麦隆）",
-        "bej": "贝扎语",
-        "bel": "白俄罗斯语",
-        "bem": "本巴语（赞比亚）",
-        "ben": "孟加拉语",
-        "bho": "博杰普尔语",
-        "bik": "比科尔语",
-        "bin": "比尼语",
-        "bis": "比斯拉马语",
-        "bla": "西克西卡语",
-        "bod": "藏语",
-        "bos": "波斯尼亚语",
-        "bra": "布拉吉语",
-        "bre": "布列塔尼语",
-        "bua": "布里亚特语",
-        "bug": "布吉语",
-        "bul": "保加利亚语",
-        "byn": "比林语",
-        "cad": "卡多语",
-        "car": "加勒比语",
-        "cat": "加泰罗尼亚语",
-        "ceb": "宿务语",
-        "ces": "捷克语",
-        "cha": "查莫罗语",
-        "chb": "奇布查语",
-        "che": "车臣语",
-        "chg": "察合台语",
-        "chk": "丘克语",
-        "chm": "马里语（俄罗斯）",
-        "chn": "奇努克混合语",
-        "cho": "乔克托语",
-        "chp": "奇佩维安语",
-        "chr": "切罗基语",
-        "chu": "斯拉夫语（古教会）",
-        "chv": "楚瓦什语",
-        "chy": "夏延语",
-        "cop": "科普特语",
-        "cor": "康沃尔语",
-        "cos": "科西嘉语",
-        "cre": "克里语",
-        "crh": "鞑靼语（克里米亚）",
-        "csb": "卡舒比语",
-        "cym": "威尔士语",
-        "dak": "达科他语",
-        "dan": "丹麦语",
-        "dar": "达尔格瓦语",
-        "del": "特拉华语",
-        "den": "史拉维语（阿沙巴斯甘）",
-        "deu": "德语",
-        "dgr": "多格里布语",
-        "din": "丁卡语",
-        "div": "迪维希语",
-        "doi": "多格拉语",
-        "dsb": "索布语（下）",
-        "dua": "杜亚拉语",
-        "dum": "荷兰语（中古，约 1050-1350）",
-        "dyu": "迪尤拉语",
-        "dzo": "宗喀语",
-        "efi": "埃菲克语",
-        "egy": "埃及语（古）",
-        "eka": "埃克丘克语",
-        "ell": "希腊语（现代，1453-）",
-        "elx": "埃兰语",
-        "eng": "英语",
-        "enm": "英语（中古，1100-1500）",
-        "epo": "世界语",
-        "est": "爱沙尼亚语",
-        "eus": "巴斯克语",
-        "ewe": "埃维语",
-        "ewo": "埃翁多语",
-        "fan": "芳语（赤道几内亚）",
-        "fao": "法罗语",
-        "fas": "波斯语",
-        "fat": "芳蒂语",
-        "fij": "斐济语",
-        "fil": "菲律宾语",
-        "fin": "芬兰语",
-        "fon": "丰语",
-        "fra": "法语",
-        "frm": "法语（中古，约 1400-1600）",
-        "fro": "法语（上古，842-约 1400）",
-        "frr": "弗里西语（北）",
-        "frs": "弗里西亚语（东）",
-        "fry": "弗里西亚语（西）",
-        "ful": "富拉语",
-        "fur": "弗留利语",
-        "gaa": "加语",
-        "gay": "卡约语",
-        "gba": "巴亚语（中非共和国）",
-        "gez": "吉兹语",
-        "gil": "吉尔伯特语",
-        "gla": "盖尔语（苏格兰）",
-        "gle": "爱尔兰语",
-        "glg": "加利西亚语",
-        "glv": "马恩岛语",
-        "gmh": "德语（中古高地，约 1050-1500）",
-        "goh": "德语（上古高地，约 750-1050）",
-        "gon": "贡德语",
-        "gor": "哥伦打洛语",
-        "got": "哥特语",
-        "grb": "格列博语",
-        "grc": "希腊语（古典，直到 1453）",
-        "grn": "瓜拉尼语",
-        "gsw": "德语（瑞士）",
-        "guj": "古吉拉特语",
-        "gwi": "库臣语",
-        "hai": "海达语",
-        "hat": "克里奥尔语（海地）",
-        "hau": "豪萨语",
-        "haw": "夏威夷语",
-        "heb": "希伯来语",
-        "her": "赫雷罗语",
-        "hil": "希利盖农语",
-        "hin": "印地语",
-        "hit": "赫梯语",
-        "hmn": "苗语",
-        "hmo": "希里莫图语",
-        "hrv": "克罗地亚语",
-        "hsb": "索布语（上）",
-        "hun": "匈牙利语",
-        "hup": "胡帕语",
-        "hye": "亚美尼亚语",
-        "iba": "伊班语",
-        "ibo": "伊博语",
-        "ido": "伊多语",
-        "iii": "彝语（四川）",
-        "iku": "伊努伊特语",
-        "ile": "国际语（西方）",
-        "ilo": "伊洛卡诺语",
-        "ina": "国际语",
-        "ind": "印尼语",
-        "inh": "印古什语",
-        "ipk": "依努庇克语",
-        "isl": "冰岛语",
-        "ita": "意大利语",
-        "jav": "爪哇语",
-        "jbo": "逻辑语",
-        "jpn": "日语",
-        "jpr": "犹太-波斯语",
-        "jrb": "犹太-阿拉伯语",
-        "kaa": "卡拉卡尔帕克语",
-        "kab": "卡布列语",
-        "kac": "景颇语",
-        "kal": "格陵兰语",
-        "kam": "坎巴语（肯尼亚）",
-        "kan": "卡纳达语",
-        "kas": "克什米尔语",
-        "kat": "格鲁吉亚语",
-        "kau": "卡努里语",
-        "kaw": "卡威语",
-        "kaz": "哈萨克语",
-        "kbd": "卡巴尔达语",
-        "kha": "卡西语",
-        "khm": "高棉语",
-        "kho": "和田语",
-        "kik": "基库尤语",
-        "kin": "基尼阿万达语",
-        "kir": "吉尔吉斯语",
-        "kmb": "金本杜语",
-        "kok": "孔卡尼语",
-        "kom": "科米语",
-        "kon": "刚果语",
-        "kor": "朝鲜语",
-        "kos": "科斯拉伊语",
-        "kpe": "克佩勒语",
-        "krc": "卡拉恰伊-巴尔卡尔语",
-        "krl": "卡累利阿语",
-        "kru": "库卢克语",
-        "kua": "宽亚玛语",
-        "kum": "库梅克语",
-        "kur": "库尔德语",
-        "kut": "库特内语",
-        "lad": "拉迪诺语",
-        "lah": "拉亨达语",
-        "lam": "兰巴语",
-        "lao": "老挝语",
-        "lat": "拉丁语",
-        "lav": "拉脱维亚语",
-        "lez": "列兹金语",
-        "lim": "林堡语",
-        "lin": "林加拉语",
-        "lit": "立陶宛语",
-        "lol": "芒戈语",
-        "loz": "洛齐语",
-        "ltz": "卢森堡语",
-        "lua": "卢巴-卢拉语",
-        "lub": "卢巴-加丹加语",
-        "lug": "干达语",
-        "lui": "卢伊塞诺语",
-        "lun": "隆达语",
-        "luo": "卢奥语（肯尼亚和坦桑尼亚）",
-        "lus": "卢萨语",
-        "mad": "马都拉语",
-        "mag": "摩揭陀语",
-        "mah": "马绍尔语",
-        "mai": "米德勒语",
-        "mak": "望加锡语",
-        "mal": "马拉雅拉姆语",
-        "man": "曼丁哥语",
-        "mar": "马拉地语",
-        "mas": "马萨伊语",
-        "mdf": "莫克沙语",
-        "mdr": "曼达语",
-        "men": "门德语（塞拉利昂）",
-        "mga": "爱尔兰语（中古，900-1200）",
-        "mic": "米克马克语",
-        "min": "米南卡保语",
-        "mis": "未被编码的语言",
-        "mkd": "马其顿语",
-        "mlg": "马达加斯加语",
-        "mlt": "马耳他语",
-        "mnc": "满语",
-        "mni": "曼尼普尔语",
-        "moh": "莫霍克语",
-        "mon": "蒙古语",
-        "mos": "莫西语",
-        "mri": "毛利语",
-        "msa": "马来语族",
-        "mul": "多种语言",
-        "mus": "克里克语",
-        "mwl": "米兰德斯语",
-        "mwr": "马尔瓦利语",
-        "mya": "缅甸语",
-        "myv": "厄尔兹亚语",
-        "nap": "拿坡里语",
-        "nau": "瑙鲁语",
-        "nav": "纳瓦霍语",
-        "nbl": "恩德贝勒语（南）",
-        "nde": "恩德贝勒语（北）",
-        "ndo": "恩敦加语",
-        "nds": "撒克逊语（低地）",
-        "nep": "尼泊尔语",
-        "new": "尼瓦尔语",
-        "nia": "尼亚斯语",
-        "niu": "纽埃语",
-        "nld": "荷兰语",
-        "nno": "新挪威语",
-        "nob": "挪威布克莫尔语",
-        "nog": "诺盖语",
-        "non": "诺尔斯语（古）",
-        "nor": "挪威语",
-        "nqo": "西非书面语言字母",
-        "nso": "索托语（北）",
-        "nwc": "尼瓦尔语（古典）",
-        "nya": "尼扬贾语",
-        "nym": "尼扬韦齐语",
-        "nyn": "尼扬科勒语",
-        "nyo": "尼奥罗语",
-        "nzi": "恩济马语",
-        "oci": "奥克西唐语（1500 后）",
-        "oji": "奥吉布瓦语",
-        "ori": "奥利亚语",
-        "orm": "奥罗莫语",
-        "osa": "奥萨格语",
-        "oss": "奥塞梯语",
-        "ota": "土耳其语（奥斯曼，1500-1928）",
-        "pag": "邦阿西楠语",
-        "pal": "钵罗钵语",
-        "pam": "邦板牙语",
-        "pan": "旁遮普语",
-        "pap": "帕皮亚门托语",
-        "pau": "帕劳语",
-        "peo": "波斯语（古，公元前约 600-400）",
-        "phn": "腓尼基语",
-        "pli": "巴利语",
-        "pol": "波兰语",
-        "pon": "波纳佩语",
-        "por": "葡萄牙语",
-        "pro": "普罗旺斯语（古，至 1500）",
-        "pus": "普什图语",
-        "que": "克丘亚语",
-        "raj": "拉贾斯坦语",
-        "rap": "拉帕努伊语",
-        "rar": "拉罗汤加语",
-        "roh": "罗曼什语",
-        "rom": "罗姆语",
-        "ron": "罗马尼亚语",
-        "run": "基隆迪语",
-        "rup": "阿罗马尼亚语",
-        "rus": "俄语",
-        "sad": "桑达韦语",
-        "sag": "桑戈语",
-        "sah": "雅库特语",
-        "sam": "阿拉米语（萨马利亚）",
-        "san": "梵语",
-        "sas": "萨萨克语",
-        "sat": "桑塔利语",
-        "scn": "西西里语",
-        "sco": "苏格兰语",
-        "sel": "塞尔库普语",
-        "sga": "爱尔兰语（古，至 900）",
-        "shn": "掸语",
-        "sid": "锡达莫语",
-        "sin": "僧加罗语",
-        "slk": "斯洛伐克语",
-        "slv": "斯洛文尼亚语",
-        "sma": "萨米语（南）",
-        "sme": "萨米语（北）",
-        "smj": "律勒欧-萨米语",
-        "smn": "伊纳里-萨米语",
-        "smo": "萨摩亚语",
-        "sms": "斯科特-萨米语",
-        "sna": "修纳语",
-        "snd": "信德语",
-        "snk": "索宁克语",
-        "sog": "粟特语",
-        "som": "索马里语",
-        "sot": "索托语（南）",
-        "spa": "西班牙语",
-        "sqi": "阿尔巴尼亚语",
-        "srd": "撒丁语",
-        "srn": "苏里南汤加语",
-        "srp": "塞尔维亚语",
-        "srr": "塞雷尔语",
-        "ssw": "斯瓦特语",
-        "suk": "苏库马语",
-        "sun": "巽他语",
-        "sus": "苏苏语",
-        "sux": "苏美尔语",
-        "swa": "斯瓦希里语族",
-        "swe": "瑞典语",
-        "syc": "叙利亚语（古典）",
-        "syr": "古叙利亚语",
-        "tah": "塔希提语",
-        "tam": "泰米尔语",
-        "tat": "塔塔尔语",
-        "tel": "泰卢固语",
-        "tem": "滕内语",
-        "ter": "特列纳语",
-        "tet": "特塔姆语",
-        "tgk": "塔吉克语",
-        "tgl": "塔加洛语",
-        "tha": "泰语",
-        "tig": "提格雷语",
-        "tir": "提格里尼亚语",
-        "tiv": "蒂夫语",
-        "tkl": "托克劳语",
-        "tlh": "克林贡语",
-        "tli": "特林吉特语",
-        "tmh": "塔马舍克语",
-        "tog": "汤加语 (尼亚萨)",
-        "ton": "汤加语（汤加岛）",
-        "tpi": "托克皮辛语",
-        "tsi": "钦西安语",
-        "tsn": "茨瓦纳语",
-        "tso": "聪加语",
-        "tuk": "土库曼语",
-        "tum": "奇图姆布卡语",
-        "tur": "土耳其语",
-        "tvl": "图瓦卢语",
-        "twi": "契维语",
-        "tyv": "图瓦语",
-        "udm": "乌德穆尔特语",
-        "uga": "乌加里特语",
-        "uig": "维吾尔语",
-        "ukr": "乌克兰语",
-        "umb": "翁本杜语",
-        "und": "未确定的语言",
-        "urd": "乌尔都语",
-        "uzb": "乌兹别克语",
-        "vai": "瓦伊语",
-        "ven": "文达语",
-        "vie": "越南语",
-        "vol": "沃拉普克语",
-        "vot": "沃提克语",
-        "wal": "瓦拉莫语",
-        "war": "瓦赖语（菲律宾）",
-        "was": "瓦肖语",
-        "wln": "瓦龙语",
-        "wol": "沃洛夫语",
-        "xal": "卡尔梅克语",
-        "xho": "科萨语",
-        "yao": "瑶语",
-        "yap": "雅浦语",
-        "yid": "依地语",
-        "yor": "约鲁巴语",
-        "zap": "萨波特克语",
-        "zbl": "布利斯符号",
-        "zen": "哲纳加语",
-        "zha": "壮语",
-        "zho": "中文",
-        "zul": "祖鲁语",
-        "zun": "祖尼语",
-        "zxx": "No linguistic content",
-        "zza": "扎扎其语"
-    },
-    "it": {
-        "aar": "Afar",
-        "abk": "Abkhazian",
-        "ace": "Achinese",
-        "ach": "Acoli",
-        "ada": "Adangme",
-        "ady": "Adyghe",
-        "afh": "Afrihili",
-        "afr": "Afrikaans",
-        "ain": "Ainu (Giappone)",
-        "aka": "Akan",
-        "akk": "Accadico",
-        "ale": "Aleut",
-        "alt": "Altai meridionale",
-        "amh": "Amarico",
-        "ang": "Inglese antico (ca. 450-1100)",
-        "anp": "Angika",
-        "ara": "Arabo",
-        "arc": "Aramaico ufficiale (700-300 p.e.v.)",
-        "arg": "Aragonese",
-        "arn": "Mapudungun",
-        "arp": "Arapaho",
-        "arw": "Arawak",
-        "asm": "Assamese",
-        "ast": "Asturiano",
-        "ava": "Avarico",
-        "ave": "Avestano",
-        "awa": "Awadhi",
-        "aym": "Aymara",
-        "aze": "Azerbaijano",
-        "bak": "Bashkir",
-        "bal": "Baluchi",
-        "bam": "Bambara",
-        "ban": "Balinese",
-        "bas": "Basa (Cameru)",
-        "bej": "Beja",
-        "bel": "Bielorusso",
-        "bem": "Bemba (Zambia)",
-        "ben": "Bengalese",
-        "bho": "Bhojpuri",
-        "bik": "bicol",
-        "bin": "Bini",
-        "bis": "bislama",
-        "bla": "Siksika",
-        "bod": "Tibetano",
-        "bos": "Bosniaco",
-        "bra": "braj",
-        "bre": "Bretone",
-        "bua": "Buriat",
-        "bug": "Buginese",
-        "bul": "Bulgaro",
-        "byn": "Bilin",
-        "cad": "caddo",
-        "car": "Carib (Galibi)",
-        "cat": "Catalano",
-        "ceb": "Cebuano",
-        "ces": "Ceco",
-        "cha": "Chamorro",
-        "chb": "Chibcha",
-        "che": "Chechen",
-        "chg": "Ciagataico",
-        "chk": "Chuukese",
-        "chm": "Mari (Russia)",
-        "chn": "Chinook jargon",
-        "cho": "Choctaw",
-        "chp": "Chipewyan",
-        "chr": "Cherokee",
-        "chu": "Slavo antico",
-        "chv": "Chuvash",
-        "chy": "Cheyenne",
-        "cop": "Copto",
-        "cor": "Cornish",
-        "cos": "Corso",
-        "cre": "Cree",
-        "crh": "Turco; Crimeo",
-        "csb": "kashubian",
-        "cym": "Gallese",
-        "dak": "Dakota",
-        "dan": "Danese",
-        "dar": "Dargwa",
-        "del": "delaware",
-        "den": "Slave (Athapascan)",
-        "deu": "Tedesco",
-        "dgr": "Dogrib",
-        "din": "Dinca",
-        "div": "Dhivehi",
-        "doi": "Dogri (macrolingua)",
-        "dsb": "Lusaziano inferiore",
-        "dua": "Duala",
-        "dum": "Olandese medio (ca. 1050-1350)",
-        "dyu": "Diula",
-        "dzo": "Dzongkha",
-        "efi": "Efik",
-        "egy": "Egiziano antico",
-        "eka": "Ekajuk",
-        "ell": "Greco moderno (1453-)",
-        "elx": "Elamitico",
-        "eng": "Inglese",
-        "enm": "Inglese medio (1100-1500)",
-        "epo": "Esperanto",
-        "est": "Estone",
-        "eus": "Basco",
-        "ewe": "Ewe",
-        "ewo": "Ewondo",
-        "fan": "Fang (Guinea equatoriale)",
-        "fao": "Faroese",
-        "fas": "Persiano",
-        "fat": "Fanti",
-        "fij": "Figiano",
-        "fil": "Filippino",
-        "fin": "Finlandese",
-        "fon": "Fon",
-        "fra": "Francese",
-        "frm": "Francese medio (ca. 1400-1600)",
-        "fro": "Francese antico (842-ca. 1400)",
-        "frr": "Frisone settentrionale",
-        "frs": "Frisone orientale",
-        "fry": "Frisone occidentale",
-        "ful": "Fulah",
-        "fur": "Friulano",
-        "gaa": "ga",
-        "gay": "gayo",
-        "gba": "Gbaya (Repubblica centro africana)",
-        "gez": "Geez",
-        "gil": "Gilbertese",
-        "gla": "Gaelico (Scozzese)",
-        "gle": "Gaelico",
-        "glg": "Galiziano",
-        "glv": "Manx",
-        "gmh": "Tedesco medio alto (ca. 1050-1500)",
-        "goh": "Tedesco antico alto (ca. 750-1050)",
-        "gon": "Gondi",
-        "gor": "Gorontalo",
-        "got": "Gotico",
-        "grb": "Grebo",
-        "grc": "Greco antico (fino al 1453)",
-        "grn": "Guarani",
-        "gsw": "Tedesco (Svizzera)",
-        "guj": "Gujarati",
-        "gwi": "Gwichʼin",
-        "hai": "Haida",
-        "hat": "Creolo (Haitiano)",
-        "hau": "Hausa",
-        "haw": "hawaiano",
-        "heb": "Ebraico",
-        "her": "Herero",
-        "hil": "Hiligayna",
-        "hin": "Hindi",
-        "hit": "hittite",
-        "hmn": "Hmong",
-        "hmo": "Hiri motu",
-        "hrv": "Croato",
-        "hsb": "Lusaziano superiore",
-        "hun": "Ungherese",
-        "hup": "Hupa",
-        "hye": "armeno",
-        "iba": "Iban",
-        "ibo": "Igbo",
-        "ido": "Ido",
-        "iii": "Yi; Sichuan",
-        "iku": "inuktitut",
-        "ile": "Interlingua",
-        "ilo": "Ilocano",
-        "ina": "Interlingua (International Auxiliary Language Association)",
-        "ind": "Indonesiano",
-        "inh": "Ingush",
-        "ipk": "Inupiaq",
-        "isl": "Islandese",
-        "ita": "Italiano",
-        "jav": "Javanese",
-        "jbo": "lojban",
-        "jpn": "Giapponese",
-        "jpr": "Giudeo-persiano",
-        "jrb": "Giudeo-arabo",
-        "kaa": "Kara-Kalpak",
-        "kab": "Kabyle",
-        "kac": "Kachin",
-        "kal": "Kalaallisut",
-        "kam": "Kamba (Kenya)",
-        "kan": "kannada",
-        "kas": "kashmiri",
-        "kat": "Georgiano",
-        "kau": "Kanuri",
-        "kaw": "Kawi",
-        "kaz": "Kazako",
-        "kbd": "Kabardia",
-        "kha": "Khasi",
-        "khm": "Khmer centrale",
-        "kho": "Khotanese",
-        "kik": "Kikuyu",
-        "kin": "Kinyarwanda",
-        "kir": "Kirghiso",
-        "kmb": "Kimbundu",
-        "kok": "Konkani (macrolinguaggio)",
-        "kom": "Komi",
-        "kon": "Kongo",
-        "kor": "Coreano",
-        "kos": "Kosraean",
-        "kpe": "Kpelle",
-        "krc": "karachay-Balkar",
-        "krl": "Karelian",
-        "kru": "Kurukh",
-        "kua": "Kuanyama",
-        "kum": "kumyk",
-        "kur": "Curdo",
-        "kut": "kutenai",
-        "lad": "Ladino",
-        "lah": "lahnda",
-        "lam": "Lamba",
-        "lao": "Lao",
-        "lat": "Latino",
-        "lav": "Lettone",
-        "lez": "Lezghian",
-        "lim": "Limburgan",
-        "lin": "Lingala",
-        "lit": "Lituano",
-        "lol": "Mongo",
-        "loz": "lozi",
-        "ltz": "Lussemburghese",
-        "lua": "Luba-lulua",
-        "lub": "Luba-katanga",
-        "lug": "Ganda",
-        "lui": "Luiseno",
-        "lun": "Lunda",
-        "luo": "Luo (Kenya e Tanzania)",
-        "lus": "Lushai",
-        "mad": "Madurese",
-        "mag": "Magahi",
-        "mah": "Marshallese",
-        "mai": "Maithili",
-        "mak": "Makasar",
-        "mal": "Malayalam",
-        "man": "Mandingo",
-        "mar": "Marathi",
-        "mas": "Masai",
-        "mdf": "Moksha",
-        "mdr": "Mandar",
-        "men": "Mende (Sierra Leone)",
-        "mga": "Irlandese medio (900-1200)",
-        "mic": "Mi'kmaq",
-        "min": "Minangkabau",
-        "mis": "Lingue non codificate",
-        "mkd": "Macedone",
-        "mlg": "malagasy",
-        "mlt": "Maltese",
-        "mnc": "Manchu",
-        "mni": "Manipuri",
-        "moh": "mohawk",
-        "mon": "Mongolo",
-        "mos": "Mossi",
-        "mri": "Maori",
-        "msa": "Malay (macrolingua)",
-        "mul": "Lingue multiple",
-        "mus": "Creek",
-        "mwl": "Mirandese",
-        "mwr": "Marwari",
-        "mya": "Burmese",
-        "myv": "Erzya",
-        "nap": "Napoletano",
-        "nau": "Nauru",
-        "nav": "Navajo",
-        "nbl": "Ndebele del Sud",
-        "nde": "Ndebele del Nord",
-        "ndo": "Ndonga",
-        "nds": "Tedesco; Volgare",
-        "nep": "Nepali",
-        "new": "Bhasa; Nepal",
-        "nia": "Nias",
-        "niu": "Niuean",
-        "nld": "Olandese",
-        "nno": "Norvegese nynorsk",
-        "nob": "Norvegese bokmål",
-        "nog": "Nogai",
-        "non": "Norse antico",
-        "nor": "Norvegese",
-        "nqo": "N'Ko",
-        "nso": "Sotho settentrionale",
-        "nwc": "Newari antico",
-        "nya": "Nyanja",
-        "nym": "Nyamwezi",
-        "nyn": "Nyankole",
-        "nyo": "Nyoro",
-        "nzi": "Nzima",
-        "oci": "Occitan (post 1500)",
-        "oji": "Ojibwa",
-        "ori": "Oriya",
-        "orm": "Oromo",
-        "osa": "Osage",
-        "oss": "Ossetian",
-        "ota": "Turco ottomano (1500-1928)",
-        "pag": "Pangasinan",
-        "pal": "Pahlavi",
-        "pam": "pampanga",
-        "pan": "Panjabi",
-        "pap": "Papiamento",
-        "pau": "Palauan",
-        "peo": "Persiano antico (ca. 600-400 A.C.)",
-        "phn": "Fenicio",
-        "pli": "Pali",
-        "pol": "Polacco",
-        "pon": "Pohnpeian",
-        "por": "Portoghese",
-        "pro": "Provençal antico (fino al 1500)",
-        "pus": "Pushto",
-        "que": "Quechua",
-        "raj": "rajasthani",
-        "rap": "Rapanui",
-        "rar": "Maori (Isole Cook)",
-        "roh": "Romansh",
-        "rom": "Romany",
-        "ron": "Rumeno",
-        "run": "Rundi",
-        "rup": "Rumeno macedone",
-        "rus": "Russo",
-        "sad": "Sandawe",
-        "sag": "Sango",
-        "sah": "Yakut",
-        "sam": "Aramaico samaritano",
-        "san": "Sanscrito",
-        "sas": "Sasak",
-        "sat": "Santali",
-        "scn": "Siciliano",
-        "sco": "Scots",
-        "sel": "Selkup",
-        "sga": "Irlandese antico (fino al ’900)",
-        "shn": "Shan",
-        "sid": "Sidamo",
-        "sin": "Sinhala",
-        "slk": "Slovacco",
-        "slv": "Sloveno",
-        "sma": "Sami meridionale",
-        "sme": "Sami settentrionale",
-        "smj": "sami lule",
-        "smn": "Sami; Inari",
-        "smo": "Samoano",
-        "sms": "Sami; Skolt",
-        "sna": "Shona",
-        "snd": "Sindhi",
-        "snk": "Soninke",
-        "sog": "Sogdian",
-        "som": "Somali",
-        "sot": "Sotho meridionale",
-        "spa": "Spagnolo",
-        "sqi": "Albanese",
-        "srd": "Sardo",
-        "srn": "Sranan Tongo",
-        "srp": "Serbo",
-        "srr": "Serer",
-        "ssw": "Swati",
-        "suk": "sukuma",
-        "sun": "Sundanese",
-        "sus": "Susu",
-        "sux": "Sumero",
-        "swa": "Swahili (macro-lingua)",
-        "swe": "Svedese",
-        "syc": "Siriaco classico",
-        "syr": "Siriaco",
-        "tah": "Tahitian",
-        "tam": "Tamil",
-        "tat": "Tatarico",
-        "tel": "Telugu",
-        "tem": "Temne",
-        "ter": "Tereno",
-        "tet": "Tetum",
-        "tgk": "Tajik",
-        "tgl": "Tagalog",
-        "tha": "Thailandese",
-        "tig": "Tigre",
-        "tir": "Tigrinya",
-        "tiv": "Tiv",
-        "tkl": "Tokelau",
-        "tlh": "Klingon",
-        "tli": "Tlingit",
-        "tmh": "Tamashek",
-        "tog": "Tonga (Nyasa)",
-        "ton": "Tonga (Isole Tonga)",
-        "tpi": "Tok pisin",
-        "tsi": "Tsimshian",
-        "tsn": "Tswana",
-        "tso": "Tsonga",
-        "tuk": "Turkmeno",
-        "tum": "Tumbuka",
-        "tur": "Turco",
-        "tvl": "Tuvalu",
-        "twi": "Twi",
-        "tyv": "Tuvinian",
-        "udm": "Udmurt",
-        "uga": "Ugaritico",
-        "uig": "Uighuro",
-        "ukr": "Ucraino",
-        "umb": "Umbundu",
-        "und": "Non determinato",
-        "urd": "Urdu",
-        "uzb": "Usbeco",
-        "vai": "Vai",
-        "ven": "venda",
-        "vie": "Vietnamita",
-        "vol": "Volapük",
-        "vot": "Votic",
-        "wal": "Wolaytta",
-        "war": "Waray (Filippine)",
-        "was": "Washo",
-        "wln": "Walloon",
-        "wol": "Wolof",
-        "xal": "Kalmyk",
-        "xho": "Xhosa",
-        "yao": "Yao",
-        "yap": "Yapese",
-        "yid": "Yiddish",
-        "yor": "Yoruba",
-        "zap": "Zapoteco",
-        "zbl": "Blissymbols",
-        "zen": "Zenaga",
-        "zha": "Zhuang",
-        "zho": "Cinese",
-        "zul": "Zulu",
-        "zun": "Zuni",
-        "zxx": "Nessun contenuto linguistico",
-        "zza": "Zaza"
-    },
-    "uk": {
-        "aar": "афар",
-        "abk": "абхазька",
-        "ace": "ачеська",
-        "ach": "ачолі",
-        "ada": "адангме",
-        "ady": "адигейська",
-        "afh": "афрингілі",
-        "afr": "африкаанс",
-        "ain": "айнська (Японія)",
-        "aka": "акан",
-        "akk": "аккадська",
-        "ale": "алеутська",
-        "alt": "алтайська (південна)",
-        "amh": "амхарська",
-        "ang": "давньоанглійська (бл. 450-1100)",
-        "anp": "ангіка",
-        "ara": "арабська",
-        "arc": "арамейська (офіційна; 700-300 до нашої ери)",
-        "arg": "арагонська",
-        "arn": "арауканська",
-        "arp": "арапахо",
-        "arw": "аравакська",
-        "asm": "ассамська",
-        "ast": "астурійська",
-        "ava": "аварська",
-        "ave": "авестанська",
-        "awa": "авадхі",
-        "aym": "аймарська",
-        "aze": "азербайджанська",
-        "bak": "башкирська",
-        "bal": "белуджійська",
-        "bam": "бамбара",
-        "ban": "балійська",
-        "bas": "баса (Камерун)",
-        "bej": "бежа",
-        "bel": "білоруська",
-        "bem": "бемба (Замбія)",
-        "ben": "бенгальська",
-        "bho": "бходжпурі",
-        "bik": "бікольська",
-        "bin": "біні",
-        "bis": "біслама",
-        "bla": "сісіка",
-        "bod": "тибетська",
-        "bos": "боснійська",
-        "bra": "брай",
-        "bre": "бретонська",
-        "bua": "бурятська",
-        "bug": "бугійська",
-        "bul": "болгарська",
-        "byn": "білін",
-        "cad": "каддо",
-        "car": "карибська (галібі)",
-        "cat": "каталонська",
-        "ceb": "себуано",
-        "ces": "чеська",
-        "cha": "чаморо",
-        "chb": "чибча",
-        "che": "чеченська",
-        "chg": "чагатайська",
-        "chk": "чуукська",
-        "chm": "марійська (Росія)",
-        "chn": "чинук; жаргон",
-        "cho": "чоктау",
-        "chp": "чипев’ян",
-        "chr": "черокі",
-        "chu": "давньослов’янська",
-        "chv": "чуваська",
-        "chy": "шаєнн",
-        "cop": "коптська",
-        "cor": "корнійська",
-        "cos": "корсиканська",
-        "cre": "крі",
-        "crh": "турецька (кримська)",
-        "csb": "кашубська",
-        "cym": "валійська",
-        "dak": "дакота",
-        "dan": "данська",
-        "dar": "даргва",
-        "del": "делаварська",
-        "den": "слейві (атабаська)",
-        "deu": "німецька",
-        "dgr": "догріб",
-        "din": "дінка",
-        "div": "мальдивська",
-        "doi": "догрі (макромова)",
-        "dsb": "нижньолужицька",
-        "dua": "дуала",
-        "dum": "середньовічна голландська (бл. 1050-1350)",
-        "dyu": "діула",
-        "dzo": "дзонг-ке",
-        "efi": "ефік",
-        "egy": "давньоєгипетська",
-        "eka": "екаджук",
-        "ell": "грецька (з 1453)",
-        "elx": "еламська",
-        "eng": "англійська",
-        "enm": "середньоанглійська (1100-1500)",
-        "epo": "есперанто",
-        "est": "естонська",
-        "eus": "баскська",
-        "ewe": "еве",
-        "ewo": "евондо",
-        "fan": "фанг (Екваторіальна Гвінея)",
-        "fao": "фарерська",
-        "fas": "перська",
-        "fat": "фанті",
-        "fij": "фіджійська",
-        "fil": "філіппінська",
-        "fin": "фінська",
-        "fon": "фон",
-        "fra": "французька",
-        "frm": "середньофранцузька (бл. 1400-1600)",
-        "fro": "давньофранцузька (842-бл. 1400)",
-        "frr": "фризька (північна)",
-        "frs": "фризька (східна)",
-        "fry": "фризька (західна)",
-        "ful": "фулах",
-        "fur": "фріульська",
-        "gaa": "га",
-        "gay": "гайо",
-        "gba": "гбая (Центральноафриканська Республіка)",
-        "gez": "гііз",
-        "gil": "гільбертська",
-        "gla": "гаельська (Шотландія)",
-        "gle": "ірландська",
-        "glg": "галісійська",
-        "glv": "манкс",
-        "gmh": "середньоверхньонімецька (бл. 1050-1500)",
-        "goh": "давньосередньонімецька (бл. 750-1050)",
-        "gon": "гонді",
-        "gor": "горонтало",
-        "got": "готська",
-        "grb": "гребо",
-        "grc": "давньогрецька (до 1453)",
-        "grn": "гуарані",
-        "gsw": "німецька (Швейцарія)",
-        "guj": "гуджараті",
-        "gwi": "гвічин",
-        "hai": "хайда",
-        "hat": "креольська (гаїтянська)",
-        "hau": "хауса",
-        "haw": "гавайська",
-        "heb": "іврит",
-        "her": "гереро",
-        "hil": "хілігайнон",
-        "hin": "хінді",
-        "hit": "хетська",
-        "hmn": "хмонг",
-        "hmo": "хірімоту",
-        "hrv": "хорватська",
-        "hsb": "верхньолужицька",
-        "hun": "угорська",
-        "hup": "хупа",
-        "hye": "вірменська",
-        "iba": "ібанська",
-        "ibo": "ігбо",
-        "ido": "ідо",
-        "iii": "ї (Сичуань)",
-        "iku": "інуктітут",
-        "ile": "окциденталь",
-        "ilo": "ілоко",
-        "ina": "інтерлінгва (Асоціація міжнародної допоміжної мови)",
-        "ind": "індонезійська",
-        "inh": "інгушська",
-        "ipk": "інупіак",
-        "isl": "ісландська",
-        "ita": "італійська",
-        "jav": "яванська",
-        "jbo": "ложбан",
-        "jpn": "японська",
-        "jpr": "єврейсько-перська",
-        "jrb": "єврейсько-арабська",
-        "kaa": "каракалпацька",
-        "kab": "кабильська",
-        "kac": "качин",
-        "kal": "калаалісут",
-        "kam": "камба (Кенія)",
-        "kan": "каннада",
-        "kas": "кашмірська",
-        "kat": "грузинська",
-        "kau": "канурі",
-        "kaw": "каві",
-        "kaz": "казахська",
-        "kbd": "кабардінська",
-        "kha": "кхасі",
-        "khm": "кхмерська (центральна)",
-        "kho": "хотаносакська",
-        "kik": "кікуйю",
-        "kin": "кіньяруанда",
-        "kir": "киргизька",
-        "kmb": "кімбунду",
-        "kok": "конкані (макромова)",
-        "kom": "комі",
-        "kon": "конго",
-        "kor": "корейська",
-        "kos": "косрейська",
-        "kpe": "кпелле",
-        "krc": "карачаєво-балкарська",
-        "krl": "карельська",
-        "kru": "курух",
-        "kua": "куаньяма",
-        "kum": "кумикська",
-        "kur": "курдська",
-        "kut": "кутенай",
-        "lad": "ладіно",
-        "lah": "лахнда",
-        "lam": "ламба",
-        "lao": "лаоська",
-        "lat": "латинська",
-        "lav": "латиська",
-        "lez": "лезгінська",
-        "lim": "лімбурганська",
-        "lin": "лінгала",
-        "lit": "литовська",
-        "lol": "монго",
-        "loz": "лозі",
-        "ltz": "люксембурзька",
-        "lua": "луба-лулуа",
-        "lub": "луба-катанга",
-        "lug": "ганда",
-        "lui": "луйсеньо",
-        "lun": "лунда",
-        "luo": "луо (Кенія і Танзанія)",
-        "lus": "лушай",
-        "mad": "мадурська",
-        "mag": "магахі",
-        "mah": "маршальська",
-        "mai": "майтхілі",
-        "mak": "макасарська",
-        "mal": "малаялам",
-        "man": "мандінго",
-        "mar": "мараті",
-        "mas": "масаї",
-        "mdf": "мокшанська",
-        "mdr": "мандарська",
-        "men": "менде (Сьєрра-Леоне)",
-        "mga": "середньоірландська (900-1200)",
-        "mic": "мікмак",
-        "min": "мінангкабау",
-        "mis": "мови без коду",
-        "mkd": "македонська",
-        "mlg": "малагасійська",
-        "mlt": "мальтійська",
-        "mnc": "манчжурська",
-        "mni": "маніпурська",
-        "moh": "мохаук",
-        "mon": "монгольська",
-        "mos": "мосі",
-        "mri": "маорійська",
-        "msa": "малайська (макромова)",
-        "mul": "мови; що належать до декількох родин",
-        "mus": "крікська",
-        "mwl": "мірандська",
-        "mwr": "марварі",
-        "mya": "бірманська",
-        "myv": "ерзянська",
-        "nap": "неаполітанська",
-        "nau": "науру",
-        "nav": "навахо",
-        "nbl": "південна ндебеле",
-        "nde": "північна ндебеле",
-        "ndo": "ндонга",
-        "nds": "нижньонімецька",
-        "nep": "непальська",
-        "new": "бхаса (Непал)",
-        "nia": "ніасійська",
-        "niu": "ніуе",
-        "nld": "голландська",
-        "nno": "норвезька нюноршк",
-        "nob": "норвезька букмол",
-        "nog": "ногайська",
-        "non": "давньонорвезька",
-        "nor": "норвезька",
-        "nqo": "н’ко",
-        "nso": "сото; північне",
-        "nwc": "неварі (давня)",
-        "nya": "ньянджа",
-        "nym": "ньямвезі",
-        "nyn": "ньянколе",
-        "nyo": "ньоро",
-        "nzi": "нзіма",
-        "oci": "оксітанська (після 1500)",
-        "oji": "оджибва",
-        "ori": "орія",
-        "orm": "оромо",
-        "osa": "оседжі",
-        "oss": "осетинська",
-        "ota": "оттоманська турецька (1500-1928)",
-        "pag": "пангасінан",
-        "pal": "пехлевійська",
-        "pam": "пампанга",
-        "pan": "пенджабі",
-        "pap": "папьяменто",
-        "pau": "палау",
-        "peo": "давньоперська (бл. 600-400 до н.е.)",
-        "phn": "фінікійська",
-        "pli": "палі",
-        "pol": "польська",
-        "pon": "понапе",
-        "por": "португальська",
-        "pro": "провансальська (давня; до 1500 року)",
-        "pus": "пуштунська",
-        "que": "кечуа",
-        "raj": "раджастхані",
-        "rap": "рапануї",
-        "rar": "маорійська (острови Кука)",
-        "roh": "ретророманська",
-        "rom": "ромська",
-        "ron": "румунська",
-        "run": "рунді",
-        "rup": "македоно-румунська",
-        "rus": "російська",
-        "sad": "сандаве",
-        "sag": "санго",
-        "sah": "якутська",
-        "sam": "арамейська (самаритянська)",
-        "san": "санскрит",
-        "sas": "сасакська",
-        "sat": "санталі",
-        "scn": "сицилійська",
-        "sco": "шотландська",
-        "sel": "селькупська",
-        "sga": "давньоірландська (до 900)",
-        "shn": "шан",
-        "sid": "сидама",
-        "sin": "сингалійська",
-        "slk": "словацька",
-        "slv": "словенська",
-        "sma": "саамська (південна)",
-        "sme": "саамська (північна)",
-        "smj": "лулесаамська",
-        "smn": "саамська (інарі)",
-        "smo": "самоанська",
-        "sms": "саамська (сколт)",
-        "sna": "шона",
-        "snd": "синдхі",
-        "snk": "сонікійська",
-        "sog": "согдійська",
-        "som": "сомалійська",
-        "sot": "сото; південна",
-        "spa": "іспанська",
-        "sqi": "албанська",
-        "srd": "сардинська",
-        "srn": "сранан-тонго",
-        "srp": "сербська",
-        "srr": "серер",
-        "ssw": "свазі",
-        "suk": "сукума",
-        "sun": "сунданська",
-        "sus": "сусу",
-        "sux": "шумерська",
-        "swa": "суахілі (макромова)",
-        "swe": "шведська",
-        "syc": "сирійська (класична)",
-        "syr": "сирійська",
-        "tah": "таїтянська",
-        "tam": "тамільська",
-        "tat": "татарська",
-        "tel": "телугу",
-        "tem": "тімне",
-        "ter": "терено",
-        "tet": "тетум",
-        "tgk": "таджицька",
-        "tgl": "тагалог",
-        "tha": "таїландська",
-        "tig": "тігре",
-        "tir": "тигринійська",
-        "tiv": "тиві",
-        "tkl": "токелау",
-        "tlh": "клінгонська",
-        "tli": "тлінгіт",
-        "tmh": "тамашек",
-        "tog": "тонга (ньяса)",
-        "ton": "тонга (острови Тонга)",
-        "tpi": "ток-пісін",
-        "tsi": "цимшіан",
-        "tsn": "тсвана",
-        "tso": "цонга",
-        "tuk": "туркменська",
-        "tum": "тумбука",
-        "tur": "турецька",
-        "tvl": "тувалу",
-        "twi": "тві",
-        "tyv": "тувінська",
-        "udm": "удмурдська",
-        "uga": "угаритська",
-        "uig": "уйгурська",
-        "ukr": "українська",
-        "umb": "умбунду",
-        "und": "невизначена",
-        "urd": "урду",
-        "uzb": "узбецька",
-        "vai": "вай",
-        "ven": "венда",
-        "vie": "в'єтнамська",
-        "vol": "волапюк",
-        "vot": "водська",
-        "wal": "волайтта",
-        "war": "варай (Філіппіни)",
-        "was": "вашо",
-        "wln": "валлонська",
-        "wol": "волоф",
-        "xal": "калмицька",
-        "xho": "хоза",
-        "yao": "яо",
-        "yap": "япська",
-        "yid": "ідиш",
-        "yor": "йоруба",
-        "zap": "сапотецька",
-        "zbl": "бліссимволіка",
-        "zen": "зеназька",
-        "zha": "чжуань",
-        "zho": "китайська",
-        "zul": "зулуська",
-        "zun": "зуні",
-        "zxx": "немає мовних даних",
-        "zza": "заза"
-    },
-    "de": {
-        "aar": "Danakil-Sprache",
-        "abk": "Abchasisch",
-        "ace": "Aceh-Sprache",
-        "ach": "Acholi-Sprache",
-        "ada": "Adangme-Sprache",
-        "ady": "Adygisch",
-        "afh": "Afrihili",
-        "afr": "Afrikaans",
-        "ain": "Ainu-Sprache (Japan)",
-        "aka": "Akan-Sprache",
-        "akk": "Akkadisch",
-        "ale": "Aleutisch",
-        "alt": "Altaisch; Süd",
-        "amh": "Amharisch",
-        "ang": "Englisch; Alt (ca. 450-1100)",
-        "anp": "Anga-Sprache",
-        "ara": "Arabisch",
-        "arc": "Aramäisch",
-        "arg": "Aragonesisch",
-        "arn": "Mapudungun",
-        "arp": "Arapaho",
-        "arw": "Arawakisch",
-        "asm": "Assamesisch",
-        "ast": "Asturisch",
-        "ava": "Awarisch",
-        "ave": "Avestisch",
-        "awa": "Awadhi",
-        "aym": "Aymara",
-        "aze": "Aserbaidschanisch",
-        "bak": "Baschkirisch",
-        "bal": "Belutschisch",
-        "bam": "Bambara",
-        "ban": "Balinesisch",
-        "bas": "Basa (Kamerun)",
-        "bej": "Bedja (Bedauye)",
-        "bel": "Weißrussisch",
-        "bem": "Bemba (Sambia)",
-        "ben": "Bengalisch",
-        "bho": "Bhojpuri",
-        "bik": "Bikol",
-        "bin": "Bini",
-        "bis": "Bislama",
-        "bla": "Blackfoot",
-        "bod": "Tibetisch",
-        "bos": "Bosnisch",
-        "bra": "Braj-Bhakha",
-        "bre": "Bretonisch",
-        "bua": "Burjatisch",
-        "bug": "Buginesisch",
-        "bul": "Bulgarisch",
-        "byn": "Bilin",
-        "cad": "Caddo",
-        "car": "Karibisch; Galíbi",
-        "cat": "Katalanisch",
-        "ceb": "Cebuano",
-        "ces": "Tschechisch",
-        "cha": "Chamorro",
-        "chb": "Chibcha",
-        "che": "Tschetschenisch",
-        "chg": "Tschagataisch",
-        "chk": "Trukesisch",
-        "chm": "Mari (Russland)",
-        "chn": "Chinook",
-        "cho": "Choctaw",
-        "chp": "Chipewyan",
-        "chr": "Cherokee",
-        "chu": "Altkirchenslawisch",
-        "chv": "Tschuwaschisch",
-        "chy": "Cheyenne",
-        "cop": "Koptisch",
-        "cor": "Kornisch",
-        "cos": "Korsisch",
-        "cre": "Cree",
-        "crh": "Türkisch; Krimtatarisch",
-        "csb": "Kaschubisch",
-        "cym": "Walisisch",
-        "dak": "Dakota",
-        "dan": "Dänisch",
-        "dar": "Darginisch",
-        "del": "Delaware",
-        "den": "Slave (Athapaskisch)",
-        "deu": "Deutsch",
-        "dgr": "Dogrib",
-        "din": "Dinka",
-        "div": "Dhivehi",
-        "doi": "Dogri (Makrosprache)",
-        "dsb": "Sorbisch; Nieder",
-        "dua": "Duala",
-        "dum": "Niederländisch; Mittel (ca. 1050-1350)",
-        "dyu": "Dyula",
-        "dzo": "Dzongkha",
-        "efi": "Efik",
-        "egy": "Ägyptisch (Historisch)",
-        "eka": "Ekajuk",
-        "ell": "Neugriechisch (ab 1453)",
-        "elx": "Elamisch",
-        "eng": "Englisch",
-        "enm": "Mittelenglisch",
-        "epo": "Esperanto",
-        "est": "Estnisch",
-        "eus": "Baskisch",
-        "ewe": "Ewe-Sprache",
-        "ewo": "Ewondo",
-        "fan": "Fang (Äquatorial-Guinea)",
-        "fao": "Färöisch",
-        "fas": "Persisch",
-        "fat": "Fanti",
-        "fij": "Fidschianisch",
-        "fil": "Filipino",
-        "fin": "Finnisch",
-        "fon": "Fon",
-        "fra": "Französisch",
-        "frm": "Französisch; Mittel (ca. 1400 - 1600)",
-        "fro": "Französisch; Alt (842 - ca. 1400)",
-        "frr": "Friesisch; Nord",
-        "frs": "Friesisch; Ost",
-        "fry": "Friesisch; West",
-        "ful": "Ful",
-        "fur": "Friaulisch",
-        "gaa": "Ga",
-        "gay": "Gayo",
-        "gba": "Gbaya (Zentralafrikanische Republik)",
-        "gez": "Altäthiopisch",
-        "gil": "Gilbertesisch",
-        "gla": "Gälisch; Schottisch",
-        "gle": "Irisch",
-        "glg": "Galicisch",
-        "glv": "Manx",
-        "gmh": "Mittelhochdeutsch (ca. 1050-1500)",
-        "goh": "Althochdeutsch (ca. 750-1050)",
-        "gon": "Gondi",
-        "gor": "Gorontalesisch",
-        "got": "Gotisch",
-        "grb": "Grebo",
-        "grc": "Altgriechisch (bis 1453)",
-        "grn": "Guaraní",
-        "gsw": "Schweizerdeutsch",
-        "guj": "Gujarati",
-        "gwi": "Kutchin",
-        "hai": "Haida",
-        "hat": "Kreolisch; Haitisch",
-        "hau": "Haussa",
-        "haw": "Hawaiianisch",
-        "heb": "Hebräisch",
-        "her": "Herero",
-        "hil": "Hiligaynon",
-        "hin": "Hindi",
-        "hit": "Hethitisch",
-        "hmn": "Miao-Sprachen",
-        "hmo": "Hiri-Motu",
-        "hrv": "Kroatisch",
-        "hsb": "Obersorbisch",
-        "hun": "Ungarisch",
-        "hup": "Hupa",
-        "hye": "Armenisch",
-        "iba": "Iban",
-        "ibo": "Ibo",
-        "ido": "Ido",
-        "iii": "Yi; Sichuan",
-        "iku": "Inuktitut",
-        "ile": "Interlingue",
-        "ilo": "Ilokano",
-        "ina": "Interlingua (Internationale Hilfssprachen-Vereinigung)",
-        "ind": "Indonesisch",
-        "inh": "Inguschisch",
-        "ipk": "Inupiaq",
-        "isl": "Isländisch",
-        "ita": "Italienisch",
-        "jav": "Javanisch",
-        "jbo": "Lojban",
-        "jpn": "Japanisch",
-        "jpr": "Jüdisch-Persisch",
-        "jrb": "Jüdisch-Arabisch",
-        "kaa": "Karakalpakisch",
-        "kab": "Kabylisch",
-        "kac": "Kachinisch",
-        "kal": "Kalaallisut (Grönländisch)",
-        "kam": "Kamba (Kenia)",
-        "kan": "Kannada",
-        "kas": "Kaschmirisch",
-        "kat": "Georgisch",
-        "kau": "Kanuri",
-        "kaw": "Kawi; Altjavanisch",
-        "kaz": "Kasachisch",
-        "kbd": "Kabardisch",
-        "kha": "Khasi-Sprache",
-        "khm": "Khmer; Zentral",
-        "kho": "Sakisch",
-        "kik": "Kikuyu",
-        "kin": "Rwanda",
-        "kir": "Kirgisisch",
-        "kmb": "Mbundu; Kimbundu",
-        "kok": "Konkani (Makrosprache)",
-        "kom": "Komi",
-        "kon": "Kongo",
-        "kor": "Koreanisch",
-        "kos": "Kosraeanisch",
-        "kpe": "Kpelle",
-        "krc": "Karachay-Balkar",
-        "krl": "Karenisch",
-        "kru": "Kurukh",
-        "kua": "Kwanyama",
-        "kum": "Kumükisch",
-        "kur": "Kurdisch",
-        "kut": "Kutenai",
-        "lad": "Judenspanisch",
-        "lah": "Lahnda",
-        "lam": "Banjari; Lamba",
-        "lao": "Laotisch",
-        "lat": "Lateinisch",
-        "lav": "Lettisch",
-        "lez": "Lesgisch",
-        "lim": "Limburgisch",
-        "lin": "Lingala",
-        "lit": "Litauisch",
-        "lol": "Mongo",
-        "loz": "Rotse",
-        "ltz": "Luxemburgisch",
-        "lua": "Luba-Lulua",
-        "lub": "Luba-Katanga",
-        "lug": "Ganda",
-        "lui": "Luiseno",
-        "lun": "Lunda",
-        "luo": "Luo (Kenia und Tansania)",
-        "lus": "Lushai",
-        "mad": "Maduresisch",
-        "mag": "Khotta",
-        "mah": "Marshallesisch",
-        "mai": "Maithili",
-        "mak": "Makassarisch",
-        "mal": "Malayalam",
-        "man": "Mande; Mandigo; Malinke",
-        "mar": "Marathi",
-        "mas": "Massai",
-        "mdf": "Moksha",
-        "mdr": "Mandaresisch",
-        "men": "Mende (Sierra Leone)",
-        "mga": "Mittelirisch (900-1200)",
-        "mic": "Mikmak",
-        "min": "Minangkabau",
-        "mis": "Nichtklassifizierte Sprachen",
-        "mkd": "Makedonisch",
-        "mlg": "Madegassisch",
-        "mlt": "Maltesisch",
-        "mnc": "Manchu; Mandschurisch",
-        "mni": "Meithei-Sprache",
-        "moh": "Mohawk",
-        "mon": "Mongolisch",
-        "mos": "Mossi",
-        "mri": "Maori",
-        "msa": "Malaiisch (Makrosprache)",
-        "mul": "Mehrsprachig; Polyglott",
-        "mus": "Muskogee",
-        "mwl": "Mirandesisch",
-        "mwr": "Marwari",
-        "mya": "Burmesisch",
-        "myv": "Erzya",
-        "nap": "Neapolitanisch",
-        "nau": "Nauruanisch",
-        "nav": "Navajo",
-        "nbl": "Ndebele (Süd)",
-        "nde": "Ndebele (Nord)",
-        "ndo": "Ndonga",
-        "nds": "Plattdeutsch",
-        "nep": "Nepali",
-        "new": "Bhasa; Nepalesisch",
-        "nia": "Nias",
-        "niu": "Niue",
-        "nld": "Niederländisch",
-        "nno": "Nynorsk (Norwegen)",
-        "nob": "Norwegisch-Bokmål",
-        "nog": "Nogai",
-        "non": "Altnordisch",
-        "nor": "Norwegisch",
-        "nqo": "N'Ko",
-        "nso": "Sotho; Nord",
-        "nwc": "Newari; Alt",
-        "nya": "Nyanja",
-        "nym": "Nyamwezi",
-        "nyn": "Nyankole",
-        "nyo": "Nyoro",
-        "nzi": "Nzima",
-        "oci": "Okzitanisch (nach 1500)",
-        "oji": "Ojibwa",
-        "ori": "Orija",
-        "orm": "Oromo",
-        "osa": "Osage",
-        "oss": "Ossetisch",
-        "ota": "Ottomanisch (Osmanisch/Türkisch) (1500-1928)",
-        "pag": "Pangasinan",
-        "pal": "Mittelpersisch",
-        "pam": "Pampanggan",
-        "pan": "Panjabi",
-        "pap": "Papiamento",
-        "pau": "Palau",
-        "peo": "Persisch; Alt (ca. 600-400 v.Chr.)",
-        "phn": "Phönikisch",
-        "pli": "Pali",
-        "pol": "Polnisch",
-        "pon": "Ponapeanisch",
-        "por": "Portugiesisch",
-        "pro": "Altokzitanisch; Altprovenzalisch (bis 1500)",
-        "pus": "Paschtu; Afghanisch",
-        "que": "Ketschua",
-        "raj": "Rajasthani",
-        "rap": "Osterinsel-Sprache; Rapanui",
-        "rar": "Maori; Cook-Inseln",
-        "roh": "Bündnerromanisch",
-        "rom": "Romani; Zigeunersprache",
-        "ron": "Rumänisch",
-        "run": "Rundi",
-        "rup": "Rumänisch; Mezedonisch",
-        "rus": "Russisch",
-        "sad": "Sandawe",
-        "sag": "Sango",
-        "sah": "Jakutisch",
-        "sam": "Aramäisch; Samaritanisch",
-        "san": "Sanskrit",
-        "sas": "Sassak",
-        "sat": "Santali",
-        "scn": "Sizilianisch",
-        "sco": "Schottisch",
-        "sel": "Selkupisch",
-        "sga": "Altirisch (bis 900)",
-        "shn": "Schan",
-        "sid": "Sidamo",
-        "sin": "Singhalesisch",
-        "slk": "Slowakisch",
-        "slv": "Slowenisch",
-        "sma": "Sami; Süd",
-        "sme": "Nordsamisch",
-        "smj": "Samisch (Lule)",
-        "smn": "Samisch; Inari",
-        "smo": "Samoanisch",
-        "sms": "Samisch; Skolt",
-        "sna": "Schona",
-        "snd": "Sindhi",
-        "snk": "Soninke",
-        "sog": "Sogdisch",
-        "som": "Somali",
-        "sot": "Sotho (Süd)",
-        "spa": "Spanisch; Kastilianisch",
-        "sqi": "Albanisch",
-        "srd": "Sardisch",
-        "srn": "Sranan Tongo",
-        "srp": "Serbisch",
-        "srr": "Serer",
-        "ssw": "Swazi",
-        "suk": "Sukuma",
-        "sun": "Sundanesisch",
-        "sus": "Susu",
-        "sux": "Sumerisch",
-        "swa": "Swahili (Makrosprache)",
-        "swe": "Schwedisch",
-        "syc": "Syrisch; Klassisch",
-        "syr": "Syrisch",
-        "tah": "Tahitisch",
-        "tam": "Tamilisch",
-        "tat": "Tatarisch",
-        "tel": "Telugu",
-        "tem": "Temne",
-        "ter": "Tereno",
-        "tet": "Tetum",
-        "tgk": "Tadschikisch",
-        "tgl": "Tagalog",
-        "tha": "Thailändisch",
-        "tig": "Tigre",
-        "tir": "Tigrinja",
-        "tiv": "Tiv",
-        "tkl": "Tokelauanisch",
-        "tlh": "Klingonisch",
-        "tli": "Tlingit",
-        "tmh": "Tamaseq",
-        "tog": "Tonga (Nyasa)",
-        "ton": "Tonga (Tonga-Inseln)",
-        "tpi": "Neumelanesisch; Pidgin",
-        "tsi": "Tsimshian",
-        "tsn": "Tswana",
-        "tso": "Tsonga",
-        "tuk": "Turkmenisch",
-        "tum": "Tumbuka",
-        "tur": "Türkisch",
-        "tvl": "Elliceanisch",
-        "twi": "Twi",
-        "tyv": "Tuwinisch",
-        "udm": "Udmurt",
-        "uga": "Ugaritisch",
-        "uig": "Uigurisch",
-        "ukr": "Ukrainisch",
-        "umb": "Mbundu; Umbundu",
-        "und": "Unbestimmbar",
-        "urd": "Urdu",
-        "uzb": "Usbekisch",
-        "vai": "Vai",
-        "ven": "Venda",
-        "vie": "Vietnamesisch",
-        "vol": "Volapük",
-        "vot": "Wotisch",
-        "wal": "Wolaytta",
-        "war": "Waray (Philippinen)",
-        "was": "Washo",
-        "wln": "Wallonisch",
-        "wol": "Wolof",
-        "xal": "Kalmükisch",
-        "xho": "Xhosa",
-        "yao": "Yao",
-        "yap": "Yapesisch",
-        "yid": "Jiddisch",
-        "yor": "Joruba",
-        "zap": "Zapotekisch",
-        "zbl": "Bliss-Symbole",
-        "zen": "Zenaga",
-        "zha": "Zhuang",
-        "zho": "Chinesisch",
-        "zul": "Zulu",
-        "zun": "Zuni",
-        "zxx": "Kein sprachlicher Inhalt",
-        "zza": "Zaza"
-    },
-    "ja": {
-        "aar": "アファル語",
-        "abk": "アブハジア語",
-        "ace": "アチェー語",
-        "ach": "アチョリ語",
-        "ada": "アダングメ語",
-        "ady": "Adyghe",
-        "afh": "アフリヒリ",
-        "afr": "アフリカーンス語",
-        "ain": "Ainu (Japan)",
-        "aka": "アカン語",
-        "akk": "アッカド語",
-        "ale": "アレウト語",
-        "alt": "Altai; Southern",
-        "amh": "アムハラ語",
-        "ang": "English; Old (ca. 450-1100)",
-        "anp": "アンギカ語",
-        "ara": "アラビア語",
-        "arc": "Aramaic; Official (700-300 BCE)",
-        "arg": "アラゴン語",
-        "arn": "Mapudungun",
-        "arp": "アラパホー語",
-        "arw": "アラワク語",
-        "asm": "アッサム語",
-        "ast": "Asturian",
-        "ava": "アヴァル語",
-        "ave": "アヴェスタ語",
-        "awa": "アワディ語",
-        "aym": "アイマラ語",
-        "aze": "アゼルバイジャン語",
-        "bak": "バシキール語",
-        "bal": "バルーチー語",
-        "bam": "バンバラ語",
-        "ban": "バリ語",
-        "bas": "Basa (Cameroon)",
-        "bej": "ベジャ語",
-        "bel": "白ロシア語",
-        "bem": "Bemba (Zambia)",
-        "ben": "ベンガル語",
-        "bho": "ボージプリー語",
-        "bik": "ビコル語",
-        "bin": "ビニ語",
-        "bis": "ビスラマ語",
-        "bla": "ブラックフット語",
-        "bod": "チベット語",
-        "bos": "ボスニア語",
-        "bra": "ブラジ語",
-        "bre": "ブルトン語",
-        "bua": "ブリヤート語",
-        "bug": "ブギ語",
-        "bul": "ブルガリア語",
-        "byn": "Bilin",
-        "cad": "カドー語",
-        "car": "Carib; Galibi",
-        "cat": "カタロニア語",
-        "ceb": "セブアノ語",
-        "ces": "チェコ語",
-        "cha": "チャモロ語",
-        "chb": "チブチャ語",
-        "che": "チェチェン語",
-        "chg": "チャガタイ語",
-        "chk": "チューク語",
-        "chm": "Mari (Russia)",
-        "chn": "チヌーク混成語",
-        "cho": "チョクトー語",
-        "chp": "チペワイアン語",
-        "chr": "チェロキー語",
-        "chu": "Slavonic; Old",
-        "chv": "チュヴァシュ語",
-        "chy": "シャイアン語",
-        "cop": "コプト語",
-        "cor": "コーンウォール語",
-        "cos": "コルシカ語",
-        "cre": "クリー語",
-        "crh": "Turkish; Crimean",
-        "csb": "カシュビアン語",
-        "cym": "ウェールズ語",
-        "dak": "ダコタ語",
-        "dan": "デンマーク語",
-        "dar": "ダルガン語",
-        "del": "デラウェア語",
-        "den": "スレーブ語 (アサパスカン語)",
-        "deu": "ドイツ語",
-        "dgr": "ドクリブ語",
-        "din": "ディンカ語",
-        "div": "Dhivehi",
-        "doi": "Dogri (macrolanguage)",
-        "dsb": "Sorbian; Lower",
-        "dua": "ドゥアラ語",
-        "dum": "Dutch; Middle (ca. 1050-1350)",
-        "dyu": "デュラ語",
-        "dzo": "ゾンカ語",
-        "efi": "エフィク語",
-        "egy": "エジプト語 (古代)",
-        "eka": "エカジュク語",
-        "ell": "ギリシア語; 現代 (1453-)",
-        "elx": "エラム語",
-        "eng": "英語",
-        "enm": "英語; 中世 (1100-1500)",
-        "epo": "エスペラント",
-        "est": "エストニア語",
-        "eus": "バスク語",
-        "ewe": "エウェ語",
-        "ewo": "エウォンド語",
-        "fan": "Fang (Equatorial Guinea)",
-        "fao": "フェロー語",
-        "fas": "ペルシア語",
-        "fat": "ファンティー語",
-        "fij": "フィジー語",
-        "fil": "Filipino",
-        "fin": "フィン語",
-        "fon": "フォン語",
-        "fra": "フランス語",
-        "frm": "French; Middle (ca. 1400-1600)",
-        "fro": "French; Old (842-ca. 1400)",
-        "frr": "Frisian; Northern",
-        "frs": "Frisian; Eastern",
-        "fry": "Frisian; Western",
-        "ful": "フラ語",
-        "fur": "フリウリ語",
-        "gaa": "ガ語",
-        "gay": "ガヨ語",
-        "gba": "Gbaya (Central African Republic)",
-        "gez": "ゲーズ語",
-        "gil": "キリバス語",
-        "gla": "Gaelic; Scottish",
-        "gle": "アイルランド語",
-        "glg": "Galician",
-        "glv": "マン島語",
-        "gmh": "German; Middle High (ca. 1050-1500)",
-        "goh": "German; Old High (ca. 750-1050)",
-        "gon": "ゴーンディー語",
-        "gor": "ゴロンタロ語",
-        "got": "ゴート語",
-        "grb": "グレボ語",
-        "grc": "ギリシア語; 古代 (-1453)",
-        "grn": "グアラニー語",
-        "gsw": "German; Swiss",
-        "guj": "グジャラーティー語",
-        "gwi": "Gwichʼin",
-        "hai": "ハイダ語",
-        "hat": "Creole; Haitian",
-        "hau": "ハウサ語",
-        "haw": "ハワイ語",
-        "heb": "ヘブライ語",
-        "her": "ヘレロ語",
-        "hil": "ヒリジャノン語",
-        "hin": "ヒンディー語",
-        "hit": "ヒッタイト語",
-        "hmn": "フモング語",
-        "hmo": "ヒリモトゥ語",
-        "hrv": "クロアチア語",
-        "hsb": "Sorbian; Upper",
-        "hun": "ハンガリー語",
-        "hup": "アタパスカ語",
-        "hye": "アルメニア語",
-        "iba": "イバン語",
-        "ibo": "イボ語",
-        "ido": "イド語",
-        "iii": "Yi; Sichuan",
-        "iku": "イヌクチタット語",
-        "ile": "インターリング",
-        "ilo": "イロカノ語",
-        "ina": "インターリングア語 (国際補助語協会)",
-        "ind": "インドネシア語",
-        "inh": "イングーシ語",
-        "ipk": "イヌピアク語",
-        "isl": "アイスランド語",
-        "ita": "イタリア語",
-        "jav": "ジャワ語",
-        "jbo": "ロジバン語",
-        "jpn": "日本語",
-        "jpr": "ユダヤ・ペルシア語",
-        "jrb": "ユダヤ・アラビア語",
-        "kaa": "カラ・カルパク語",
-        "kab": "カビル語",
-        "kac": "カチン語",
-        "kal": "Kalaallisut",
-        "kam": "Kamba (Kenya)",
-        "kan": "カンナダ語",
-        "kas": "カシミーリー語",
-        "kat": "グルジア語",
-        "kau": "カヌリ語",
-        "kaw": "カウィ語",
-        "kaz": "カザーフ語",
-        "kbd": "カバルダ語",
-        "kha": "カシ語",
-        "khm": "Khmer; Central",
-        "kho": "ホータン語",
-        "kik": "キクユ語",
-        "kin": "キンヤルワンダ語",
-        "kir": "キルギス語",
-        "kmb": "キンブンドゥ語",
-        "kok": "Konkani (macrolanguage)",
-        "kom": "コミ語",
-        "kon": "コンゴ語",
-        "kor": "朝鮮語",
-        "kos": "コスラエ語",
-        "kpe": "クペレ語",
-        "krc": "カラチャイ・バルカル語",
-        "krl": "カレリア語",
-        "kru": "クルク語",
-        "kua": "クアニャマ語",
-        "kum": "クミック語",
-        "kur": "クルド語",
-        "kut": "クテナイ語",
-        "lad": "ラジノ語",
-        "lah": "ラフンダー語",
-        "lam": "ランバ語",
-        "lao": "ラオ語",
-        "lat": "ラテン語",
-        "lav": "ラトヴィア語",
-        "lez": "レズギ語",
-        "lim": "Limburgan",
-        "lin": "リンガラ語",
-        "lit": "リトアニア語",
-        "lol": "モンゴ語",
-        "loz": "ロジ語",
-        "ltz": "Luxembourgish",
-        "lua": "ルバ・ルルア語",
-        "lub": "ルバ語",
-        "lug": "ガンダ語",
-        "lui": "ルイセニョ語",
-        "lun": "ランダ語",
-        "luo": "ルオ語 (ケニアとタンザニア)",
-        "lus": "ルシャイ語",
-        "mad": "マドゥラ語",
-        "mag": "マガヒ語",
-        "mah": "Marshallese",
-        "mai": "マイチリ語",
-        "mak": "マカッサル語",
-        "mal": "マラヤーラム語",
-        "man": "マンディンゴ語",
-        "mar": "マラーティー語",
-        "mas": "マサイ語",
-        "mdf": "モクシャ語",
-        "mdr": "マンダル語",
-        "men": "Mende (Sierra Leone)",
-        "mga": "アイルランド語; 中世 (900-1200)",
-        "mic": "Mi'kmaq",
-        "min": "ミナンカバウ語",
-        "mis": "Uncoded languages",
-        "mkd": "マケドニア語",
-        "mlg": "マラガシ語",
-        "mlt": "マルタ語",
-        "mnc": "満州語",
-        "mni": "マニプル語",
-        "moh": "モーホーク語",
-        "mon": "蒙古語",
-        "mos": "モッシー語",
-        "mri": "マオリ語",
-        "msa": "Malay (macrolanguage)",
-        "mul": "多言語",
-        "mus": "クリーク語",
-        "mwl": "ミランド語",
-        "mwr": "マルワリ語",
-        "mya": "ビルマ語",
-        "myv": "エルジャ語",
-        "nap": "ナポリ語",
-        "nau": "ナウル語",
-        "nav": "Navajo",
-        "nbl": "ヌデベレ語; 南",
-        "nde": "マタベレ語; 北",
-        "ndo": "ンドンガ語",
-        "nds": "German; Low",
-        "nep": "ネパール語",
-        "new": "Bhasa; Nepal",
-        "nia": "ニアス語",
-        "niu": "ニウーエイ語",
-        "nld": "オランダ語",
-        "nno": "ニーノシュク・ノルウェー語",
-        "nob": "Norwegian Bokmål",
-        "nog": "ノガイ語",
-        "non": "スカンジナビア語; 古期",
-        "nor": "ノルウェー語",
-        "nqo": "ンコ文字",
-        "nso": "Sotho; Northern",
-        "nwc": "Newari; Old",
-        "nya": "Nyanja",
-        "nym": "ムエジ語",
-        "nyn": "ニャンコール語",
-        "nyo": "ニョロ語",
-        "nzi": "ンゼマ語",
-        "oci": "Occitan (post 1500)",
-        "oji": "オジブワ語",
-        "ori": "オリヤー語",
-        "orm": "オロモ語",
-        "osa": "オーセージ語",
-        "oss": "Ossetian",
-        "ota": "トルコ語; オスマン (1500-1928)",
-        "pag": "パンガシナーン語",
-        "pal": "パーラヴィー語",
-        "pam": "パンパンガ語",
-        "pan": "Panjabi",
-        "pap": "パピアメント",
-        "pau": "パラオ語",
-        "peo": "Persian; Old (ca. 600-400 B.C.)",
-        "phn": "フェニキア語",
-        "pli": "パーリ語",
-        "pol": "ポーランド語",
-        "pon": "ポナペ語",
-        "por": "ポルトガル語",
-        "pro": "プロヴァンス語; 古期 (-1500)",
-        "pus": "プシュトゥー語",
-        "que": "キチュワ語",
-        "raj": "ラージャスターニー語",
-        "rap": "ラパヌーイ語",
-        "rar": "Maori; Cook Islands",
-        "roh": "Romansh",
-        "rom": "ロマニ語",
-        "ron": "ルーマニア語",
-        "run": "ルンディ語",
-        "rup": "Romanian; Macedo-",
-        "rus": "ロシア語",
-        "sad": "サンダウェ語",
-        "sag": "サンゴ語",
-        "sah": "ヤクート語",
-        "sam": "Aramaic; Samaritan",
-        "san": "梵語",
-        "sas": "ササク語",
-        "sat": "サンターリー語",
-        "scn": "シチリア語",
-        "sco": "スコットランド語",
-        "sel": "セリクプ語",
-        "sga": "アイルランド語; 古 (-900)",
-        "shn": "シャン語",
-        "sid": "シダモ語",
-        "sin": "シンハラ文字",
-        "slk": "スロヴァキア語",
-        "slv": "スロヴェニア語",
-        "sma": "Sami; Southern",
-        "sme": "Sami; Northern",
-        "smj": "ルレ・サーミ語",
-        "smn": "Sami; Inari",
-        "smo": "サモア語",
-        "sms": "Sami; Skolt",
-        "sna": "ショナ語",
-        "snd": "シンディー語",
-        "snk": "ソニンケ語",
-        "sog": "ソグド語",
-        "som": "ソマリ語",
-        "sot": "ソト語; 南",
-        "spa": "スペイン語",
-        "sqi": "アルバニア語",
-        "srd": "サルデーニャ語",
-        "srn": "Sranan Tongo",
-        "srp": "セルビア語",
-        "srr": "セレール語",
-        "ssw": "シスワティ語",
-        "suk": "スクマ語",
-        "sun": "スンダ語",
-        "sus": "スス語",
-        "sux": "シュメール語",
-        "swa": "Swahili (macrolanguage)",
-        "swe": "スウェーデン語",
-        "syc": "Syriac; Classical",
-        "syr": "シリア語",
-        "tah": "タヒチ語",
-        "tam": "タミル語",
-        "tat": "タタール語",
-        "tel": "テルグ語",
-        "tem": "テムネ語",
-        "ter": "テレーノ語",
-        "tet": "テトゥン語",
-        "tgk": "タジク語",
-        "tgl": "タガログ語",
-        "tha": "タイ語",
-        "tig": "ティグレ語",
-        "tir": "ティグリニア語",
-        "tiv": "ティブ語",
-        "tkl": "トケラウ語",
-        "tlh": "Klingon",
-        "tli": "トリンギット語",
-        "tmh": "タマシェク語",
-        "tog": "トンガ語 (ニアサ)",
-        "ton": "トンガ語 (トンガ諸島)",
-        "tpi": "トック・ピジン",
-        "tsi": "チムシュ語",
-        "tsn": "ツワナ語",
-        "tso": "ツォンガ語",
-        "tuk": "トゥルクメン語",
-        "tum": "タンブカ語",
-        "tur": "トルコ語",
-        "tvl": "ツバル語",
-        "twi": "トウィ語",
-        "tyv": "ツバニア語",
-        "udm": "ウドムルト語",
-        "uga": "ウガリット語",
-        "uig": "ウイグル語",
-        "ukr": "ウクライナ語",
-        "umb": "アンブンドゥ語",
-        "und": "言語名不明",
-        "urd": "ウルドゥー語",
-        "uzb": "ウズベク語",
-        "vai": "ヴァイ語",
-        "ven": "ベンダ語",
-        "vie": "ベトナム語",
-        "vol": "ボラピューク語",
-        "vot": "ヴォート語",
-        "wal": "Wolaytta",
-        "war": "Waray (Philippines)",
-        "was": "ワショ語",
-        "wln": "ワロン語",
-        "wol": "ウォロフ語",
-        "xal": "Kalmyk",
-        "xho": "ホサ語",
-        "yao": "ヤオ語",
-        "yap": "ヤップ語",
-        "yid": "イディッシュ語",
-        "yor": "ヨルバ語",
-        "zap": "ザポテック語",
-        "zbl": "Blissymbols",
-        "zen": "ゼナガ語",
-        "zha": "Zhuang",
-        "zho": "中国語",
-        "zul": "ズールー語",
-        "zun": "ズニ語",
-        "zxx": "No linguistic content",
-        "zza": "Zaza"
-    },
-    "km": {
-        "aar": "Afar",
-        "abk": "Abkhazian",
-        "ace": "Achinese",
-        "ach": "Acoli",
-        "ada": "Adangme",
-        "ady": "Adyghe",
-        "afh": "Afrihili",
-        "afr": "Afrikaans",
-        "ain": "Ainu (Japan)",
-        "aka": "Akan",
-        "akk": "Akkadian",
-        "ale": "Aleut",
-        "alt": "Altai; Southern",
-        "amh": "Amharic",
-        "ang": "English; Old (ca. 450-1100)",
-        "anp": "Angika",
-        "ara": "Arabic",
-        "arc": "Aramaic; Official (700-300 BCE)",
-        "arg": "Aragonese",
-        "arn": "Mapudungun",
-        "arp": "Arapaho",
-        "arw": "Arawak",
-        "asm": "Assamese",
-        "ast": "Asturian",
-        "ava": "Avaric",
-        "ave": "Avestan",
-        "awa": "Awadhi",
-        "aym": "Aymara",
-        "aze": "Azerbaijani",
-        "bak": "Bashkir",
-        "bal": "Baluchi",
-        "bam": "Bambara",
-        "ban": "Balinese",
-        "bas": "Basa (Cameroon)",
-        "bej": "Beja",
-        "bel": "Belarusian",
-        "bem": "Bemba (Zambia)",
-        "ben": "Bengali",
-        "bho": "Bhojpuri",
-        "bik": "Bikol",
-        "bin": "Bini",
-        "bis": "Bislama",
-        "bla": "Siksika",
-        "bod": "Tibetan",
-        "bos": "Bosnian",
-        "bra": "Braj",
-        "bre": "Breton",
-        "bua": "Buriat",
-        "bug": "Buginese",
-        "bul": "Bulgarian",
-        "byn": "Bilin",
-        "cad": "Caddo",
-        "car": "Carib; Galibi",
-        "cat": "Catalan",
-        "ceb": "Cebuano",
-        "ces": "Czech",
-        "cha": "Chamorro",
-        "chb": "Chibcha",
-        "che": "Chechen",
-        "chg": "Chagatai",
-        "chk": "Chuukese",
-        "chm": "Mari (Russia)",
-        "chn": "Chinook jargon",
-        "cho": "Choctaw",
-        "chp": "Chipewyan",
-        "chr": "Cherokee",
-        "chu": "Slavonic; Old",
-        "chv": "Chuvash",
-        "chy": "Cheyenne",
-        "cop": "Coptic",
-        "cor": "Cornish",
-        "cos": "Corsican",
-        "cre": "Cree",
-        "crh": "Turkish; Crimean",
-        "csb": "Kashubian",
-        "cym": "Welsh",
-        "dak": "Dakota",
-        "dan": "Danish",
-        "dar": "Dargwa",
-        "del": "Delaware",
-        "den": "Slave (Athapascan)",
-        "deu": "German",
-        "dgr": "Dogrib",
-        "din": "Dinka",
-        "div": "Dhivehi",
-        "doi": "Dogri (macrolanguage)",
-        "dsb": "Sorbian; Lower",
-        "dua": "Duala",
-        "dum": "Dutch; Middle (ca. 1050-1350)",
-        "dyu": "Dyula",
-        "dzo": "Dzongkha",
-        "efi": "Efik",
-        "egy": "Egyptian (Ancient)",
-        "eka": "Ekajuk",
-        "ell": "Greek; Modern (1453-)",
-        "elx": "Elamite",
-        "eng": "English",
-        "enm": "English; Middle (1100-1500)",
-        "epo": "Esperanto",
-        "est": "Estonian",
-        "eus": "Basque",
-        "ewe": "Ewe",
-        "ewo": "Ewondo",
-        "fan": "Fang (Equatorial Guinea)",
-        "fao": "Faroese",
-        "fas": "Persian",
-        "fat": "Fanti",
-        "fij": "Fijian",
-        "fil": "Filipino",
-        "fin": "Finnish",
-        "fon": "Fon",
-        "fra": "French",
-        "frm": "French; Middle (ca. 1400-1600)",
-        "fro": "French; Old (842-ca. 1400)",
-        "frr": "Frisian; Northern",
-        "frs": "Frisian; Eastern",
-        "fry": "Frisian; Western",
-        "ful": "Fulah",
-        "fur": "Friulian",
-        "gaa": "Ga",
-        "gay": "Gayo",
-        "gba": "Gbaya (Central African Republic)",
-        "gez": "Geez",
-        "gil": "Gilbertese",
-        "gla": "Gaelic; Scottish",
-        "gle": "Irish",
-        "glg": "Galician",
-        "glv": "Manx",
-        "gmh": "German; Middle High (ca. 1050-1500)",
-        "goh": "German; Old High (ca. 750-1050)",
-        "gon": "Gondi",
-        "gor": "Gorontalo",
-        "got": "Gothic",
-        "grb": "Grebo",
-        "grc": "Greek; Ancient (to 1453)",
-        "grn": "Guarani",
-        "gsw": "German; Swiss",
-        "guj": "Gujarati",
-        "gwi": "Gwichʼin",
-        "hai": "Haida",
-        "hat": "Creole; Haitian",
-        "hau": "Hausa",
-        "haw": "Hawaiian",
-        "heb": "Hebrew",
-        "her": "Herero",
-        "hil": "Hiligaynon",
-        "hin": "Hindi",
-        "hit": "Hittite",
-        "hmn": "Hmong",
-        "hmo": "Hiri Motu",
-        "hrv": "Croatian",
-        "hsb": "Sorbian; Upper",
-        "hun": "Hungarian",
-        "hup": "Hupa",
-        "hye": "Armenian",
-        "iba": "Iban",
-        "ibo": "Igbo",
-        "ido": "Ido",
-        "iii": "Yi; Sichuan",
-        "iku": "Inuktitut",
-        "ile": "Interlingue",
-        "ilo": "Iloko",
-        "ina": "Interlingua (International Auxiliary Language Association)",
-        "ind": "Indonesian",
-        "inh": "Ingush",
-        "ipk": "Inupiaq",
-        "isl": "Icelandic",
-        "ita": "Italian",
-        "jav": "Javanese",
-        "jbo": "Lojban",
-        "jpn": "Japanese",
-        "jpr": "Judeo-Persian",
-        "jrb": "Judeo-Arabic",
-        "kaa": "Kara-Kalpak",
-        "kab": "Kabyle",
-        "kac": "Kachin",
-        "kal": "Kalaallisut",
-        "kam": "Kamba (Kenya)",
-        "kan": "Kannada",
-        "kas": "Kashmiri",
-        "kat": "Georgian",
-        "kau": "Kanuri",
-        "kaw": "Kawi",
-        "kaz": "Kazakh",
-        "kbd": "Kabardian",
-        "kha": "Khasi",
-        "khm": "Khmer; Central",
-        "kho": "Khotanese",
-        "kik": "Kikuyu",
-        "kin": "Kinyarwanda",
-        "kir": "Kirghiz",
-        "kmb": "Kimbundu",
-        "kok": "Konkani (macrolanguage)",
-        "kom": "Komi",
-        "kon": "Kongo",
-        "kor": "Korean",
-        "kos": "Kosraean",
-        "kpe": "Kpelle",
-        "krc": "Karachay-Balkar",
-        "krl": "Karelian",
-        "kru": "Kurukh",
-        "kua": "Kuanyama",
-        "kum": "Kumyk",
-        "kur": "Kurdish",
-        "kut": "Kutenai",
-        "lad": "Ladino",
-        "lah": "Lahnda",
-        "lam": "Lamba",
-        "lao": "Lao",
-        "lat": "Latin",
-        "lav": "Latvian",
-        "lez": "Lezghian",
-        "lim": "Limburgan",
-        "lin": "Lingala",
-        "lit": "Lithuanian",
-        "lol": "Mongo",
-        "loz": "Lozi",
-        "ltz": "Luxembourgish",
-        "lua": "Luba-Lulua",
-        "lub": "Luba-Katanga",
-        "lug": "Ganda",
-        "lui": "Luiseno",
-        "lun": "Lunda",
-        "luo": "Luo (Kenya and Tanzania)",
-        "lus": "Lushai",
-        "mad": "Madurese",
-        "mag": "Magahi",
-        "mah": "Marshallese",
-        "mai": "Maithili",
-        "mak": "Makasar",
-        "mal": "Malayalam",
-        "man": "Mandingo",
-        "mar": "Marathi",
-        "mas": "Masai",
-        "mdf": "Moksha",
-        "mdr": "Mandar",
-        "men": "Mende (Sierra Leone)",
-        "mga": "Irish; Middle (900-1200)",
-        "mic": "Mi'kmaq",
-        "min": "Minangkabau",
-        "mis": "Uncoded languages",
-        "mkd": "Macedonian",
-        "mlg": "Malagasy",
-        "mlt": "Maltese",
-        "mnc": "Manchu",
-        "mni": "Manipuri",
-        "moh": "Mohawk",
-        "mon": "Mongolian",
-        "mos": "Mossi",
-        "mri": "Maori",
-        "msa": "Malay (macrolanguage)",
-        "mul": "Multiple languages",
-        "mus": "Creek",
-        "mwl": "Mirandese",
-        "mwr": "Marwari",
-        "mya": "Burmese",
-        "myv": "Erzya",
-        "nap": "Neapolitan",
-        "nau": "Nauru",
-        "nav": "Navajo",
-        "nbl": "Ndebele; South",
-        "nde": "Ndebele; North",
-        "ndo": "Ndonga",
-        "nds": "German; Low",
-        "nep": "Nepali",
-        "new": "Bhasa; Nepal",
-        "nia": "Nias",
-        "niu": "Niuean",
-        "nld": "Dutch",
-        "nno": "Norwegian Nynorsk",
-        "nob": "Norwegian Bokmål",
-        "nog": "Nogai",
-        "non": "Norse; Old",
-        "nor": "Norwegian",
-        "nqo": "N'Ko",
-        "nso": "Sotho; Northern",
-        "nwc": "Newari; Old",
-        "nya": "Nyanja",
-        "nym": "Nyamwezi",
-        "nyn": "Nyankole",
-        "nyo": "Nyoro",
-        "nzi": "Nzima",
-        "oci": "Occitan (post 1500)",
-        "oji": "Ojibwa",
-        "ori": "Oriya",
-        "orm": "Oromo",
-        "osa": "Osage",
-        "oss": "Ossetian",
-        "ota": "Turkish; Ottoman (1500-1928)",
-        "pag": "Pangasinan",
-        "pal": "Pahlavi",
-        "pam": "Pampanga",
-        "pan": "Panjabi",
-        "pap": "Papiamento",
-        "pau": "Palauan",
-        "peo": "Persian; Old (ca. 600-400 B.C.)",
-        "phn": "Phoenician",
-        "pli": "Pali",
-        "pol": "Polish",
-        "pon": "Pohnpeian",
-        "por": "Portuguese",
-        "pro": "Provençal; Old (to 1500)",
-        "pus": "Pushto",
-        "que": "Quechua",
-        "raj": "Rajasthani",
-        "rap": "Rapanui",
-        "rar": "Maori; Cook Islands",
-        "roh": "Romansh",
-        "rom": "Romany",
-        "ron": "Romanian",
-        "run": "Rundi",
-        "rup": "Romanian; Macedo-",
-        "rus": "Russian",
-        "sad": "Sandawe",
-        "sag": "Sango",
-        "sah": "Yakut",
-        "sam": "Aramaic; Samaritan",
-        "san": "Sanskrit",
-        "sas": "Sasak",
-        "sat": "Santali",
-        "scn": "Sicilian",
-        "sco": "Scots",
-        "sel": "Selkup",
-        "sga": "Irish; Old (to 900)",
-        "shn": "Shan",
-        "sid": "Sidamo",
-        "sin": "Sinhala",
-        "slk": "Slovak",
-        "slv": "Slovenian",
-        "sma": "Sami; Southern",
-        "sme": "Sami; Northern",
-        "smj": "Lule Sami",
-        "smn": "Sami; Inari",
-        "smo": "Samoan",
-        "sms": "Sami; Skolt",
-        "sna": "Shona",
-        "snd": "Sindhi",
-        "snk": "Soninke",
-        "sog": "Sogdian",
-        "som": "Somali",
-        "sot": "Sotho; Southern",
-        "spa": "Spanish",
-        "sqi": "Albanian",
-        "srd": "Sardinian",
-        "srn": "Sranan Tongo",
-        "srp": "Serbian",
-        "srr": "Serer",
-        "ssw": "Swati",
-        "suk": "Sukuma",
-        "sun": "Sundanese",
-        "sus": "Susu",
-        "sux": "Sumerian",
-        "swa": "Swahili (macrolanguage)",
-        "swe": "Swedish",
-        "syc": "Syriac; Classical",
-        "syr": "Syriac",
-        "tah": "Tahitian",
-        "tam": "Tamil",
-        "tat": "Tatar",
-        "tel": "Telugu",
-        "tem": "Timne",
-        "ter": "Tereno",
-        "tet": "Tetum",
-        "tgk": "Tajik",
-        "tgl": "Tagalog",
-        "tha": "Thai",
-        "tig": "Tigre",
-        "tir": "Tigrinya",
-        "tiv": "Tiv",
-        "tkl": "Tokelau",
-        "tlh": "Klingon",
-        "tli": "Tlingit",
-        "tmh": "Tamashek",
-        "tog": "Tonga (Nyasa)",
-        "ton": "Tonga (Tonga Islands)",
-        "tpi": "Tok Pisin",
-        "tsi": "Tsimshian",
-        "tsn": "Tswana",
-        "tso": "Tsonga",
-        "tuk": "Turkmen",
-        "tum": "Tumbuka",
-        "tur": "Turkish",
-        "tvl": "Tuvalu",
-        "twi": "Twi",
-        "tyv": "Tuvinian",
-        "udm": "Udmurt",
-        "uga": "Ugaritic",
-        "uig": "Uighur",
-        "ukr": "Ukrainian",
-        "umb": "Umbundu",
-        "und": "Undetermined",
-        "urd": "Urdu",
-        "uzb": "Uzbek",
-        "vai": "Vai",
-        "ven": "Venda",
-        "vie": "Vietnamese",
-        "vol": "Volapük",
-        "vot": "Votic",
-        "wal": "Wolaytta",
-        "war": "Waray (Philippines)",
-        "was": "Washo",
-        "wln": "Walloon",
-        "wol": "Wolof",
-        "xal": "Kalmyk",
-        "xho": "Xhosa",
-        "yao": "Yao",
-        "yap": "Yapese",
-        "yid": "Yiddish",
-        "yor": "Yoruba",
-        "zap": "Zapotec",
-        "zbl": "Blissymbols",
-        "zen": "Zenaga",
-        "zha": "Zhuang",
-        "zho": "Chinese",
-        "zul": "Zulu",
-        "zun": "Zuni",
-        "zxx": "No linguistic content",
-        "zza": "Zaza"
-    },
-    "sv": {
-        "aar": "Afar",
-        "abk": "Abchaziska",
-        "ace": "Acehnesiska (Indonesien)",
-        "ach": "Acoli (Uganda)",
-        "ada": "Adangme",
-        "ady": "Adygeiska",
-        "afh": "Afrihili (konstgjort språk)",
-        "afr": "Afrikaans",
-        "ain": "Ainu (Japan)",
-        "aka": "Akan (Ghana, Elfenbenskusten)",
-        "akk": "Akkadiska",
-        "ale": "Aleutiska",
-        "alt": "Altaiska; södra",
-        "amh": "Amhariska (Etiopien)",
-        "ang": "Engelska; gammal (ca. 450-1100)",
-        "anp": "Angika",
-        "ara": "Arabiska",
-        "arc": "Arameiska; officiell (700-300 f.Kr.)",
-        "arg": "Aragonska",
-        "arn": "Mapudungun",
-        "arp": "Arapaho",
-        "arw": "Arawakiska",
-        "asm": "Assamesiska",
-        "ast": "Asturiska",
-        "ava": "Avariska",
-        "ave": "Avestiska",
-        "awa": "Awadhi",
-        "aym": "Aymara (Bolivien)",
-        "aze": "Azerbajdzjanska",
-        "bak": "Basjkiriska",
-        "bal": "Baluchi",
-        "bam": "Bambara (Västafrika)",
-        "ban": "Balinesiska",
-        "bas": "Basa (Kamerun)",
-        "bej": "Beyja",
-        "bel": "Vitryska",
-        "bem": "Bemba (Zambia)",
-        "ben": "Bengaliska",
-        "bho": "Bhojpuri",
-        "bik": "Bikol",
-        "bin": "Edo (bini)",
-        "bis": "Bislama",
-        "bla": "Siksika (svartfotindianernas språk)",
-        "bod": "Tibetanska",
-        "bos": "Bosniska",
-        "bra": "Braj",
-        "bre": "Bretonska",
-        "bua": "Burjatiska",
-        "bug": "Buginesiska",
-        "bul": "Bulgariska",
-        "byn": "Bilin",
-        "cad": "Caddo",
-        "car": "Carib; Galibi",
-        "cat": "Katalanska (Katalonien)",
-        "ceb": "Cebuanska",
-        "ces": "Tjeckiska",
-        "cha": "Chamorro",
-        "chb": "Chibcha",
-        "che": "Tjetjenska",
-        "chg": "Chagatai",
-        "chk": "Chuukese",
-        "chm": "Mari (Ryssland)",
-        "chn": "Chinook",
-        "cho": "Choctaw",
-        "chp": "Chopi",
-        "chr": "Cherokesiska",
-        "chu": "Slavonic; antik",
-        "chv": "Tjuvasjiska",
-        "chy": "Cheyenne",
-        "cop": "Koptiska",
-        "cor": "Korniska",
-        "cos": "Korsikanska",
-        "cre": "Cree",
-        "crh": "Turkiska Krim",
-        "csb": "Kasjubianska",
-        "cym": "Kymriska",
-        "dak": "Dakota",
-        "dan": "Danska",
-        "dar": "Dargwa",
-        "del": "Delaware",
-        "den": "Slave",
-        "deu": "Tyska",
-        "dgr": "Dogrib",
-        "din": "Dinka",
-        "div": "Divehi",
-        "doi": "Dogri (macrolanguage)",
-        "dsb": "Sorbian; nedre",
-        "dua": "Duala",
-        "dum": "Hollänska; medeltida (ca. 1050-1350)",
-        "dyu": "Dyula",
-        "dzo": "Bhutanesiska (Dzongkha)",
-        "efi": "Efik",
-        "egy": "Egyptiska; gammal",
-        "eka": "Ekajuk",
-        "ell": "Grekiska; modern (1453-)",
-        "elx": "Elamitiska",
-        "eng": "Engelska",
-        "enm": "Medelengelska (1100-1500)",
-        "epo": "Esperanto",
-        "est": "Estniska",
-        "eus": "Baskiska",
-        "ewe": "Ewe",
-        "ewo": "Ewondo",
-        "fan": "Fang (Ekvatorialguinea)",
-        "fao": "Färöiska",
-        "fas": "Persiska",
-        "fat": "Fanti",
-        "fij": "Fijianska",
-        "fil": "Filipino",
-        "fin": "Finska",
-        "fon": "Fon",
-        "fra": "Franska",
-        "frm": "Franska; medel (ca. 1400-1600)",
-        "fro": "Franska; gammal (842-ca. 1400)",
-        "frr": "Frisian; norra",
-        "frs": "Frisian; östra",
-        "fry": "Frisian; västra",
-        "ful": "Fulani",
-        "fur": "Friuliska",
-        "gaa": "Ga",
-        "gay": "Gayo",
-        "gba": "Gbaya (Centralafrikanska republiken)",
-        "gez": "Geez; fornetiopiska",
-        "gil": "Gilbertesiska",
-        "gla": "Gaeliska; skotska",
-        "gle": "Iriska",
-        "glg": "Galiciska",
-        "glv": "Manx",
-        "gmh": "Tyska; medelhög (ca. 1050-1500)",
-        "goh": "Tyska; gammal hög (ca. 750-1050)",
-        "gon": "Gondi",
-        "gor": "Gorontalo",
-        "got": "Gotiska",
-        "grb": "Grebo",
-        "grc": "Grekiska; antik (-1453)",
-        "grn": "Guarani",
-        "gsw": "Tyska; Schweizisk",
-        "guj": "Gujarati (Indien)",
-        "gwi": "Gwichʼin",
-        "hai": "Haida",
-        "hat": "Kreolspråk; haitisk kreol",
-        "hau": "Haussa",
-        "haw": "Hawaiiska",
-        "heb": "Hebreiska",
-        "her": "Herero",
-        "hil": "Hiligaynon",
-        "hin": "Hindi",
-        "hit": "Hettitiska språk",
-        "hmn": "Hmong",
-        "hmo": "Hiri Motu",
-        "hrv": "Kroatiska",
-        "hsb": "Sorbiska; övre",
-        "hun": "Ungerska",
-        "hup": "Hupa",
-        "hye": "Armeniska",
-        "iba": "Iban",
-        "ibo": "Ibo (Igbo)",
-        "ido": "Ido",
-        "iii": "Yi; Sichuan",
-        "iku": "Inuktitut",
-        "ile": "Interlingue",
-        "ilo": "Iloko",
-        "ina": "Interlingua (International Auxiliary Language Association)",
-        "ind": "Indonesiska",
-        "inh": "Ingusj",
-        "ipk": "Inupiaq",
-        "isl": "Isländska",
-        "ita": "Italienska",
-        "jav": "Javanesiska",
-        "jbo": "Lojban",
-        "jpn": "Japanska",
-        "jpr": "Judepersiska",
-        "jrb": "Judearabiska",
-        "kaa": "Karakalpakiska",
-        "kab": "Kabyliska",
-        "kac": "Kachin",
-        "kal": "Grönländska (Kalaallisut)",
-        "kam": "Kamba (Kenya)",
-        "kan": "Kannada (Indien)",
-        "kas": "Kashmiri",
-        "kat": "Georgiska",
-        "kau": "Kanuri",
-        "kaw": "Kiwi; fornjavanska",
-        "kaz": "Kazakiska (Kazakstan)",
-        "kbd": "Kabardinska (östtjerkessiska)",
-        "kha": "Khasi",
-        "khm": "Khmer (Kambodja)",
-        "kho": "Sakiska (khotanesiska)",
-        "kik": "Kikuyu (Kenya)",
-        "kin": "Kinyarwanda (Rwanda)",
-        "kir": "Kirgisiska",
-        "kmb": "Mbundu (kimbundu)",
-        "kok": "Konkani (macrolanguage)",
-        "kom": "Komi",
-        "kon": "Kongo",
-        "kor": "Koreanska",
-        "kos": "Kusaie",
-        "kpe": "Kpelle",
-        "krc": "Karatjaj-balkar",
-        "krl": "Karelska",
-        "kru": "Kurukh",
-        "kua": "Ovambo (kuanyama)",
-        "kum": "Kumyk",
-        "kur": "Kurdiska",
-        "kut": "Kutenai",
-        "lad": "Spanjolska (ladino)",
-        "lah": "Lahnda",
-        "lam": "Lamba",
-        "lao": "Laotiska (Laos)",
-        "lat": "Latin",
-        "lav": "Lettiska",
-        "lez": "Lezginska",
-        "lim": "Limburgan",
-        "lin": "Lingala (Kongo-Kinshasa, Kongo-Brazzaville)",
-        "lit": "Litauiska",
-        "lol": "Lolo (mongo)",
-        "loz": "Lozi",
-        "ltz": "Luxembourgish",
-        "lua": "Luba-Lulua",
-        "lub": "Luba-Katanga",
-        "lug": "Luganda/Ganda (Uganda)",
-        "lui": "Luiseno",
-        "lun": "Lunda",
-        "luo": "Luo (Kenya och Tanzania)",
-        "lus": "Mizo (lushai)",
-        "mad": "Madurese",
-        "mag": "Magahi",
-        "mah": "Marshallese",
-        "mai": "Maithili",
-        "mak": "Makasar",
-        "mal": "Malayalam (Indien)",
-        "man": "Mande",
-        "mar": "Marathi (Indien)",
-        "mas": "Massajiska",
-        "mdf": "Moksha",
-        "mdr": "Mandar",
-        "men": "Mende (Sierra Leone)",
-        "mga": "irländsk; medel (900-1200)",
-        "mic": "Mi'kmaq",
-        "min": "Minangkabau",
-        "mis": "Okodade språk",
-        "mkd": "Makedonska",
-        "mlg": "Madagaskiska",
-        "mlt": "Maltesiska (Malta)",
-        "mnc": "Manchu",
-        "mni": "Manipuri",
-        "moh": "Mohawk",
-        "mon": "Mongoliska",
-        "mos": "Mossi",
-        "mri": "Maoriska",
-        "msa": "Malajiska (makrospråk)",
-        "mul": "Flera språk",
-        "mus": "Muskogee",
-        "mwl": "Mirandese",
-        "mwr": "Marwari",
-        "mya": "Burmanska",
-        "myv": "Erzya",
-        "nap": "Neapolitansk italienska",
-        "nau": "Nauruanska",
-        "nav": "Navajo",
-        "nbl": "Ndebele; syd",
-        "nde": "Ndebele; norra",
-        "ndo": "Ndonga",
-        "nds": "Tyska; låg",
-        "nep": "Nepalesiska",
-        "new": "Bhasa; Nepal",
-        "nia": "Nias",
-        "niu": "Niuean",
-        "nld": "Nederländska",
-        "nno": "Nynorsk",
-        "nob": "Norskt bokmål",
-        "nog": "Nogaiska",
-        "non": "Nordiska; gammal",
-        "nor": "Norska",
-        "nqo": "N'Ko",
-        "nso": "Nordsotho",
-        "nwc": "Newari; gammal",
-        "nya": "Nyanja",
-        "nym": "Nyamwezi",
-        "nyn": "Nyankole",
-        "nyo": "Nyoro",
-        "nzi": "Nzima",
-        "oci": "Occitan (post 1500)",
-        "oji": "Odjibwa (chippewa)",
-        "ori": "Oriya",
-        "orm": "Oromo ( Etiopien, Kenya)",
-        "osa": "Osage",
-        "oss": "Ossetian",
-        "ota": "Ottomanska (1500-1928)",
-        "pag": "Pangasinan",
-        "pal": "Pahlavi (medelpersiska)",
-        "pam": "Pampanga (Filippinerna)",
-        "pan": "Punjabi (Indien)",
-        "pap": "Papiamento",
-        "pau": "Palauan",
-        "peo": "Persiska; antik (ca. 600-400 f.Kr.)",
-        "phn": "Feniciska",
-        "pli": "Pali",
-        "pol": "Polska",
-        "pon": "Ponape",
-        "por": "Portugisiska",
-        "pro": "Provensalska; gammal (-1500)",
-        "pus": "Pashto",
-        "que": "Quechua",
-        "raj": "Rajasthani",
-        "rap": "Rapanui",
-        "rar": "Maoriska; Cooköarna",
-        "roh": "Romansh",
-        "rom": "Romani",
-        "ron": "Rumänska",
-        "run": "Rundi",
-        "rup": "Rumänska; Macedo-",
-        "rus": "Ryska",
-        "sad": "Sandawe",
-        "sag": "Sango",
-        "sah": "Jakutiska",
-        "sam": "Arameiska; samariska",
-        "san": "Sanskrit",
-        "sas": "Sasak",
-        "sat": "Santali",
-        "scn": "Sicilianska",
-        "sco": "Lågskotska",
-        "sel": "Selkup",
-        "sga": "Iriska; gammal (-900)",
-        "shn": "Shan",
-        "sid": "Sidami",
-        "sin": "Sinhala",
-        "slk": "Slovakiska",
-        "slv": "Slovenska",
-        "sma": "Samiska,; södra",
-        "sme": "Samiska; norra",
-        "smj": "Samiska; Luleå",
-        "smn": "Samiska; Inari",
-        "smo": "Samoanska",
-        "sms": "Samiska; Skolt",
-        "sna": "Shona (Zimbabwe)",
-        "snd": "Sindhi",
-        "snk": "Soninke",
-        "sog": "Sogdiska",
-        "som": "Somaliska",
-        "sot": "Sotho; södra",
-        "spa": "Spanska",
-        "sqi": "Albanska",
-        "srd": "Sardiska",
-        "srn": "Sranan Tongo",
-        "srp": "Serbiska",
-        "srr": "Serer",
-        "ssw": "Swazi",
-        "suk": "Sukuma",
-        "sun": "Sundanesiska",
-        "sus": "Susu",
-        "sux": "Sumeriska",
-        "swa": "Swahili",
-        "swe": "Svenska",
-        "syc": "Syriac; klassisk",
-        "syr": "Syriska",
-        "tah": "Tahitiska",
-        "tam": "Tamil (Indien, Sri Lanka, Singapore)",
-        "tat": "Tatariska ( Ryssland, Ukraina, Turkiet, Kina, Finland, Centralasien)",
-        "tel": "Telugu (Indien)",
-        "tem": "Temne",
-        "ter": "Tereno",
-        "tet": "Tetum",
-        "tgk": "Tadzjikiska (Tadzjikistan)",
-        "tgl": "Tagalog (Filippinerna)",
-        "tha": "Thailändska",
-        "tig": "Tigre (Eritrea)",
-        "tir": "Tigrinja (Etiopien, Eritrea)",
-        "tiv": "Tivi",
-        "tkl": "Tokelau",
-        "tlh": "Klingon",
-        "tli": "Tlingit",
-        "tmh": "Tamashek",
-        "tog": "Tonga (Nyasa)",
-        "ton": "Tonga (Tongaöarna)",
-        "tpi": "Tok Pisin",
-        "tsi": "Tsimshian",
-        "tsn": "Setswana/Tswand (Botswana, Sydafrika, Zimbabwe, Namibia)",
-        "tso": "Tsonga",
-        "tuk": "Turkmeniska",
-        "tum": "Tumbuka",
-        "tur": "Turkiska",
-        "tvl": "Tuvaluan",
-        "twi": "Twi",
-        "tyv": "Tuvinska",
-        "udm": "Udmurt",
-        "uga": "Ugaritiska",
-        "uig": "UighurUiguriska (Kina, Kazakstan, Pakistan, Kirgizistan, Tadzjikistan, Indien)",
-        "ukr": "Ukrainska",
-        "umb": "Umbundu",
-        "und": "Odefinierat",
-        "urd": "Urdu (Pakistan, Indien)",
-        "uzb": "Uzbekiska",
-        "vai": "Vai",
-        "ven": "Venda",
-        "vie": "Vietnamesiska",
-        "vol": "Volapük",
-        "vot": "Votiska",
-        "wal": "Wolaytta",
-        "war": "Waray (Filippinerna)",
-        "was": "Washo",
-        "wln": "Vallonska",
-        "wol": "Wolof (Senegal, Gambia, Mauretanien)",
-        "xal": "Kalmyk",
-        "xho": "Xhosa (Sydafrika)",
-        "yao": "Yao",
-        "yap": "Yap",
-        "yid": "Jiddisch",
-        "yor": "Yoruba",
-        "zap": "Zapotek",
-        "zbl": "Blissymbols",
-        "zen": "Zenaga",
-        "zha": "Zhuang",
-        "zho": "Kinesiska",
-        "zul": "Zulu (Sydafrika, Malawi, Moçambique, Swaziland)",
-        "zun": "Zuni",
-        "zxx": "No linguistic content",
-        "zza": "Zaza"
-    },
-    "es": {
-        "aar": "Afar",
-        "abk": "Abkhazian",
-        "ace": "Achinese",
-        "ach": "Acoli",
-        "ada": "Adangme",
-        "ady": "Adyghe",
-        "afh": "Afrihili",
-        "afr": "Afrikaans",
-        "ain": "Ainu (Japan)",
-        "aka": "Akan",
-        "akk": "Akkadian",
-        "ale": "Aleut",
-        "alt": "Altai; Southern",
-        "amh": "Amharic",
-        "ang": "English; Old (ca. 450-1100)",
-        "anp": "Angika",
-        "ara": "Arabic",
-        "arc": "Aramaic; Official (700-300 BCE)",
-        "arg": "Aragonese",
-        "arn": "Mapudungun",
-        "arp": "Arapaho",
-        "arw": "Arawak",
-        "asm": "Assamese",
-        "ast": "Asturian",
-        "ava": "Avaric",
-        "ave": "Avestan",
-        "awa": "Awadhi",
-        "aym": "Aymara",
-        "aze": "Azerbaijani",
-        "bak": "Bashkir",
-        "bal": "Baluchi",
-        "bam": "Bambara",
-        "ban": "Balinese",
-        "bas": "Basa (Cameroon)",
-        "bej": "Beja",
-        "bel": "Belarusian",
-        "bem": "Bemba (Zambia)",
-        "ben": "Bengali",
-        "bho": "Bhojpuri",
-        "bik": "Bikol",
-        "bin": "Bini",
-        "bis": "Bislama",
-        "bla": "Siksika",
-        "bod": "Tibetan",
-        "bos": "Bosnian",
-        "bra": "Braj",
-        "bre": "Breton",
-        "bua": "Buriat",
-        "bug": "Buginese",
-        "bul": "Bulgarian",
-        "byn": "Bilin",
-        "cad": "Caddo",
-        "car": "Carib; Galibi",
-        "cat": "Catalan",
-        "ceb": "Cebuano",
-        "ces": "Czech",
-        "cha": "Chamorro",
-        "chb": "Chibcha",
-        "che": "Chechen",
-        "chg": "Chagatai",
-        "chk": "Chuukese",
-        "chm": "Mari (Russia)",
-        "chn": "Chinook jargon",
-        "cho": "Choctaw",
-        "chp": "Chipewyan",
-        "chr": "Cherokee",
-        "chu": "Slavonic; Old",
-        "chv": "Chuvash",
-        "chy": "Cheyenne",
-        "cop": "Coptic",
-        "cor": "Cornish",
-        "cos": "Corsican",
-        "cre": "Cree",
-        "crh": "Turkish; Crimean",
-        "csb": "Kashubian",
-        "cym": "Welsh",
-        "dak": "Dakota",
-        "dan": "Danish",
-        "dar": "Dargwa",
-        "del": "Delaware",
-        "den": "Slave (Athapascan)",
-        "deu": "German",
-        "dgr": "Dogrib",
-        "din": "Dinka",
-        "div": "Dhivehi",
-        "doi": "Dogri (macrolanguage)",
-        "dsb": "Sorbian; Lower",
-        "dua": "Duala",
-        "dum": "Dutch; Middle (ca. 1050-1350)",
-        "dyu": "Dyula",
-        "dzo": "Dzongkha",
-        "efi": "Efik",
-        "egy": "Egyptian (Ancient)",
-        "eka": "Ekajuk",
-        "ell": "Greek; Modern (1453-)",
-        "elx": "Elamite",
-        "eng": "English",
-        "enm": "English; Middle (1100-1500)",
-        "epo": "Esperanto",
-        "est": "Estonian",
-        "eus": "Basque",
-        "ewe": "Ewe",
-        "ewo": "Ewondo",
-        "fan": "Fang (Equatorial Guinea)",
-        "fao": "Faroese",
-        "fas": "Persian",
-        "fat": "Fanti",
-        "fij": "Fijian",
-        "fil": "Filipino",
-        "fin": "Finnish",
-        "fon": "Fon",
-        "fra": "French",
-        "frm": "French; Middle (ca. 1400-1600)",
-        "fro": "French; Old (842-ca. 1400)",
-        "frr": "Frisian; Northern",
-        "frs": "Frisian; Eastern",
-        "fry": "Frisian; Western",
-        "ful": "Fulah",
-        "fur": "Friulian",
-        "gaa": "Ga",
-        "gay": "Gayo",
-        "gba": "Gbaya (Central African Republic)",
-        "gez": "Geez",
-        "gil": "Gilbertese",
-        "gla": "Gaelic; Scottish",
-        "gle": "Irish",
-        "glg": "Galician",
-        "glv": "Manx",
-        "gmh": "German; Middle High (ca. 1050-1500)",
-        "goh": "German; Old High (ca. 750-1050)",
-        "gon": "Gondi",
-        "gor": "Gorontalo",
-        "got": "Gothic",
-        "grb": "Grebo",
-        "grc": "Greek; Ancient (to 1453)",
-        "grn": "Guarani",
-        "gsw": "German; Swiss",
-        "guj": "Gujarati",
-        "gwi": "Gwichʼin",
-        "hai": "Haida",
-        "hat": "Creole; Haitian",
-        "hau": "Hausa",
-        "haw": "Hawaiian",
-        "heb": "Hebrew",
-        "her": "Herero",
-        "hil": "Hiligaynon",
-        "hin": "Hindi",
-        "hit": "Hittite",
-        "hmn": "Hmong",
-        "hmo": "Hiri Motu",
-        "hrv": "Croatian",
-        "hsb": "Sorbian; Upper",
-        "hun": "Hungarian",
-        "hup": "Hupa",
-        "hye": "Armenian",
-        "iba": "Iban",
-        "ibo": "Igbo",
-        "ido": "Ido",
-        "iii": "Yi; Sichuan",
-        "iku": "Inuktitut",
-        "ile": "Interlingue",
-        "ilo": "Iloko",
-        "ina": "Interlingua (International Auxiliary Language Association)",
-        "ind": "Indonesian",
-        "inh": "Ingush",
-        "ipk": "Inupiaq",
-        "isl": "Icelandic",
-        "ita": "Italian",
-        "jav": "Javanese",
-        "jbo": "Lojban",
-        "jpn": "Japanese",
-        "jpr": "Judeo-Persian",
-        "jrb": "Judeo-Arabic",
-        "kaa": "Kara-Kalpak",
-        "kab": "Kabyle",
-        "kac": "Kachin",
-        "kal": "Kalaallisut",
-        "kam": "Kamba (Kenya)",
-        "kan": "Kannada",
-        "kas": "Kashmiri",
-        "kat": "Georgian",
-        "kau": "Kanuri",
-        "kaw": "Kawi",
-        "kaz": "Kazakh",
-        "kbd": "Kabardian",
-        "kha": "Khasi",
-        "khm": "Khmer; Central",
-        "kho": "Khotanese",
-        "kik": "Kikuyu",
-        "kin": "Kinyarwanda",
-        "kir": "Kirghiz",
-        "kmb": "Kimbundu",
-        "kok": "Konkani (macrolanguage)",
-        "kom": "Komi",
-        "kon": "Kongo",
-        "kor": "Korean",
-        "kos": "Kosraean",
-        "kpe": "Kpelle",
-        "krc": "Karachay-Balkar",
-        "krl": "Karelian",
-        "kru": "Kurukh",
-        "kua": "Kuanyama",
-        "kum": "Kumyk",
-        "kur": "Kurdish",
-        "kut": "Kutenai",
-        "lad": "Ladino",
-        "lah": "Lahnda",
-        "lam": "Lamba",
-        "lao": "Lao",
-        "lat": "Latin",
-        "lav": "Latvian",
-        "lez": "Lezghian",
-        "lim": "Limburgan",
-        "lin": "Lingala",
-        "lit": "Lithuanian",
-        "lol": "Mongo",
-        "loz": "Lozi",
-        "ltz": "Luxembourgish",
-        "lua": "Luba-Lulua",
-        "lub": "Luba-Katanga",
-        "lug": "Ganda",
-        "lui": "Luiseno",
-        "lun": "Lunda",
-        "luo": "Luo (Kenya and Tanzania)",
-        "lus": "Lushai",
-        "mad": "Madurese",
-        "mag": "Magahi",
-        "mah": "Marshallese",
-        "mai": "Maithili",
-        "mak": "Makasar",
-        "mal": "Malayalam",
-        "man": "Mandingo",
-        "mar": "Marathi",
-        "mas": "Masai",
-        "mdf": "Moksha",
-        "mdr": "Mandar",
-        "men": "Mende (Sierra Leone)",
-        "mga": "Irish; Middle (900-1200)",
-        "mic": "Mi'kmaq",
-        "min": "Minangkabau",
-        "mis": "Uncoded languages",
-        "mkd": "Macedonian",
-        "mlg": "Malagasy",
-        "mlt": "Maltese",
-        "mnc": "Manchu",
-        "mni": "Manipuri",
-        "moh": "Mohawk",
-        "mon": "Mongolian",
-        "mos": "Mossi",
-        "mri": "Maori",
-        "msa": "Malay (macrolanguage)",
-        "mul": "Multiple languages",
-        "mus": "Creek",
-        "mwl": "Mirandese",
-        "mwr": "Marwari",
-        "mya": "Burmese",
-        "myv": "Erzya",
-        "nap": "Neapolitan",
-        "nau": "Nauru",
-        "nav": "Navajo",
-        "nbl": "Ndebele; South",
-        "nde": "Ndebele; North",
-        "ndo": "Ndonga",
-        "nds": "German; Low",
-        "nep": "Nepali",
-        "new": "Bhasa; Nepal",
-        "nia": "Nias",
-        "niu": "Niuean",
-        "nld": "Dutch",
-        "nno": "Norwegian Nynorsk",
-        "nob": "Norwegian Bokmål",
-        "nog": "Nogai",
-        "non": "Norse; Old",
-        "nor": "Norwegian",
-        "nqo": "N'Ko",
-        "nso": "Sotho; Northern",
-        "nwc": "Newari; Old",
-        "nya": "Nyanja",
-        "nym": "Nyamwezi",
-        "nyn": "Nyankole",
-        "nyo": "Nyoro",
-        "nzi": "Nzima",
-        "oci": "Occitan (post 1500)",
-        "oji": "Ojibwa",
-        "ori": "Oriya",
-        "orm": "Oromo",
-        "osa": "Osage",
-        "oss": "Ossetian",
-        "ota": "Turkish; Ottoman (1500-1928)",
-        "pag": "Pangasinan",
-        "pal": "Pahlavi",
-        "pam": "Pampanga",
-        "pan": "Panjabi",
-        "pap": "Papiamento",
-        "pau": "Palauan",
-        "peo": "Persian; Old (ca. 600-400 B.C.)",
-        "phn": "Phoenician",
-        "pli": "Pali",
-        "pol": "Polish",
-        "pon": "Pohnpeian",
-        "por": "Portuguese",
-        "pro": "Provençal; Old (to 1500)",
-        "pus": "Pushto",
-        "que": "Quechua",
-        "raj": "Rajasthani",
-        "rap": "Rapanui",
-        "rar": "Maori; Cook Islands",
-        "roh": "Romansh",
-        "rom": "Romany",
-        "ron": "Romanian",
-        "run": "Rundi",
-        "rup": "Romanian; Macedo-",
-        "rus": "Russian",
-        "sad": "Sandawe",
-        "sag": "Sango",
-        "sah": "Yakut",
-        "sam": "Aramaic; Samaritan",
-        "san": "Sanskrit",
-        "sas": "Sasak",
-        "sat": "Santali",
-        "scn": "Sicilian",
-        "sco": "Scots",
-        "sel": "Selkup",
-        "sga": "Irish; Old (to 900)",
-        "shn": "Shan",
-        "sid": "Sidamo",
-        "sin": "Sinhala",
-        "slk": "Slovak",
-        "slv": "Slovenian",
-        "sma": "Sami; Southern",
-        "sme": "Sami; Northern",
-        "smj": "Lule Sami",
-        "smn": "Sami; Inari",
-        "smo": "Samoan",
-        "sms": "Sami; Skolt",
-        "sna": "Shona",
-        "snd": "Sindhi",
-        "snk": "Soninke",
-        "sog": "Sogdian",
-        "som": "Somali",
-        "sot": "Sotho; Southern",
-        "spa": "Spanish",
-        "sqi": "Albanian",
-        "srd": "Sardinian",
-        "srn": "Sranan Tongo",
-        "srp": "Serbian",
-        "srr": "Serer",
-        "ssw": "Swati",
-        "suk": "Sukuma",
-        "sun": "Sundanese",
-        "sus": "Susu",
-        "sux": "Sumerian",
-        "swa": "Swahili (macrolanguage)",
-        "swe": "Swedish",
-        "syc": "Syriac; Classical",
-        "syr": "Syriac",
-        "tah": "Tahitian",
-        "tam": "Tamil",
-        "tat": "Tatar",
-        "tel": "Telugu",
-        "tem": "Timne",
-        "ter": "Tereno",
-        "tet": "Tetum",
-        "tgk": "Tajik",
-        "tgl": "Tagalog",
-        "tha": "Thai",
-        "tig": "Tigre",
-        "tir": "Tigrinya",
-        "tiv": "Tiv",
-        "tkl": "Tokelau",
-        "tlh": "Klingon",
-        "tli": "Tlingit",
-        "tmh": "Tamashek",
-        "tog": "Tonga (Nyasa)",
-        "ton": "Tonga (Tonga Islands)",
-        "tpi": "Tok Pisin",
-        "tsi": "Tsimshian",
-        "tsn": "Tswana",
-        "tso": "Tsonga",
-        "tuk": "Turkmen",
-        "tum": "Tumbuka",
-        "tur": "Turkish",
-        "tvl": "Tuvalu",
-        "twi": "Twi",
-        "tyv": "Tuvinian",
-        "udm": "Udmurt",
-        "uga": "Ugaritic",
-        "uig": "Uighur",
-        "ukr": "Ukrainian",
-        "umb": "Umbundu",
-        "und": "Undetermined",
-        "urd": "Urdu",
-        "uzb": "Uzbek",
-        "vai": "Vai",
-        "ven": "Venda",
-        "vie": "Vietnamese",
-        "vol": "Volapük",
-        "vot": "Votic",
-        "wal": "Wolaytta",
-        "war": "Waray (Philippines)",
-        "was": "Washo",
-        "wln": "Walloon",
-        "wol": "Wolof",
-        "xal": "Kalmyk",
-        "xho": "Xhosa",
-        "yao": "Yao",
-        "yap": "Yapese",
-        "yid": "Yiddish",
-        "yor": "Yoruba",
-        "zap": "Zapotec",
-        "zbl": "Blissymbols",
-        "zen": "Zenaga",
-        "zha": "Zhuang",
-        "zho": "Chinese",
-        "zul": "Zulu",
-        "zun": "Zuni",
-        "zxx": "No linguistic content",
-        "zza": "Zaza"
-    },
-    "en": {
-        "aar": "Afar",
-        "abk": "Abkhazian",
-        "ace": "Achinese",
-        "ach": "Acoli",
-        "ada": "Adangme",
-        "ady": "Adyghe",
-        "afh": "Afrihili",
-        "afr": "Afrikaans",
-        "ain": "Ainu (Japan)",
-        "aka": "Akan",
-        "akk": "Akkadian",
-        "ale": "Aleut",
-        "alt": "Altai; Southern",
-        "amh": "Amharic",
-        "ang": "English; Old (ca. 450-1100)",
-        "anp": "Angika",
-        "ara": "Arabic",
-        "arc": "Aramaic; Official (700-300 BCE)",
-        "arg": "Aragonese",
-        "arn": "Mapudungun",
-        "arp": "Arapaho",
-        "arw": "Arawak",
-        "asm": "Assamese",
-        "ast": "Asturian",
-        "ava": "Avaric",
-        "ave": "Avestan",
-        "awa": "Awadhi",
-        "aym": "Aymara",
-        "aze": "Azerbaijani",
-        "bak": "Bashkir",
-        "bal": "Baluchi",
-        "bam": "Bambara",
-        "ban": "Balinese",
-        "bas": "Basa (Cameroon)",
-        "bej": "Beja",
-        "bel": "Belarusian",
-        "bem": "Bemba (Zambia)",
-        "ben": "Bengali",
-        "bho": "Bhojpuri",
-        "bik": "Bikol",
-        "bin": "Bini",
-        "bis": "Bislama",
-        "bla": "Siksika",
-        "bod": "Tibetan",
-        "bos": "Bosnian",
-        "bra": "Braj",
-        "bre": "Breton",
-        "bua": "Buriat",
-        "bug": "Buginese",
-        "bul": "Bulgarian",
-        "byn": "Bilin",
-        "cad": "Caddo",
-        "car": "Carib; Galibi",
-        "cat": "Catalan",
-        "ceb": "Cebuano",
-        "ces": "Czech",
-        "cha": "Chamorro",
-        "chb": "Chibcha",
-        "che": "Chechen",
-        "chg": "Chagatai",
-        "chk": "Chuukese",
-        "chm": "Mari (Russia)",
-        "chn": "Chinook jargon",
-        "cho": "Choctaw",
-        "chp": "Chipewyan",
-        "chr": "Cherokee",
-        "chu": "Slavonic; Old",
-        "chv": "Chuvash",
-        "chy": "Cheyenne",
-        "cop": "Coptic",
-        "cor": "Cornish",
-        "cos": "Corsican",
-        "cre": "Cree",
-        "crh": "Turkish; Crimean",
-        "csb": "Kashubian",
-        "cym": "Welsh",
-        "dak": "Dakota",
-        "dan": "Danish",
-        "dar": "Dargwa",
-        "del": "Delaware",
-        "den": "Slave (Athapascan)",
-        "deu": "German",
-        "dgr": "Dogrib",
-        "din": "Dinka",
-        "div": "Dhivehi",
-        "doi": "Dogri (macrolanguage)",
-        "dsb": "Sorbian; Lower",
-        "dua": "Duala",
-        "dum": "Dutch; Middle (ca. 1050-1350)",
-        "dyu": "Dyula",
-        "dzo": "Dzongkha",
-        "efi": "Efik",
-        "egy": "Egyptian (Ancient)",
-        "eka": "Ekajuk",
-        "ell": "Greek; Modern (1453-)",
-        "elx": "Elamite",
-        "eng": "English",
-        "enm": "English; Middle (1100-1500)",
-        "epo": "Esperanto",
-        "est": "Estonian",
-        "eus": "Basque",
-        "ewe": "Ewe",
-        "ewo": "Ewondo",
-        "fan": "Fang (Equatorial Guinea)",
-        "fao": "Faroese",
-        "fas": "Persian",
-        "fat": "Fanti",
-        "fij": "Fijian",
-        "fil": "Filipino",
-        "fin": "Finnish",
-        "fon": "Fon",
-        "fra": "French",
-        "frm": "French; Middle (ca. 1400-1600)",
-        "fro": "French; Old (842-ca. 1400)",
-        "frr": "Frisian; Northern",
-        "frs": "Frisian; Eastern",
-        "fry": "Frisian; Western",
-        "ful": "Fulah",
-        "fur": "Friulian",
-        "gaa": "Ga",
-        "gay": "Gayo",
-        "gba": "Gbaya (Central African Republic)",
-        "gez": "Geez",
-        "gil": "Gilbertese",
-        "gla": "Gaelic; Scottish",
-        "gle": "Irish",
-        "glg": "Galician",
-        "glv": "Manx",
-        "gmh": "German; Middle High (ca. 1050-1500)",
-        "goh": "German; Old High (ca. 750-1050)",
-        "gon": "Gondi",
-        "gor": "Gorontalo",
-        "got": "Gothic",
-        "grb": "Grebo",
-        "grc": "Greek; Ancient (to 1453)",
-        "grn": "Guarani",
-        "gsw": "German; Swiss",
-        "guj": "Gujarati",
-        "gwi": "Gwichʼin",
-        "hai": "Haida",
-        "hat": "Creole; Haitian",
-        "hau": "Hausa",
-        "haw": "Hawaiian",
-        "heb": "Hebrew",
-        "her": "Herero",
-        "hil": "Hiligaynon",
-        "hin": "Hindi",
-        "hit": "Hittite",
-        "hmn": "Hmong",
-        "hmo": "Hiri Motu",
-        "hrv": "Croatian",
-        "hsb": "Sorbian; Upper",
-        "hun": "Hungarian",
-        "hup": "Hupa",
-        "hye": "Armenian",
-        "iba": "Iban",
-        "ibo": "Igbo",
-        "ido": "Ido",
-        "iii": "Yi; Sichuan",
-        "iku": "Inuktitut",
-        "ile": "Interlingue",
-        "ilo": "Iloko",
-        "ina": "Interlingua (International Auxiliary Language Association)",
-        "ind": "Indonesian",
-        "inh": "Ingush",
-        "ipk": "Inupiaq",
-        "isl": "Icelandic",
-        "ita": "Italian",
-        "jav": "Javanese",
-        "jbo": "Lojban",
-        "jpn": "Japanese",
-        "jpr": "Judeo-Persian",
-        "jrb": "Judeo-Arabic",
-        "kaa": "Kara-Kalpak",
-        "kab": "Kabyle",
-        "kac": "Kachin",
-        "kal": "Kalaallisut",
-        "kam": "Kamba (Kenya)",
-        "kan": "Kannada",
-        "kas": "Kashmiri",
-        "kat": "Georgian",
-        "kau": "Kanuri",
-        "kaw": "Kawi",
-        "kaz": "Kazakh",
-        "kbd": "Kabardian",
-        "kha": "Khasi",
-        "khm": "Khmer; Central",
-        "kho": "Khotanese",
-        "kik": "Kikuyu",
-        "kin": "Kinyarwanda",
-        "kir": "Kirghiz",
-        "kmb": "Kimbundu",
-        "kok": "Konkani (macrolanguage)",
-        "kom": "Komi",
-        "kon": "Kongo",
-        "kor": "Korean",
-        "kos": "Kosraean",
-        "kpe": "Kpelle",
-        "krc": "Karachay-Balkar",
-        "krl": "Karelian",
-        "kru": "Kurukh",
-        "kua": "Kuanyama",
-        "kum": "Kumyk",
-        "kur": "Kurdish",
-        "kut": "Kutenai",
-        "lad": "Ladino",
-        "lah": "Lahnda",
-        "lam": "Lamba",
-        "lao": "Lao",
-        "lat": "Latin",
-        "lav": "Latvian",
-        "lez": "Lezghian",
-        "lim": "Limburgan",
-        "lin": "Lingala",
-        "lit": "Lithuanian",
-        "lol": "Mongo",
-        "loz": "Lozi",
-        "ltz": "Luxembourgish",
-        "lua": "Luba-Lulua",
-        "lub": "Luba-Katanga",
-        "lug": "Ganda",
-        "lui": "Luiseno",
-        "lun": "Lunda",
-        "luo": "Luo (Kenya and Tanzania)",
-        "lus": "Lushai",
-        "mad": "Madurese",
-        "mag": "Magahi",
-        "mah": "Marshallese",
-        "mai": "Maithili",
-        "mak": "Makasar",
-        "mal": "Malayalam",
-        "man": "Mandingo",
-        "mar": "Marathi",
-        "mas": "Masai",
-        "mdf": "Moksha",
-        "mdr": "Mandar",
-        "men": "Mende (Sierra Leone)",
-        "mga": "Irish; Middle (900-1200)",
-        "mic": "Mi'kmaq",
-        "min": "Minangkabau",
-        "mis": "Uncoded languages",
-        "mkd": "Macedonian",
-        "mlg": "Malagasy",
-        "mlt": "Maltese",
-        "mnc": "Manchu",
-        "mni": "Manipuri",
-        "moh": "Mohawk",
-        "mon": "Mongolian",
-        "mos": "Mossi",
-        "mri": "Maori",
-        "msa": "Malay (macrolanguage)",
-        "mul": "Multiple languages",
-        "mus": "Creek",
-        "mwl": "Mirandese",
-        "mwr": "Marwari",
-        "mya": "Burmese",
-        "myv": "Erzya",
-        "nap": "Neapolitan",
-        "nau": "Nauru",
-        "nav": "Navajo",
-        "nbl": "Ndebele; South",
-        "nde": "Ndebele; North",
-        "ndo": "Ndonga",
-        "nds": "German; Low",
-        "nep": "Nepali",
-        "new": "Bhasa; Nepal",
-        "nia": "Nias",
-        "niu": "Niuean",
-        "nld": "Dutch",
-        "nno": "Norwegian Nynorsk",
-        "nob": "Norwegian Bokmål",
-        "nog": "Nogai",
-        "non": "Norse; Old",
-        "nor": "Norwegian",
-        "nqo": "N'Ko",
-        "nso": "Sotho; Northern",
-        "nwc": "Newari; Old",
-        "nya": "Nyanja",
-        "nym": "Nyamwezi",
-        "nyn": "Nyankole",
-        "nyo": "Nyoro",
-        "nzi": "Nzima",
-        "oci": "Occitan (post 1500)",
-        "oji": "Ojibwa",
-        "ori": "Oriya",
-        "orm": "Oromo",
-        "osa": "Osage",
-        "oss": "Ossetian",
-        "ota": "Turkish; Ottoman (1500-1928)",
-        "pag": "Pangasinan",
-        "pal": "Pahlavi",
-        "pam": "Pampanga",
-        "pan": "Panjabi",
-        "pap": "Papiamento",
-        "pau": "Palauan",
-        "peo": "Persian; Old (ca. 600-400 B.C.)",
-        "phn": "Phoenician",
-        "pli": "Pali",
-        "pol": "Polish",
-        "pon": "Pohnpeian",
-        "por": "Portuguese",
-        "pro": "Provençal; Old (to 1500)",
-        "pus": "Pushto",
-        "que": "Quechua",
-        "raj": "Rajasthani",
-        "rap": "Rapanui",
-        "rar": "Maori; Cook Islands",
-        "roh": "Romansh",
-        "rom": "Romany",
-        "ron": "Romanian",
-        "run": "Rundi",
-        "rup": "Romanian; Macedo-",
-        "rus": "Russian",
-        "sad": "Sandawe",
-        "sag": "Sango",
-        "sah": "Yakut",
-        "sam": "Aramaic; Samaritan",
-        "san": "Sanskrit",
-        "sas": "Sasak",
-        "sat": "Santali",
-        "scn": "Sicilian",
-        "sco": "Scots",
-        "sel": "Selkup",
-        "sga": "Irish; Old (to 900)",
-        "shn": "Shan",
-        "sid": "Sidamo",
-        "sin": "Sinhala",
-        "slk": "Slovak",
-        "slv": "Slovenian",
-        "sma": "Sami; Southern",
-        "sme": "Sami; Northern",
-        "smj": "Lule Sami",
-        "smn": "Sami; Inari",
-        "smo": "Samoan",
-        "sms": "Sami; Skolt",
-        "sna": "Shona",
-        "snd": "Sindhi",
-        "snk": "Soninke",
-        "sog": "Sogdian",
-        "som": "Somali",
-        "sot": "Sotho; Southern",
-        "spa": "Spanish",
-        "sqi": "Albanian",
-        "srd": "Sardinian",
-        "srn": "Sranan Tongo",
-        "srp": "Serbian",
-        "srr": "Serer",
-        "ssw": "Swati",
-        "suk": "Sukuma",
-        "sun": "Sundanese",
-        "sus": "Susu",
-        "sux": "Sumerian",
-        "swa": "Swahili (macrolanguage)",
-        "swe": "Swedish",
-        "syc": "Syriac; Classical",
-        "syr": "Syriac",
-        "tah": "Tahitian",
-        "tam": "Tamil",
-        "tat": "Tatar",
-        "tel": "Telugu",
-        "tem": "Timne",
-        "ter": "Tereno",
-        "tet": "Tetum",
-        "tgk": "Tajik",
-        "tgl": "Tagalog",
-        "tha": "Thai",
-        "tig": "Tigre",
-        "tir": "Tigrinya",
-        "tiv": "Tiv",
-        "tkl": "Tokelau",
-        "tlh": "Klingon",
-        "tli": "Tlingit",
-        "tmh": "Tamashek",
-        "tog": "Tonga (Nyasa)",
-        "ton": "Tonga (Tonga Islands)",
-        "tpi": "Tok Pisin",
-        "tsi": "Tsimshian",
-        "tsn": "Tswana",
-        "tso": "Tsonga",
-        "tuk": "Turkmen",
-        "tum": "Tumbuka",
-        "tur": "Turkish",
-        "tvl": "Tuvalu",
-        "twi": "Twi",
-        "tyv": "Tuvinian",
-        "udm": "Udmurt",
-        "uga": "Ugaritic",
-        "uig": "Uighur",
-        "ukr": "Ukrainian",
-        "umb": "Umbundu",
-        "und": "Undetermined",
-        "urd": "Urdu",
-        "uzb": "Uzbek",
-        "vai": "Vai",
-        "ven": "Venda",
-        "vie": "Vietnamese",
-        "vol": "Volapük",
-        "vot": "Votic",
-        "wal": "Wolaytta",
-        "war": "Waray (Philippines)",
-        "was": "Washo",
-        "wln": "Walloon",
-        "wol": "Wolof",
-        "xal": "Kalmyk",
-        "xho": "Xhosa",
-        "yao": "Yao",
-        "yap": "Yapese",
-        "yid": "Yiddish",
-        "yor": "Yoruba",
-        "zap": "Zapotec",
-        "zbl": "Blissymbols",
-        "zen": "Zenaga",
-        "zha": "Zhuang",
-        "zho": "Chinese",
-        "zul": "Zulu",
-        "zun": "Zuni",
-        "zxx": "No linguistic content",
-        "zza": "Zaza"
-    }
-}
\ No newline at end of file
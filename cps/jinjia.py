@@ -43,7 +43,9 @@ log = logger.create()
 # pagination links in jinja
 @jinjia.app_template_filter('url_for_other_page')
 def url_for_other_page(page):
-    args = request.view_args.copy()
+    # the arguments of the query string (e.g. the search term) are kept as well
+    args = request.args.to_dict(flat=False)
+    args.update(request.view_args)
     args['page'] = page
     return url_for(request.endpoint, **args)
 
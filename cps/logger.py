@@ -92,6 +92,27 @@ def get_accesslogfile(log_file):
     return _absolute_log_file(log_file, DEFAULT_ACCESS_LOG)
 
 
+class _SharedRotatingFileHandler(RotatingFileHandler):
+    '''RotatingFileHandler for a log file written by several server processes.
+
+    After one process rotated the file, the others would write to the renamed file and rotate it again
+    because of its size. Like WatchedFileHandler, the file is opened again when it was replaced.
+    '''
+
+    def shouldRollover(self, record):
+        if self.stream is not None:
+            try:
+                current = os.stat(self.baseFilename)
+                opened = os.fstat(self.stream.fileno())
+                replaced = (current.st_dev, current.st_ino) != (opened.st_dev, opened.st_ino)
+            except OSError:
+                replaced = True
+            if replaced:
+                self.stream.close()
+                self.stream = self._open()
+        return RotatingFileHandler.shouldRollover(self, record)
+
+
 def setup(log_file, log_level=None):
     '''
     Configure the logging output.
@@ -123,11 +144,11 @@ def setup(log_file, log_level=None):
             file_handler.baseFilename = log_file
     else:
         try:
-            file_handler = RotatingFileHandler(log_file, maxBytes=50000, backupCount=2)
+            file_handler = _SharedRotatingFileHandler(log_file, maxBytes=50000, backupCount=2)
         except IOError:
             if log_file == DEFAULT_LOG_FILE:
                 raise
-            file_handler = RotatingFileHandler(DEFAULT_LOG_FILE, maxBytes=50000, backupCount=2)
+            file_handler = _SharedRotatingFileHandler(DEFAULT_LOG_FILE, maxBytes=50000, backupCount=2)
     file_handler.setFormatter(FORMATTER)
 
     for h in r.handlers:
@@ -147,7 +168,7 @@ def create_access_log(log_file, log_name, formatter):
     access_log.propagate = False
     access_log.setLevel(logging.INFO)
 
-    file_handler = RotatingFileHandler(log_file, maxBytes=50000, backupCount=2)
+    file_handler = _SharedRotatingFileHandler(log_file, maxBytes=50000, backupCount=2)
     file_handler.setFormatter(formatter)
     access_log.addHandler(file_handler)
     return access_log
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Memory diagnostics: tracemalloc snapshots and the sizes of the in-process caches.
+
+Everything is per process, with several server processes the process answering the request is inspected.
+"""
+
+from __future__ import division, print_function, unicode_literals
+import os
+import time
+from datetime import datetime
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+from . import logger
+
+
+log = logger.create()
+
+# snapshots are big (one entry per allocation site), only the last few are kept
+MAX_SNAPSHOTS = 5
+TOP_LIMIT = 25
+# stack frames stored per allocation, every frame makes tracing slower and the traces bigger
+MAX_FRAMES = 50
+
+_snapshots = []
+
+
+def is_available():
+    return tracemalloc is not None
+
+
+def is_tracing():
+    return is_available() and tracemalloc.is_tracing()
+
+
+def start(frames=1):
+    frames = min(max(frames, 1), MAX_FRAMES)
+    if is_available() and not tracemalloc.is_tracing():
+        log.info("Starting tracemalloc with %d frames", frames)
+        tracemalloc.start(frames)
+
+
+def stop():
+    '''Stops tracing, the snapshots taken so far are dropped as well.'''
+    if is_tracing():
+        log.info("Stopping tracemalloc")
+        tracemalloc.stop()
+    del _snapshots[:]
+
+
+def take_snapshot():
+    if not is_tracing():
+        return None
+    snapshot = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<unknown>'),
+    ))
+    _snapshots.append((datetime.now(), snapshot))
+    del _snapshots[:-MAX_SNAPSHOTS]
+    return len(_snapshots) - 1
+
+
+def clear_snapshots():
+    del _snapshots[:]
+
+
+def _format_trace(traceback):
+    frame = traceback[0]
+    return '%s:%d' % (frame.filename, frame.lineno)
+
+
+def top_allocators(index=-1, limit=TOP_LIMIT, key_type='lineno'):
+    if not _snapshots:
+        return []
+    __, snapshot = _snapshots[index]
+    return [{'location': _format_trace(stat.traceback), 'size': stat.size, 'count': stat.count}
+            for stat in snapshot.statistics(key_type)[:limit]]
+
+
+def compare_snapshots(old=-2, new=-1, limit=TOP_LIMIT, key_type='lineno'):
+    '''Allocation sites which grew the most between two snapshots.'''
+    if len(_snapshots) < 2:
+        return []
+    differences = _snapshots[new][1].compare_to(_snapshots[old][1], key_type)
+    return [{'location': _format_trace(stat.traceback), 'size': stat.size, 'size_diff': stat.size_diff,
+             'count': stat.count, 'count_diff': stat.count_diff}
+            for stat in differences[:limit]]
+
+
+def _rss():
+    '''Resident set size in bytes (Linux only), None if unknown.'''
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError, ValueError, AttributeError):
+        return None
+
+
+def session_stats(scoped_session):
+    '''Number of open sessions of a scoped_session registry and objects in their identity maps.'''
+    if scoped_session is None:
+        return None
+    registry = scoped_session.registry.registry
+    if isinstance(registry, dict):
+        # sessions per greenlet (see blocking.session_scope), all of them are visible
+        sessions = list(registry.values())
+    else:
+        # thread local sessions, only the one of the current thread is visible
+        sessions = [registry.value] if hasattr(registry, 'value') else []
+    return {'sessions': len(sessions), 'identity_map': sum(len(session.identity_map) for session in sessions)}
+
+
+def cache_stats():
+    # imported here, the diagnostics must not be a dependency of these modules
+    from . import db, ub, searched_ids, basic_auth_cache, cached_users, isoLanguages, worker, services, \
+        feed_snapshots, prefix_index, book_index, typeahead, catalog
+    stats = {
+        'search_results': searched_ids.get_stats(),
+        'basic_auth': basic_auth_cache.get_stats(),
+        'users': cached_users.get_stats(),
+        'opds_feeds': feed_snapshots.opds_feeds.get_stats(),
+        'prefix_index': prefix_index.prefixes.get_stats(),
+        'book_index': book_index.book_ids.get_stats(),
+        'typeahead': typeahead.typeahead.get_stats(),
+        'catalog': catalog.catalog.get_stats(),
+        'language_names': {'locales': len(isoLanguages.get_loaded_locales())},
+        'worker': worker.get_queue_stats(),
+        'app_db_sessions': session_stats(ub.session),
+        'calibre_db_sessions': session_stats(db.session),
+    }
+    if services.goodreads_support.is_loaded():
+        stats['goodreads_authors'] = services.goodreads_support.get_cache_stats()
+    if services.ldap.is_loaded():
+        stats['ldap_binds'] = services.ldap.get_cache_stats()
+    return stats
+
+
+def report(limit=TOP_LIMIT):
+    result = {
+        'pid': os.getpid(),
+        'time': time.time(),
+        'rss': _rss(),
+        'tracemalloc_available': is_available(),
+        'tracing': is_tracing(),
+        'caches': cache_stats(),
+        'snapshots': [taken.isoformat() for taken, __ in _snapshots],
+    }
+    if is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        result['traced_memory'] = {'current': current, 'peak': peak}
+    result['top_allocators'] = top_allocators(limit=limit)
+    result['growth'] = compare_snapshots(limit=limit)
+    return result
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Request, database, cache and worker metrics in the Prometheus text format (served on /metrics).
+
+Metrics are kept per process, with several server processes every scrape is answered by one of them.
+"""
+
+from __future__ import division, print_function, unicode_literals
+import threading
+import time
+
+from flask import request
+from werkzeug.wsgi import ClosingIterator
+
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+DEFAULT_BUCKETS = (.005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10)
+
+_metrics = []
+
+
+def _escape(value):
+    return ('%s' % value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=None):
+    labels = ['%s="%s"' % (name, _escape(value)) for name, value in zip(names, values)]
+    if extra:
+        labels.append('%s="%s"' % extra)
+    return '{%s}' % ','.join(labels) if labels else ''
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value))
+
+
+# Base of Counter, Gauge and Histogram, which set type and return their sample lines from _samples()
+class _Metric(object):
+    type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        _metrics.append(self)
+
+    def _key(self, labels):
+        return tuple(labels.get(name, '') for name in self.labelnames)
+
+    def render(self):
+        lines = ['# HELP %s %s' % (self.name, self.documentation), '# TYPE %s %s' % (self.name, self.type)]
+        with self._lock:
+            lines.extend(self._samples())
+        return lines
+
+
+class Counter(_Metric):
+    type = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _samples(self):
+        return ['%s%s %s' % (self.name, _format_labels(self.labelnames, key), _format_value(value))
+                for key, value in sorted(self._values.items())]
+
+
+class Gauge(Counter):
+    type = 'gauge'
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        _Metric.__init__(self, name, documentation, labelnames)
+        self.buckets = tuple(buckets) + (float('inf'),)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            # counts per bucket (not cumulated) and the sum of all observed values
+            values = self._values.get(key)
+            if values is None:
+                values = self._values[key] = [[0] * len(self.buckets), 0.0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    values[0][index] += 1
+                    break
+            values[1] += value
+
+    def _samples(self):
+        lines = []
+        for key, (counts, total) in sorted(self._values.items()):
+            cumulated = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulated += count
+                lines.append('%s_bucket%s %d' % (self.name, _format_labels(self.labelnames, key,
+                                                                             ('le', _format_value(bound))),
+                                                 cumulated))
+            labels = _format_labels(self.labelnames, key)
+            lines.append('%s_count%s %d' % (self.name, labels, cumulated))
+            lines.append('%s_sum%s %s' % (self.name, labels, _format_value(total)))
+        return lines
+
+
+def render():
+    lines = []
+    for metric in _metrics:
+        lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
+
+
+REQUEST_DURATION = Histogram('calibre_web_request_duration_seconds',
+                             'Time until the response was sent completely',
+                             ('blueprint', 'endpoint', 'method', 'status'))
+REQUESTS_IN_FLIGHT = Gauge('calibre_web_requests_in_flight', 'Requests currently processed')
+REQUEST_DB_QUERIES = Histogram('calibre_web_request_db_queries', 'Database queries executed per request',
+                               buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000))
+DB_QUERIES = Counter('calibre_web_db_queries_total', 'Executed database queries', ('database', 'endpoint'))
+DB_QUERY_SECONDS = Counter('calibre_web_db_query_seconds_total', 'Time spent executing database queries',
+                           ('database', 'endpoint'))
+CACHE_REQUESTS = Counter('calibre_web_cache_requests_total', 'Cache lookups', ('cache', 'result'))
+WORKER_TASKS = Gauge('calibre_web_worker_tasks', 'Background tasks in the task list', ('status',))
+CONVERSION_DURATION = Histogram('calibre_web_conversion_duration_seconds', 'Duration of ebook conversions',
+                                ('format', 'result'), buckets=(1, 5, 10, 30, 60, 120, 300, 600, 1800))
+SERVER_POOL_SIZE = Gauge('calibre_web_server_pool_size', 'Size of the server pool (0 is unlimited)')
+SERVER_POOL_USED = Gauge('calibre_web_server_pool_used', 'Greenlets of the server pool in use')
+SLOTS_ACTIVE = Gauge('calibre_web_request_slots_active', 'Requests holding a request slot', ('slots',))
+SLOTS_QUEUED = Gauge('calibre_web_request_slots_queued', 'Requests waiting for a request slot', ('slots',))
+SLOTS_REJECTED = Counter('calibre_web_request_slots_rejected_total', 'Requests rejected with 503', ('slots',))
+LDAP_BIND_DURATION = Histogram('calibre_web_ldap_bind_duration_seconds', 'Duration of binds to the LDAP server',
+                               ('kind', 'result'))
+
+
+def cache_access(cache, hit):
+    CACHE_REQUESTS.inc(cache=cache, result='hit' if hit else 'miss')
+
+
+class MetricsMiddleware(object):
+    '''WSGI middleware measuring the duration of every request until the response is sent completely.'''
+
+    def __init__(self, application):
+        self.app = application
+
+    def __call__(self, environ, start_response):
+        start = time.time()
+        status = ['']
+
+        def _start_response(response_status, headers, exc_info=None):
+            status[0] = response_status.split(' ', 1)[0]
+            return start_response(response_status, headers, exc_info)
+
+        def _finished():
+            REQUESTS_IN_FLIGHT.dec()
+            REQUEST_DURATION.observe(time.time() - start,
+                                     blueprint=environ.get('cps.blueprint') or '',
+                                     endpoint=environ.get('cps.endpoint') or '',
+                                     method=environ.get('REQUEST_METHOD', ''), status=status[0])
+            REQUEST_DB_QUERIES.observe(environ.get('cps.db_queries', 0))
+
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            app_iter = self.app(environ, _start_response)
+        except Exception:
+            status[0] = '500'
+            _finished()
+            raise
+        return ClosingIterator(app_iter, _finished)
+
+
+def record_endpoint():
+    '''Called before every request, the middleware only sees the WSGI environment.'''
+    request.environ['cps.endpoint'] = request.endpoint
+    request.environ['cps.blueprint'] = request.blueprint
+
+
+def observe_query(database, duration, environ=None):
+    '''Counts a database query, environ is the WSGI environment of the current request (if any).'''
+    endpoint = ''
+    if environ is not None:
+        environ['cps.db_queries'] = environ.get('cps.db_queries', 0) + 1
+        endpoint = environ.get('cps.endpoint') or ''
+    DB_QUERIES.inc(database=database, endpoint=endpoint)
+    DB_QUERY_SECONDS.inc(duration, database=database, endpoint=endpoint)
@@ -38,6 +38,15 @@ try:
             self.provider_id = provider_id
             super(OAuthBackend, self).__init__(model, session, user, user_id, user_required, anon_user, cache)
 
+        def _get_user(self, blueprint, user, user_id):
+            uid = first([user_id, self.user_id, blueprint.config.get("user_id")])
+            u = first(_get_real_user(ref, self.anon_user)
+                      for ref in (user, self.user, blueprint.config.get("user")))
+            # current_user is a read only copy of the user (see user_cache), which can't be used in queries
+            if not uid and u is not None and u.is_authenticated and not hasattr(u, '_sa_instance_state'):
+                uid, u = u.id, None
+            return uid, u
+
         def get(self, blueprint, user=None, user_id=None):
             if self.provider_id + '_oauth_token' in session and session[self.provider_id + '_oauth_token'] != '':
                 return session[blueprint.name + '_oauth_token']
@@ -52,9 +61,7 @@ try:
                 self.session.query(self.model)
                 .filter_by(provider=self.provider_id)
             )
-            uid = first([user_id, self.user_id, blueprint.config.get("user_id")])
-            u = first(_get_real_user(ref, self.anon_user)
-                      for ref in (user, self.user, blueprint.config.get("user")))
+            uid, u = self._get_user(blueprint, user, user_id)
 
             use_provider_user_id = False
             if self.provider_id + '_oauth_user_id' in session and session[self.provider_id + '_oauth_user_id'] != '':
@@ -85,9 +92,7 @@ try:
             return token
 
         def set(self, blueprint, token, user=None, user_id=None):
-            uid = first([user_id, self.user_id, blueprint.config.get("user_id")])
-            u = first(_get_real_user(ref, self.anon_user)
-                          for ref in (user, self.user, blueprint.config.get("user")))
+            uid, u = self._get_user(blueprint, user, user_id)
 
             if self.user_required and not u and not uid:
                 raise ValueError("Cannot set OAuth token without an associated user")
@@ -129,9 +134,7 @@ try:
                 self.session.query(self.model)
                 .filter_by(provider=self.provider_id)
             )
-            uid = first([user_id, self.user_id, blueprint.config.get("user_id")])
-            u = first(_get_real_user(ref, self.anon_user)
-                      for ref in (user, self.user, blueprint.config.get("user")))
+            uid, u = self._get_user(blueprint, user, user_id)
 
             if self.user_required and not u and not uid:
                 raise ValueError("Cannot delete OAuth token without an associated user")
@@ -225,7 +225,7 @@ if ub.oauth_support:
             else:
                 # bind to current user
                 if current_user and current_user.is_authenticated:
-                    oauth.user = current_user
+                    oauth.user_id = current_user.id
                     try:
                         ub.session.add(oauth)
                         ub.session.commit()
@@ -266,7 +266,7 @@ if ub.oauth_support:
         try:
             oauth = query.one()
             if current_user and current_user.is_authenticated:
-                oauth.user = current_user
+                oauth.user_id = current_user.id
                 try:
                     ub.session.delete(oauth)
                     ub.session.commit()
@@ -28,13 +28,16 @@ from functools import wraps
 
 from flask import Blueprint, request, render_template, Response, g, make_response
 from flask_login import current_user
-from sqlalchemy.sql.expression import func, text, or_, and_
-from werkzeug.security import check_password_hash
+from sqlalchemy.sql.expression import func, or_, and_
 
-from . import constants, logger, config, db, ub, services, get_locale, isoLanguages
-from .helper import fill_indexpage, get_download_link, get_book_cover, speaking_language
+from . import constants, logger, config, db, ub, services, get_locale, isoLanguages, basic_auth_cache, cached_users
+from .feed_snapshots import opds_feeds
+from .helper import fill_indexpage, get_download_link, get_book_cover, speaking_language, aggregate_query, \
+    fill_aggregate_page
 from .pagination import Pagination
-from .web import common_filters, get_search_results, render_read_books, download_required
+from .prefix_index import prefixes
+from .search import search_books
+from .web import common_filters, render_read_books, download_required
 from flask_babel import gettext as _
 from babel import Locale as LC
 from babel.core import UnknownLocaleError
@@ -60,12 +63,14 @@ def requires_basic_auth_if_no_ano(f):
 @opds.route("/opds/")
 @opds.route("/opds")
 @requires_basic_auth_if_no_ano
+@opds_feeds.snapshot
 def feed_index():
     return render_xml_template('index.xml')
 
 
 @opds.route("/opds/osd")
 @requires_basic_auth_if_no_ano
+@opds_feeds.snapshot
 def feed_osd():
     return render_xml_template('osd.xml', lang='en-EN')
 
@@ -85,6 +90,7 @@ def feed_normal_search():
 
 @opds.route("/opds/new")
 @requires_basic_auth_if_no_ano
+@opds_feeds.snapshot
 def feed_new():
     off = request.args.get("offset") or 0
     entries, __, pagination = fill_indexpage((int(off) / (int(config.config_books_per_page)) + 1),
@@ -103,6 +109,7 @@ def feed_discover():
 
 @opds.route("/opds/rated")
 @requires_basic_auth_if_no_ano
+@opds_feeds.snapshot
 def feed_best_rated():
     off = request.args.get("offset") or 0
     entries, __, pagination = fill_indexpage((int(off) / (int(config.config_books_per_page)) + 1),
@@ -137,17 +144,21 @@ def feed_hot():
 
 @opds.route("/opds/author")
 @requires_basic_auth_if_no_ano
+@opds_feeds.snapshot
 def feed_authorindex():
-    off = request.args.get("offset") or 0
-    entries = db.session.query(db.Authors).join(db.books_authors_link).join(db.Books).filter(common_filters())\
-        .group_by(text('books_authors_link.author')).order_by(db.Authors.sort).limit(config.config_books_per_page).offset(off)
-    pagination = Pagination((int(off) / (int(config.config_books_per_page)) + 1), config.config_books_per_page,
-                            len(db.session.query(db.Authors).all()))
-    return render_xml_template('feed.xml', listelements=entries, folder='opds.feed_author', pagination=pagination)
+    return render_prefix_feed('author', 'opds.feed_author', 'opds.feed_author_letter')
+
+
+@opds.route("/opds/author/letter/<path:book_id>")
+@requires_basic_auth_if_no_ano
+@opds_feeds.snapshot
+def feed_author_letter(book_id):
+    return render_prefix_feed('author', 'opds.feed_author', 'opds.feed_author_letter', book_id)
 
 
 @opds.route("/opds/author/<int:book_id>")
 @requires_basic_auth_if_no_ano
+@opds_feeds.snapshot
 def feed_author(book_id):
     off = request.args.get("offset") or 0
     entries, __, pagination = fill_indexpage((int(off) / (int(config.config_books_per_page)) + 1),
@@ -157,17 +168,21 @@ def feed_author(book_id):
 
 @opds.route("/opds/publisher")
 @requires_basic_auth_if_no_ano
+@opds_feeds.snapshot
 def feed_publisherindex():
-    off = request.args.get("offset") or 0
-    entries = db.session.query(db.Publishers).join(db.books_publishers_link).join(db.Books).filter(common_filters())\
-        .group_by(text('books_publishers_link.publisher')).order_by(db.Publishers.sort).limit(config.config_books_per_page).offset(off)
-    pagination = Pagination((int(off) / (int(config.config_books_per_page)) + 1), config.config_books_per_page,
-                            len(db.session.query(db.Publishers).all()))
-    return render_xml_template('feed.xml', listelements=entries, folder='opds.feed_publisher', pagination=pagination)
+    return render_prefix_feed('publisher', 'opds.feed_publisher', 'opds.feed_publisher_letter')
+
+
+@opds.route("/opds/publisher/letter/<path:book_id>")
+@requires_basic_auth_if_no_ano
+@opds_feeds.snapshot
+def feed_publisher_letter(book_id):
+    return render_prefix_feed('publisher', 'opds.feed_publisher', 'opds.feed_publisher_letter', book_id)
 
 
 @opds.route("/opds/publisher/<int:book_id>")
 @requires_basic_auth_if_no_ano
+@opds_feeds.snapshot
 def feed_publisher(book_id):
     off = request.args.get("offset") or 0
     entries, __, pagination = fill_indexpage((int(off) / (int(config.config_books_per_page)) + 1),
@@ -178,17 +193,21 @@ def feed_publisher(book_id):
 
 @opds.route("/opds/category")
 @requires_basic_auth_if_no_ano
+@opds_feeds.snapshot
 def feed_categoryindex():
-    off = request.args.get("offset") or 0
-    entries = db.session.query(db.Tags).join(db.books_tags_link).join(db.Books).filter(common_filters())\
-        .group_by(text('books_tags_link.tag')).order_by(db.Tags.name).offset(off).limit(config.config_books_per_page)
-    pagination = Pagination((int(off) / (int(config.config_books_per_page)) + 1), config.config_books_per_page,
-                            len(db.session.query(db.Tags).all()))
-    return render_xml_template('feed.xml', listelements=entries, folder='opds.feed_category', pagination=pagination)
+    return render_prefix_feed('category', 'opds.feed_category', 'opds.feed_category_letter')
+
+
+@opds.route("/opds/category/letter/<path:book_id>")
+@requires_basic_auth_if_no_ano
+@opds_feeds.snapshot
+def feed_category_letter(book_id):
+    return render_prefix_feed('category', 'opds.feed_category', 'opds.feed_category_letter', book_id)
 
 
 @opds.route("/opds/category/<int:book_id>")
 @requires_basic_auth_if_no_ano
+@opds_feeds.snapshot
 def feed_category(book_id):
     off = request.args.get("offset") or 0
     entries, __, pagination = fill_indexpage((int(off) / (int(config.config_books_per_page)) + 1),
@@ -198,17 +217,21 @@ def feed_category(book_id):
 
 @opds.route("/opds/series")
 @requires_basic_auth_if_no_ano
+@opds_feeds.snapshot
 def feed_seriesindex():
-    off = request.args.get("offset") or 0
-    entries = db.session.query(db.Series).join(db.books_series_link).join(db.Books).filter(common_filters())\
-        .group_by(text('books_series_link.series')).order_by(db.Series.sort).offset(off).all()
-    pagination = Pagination((int(off) / (int(config.config_books_per_page)) + 1), config.config_books_per_page,
-                            len(db.session.query(db.Series).all()))
-    return render_xml_template('feed.xml', listelements=entries, folder='opds.feed_series', pagination=pagination)
+    return render_prefix_feed('series', 'opds.feed_series', 'opds.feed_series_letter')
+
+
+@opds.route("/opds/series/letter/<path:book_id>")
+@requires_basic_auth_if_no_ano
+@opds_feeds.snapshot
+def feed_series_letter(book_id):
+    return render_prefix_feed('series', 'opds.feed_series', 'opds.feed_series_letter', book_id)
 
 
 @opds.route("/opds/series/<int:book_id>")
 @requires_basic_auth_if_no_ano
+@opds_feeds.snapshot
 def feed_series(book_id):
     off = request.args.get("offset") or 0
     entries, __, pagination = fill_indexpage((int(off) / (int(config.config_books_per_page)) + 1),
@@ -217,12 +240,11 @@ def feed_series(book_id):
 
 @opds.route("/opds/formats")
 @requires_basic_auth_if_no_ano
+@opds_feeds.snapshot
 def feed_formatindex():
     off = request.args.get("offset") or 0
-    entries = db.session.query(db.Data).join(db.Books).filter(common_filters()) \
-        .group_by(db.Data.format).order_by(db.Data.format).all()
-    pagination = Pagination((int(off) / (int(config.config_books_per_page)) + 1), config.config_books_per_page,
-                            len(entries))
+    entries, pagination = fill_aggregate_page(aggregate_query([db.Data], db.Data.format), db.Data.format,
+                                              [db.Data.format], off)
     for entry in entries:
         entry.name = entry.format
         entry.id = entry.format
@@ -231,6 +253,7 @@ def feed_formatindex():
 
 @opds.route("/opds/formats/<book_id>")
 @requires_basic_auth_if_no_ano
+@opds_feeds.snapshot
 def feed_format(book_id):
     off = request.args.get("offset") or 0
     entries, __, pagination = fill_indexpage((int(off) / (int(config.config_books_per_page)) + 1),
@@ -240,10 +263,14 @@ def feed_format(book_id):
 @opds.route("/opds/language")
 @opds.route("/opds/language/")
 @requires_basic_auth_if_no_ano
+@opds_feeds.snapshot
 def feed_languagesindex():
     off = request.args.get("offset") or 0
     if current_user.filter_language() == u"all":
-        languages = speaking_language()
+        languages, pagination = fill_aggregate_page(
+            aggregate_query([db.Languages], db.books_languages_link.c.lang_code, db.books_languages_link),
+            db.books_languages_link.c.lang_code, [db.Languages.lang_code], off)
+        speaking_language(languages)
     else:
         try:
             cur_l = LC.parse(current_user.filter_language())
@@ -255,13 +282,13 @@ def feed_languagesindex():
             languages[0].name = cur_l.get_language_name(get_locale())
         else:
             languages[0].name = _(isoLanguages.get(part3=languages[0].lang_code).name)
-    pagination = Pagination((int(off) / (int(config.config_books_per_page)) + 1), config.config_books_per_page,
-                            len(languages))
+        pagination = Pagination(1, config.config_books_per_page, len(languages))
     return render_xml_template('feed.xml', listelements=languages, folder='opds.feed_languages', pagination=pagination)
 
 
 @opds.route("/opds/language/<int:book_id>")
 @requires_basic_auth_if_no_ano
+@opds_feeds.snapshot
 def feed_languages(book_id):
     off = request.args.get("offset") or 0
     entries, __, pagination = fill_indexpage((int(off) / (int(config.config_books_per_page)) + 1),
@@ -340,19 +367,17 @@ def get_metadata_calibre_companion(uuid, library):
 def feed_search(term):
     if term:
         term = term.strip().lower()
-        entries = get_search_results( term)
-        entriescount = len(entries) if len(entries) > 0 else 1
-        pagination = Pagination(1, entriescount, entriescount)
-        return render_xml_template('feed.xml', searchterm=term, entries=entries, pagination=pagination)
+        result = search_books(term, request.args.get("offset", 0, type=int), after=request.args.get("after", type=int))
+        pagination = Pagination(result.offset // result.per_page + 1, result.per_page, result.total)
+        return render_xml_template('feed.xml', searchterm=term, entries=result.entries, pagination=pagination)
     else:
         return render_xml_template('feed.xml', searchterm="")
 
 def check_auth(username, password):
     if sys.version_info.major == 3:
         username=username.encode('windows-1252')
-    user = ub.session.query(ub.User).filter(func.lower(ub.User.nickname) ==
-                                            username.decode('utf-8').lower()).first()
-    return bool(user and check_password_hash(str(user.password), password))
+    user = cached_users.get_by_name(username.decode('utf-8'))
+    return bool(user and basic_auth_cache.check_password(user, username, password))
 
 
 def authenticate():
@@ -362,6 +387,20 @@ def authenticate():
         {'WWW-Authenticate': 'Basic realm="Login Required"'})
 
 
+def render_prefix_feed(kind, folder, prefix_folder, prefix=''):
+    # lists longer than a page are split by their first one or two characters
+    off = int(request.args.get("offset") or 0)
+    per_page = int(config.config_books_per_page)
+    prefix = prefix.upper()
+    buckets = prefixes.buckets(kind, prefix) if len(prefix) < 2 else []
+    if len(prefixes.ids(kind, prefix)) <= per_page or len(buckets) < 2:
+        entries, count = prefixes.page(kind, prefix, off, per_page)
+    else:
+        entries, count, folder = buckets[off:off + per_page], len(buckets), prefix_folder
+    pagination = Pagination(off // per_page + 1, per_page, count)
+    return render_xml_template('feed.xml', listelements=entries, folder=folder, pagination=pagination)
+
+
 def render_xml_template(*args, **kwargs):
     #ToDo: return time in current timezone similar to %z
     currtime = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%S+00:00")
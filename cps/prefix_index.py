@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""First letters of authors, publishers, series and categories with visible books.
+
+The ids of the visible entries are read once, sorted, and grouped by their first one and two
+characters (upper case, like the letter buttons of the list pages). Names of one character are in
+the two character bucket of their letter and a space, empty names in the buckets of UNNAMED so the
+OPDS letter feeds reach them too. The index is kept per language filter and mature content setting
+until the library generation changes, the OPDS letter feeds take their pages from it and the list
+pages their letters.
+"""
+
+from __future__ import division, print_function, unicode_literals
+import threading
+from collections import namedtuple, OrderedDict
+
+from flask_login import current_user
+
+from . import db, metrics
+from .feed_snapshots import library_generation
+from .helper import aggregate_query
+
+
+# indexes kept for different visibility profiles and kinds
+MAX_ENTRIES = 32
+
+# bucket of the entries without name
+UNNAMED = '#'
+
+Char = namedtuple('Char', 'char')
+Bucket = namedtuple('Bucket', 'id, name, count')
+
+# kind -> (model, column sorted and grouped by, link table, link column)
+_KINDS = {
+    'author': (db.Authors, db.Authors.sort, db.books_authors_link, db.books_authors_link.c.author),
+    'publisher': (db.Publishers, db.Publishers.name, db.books_publishers_link,
+                  db.books_publishers_link.c.publisher),
+    'series': (db.Series, db.Series.sort, db.books_series_link, db.books_series_link.c.series),
+    'category': (db.Tags, db.Tags.name, db.books_tags_link, db.books_tags_link.c.tag),
+}
+
+
+def _prefix(value, length):
+    '''The first characters in upper case, padded with spaces. Sliced after upper(), 'ß' is 'SS'.'''
+    value = (value or '').strip().upper()
+    return (value or UNNAMED)[:length].ljust(length)
+
+
+class _Index(object):
+    __slots__ = ('ids', 'prefixes', 'chars')
+
+    def __init__(self, rows):
+        rows = sorted(rows, key=lambda row: ((row[1] or '').strip().lower(), row[0]))
+        self.ids = [row[0] for row in rows]
+        # prefix -> ids sorted like the entries, for one and two characters
+        self.prefixes = OrderedDict()
+        for length in (1, 2):
+            for entry_id, value in rows:
+                self.prefixes.setdefault(_prefix(value, length), []).append(entry_id)
+        # the list pages filter by the first character of the names, there's no button for the empty ones
+        self.chars = sorted(set(_prefix(value, 1) for __, value in rows if (value or '').strip()))
+
+
+class PrefixIndex(object):
+
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        # (kind, language filter, mature content) -> (generation, _Index), least recently used first
+        self._indexes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, kind):
+        key = (kind, current_user.filter_language(), bool(current_user.mature_content))
+        generation = library_generation()
+        with self._lock:
+            entry = self._indexes.pop(key, None)
+            if entry is not None and entry[0] == generation:
+                self._indexes[key] = entry
+        hit = entry is not None and entry[0] == generation
+        metrics.cache_access('prefix_index', hit)
+        if hit:
+            return entry[1]
+
+        model, column, link_table, link_column = _KINDS[kind]
+        index = _Index(aggregate_query([model.id, column], link_column, link_table).all())
+        with self._lock:
+            self._indexes[key] = (generation, index)
+            while len(self._indexes) > self.max_entries:
+                self._indexes.popitem(last=False)
+        return index
+
+    def count(self, kind):
+        return len(self._get(kind).ids)
+
+    def chars(self, kind):
+        '''First characters for the letter buttons of the list pages.'''
+        return [Char(char) for char in self._get(kind).chars]
+
+    def buckets(self, kind, prefix=''):
+        '''The prefixes one character longer than prefix, with the number of entries.'''
+        return [Bucket(name, name.rstrip(), len(ids)) for name, ids in sorted(self._get(kind).prefixes.items())
+                if len(name) == len(prefix) + 1 and name.startswith(prefix)]
+
+    def ids(self, kind, prefix=''):
+        '''Ids of the entries starting with prefix, sorted.'''
+        index = self._get(kind)
+        return index.prefixes.get(prefix, []) if prefix else index.ids
+
+    def page(self, kind, prefix, offset, per_page):
+        '''Entries of one page of a prefix and the number of all entries of the prefix.'''
+        model, column = _KINDS[kind][:2]
+        ids = self.ids(kind, prefix)
+        page_ids = ids[offset:offset + per_page]
+        entries = db.session.query(model).filter(model.id.in_(page_ids)).all() if page_ids else []
+        position = dict((entry_id, number) for number, entry_id in enumerate(page_ids))
+        return sorted(entries, key=lambda entry: position[entry.id]), len(ids)
+
+    def get_stats(self):
+        with self._lock:
+            return {'entries': len(self._indexes),
+                    'ids': sum(len(index.ids) for __, index in self._indexes.values())}
+
+
+prefixes = PrefixIndex()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Profiles single requests of administrators with cProfile.
+
+Add ?profile to the url (or send the header X-Calibre-Web-Profile) to profile a request, the profile
+is saved as <time>-<endpoint>-<duration>ms.prof in the profile directory and can be opened with
+pstats, snakeviz, etc.
+"""
+
+from __future__ import division, print_function, unicode_literals
+import os
+import re
+import threading
+import time
+from datetime import datetime
+
+try:
+    import cProfile as profile
+except ImportError:
+    import profile
+
+from flask import g, request
+
+from . import logger, constants
+
+
+log = logger.create()
+
+PROFILE_PARAMETER = 'profile'
+PROFILE_HEADER = 'X-Calibre-Web-Profile'
+PROFILE_EXTENSION = '.prof'
+DEFAULT_PROFILE_DIR = os.path.join(constants.CONFIG_DIR, 'profiles')
+
+# Only one profiler can be active per thread, and with gevent all requests share the server thread
+_active = threading.Lock()
+
+
+def get_profile_dir(profile_dir):
+    return profile_dir or DEFAULT_PROFILE_DIR
+
+
+def requested():
+    return PROFILE_PARAMETER in request.args or PROFILE_HEADER in request.headers
+
+
+def start():
+    if not _active.acquire(False):
+        log.warning("Not profiling %s, another request is profiled at the moment", request.path)
+        return
+    g.profile_start = time.time()
+    g.profiler = profile.Profile()
+    g.profiler.enable()
+
+
+def finish(profile_dir):
+    '''Called at the end of every request, saves the profile if the request was profiled.'''
+    profiler = g.pop('profiler', None)
+    if profiler is None:
+        return
+    try:
+        profiler.disable()
+        duration = (time.time() - g.profile_start) * 1000
+        profile_dir = get_profile_dir(profile_dir)
+        if not os.path.isdir(profile_dir):
+            os.makedirs(profile_dir)
+        name = '%s-%s-%dms%s' % (datetime.now().strftime('%Y%m%d-%H%M%S'),
+                                 re.sub(r'[^\w.]', '_', request.endpoint or 'none'), duration, PROFILE_EXTENSION)
+        profiler.dump_stats(os.path.join(profile_dir, name))
+        log.info("Profile of %s saved as %s", request.path, name)
+    except (IOError, OSError) as ex:
+        log.error("Saving profile failed: %s", ex)
+    finally:
+        _active.release()
+
+
+def list_profiles(profile_dir):
+    '''Returns name, size and time of the saved profiles, newest first.'''
+    profile_dir = get_profile_dir(profile_dir)
+    profiles = []
+    if not os.path.isdir(profile_dir):
+        return profiles
+    for name in os.listdir(profile_dir):
+        path = os.path.join(profile_dir, name)
+        if name.endswith(PROFILE_EXTENSION) and os.path.isfile(path):
+            stat = os.stat(path)
+            profiles.append({'name': name, 'size': stat.st_size,
+                             'created': datetime.fromtimestamp(stat.st_mtime)})
+    profiles.sort(key=lambda p: p['created'], reverse=True)
+    return profiles
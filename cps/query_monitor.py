@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Watches the queries of the calibre and the app database.
+
+Every query is counted for the metrics. Queries slower than the configured threshold are logged, and
+so are requests running the same statement more often than configured (typically one query per
+book or author in a loop, "N+1 queries"). Both show up in the Calibre-Web log. The parameters of
+app.db statements are password hashes, tokens and mail settings, only their types are logged.
+"""
+
+from __future__ import division, print_function, unicode_literals
+import re
+import time
+
+from flask import request, has_request_context
+from sqlalchemy import event
+
+from . import logger, metrics
+
+
+log = logger.create()
+
+# seconds, 0 disables the slow query log
+_slow_query_time = 0
+# executions of one statement per request, 0 disables the detection
+_repeated_query_limit = 0
+
+# parameter lists of "IN (?, ?, ...)" differ in length, but it's still the same statement
+_PARAMETER_LIST = re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)')
+_MAX_PARAMETER_LENGTH = 300
+
+
+def configure(slow_query_ms, repeated_query_limit):
+    global _slow_query_time, _repeated_query_limit
+    _slow_query_time = (slow_query_ms or 0) / 1000
+    _repeated_query_limit = repeated_query_limit or 0
+
+
+def statement_shape(statement):
+    return _PARAMETER_LIST.sub('(?)', ' '.join(statement.split()))
+
+
+def _format_parameters(parameters, redact):
+    if redact:
+        values = parameters.values() if isinstance(parameters, dict) else parameters or ()
+        text = '(%s)' % ', '.join(type(value).__name__ for value in values)
+    else:
+        text = repr(parameters)
+    if len(text) > _MAX_PARAMETER_LENGTH:
+        text = text[:_MAX_PARAMETER_LENGTH] + '...'
+    return text
+
+
+def _request_description(environ):
+    if environ is None:
+        return 'background task'
+    return '%s %s (%s)' % (environ.get('REQUEST_METHOD'), environ.get('PATH_INFO'), environ.get('cps.endpoint'))
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._cps_query_start = time.time()
+
+
+def instrument_engine(engine, database, redact_parameters=False):
+    '''Attaches the query listeners to an engine, database is the name used in metrics and log.'''
+
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        duration = time.time() - context._cps_query_start
+        environ = request.environ if has_request_context() else None
+        metrics.observe_query(database, duration, environ)
+
+        if _slow_query_time and duration >= _slow_query_time:
+            log.warning("Slow query on %s database (%d ms) in %s: %s; parameters: %s", database, duration * 1000,
+                        _request_description(environ), ' '.join(statement.split()),
+                        _format_parameters(parameters, redact_parameters))
+        if _repeated_query_limit and environ is not None:
+            shapes = environ.setdefault('cps.query_shapes', {})
+            key = (database, statement_shape(statement))
+            shapes[key] = shapes.get(key, 0) + 1
+
+    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+def check_request(exception=None):
+    '''Called after every request, logs statements the request executed more often than allowed.'''
+    shapes = request.environ.pop('cps.query_shapes', None)
+    if not shapes or not _repeated_query_limit:
+        return
+    for (database, statement), count in shapes.items():
+        if count > _repeated_query_limit:
+            log.warning("N+1 queries in %s: statement executed %d times on %s database: %s",
+                        _request_description(request.environ), count, database, statement)
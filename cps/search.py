@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""The simple search of the web pages and the OPDS feed, and the advanced search.
+
+Books match if the term is part of the title, the series, a tag or the publisher, or if every word of
+the term is part of an author. They are ranked by where the term was found: title before author
+before series before tags and publisher, books found in several places first. Only the ids of the
+first MAX_RESULTS books are read, so a one letter search doesn't load the library, and only the
+books of the requested page are loaded.
+
+The advanced search form is compiled into intersections and differences of the id sets of
+book_index, starting from the visible books. Only the text conditions (author, title, publisher,
+description, dates and text custom columns) are left for the database, restricted to the remaining
+ids if there are few of them. facet_counts counts the tags, series, languages and formats of the
+books the form finds.
+"""
+
+from __future__ import division, print_function, unicode_literals
+import datetime
+import re
+from collections import namedtuple
+
+from flask_login import current_user
+from sqlalchemy.sql.expression import func, and_, case, literal
+
+from . import config, db
+from .book_index import book_ids, TAG, SERIES, LANGUAGE, FORMAT
+from .helper import common_filters, lcase, book_list_options
+
+
+# more results are not ranked, counted or shown
+MAX_RESULTS = 1000
+
+# points for finding the term in the field, the sum ranks the book
+_WEIGHTS = (('title', 16), ('author', 8), ('series', 4), ('tag', 2), ('publisher', 1))
+
+# the text conditions are only checked for these ids if there are not more of them, else for all books
+MAX_CANDIDATES = 500
+
+SearchPage = namedtuple('SearchPage', 'entries, ids, total, capped, offset, per_page')
+
+
+def _predicates(term):
+    like = "%" + term + "%"
+    author_words = [word for word in re.split("[, ]+", term) if word] or [term]
+    return {
+        'title': func.lower(db.Books.title).ilike(like),
+        'author': and_(*[db.Books.authors.any(func.lower(db.Authors.name).ilike("%" + word + "%"))
+                         for word in author_words]),
+        'series': db.Books.series.any(func.lower(db.Series.name).ilike(like)),
+        'tag': db.Books.tags.any(func.lower(db.Tags.name).ilike(like)),
+        'publisher': db.Books.publishers.any(func.lower(db.Publishers.name).ilike(like)),
+    }
+
+
+def ranked_ids(term, limit=MAX_RESULTS):
+    '''Ids of the books visible to the current user matching term, best match first.'''
+    db.session.connection().connection.connection.create_function("lower", 1, lcase)
+    predicates = _predicates(term)
+    score = sum((case([(predicates[field], literal(weight))], else_=literal(0)) for field, weight in _WEIGHTS),
+                literal(0)).label('score')
+    ranked = db.session.query(db.Books.id.label('id'), score).filter(common_filters()).subquery()
+    rows = db.session.query(ranked.c.id).join(db.Books, db.Books.id == ranked.c.id)\
+        .filter(ranked.c.score > 0).order_by(ranked.c.score.desc(), db.Books.sort, db.Books.id).limit(limit)
+    return [row.id for row in rows]
+
+
+def search_books(term, offset=0, per_page=None, after=None):
+    '''One page of the results for term.
+
+    The page starts at offset, or after the book with id after (the last book of the previous page), so
+    following pages stay the same if books are added meanwhile. total counts at most MAX_RESULTS books,
+    capped is True if there are more.
+    '''
+    per_page = int(per_page or config.config_books_per_page)
+    ids = ranked_ids(term, MAX_RESULTS + 1)
+    capped = len(ids) > MAX_RESULTS
+    ids = ids[:MAX_RESULTS]
+    if after is not None and after in ids:
+        offset = ids.index(after) + 1
+    offset = max(int(offset or 0), 0)
+    page_ids = ids[offset:offset + per_page]
+    entries = db.session.query(db.Books).options(*book_list_options()).filter(db.Books.id.in_(page_ids)).all() \
+        if page_ids else []
+    position = dict((book_id, number) for number, book_id in enumerate(page_ids))
+    entries.sort(key=lambda book: position[book.id])
+    return SearchPage(entries, ids, len(ids), capped, offset, per_page)
+
+
+def _ids(values):
+    result = []
+    for value in values:
+        try:
+            result.append(int(value))
+        except ValueError:
+            pass
+    return result
+
+
+def _date(value):
+    try:
+        return datetime.datetime.strptime(value, "%Y-%m-%d").strftime("%Y-%m-%d")
+    except (TypeError, ValueError):
+        return None
+
+
+def _include_exclude(ids, args, name, facet, keys):
+    for key in keys(args.getlist('include_' + name)):
+        ids &= book_ids.get(facet, key)
+    for key in keys(args.getlist('exclude_' + name)):
+        ids -= book_ids.get(facet, key)
+    return ids
+
+
+def _text_filters(args, cc):
+    filters = []
+    author_name = (args.get("author_name") or '').strip().lower().replace(',', '|')
+    if author_name:
+        filters.append(db.Books.authors.any(func.lower(db.Authors.name).ilike("%" + author_name + "%")))
+    book_title = (args.get("book_title") or '').strip().lower()
+    if book_title:
+        filters.append(func.lower(db.Books.title).ilike("%" + book_title + "%"))
+    publisher = (args.get("publisher") or '').strip().lower()
+    if publisher:
+        filters.append(db.Books.publishers.any(func.lower(db.Publishers.name).ilike("%" + publisher + "%")))
+    pub_start = _date(args.get("Publishstart"))
+    if pub_start:
+        filters.append(db.Books.pubdate >= pub_start)
+    pub_end = _date(args.get("Publishend"))
+    if pub_end:
+        filters.append(db.Books.pubdate <= pub_end)
+    description = args.get("comment")
+    if description:
+        filters.append(db.Books.comments.any(func.lower(db.Comments.text).ilike("%" + description + "%")))
+    for c in cc:
+        custom_query = args.get('custom_column_' + str(c.id))
+        if custom_query and c.datatype not in ('bool', 'int'):
+            filters.append(getattr(db.Books, 'custom_column_' + str(c.id)).any(
+                func.lower(db.cc_classes[c.id].value).ilike("%" + custom_query + "%")))
+    return filters
+
+
+def advanced_search_ids(args, cc):
+    '''Ids of the books visible to the current user matching the advanced search form args, sorted.'''
+    ids = set(book_ids.visible())
+    ids = _include_exclude(ids, args, 'tag', TAG, _ids)
+    ids = _include_exclude(ids, args, 'serie', SERIES, _ids)
+    ids = _include_exclude(ids, args, 'extension', FORMAT, lambda formats: formats)
+    # a language filter of the user already allows only one language
+    if current_user.filter_language() == "all":
+        ids = _include_exclude(ids, args, 'language', LANGUAGE, _ids)
+    # the form's field ratinghigh is the lower bound, each bound in stars
+    rating_low = args.get("ratinghigh")
+    if rating_low:
+        ids &= book_ids.ratings_between(low=int(rating_low) * 2)
+    rating_high = args.get("ratinglow")
+    if rating_high:
+        ids &= book_ids.ratings_between(high=int(rating_high) * 2)
+    for c in cc:
+        custom_query = args.get('custom_column_' + str(c.id))
+        if not custom_query:
+            continue
+        if c.datatype == 'bool':
+            ids &= book_ids.custom_column(c.id, custom_query == "True")
+        elif c.datatype == 'int':
+            values = _ids([custom_query])
+            ids &= book_ids.custom_column(c.id, values[0]) if values else set()
+
+    filters = _text_filters(args, cc)
+    if filters and ids:
+        db.session.connection().connection.connection.create_function("lower", 1, lcase)
+        query = db.session.query(db.Books.id).filter(*filters)
+        if len(ids) <= MAX_CANDIDATES:
+            ids = set(row.id for row in query.filter(db.Books.id.in_(ids)))
+        else:
+            ids &= set(row.id for row in query)
+    return sorted(ids)
+
+
+def facet_counts(args, cc):
+    '''The number of books found by the advanced search form args for each tag, series, language and format.'''
+    ids = advanced_search_ids(args, cc)
+    return dict((facet, book_ids.count(facet, ids)) for facet in (TAG, SERIES, LANGUAGE, FORMAT))
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""The book ids of the last search of every user, used to add all search results to a shelf.
+
+Results are kept as array('I') (4 bytes per book) for at most MAX_AGE seconds, and for at most
+MAX_ENTRIES users, the least recently used ones are dropped first. While the server runs more than one
+process, results are stored in the search_result table of app.db instead of memory.
+"""
+
+from __future__ import division, print_function, unicode_literals
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+from sqlalchemy.sql.expression import select, func
+
+from . import ub, shared_state
+
+
+# seconds a search result is kept after it was last used
+MAX_AGE = 3600
+# number of users whose last search is kept
+MAX_ENTRIES = 500
+
+ID_SIZE = array('I').itemsize
+
+
+def _to_bytes(ids):
+    return ids.tobytes() if hasattr(ids, 'tobytes') else ids.tostring()
+
+
+def _from_bytes(data):
+    ids = array('I')
+    if hasattr(ids, 'frombytes'):
+        ids.frombytes(data)
+    else:
+        ids.fromstring(data)
+    return ids
+
+
+class SearchResultStore(object):
+
+    def __init__(self, max_entries=MAX_ENTRIES, max_age=MAX_AGE):
+        self.max_entries = max_entries
+        self.max_age = max_age
+        # user id -> (last access, array of book ids), least recently used first
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def set(self, user_id, book_ids):
+        ids = array('I', book_ids)
+        if shared_state.is_enabled():
+            self._store(user_id, ids)
+            return
+        with self._lock:
+            self._results.pop(user_id, None)
+            self._results[user_id] = (time.time(), ids)
+            self._expire()
+
+    def get(self, user_id):
+        '''Returns the book ids of the last search of the user, an empty list if there is none.'''
+        if shared_state.is_enabled():
+            return list(self._load(user_id))
+        with self._lock:
+            self._expire()
+            entry = self._results.pop(user_id, None)
+            if entry is None:
+                return []
+            self._results[user_id] = (time.time(), entry[1])
+            return list(entry[1])
+
+    def _expire(self):
+        oldest = time.time() - self.max_age
+        while self._results:
+            user_id, (last_access, __) = next(iter(self._results.items()))
+            if last_access >= oldest and len(self._results) <= self.max_entries:
+                break
+            del self._results[user_id]
+
+    # Same as above, stored in app.db. Like shared_state the core connection is used, storing a search
+    # result must not commit the session of the request
+    def _store(self, user_id, ids):
+        table = ub.SearchResult.__table__
+        now = datetime.utcnow()
+        with ub.session.bind.begin() as connection:
+            connection.execute(table.insert().prefix_with('OR REPLACE'),
+                               user_id=user_id, book_ids=_to_bytes(ids), last_access=now)
+            connection.execute(table.delete().where(table.c.last_access < now - timedelta(seconds=self.max_age)))
+            keep = select([table.c.user_id]).order_by(table.c.last_access.desc()).limit(self.max_entries)
+            connection.execute(table.delete().where(~table.c.user_id.in_(keep)))
+
+    def _load(self, user_id):
+        table = ub.SearchResult.__table__
+        now = datetime.utcnow()
+        with ub.session.bind.begin() as connection:
+            row = connection.execute(select([table.c.book_ids, table.c.last_access])
+                                     .where(table.c.user_id == user_id)).first()
+            if row is None:
+                return array('I')
+            if row.last_access < now - timedelta(seconds=self.max_age):
+                connection.execute(table.delete().where(table.c.user_id == user_id))
+                return array('I')
+            connection.execute(table.update().where(table.c.user_id == user_id).values(last_access=now))
+        return _from_bytes(row.book_ids)
+
+    def get_stats(self):
+        if shared_state.is_enabled():
+            table = ub.SearchResult.__table__
+            with ub.session.bind.connect() as connection:
+                entries, size = connection.execute(select([func.count(table.c.user_id),
+                                                           func.sum(func.length(table.c.book_ids))])).first()
+            return {'entries': entries, 'book_ids': (size or 0) // ID_SIZE, 'stored_in': 'app.db'}
+        with self._lock:
+            book_ids = sum(len(ids) for __, ids in self._results.values())
+            return {'entries': len(self._results), 'book_ids': book_ids, 'stored_in': 'memory'}
@@ -22,10 +22,13 @@ import os
 import errno
 import signal
 import socket
+import time
 
 try:
     from gevent.pywsgi import WSGIServer
     from gevent.pool import Pool
+    from gevent.lock import BoundedSemaphore
+    from gevent import reinit
     from gevent import __version__ as _version
     VERSION = 'Gevent ' + _version
     _GEVENT = True
@@ -33,15 +36,20 @@ except ImportError:
     from tornado.wsgi import WSGIContainer
     from tornado.httpserver import HTTPServer
     from tornado.ioloop import IOLoop
+    from tornado.netutil import bind_sockets
     from tornado import version as _version
+    from .tornado_wsgi import ThreadedWSGIContainer
     VERSION = 'Tornado ' + _version
     _GEVENT = False
 
-from . import logger
+from . import logger, blocking, shared_state, db, ub
+from .admission import AdmissionControl
 
 
 log = logger.create()
 
+# additional greenlets beyond the request slots and queue, used to answer rejected requests with 503
+_SHED_RESERVE = 32
 
 
 def _readable_listen_address(address, port):
@@ -64,12 +72,39 @@ class WebServer(object):
         self.listen_port = None
         self.unix_socket_file = None
         self.ssl_args = None
+        self.admission = None
+        self.pool_size = None
+        self.queue_size = None
+        self.threaded_container = None
+        self.blocking_threshold = 0
+        self.processes = 1
+        self._main_pid = None
+        self._server_processes = None
+        self._stopping = False
 
     def init_app(self, application, config):
         self.app = application
         self.listen_address = config.get_config_ipaddress()
         self.listen_port = config.config_port
 
+        if config.config_max_concurrency and not _GEVENT:
+            # tornado: requests are processed on a pool of threads, the IOLoop only handles the sockets
+            self.pool_size = config.config_max_concurrency
+            self.queue_size = config.config_request_queue_size
+        elif config.config_max_concurrency:
+            self.admission = AdmissionControl(application, config.config_max_concurrency,
+                                              config.config_request_queue_size,
+                                              config.config_download_concurrency,
+                                              semaphore_class=BoundedSemaphore)
+            self.app = self.admission
+            # bound the greenlet pool as well, beyond that connections wait in the listen backlog
+            self.pool_size = config.config_max_concurrency + config.config_download_concurrency \
+                             + config.config_request_queue_size + _SHED_RESERVE
+
+        self.blocking_threshold = config.config_blocking_threshold
+        if hasattr(os, 'fork'):
+            self.processes = max(config.config_server_processes or 1, 1)
+
         if config.config_access_log:
             log_name = "gevent.access" if _GEVENT else "tornado.access"
             formatter = logger.ACCESS_FORMATTER_GEVENT if _GEVENT else logger.ACCESS_FORMATTER_TORNADO
@@ -130,40 +165,132 @@ class WebServer(object):
 
         return sock, _readable_listen_address(*address)
 
-    def _start_gevent(self):
+    def _start_gevent(self, sock=None, output=None):
         ssl_args = self.ssl_args or {}
 
         try:
-            sock, output = self._make_gevent_socket()
+            if sock is None:
+                sock, output = self._make_gevent_socket()
             if output is None:
                 output = _readable_listen_address(self.listen_address, self.listen_port)
             log.info('Starting Gevent server on %s', output)
-            self.wsgiserver = WSGIServer(sock, self.app, log=self.access_logger, spawn=Pool(), **ssl_args)
+            blocking.enable()
+            blocking.monitor_event_loop(self.blocking_threshold)
+            self.wsgiserver = WSGIServer(sock, self.app, log=self.access_logger, spawn=Pool(self.pool_size),
+                                         **ssl_args)
             self.wsgiserver.serve_forever()
         finally:
             if self.unix_socket_file:
                 os.remove(self.unix_socket_file)
                 self.unix_socket_file = None
 
-    def _start_tornado(self):
+    def _start_tornado(self, sockets=None):
         if os.name == 'nt':
             import asyncio
             asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
         log.info('Starting Tornado server on %s', _readable_listen_address(self.listen_address, self.listen_port))
 
+        if self.pool_size:
+            log.info('Processing requests on %d threads', self.pool_size)
+            self.threaded_container = ThreadedWSGIContainer(self.app, self.pool_size, self.queue_size)
+            container = self.threaded_container
+        else:
+            container = WSGIContainer(self.app)
+
         # Max Buffersize set to 200MB            )
-        http_server = HTTPServer(WSGIContainer(self.app),
+        http_server = HTTPServer(container,
                                  max_buffer_size=209700000,
                                  ssl_options=self.ssl_args)
-        http_server.listen(self.listen_port, self.listen_address)
+        if sockets:
+            http_server.add_sockets(sockets)
+        else:
+            http_server.listen(self.listen_port, self.listen_address)
         self.wsgiserver = IOLoop.instance()
         self.wsgiserver.start()
         # wait for stop signal
         self.wsgiserver.close(True)
+        if self.threaded_container:
+            self.threaded_container.shutdown()
 
-    def start(self):
+    def _bind_sockets(self):
+        if _GEVENT:
+            sock, output = self._make_gevent_socket()
+            if output is None:
+                output = _readable_listen_address(self.listen_address, self.listen_port)
+                family = socket.AF_INET6 if ':' in self.listen_address else socket.AF_INET
+                sock = WSGIServer.get_listener(sock, family=family)
+            return [sock], output
+        return bind_sockets(self.listen_port, self.listen_address or None), \
+            _readable_listen_address(self.listen_address, self.listen_port)
+
+    def _fork_server_process(self, sockets, output):
+        with shared_state.fork_lock:
+            pid = os.fork()
+        if pid:
+            self._server_processes.add(pid)
+            return
+
+        # forked server process, the socket (file) belongs to the main process
+        self._server_processes = None
+        self.unix_socket_file = None
+        signal.signal(signal.SIGHUP, signal.SIG_DFL)
+        shared_state.enable(main_process=False)
+        exit_code = 0
         try:
             if _GEVENT:
+                reinit()
+                self._start_gevent(sockets[0], output)
+            else:
+                self._start_tornado(sockets)
+        except Exception as ex:
+            log.error("Error in server process %d: %s", os.getpid(), ex)
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _start_prefork(self):
+        sockets, output = self._bind_sockets()
+        log.info('Starting %d server processes on %s', self.processes, output)
+        self._main_pid = os.getpid()
+        self._server_processes = set()
+        shared_state.enable(main_process=True)
+        # background tasks are executed by the worker thread of this process
+        from . import worker
+        worker.dispatch_shared_tasks()
+        # database connections must not be shared with the forked processes
+        ub.session.remove()
+        if db.session is not None:
+            db.session.remove()
+        signal.signal(signal.SIGHUP, self._restartServer)
+
+        try:
+            while True:
+                while not self._stopping and len(self._server_processes) < self.processes:
+                    self._fork_server_process(sockets, output)
+                if not self._server_processes:
+                    break
+                try:
+                    pid, status = os.wait()
+                except OSError as ex:
+                    if ex.errno == errno.EINTR:
+                        continue
+                    raise
+                self._server_processes.discard(pid)
+                if not self._stopping:
+                    log.error("Server process %d exited with status %d, starting a new one", pid, status)
+                    time.sleep(1)
+        finally:
+            for sock in sockets:
+                sock.close()
+            if self.unix_socket_file:
+                os.remove(self.unix_socket_file)
+                self.unix_socket_file = None
+
+    def start(self):
+        try:
+            if self.processes > 1:
+                self._start_prefork()
+            elif _GEVENT:
                 # leave subprocess out to allow forking for fetchers and processors
                 self._start_gevent()
             else:
@@ -187,13 +314,43 @@ class WebServer(object):
         os.execv(sys.executable, arguments)
         return True
 
+    def get_load_stats(self):
+        stats = {'server': VERSION, 'process': os.getpid(), 'processes': self.processes,
+                 'pool_size': self.pool_size, 'pool_used': None, 'slots': {}}
+        if _GEVENT and self.wsgiserver and self.wsgiserver.pool is not None:
+            stats['pool_used'] = len(self.wsgiserver.pool)
+        if self.admission:
+            stats['slots'] = self.admission.get_stats()
+        elif self.threaded_container:
+            stats['slots'] = {'page': self.threaded_container.get_stats()}
+        if _GEVENT:
+            stats.update(blocking.get_stats())
+        return stats
+
     def _killServer(self, ignored_signum, ignored_frame):
-        self.stop()
+        self._stop_server(False)
+
+    def _restartServer(self, ignored_signum, ignored_frame):
+        self._stop_server(True)
 
     def stop(self, restart=False):
         log.info("webserver stop (restart=%s)", restart)
+        if self._main_pid and self._server_processes is None:
+            # forked server process, the main process stops (and restarts) all server processes
+            os.kill(self._main_pid, signal.SIGHUP if restart else signal.SIGTERM)
+            return
+        self._stop_server(restart)
+
+    def _stop_server(self, restart):
         self.restart = restart
-        if self.wsgiserver:
+        if self._server_processes is not None:
+            self._stopping = True
+            for pid in self._server_processes:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except OSError:
+                    pass
+        elif self.wsgiserver:
             if _GEVENT:
                 self.wsgiserver.close()
             else:
@@ -17,6 +17,7 @@
 #  along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 from __future__ import division, print_function, unicode_literals
+import importlib
 
 from .. import logger
 
@@ -24,15 +25,57 @@ from .. import logger
 log = logger.create()
 
 
-try: from . import goodreads_support
-except ImportError as err:
-    log.debug("cannot import goodreads, showing authors-metadata will not work: %s", err)
-    goodreads_support = None
+def _module_available(name):
+    try:
+        from importlib.util import find_spec
+    except ImportError:  # Python 2
+        import imp
+        try:
+            imp.find_module(name)
+            return True
+        except ImportError:
+            return False
+    return find_spec(name) is not None
 
 
-try: from . import simpleldap as ldap
-except ImportError as err:
-    log.debug("cannot import simpleldap, logging in with ldap will not work: %s", err)
-    ldap = None
+class _LazyService(object):
+    '''Placeholder for an optional service module, the module is imported on first attribute access.
 
+    Truth testing only checks if the required packages are installed, so feature checks don't pull the service
+    (and its dependencies) in at startup.
+    '''
+    def __init__(self, module_name, requirements, feature):
+        self._module_name = module_name
+        self._requirements = requirements
+        self._feature = feature
+        self._module = None
 
+    def _load(self):
+        if self._module is None:
+            try:
+                self._module = importlib.import_module('.' + self._module_name, __name__)
+            except ImportError as err:
+                log.debug("cannot import %s, %s will not work: %s", self._module_name, self._feature, err)
+                self._module = False
+        return self._module
+
+    def is_loaded(self):
+        return bool(self._module)
+
+    def __bool__(self):
+        if self._module is None:
+            return all(_module_available(name) for name in self._requirements)
+        return bool(self._module)
+    __nonzero__ = __bool__
+
+    def __getattr__(self, item):
+        if item.startswith('_'):
+            raise AttributeError(item)
+        module = self._load()
+        if not module:
+            raise AttributeError(item)
+        return getattr(module, item)
+
+
+goodreads_support = _LazyService('goodreads_support', ('goodreads',), 'showing authors-metadata')
+ldap = _LazyService('simpleldap', ('flask_simpleldap', 'ldap'), 'logging in with ldap')
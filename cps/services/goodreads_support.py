@@ -25,7 +25,7 @@ from goodreads.client import GoodreadsClient
 try: import Levenshtein
 except ImportError: Levenshtein = False
 
-from .. import logger
+from .. import logger, metrics
 
 
 log = logger.create()
@@ -52,14 +52,20 @@ def connect(key=None, secret=None, enabled=True):
         _client = GoodreadsClient(key, secret)
 
 
+def get_cache_stats():
+    return {'entries': len(_AUTHORS_CACHE)}
+
+
 def get_author_info(author_name):
     now = time.time()
     author_info = _AUTHORS_CACHE.get(author_name, None)
     if author_info:
         if now < author_info._timestamp + _CACHE_TIMEOUT:
+            metrics.cache_access('goodreads_authors', True)
             return author_info
         # clear expired entries
         del _AUTHORS_CACHE[author_name]
+    metrics.cache_access('goodreads_authors', False)
 
     if not _client:
         log.warning("failed to get a Goodreads client")
@@ -18,14 +18,224 @@
 
 from __future__ import division, print_function, unicode_literals
 import base64
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
 
+import ldap
 from flask_simpleldap import LDAP, LDAPException
 
-from .. import constants, logger
+from .. import constants, logger, metrics
 
 
 log = logger.create()
-_ldap = LDAP()
+
+# bound connections of the service account kept for the user lookups
+POOL_SIZE = 4
+# seconds an idle connection is reused, servers close idle connections after a while
+POOL_MAX_IDLE = 60
+# seconds a successful bind is trusted, a password changed or a user disabled on the LDAP server is
+# accepted that long
+BIND_MAX_AGE = 60
+# seconds a rejected password is rejected without asking the server
+REJECT_MAX_AGE = 30
+MAX_ENTRIES = 1000
+
+
+def _encode(value):
+    return value.encode('utf-8') if not isinstance(value, bytes) else value
+
+
+class _PooledConnection(object):
+    '''Service connection handed out by the pool, unbind_s gives it back instead of closing it.
+
+    reused tells if the connection was idle in the pool. The server may have closed it in the meantime,
+    a failed search is then tried once more with a new connection.
+    '''
+
+    def __init__(self, pool, conn, reused):
+        self._pool = pool
+        self._conn = conn
+        self.reused = reused
+
+    def __getattr__(self, item):
+        return getattr(self._conn, item)
+
+    def search_s(self, *args, **kwargs):
+        try:
+            return self._conn.search_s(*args, **kwargs)
+        except ldap.LDAPError:
+            if not self.reused:
+                raise
+        self._pool.clear_pool()
+        _unbind(self._conn)
+        self._conn = self._pool.connect()
+        self.reused = False
+        return self._conn.search_s(*args, **kwargs)
+
+    def unbind_s(self):
+        self._pool.release(self._conn)
+
+
+class _BindCache(object):
+    '''Results of user binds under an HMAC of username and password with a random key of this process.
+
+    Only definite answers of the server are kept. Rejections are kept for the exact password, so a reader
+    repeating an outdated password doesn't lock the account on a server counting failed binds, while every
+    other password is still checked by the server (and its lockout policy) and the right one is never
+    rejected from the cache.
+    '''
+
+    def __init__(self, max_entries=MAX_ENTRIES, bind_max_age=BIND_MAX_AGE, reject_max_age=REJECT_MAX_AGE):
+        self.max_entries = max_entries
+        self.max_age = {True: bind_max_age, False: reject_max_age}
+        self._secret = os.urandom(32)
+        # hmac -> (checked at, lowercase username, result), oldest first
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _key(self, username, password):
+        return hmac.new(self._secret, _encode(username.lower()) + b'\0' + _encode(password),
+                        hashlib.sha256).digest()
+
+    def get(self, username, password):
+        '''True or False if the result of this bind is known, None otherwise.'''
+        key = self._key(username, password)
+        now = time.time()
+        with self._lock:
+            entry = self._results.get(key)
+            hit = entry is not None and entry[0] >= now - self.max_age[entry[2]]
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+        metrics.cache_access('ldap_binds', hit)
+        return entry[2] if hit else None
+
+    def set(self, username, password, result):
+        key = self._key(username, password)
+        name = username.lower()
+        now = time.time()
+        with self._lock:
+            if result:
+                # the password was changed, the old one must not be accepted any longer
+                for other in [other for other, entry in self._results.items() if entry[1] == name and entry[2]]:
+                    del self._results[other]
+            self._results.pop(key, None)
+            self._results[key] = (now, name, result)
+            oldest = now - max(self.max_age.values())
+            while self._results:
+                first, entry = next(iter(self._results.items()))
+                if entry[0] >= oldest and len(self._results) <= self.max_entries:
+                    break
+                del self._results[first]
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+    def get_stats(self):
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {'entries': len(self._results),
+                    'rejected': sum(1 for entry in self._results.values() if not entry[2]),
+                    'hits': self._hits, 'misses': self._misses,
+                    'hit_rate': self._hits / lookups if lookups else None}
+
+
+class _PooledLDAP(LDAP):
+    '''flask_simpleldap opens a new connection for the service account on every lookup and one for the user
+    bind, which is never closed. The service connections are kept in a pool here, the user connections are
+    closed after the bind and the results of user binds are cached.'''
+
+    def __init__(self, app=None):
+        self._idle = []
+        self._pool_lock = threading.Lock()
+        self.cache = _BindCache()
+        super(_PooledLDAP, self).__init__(app)
+
+    @property
+    def bind(self):
+        with self._pool_lock:
+            while self._idle:
+                released, conn = self._idle.pop()
+                if released >= time.time() - POOL_MAX_IDLE:
+                    return _PooledConnection(self, conn, True)
+                _unbind(conn)
+        return _PooledConnection(self, self.connect(), False)
+
+    def connect(self):
+        '''A new connection bound as the service account.'''
+        start = time.time()
+        try:
+            conn = super(_PooledLDAP, self).bind
+        except LDAPException:
+            metrics.LDAP_BIND_DURATION.observe(time.time() - start, kind='service', result='error')
+            raise
+        metrics.LDAP_BIND_DURATION.observe(time.time() - start, kind='service', result='success')
+        return conn
+
+    def release(self, conn):
+        with self._pool_lock:
+            if len(self._idle) < POOL_SIZE:
+                self._idle.append((time.time(), conn))
+                return
+        _unbind(conn)
+
+    def clear_pool(self):
+        with self._pool_lock:
+            idle, self._idle = self._idle, []
+        for __, conn in idle:
+            _unbind(conn)
+
+    def _user_dn(self, username):
+        user_dn = self.get_object_details(user=username, dn_only=True)
+        return user_dn.decode('utf-8') if isinstance(user_dn, bytes) else user_dn
+
+    def _bind_dn(self, user_dn, password):
+        conn = self.initialize
+        start = time.time()
+        result = 'success'
+        try:
+            conn.simple_bind_s(user_dn, password)
+            return True
+        except ldap.INVALID_CREDENTIALS:
+            result = 'rejected'
+            return False
+        except ldap.LDAPError as ex:
+            result = 'error'
+            raise LDAPException(self.error(ex.args))
+        finally:
+            metrics.LDAP_BIND_DURATION.observe(time.time() - start, kind='user', result=result)
+            _unbind(conn)
+
+    def bind_user(self, username, password):
+        '''True if the password is right, None if it's wrong or the user is unknown, raises LDAPException if
+        the server can't answer. Used by basic_auth_required as well.'''
+        # most servers accept an empty password as anonymous bind
+        if not username or not password:
+            return None
+        result = self.cache.get(username, password)
+        if result is None:
+            user_dn = self._user_dn(username)
+            result = user_dn is not None and self._bind_dn(user_dn, password)
+            self.cache.set(username, password, result)
+        return True if result else None
+
+
+def _unbind(conn):
+    try:
+        conn.unbind_s()
+    except ldap.LDAPError:
+        pass
+
+
+_ldap = _PooledLDAP()
 
 
 def init_app(app, config):
@@ -47,6 +257,8 @@ def init_app(app, config):
     app.config['LDAP_USE_TLS'] = bool(config.config_ldap_use_tls)
     app.config['LDAP_OPENLDAP'] = bool(config.config_ldap_openldap)
 
+    _ldap.clear_pool()
+    _ldap.cache.clear()
     _ldap.init_app(app)
 
 
@@ -75,3 +287,11 @@ def bind_user(username, password):
         else:
             log.warning('LDAP Server error: %s', ex.message)
             return None
+
+
+def get_cache_stats():
+    with _ldap._pool_lock:
+        idle = len(_ldap._idle)
+    stats = _ldap.cache.get_stats()
+    stats['idle_connections'] = idle
+    return stats
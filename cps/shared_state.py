@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""State which has to be visible to all processes of the pre-fork server.
+
+With a single process everything stays in memory as before. Once the server forks, values are
+stored in app.db (tables shared_state and queued_task), so every process sees the same task list
+and update status. A process saving the configuration stores a new token, the others load the
+configuration again when they see it.
+"""
+
+from __future__ import division, print_function, unicode_literals
+import json
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy.sql.expression import select
+
+from . import ub
+
+
+_enabled = False
+_main_process = True
+
+# seconds between the checks for a configuration saved by another process
+CONFIG_CHECK_INTERVAL = 1
+
+_config_token = None
+_config_checked = 0
+
+# Held by threads of the main process while they use SQLite, and by the server while forking. A process
+# forked while another thread is inside SQLite inherits its locked mutexes and hangs on the first query
+fork_lock = threading.Lock()
+
+
+def enable(main_process):
+    '''Called by the server before forking (main_process=True) and in every forked process.'''
+    global _enabled, _main_process
+    _enabled = True
+    _main_process = main_process
+    if main_process:
+        # the state belongs to the running server, don't pick up leftovers of the last run
+        with ub.session.bind.begin() as connection:
+            connection.execute(ub.SharedState.__table__.delete())
+            connection.execute(ub.QueuedTask.__table__.delete())
+            connection.execute(ub.SearchResult.__table__.delete())
+
+
+def is_enabled():
+    return _enabled
+
+
+def is_main_process():
+    return _main_process
+
+
+def _encode(obj):
+    if isinstance(obj, datetime):
+        return {'__datetime__': [obj.year, obj.month, obj.day, obj.hour, obj.minute, obj.second, obj.microsecond]}
+    if isinstance(obj, timedelta):
+        return {'__timedelta__': [obj.days, obj.seconds, obj.microseconds]}
+    raise TypeError("Type %s not serializable" % type(obj))
+
+
+def _decode(obj):
+    if '__datetime__' in obj:
+        return datetime(*obj['__datetime__'])
+    if '__timedelta__' in obj:
+        return timedelta(*obj['__timedelta__'])
+    return obj
+
+
+def dumps(value):
+    return json.dumps(value, default=_encode)
+
+
+def loads(value):
+    return json.loads(value, object_hook=_decode)
+
+
+# The ORM session of the current request is not used, reading or writing shared state must not
+# commit (or see) unrelated changes of the request
+def get_value(key, default=None):
+    table = ub.SharedState.__table__
+    with ub.session.bind.connect() as connection:
+        value = connection.execute(select([table.c.value]).where(table.c.key == key)).scalar()
+    return default if value is None else loads(value)
+
+
+def set_value(key, value):
+    table = ub.SharedState.__table__
+    with ub.session.bind.begin() as connection:
+        connection.execute(table.insert().prefix_with('OR REPLACE'),
+                           key=key, value=dumps(value), last_modified=datetime.utcnow())
+
+
+def delete_value(key):
+    table = ub.SharedState.__table__
+    with ub.session.bind.begin() as connection:
+        connection.execute(table.delete().where(table.c.key == key))
+
+
+def queue_task(task, arguments):
+    with ub.session.bind.begin() as connection:
+        connection.execute(ub.QueuedTask.__table__.insert(), task=task, arguments=dumps(arguments))
+
+
+def pop_tasks():
+    '''Returns (and removes) all queued tasks in the order they were queued.'''
+    table = ub.QueuedTask.__table__
+    with ub.session.bind.begin() as connection:
+        rows = connection.execute(select([table.c.id, table.c.task, table.c.arguments])
+                                  .order_by(table.c.id)).fetchall()
+        if rows:
+            connection.execute(table.delete().where(table.c.id <= rows[-1].id))
+    return [(row.task, loads(row.arguments)) for row in rows]
+
+
+def config_saved():
+    '''Called after this process saved the configuration, the other processes have to load it again.'''
+    global _config_token
+    if _enabled:
+        _config_token = uuid.uuid4().hex
+        set_value('config', _config_token)
+
+
+def config_outdated():
+    '''True once after another process saved the configuration, checked at most every CONFIG_CHECK_INTERVAL.'''
+    global _config_token, _config_checked
+    now = time.time()
+    if not _enabled or now - _config_checked < CONFIG_CHECK_INTERVAL:
+        return False
+    _config_checked = now
+    token = get_value('config')
+    if token == _config_token:
+        return False
+    _config_token = token
+    return True
@@ -109,18 +109,19 @@ def search_to_shelf(shelf_id):
         flash(_(u"User is not allowed to edit public shelves"), category="error")
         return redirect(url_for('web.index'))
 
-    if current_user.id in searched_ids and searched_ids[current_user.id]:
+    search_result = searched_ids.get(current_user.id)
+    if search_result:
         books_for_shelf = list()
         books_in_shelf = ub.session.query(ub.BookShelf).filter(ub.BookShelf.shelf == shelf_id).all()
         if books_in_shelf:
             book_ids = list()
             for book_id in books_in_shelf:
                 book_ids.append(book_id.book_id)
-            for searchid in searched_ids[current_user.id]:
+            for searchid in search_result:
                 if searchid not in book_ids:
                     books_for_shelf.append(searchid)
         else:
-            books_for_shelf = searched_ids[current_user.id]
+            books_for_shelf = search_result
 
         if not books_for_shelf:
             log.error("Books are already part of %s", shelf)
@@ -252,8 +252,16 @@ promisePublishers.done(function() {
 $("#search").on("change input.typeahead:selected", function() {
     var form = $("form").serialize();
     $.getJSON( getPath() + "/get_matching_tags", form, function( data ) {
-        $(".tags_click").each(function() {
-            if ($.inArray(parseInt($(this).children("input").first().val(), 10), data.tags) === -1 ) {
+        var facets = {
+            tag: data.facets.tag,
+            serie: data.facets.series,
+            language: data.facets.language,
+            extension: data.facets.format
+        };
+        $(".tags_click, .serie_click, .language_click, .extension_click").each(function() {
+            var input = $(this).children("input").first();
+            var counts = facets[input.attr("name").replace(/^(in|ex)clude_/, "")];
+            if (!(input.val() in counts)) {
                 if (!($(this).hasClass("active"))) {
                     $(this).addClass("disabled");
                 }
@@ -43,7 +43,12 @@ function init(logType) {
             text = (data).split("\n");
             // console.log(text.length);
             for (var i = 0; i < text.length; i++) {
-                $("#renderer").append( "<div>" + _sanitize(text[i]) + "</div>" );
+                // highlight slow queries and N+1 queries reported by the query monitor
+                if (text[i].indexOf("{cps.query_monitor:") !== -1) {
+                    $("#renderer").append( "<div class=\"query-warning\">" + _sanitize(text[i]) + "</div>" );
+                } else {
+                    $("#renderer").append( "<div>" + _sanitize(text[i]) + "</div>" );
+                }
             }
         });
 }
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import division, print_function, unicode_literals
+from concurrent.futures import ThreadPoolExecutor
+
+import tornado
+from tornado import escape, gen, httputil
+from tornado.ioloop import IOLoop
+from tornado.wsgi import WSGIContainer
+
+from . import logger
+from .admission import RETRY_AFTER
+
+
+log = logger.create()
+
+
+class ThreadedWSGIContainer(WSGIContainer):
+    """Runs the WSGI application on a pool of worker threads instead of the IOLoop thread.
+
+    The IOLoop keeps reading requests and writing responses, while up to ``pool_size`` requests are
+    processed at the same time. At most ``queue_size`` further requests wait for a free thread,
+    beyond that requests are answered immediately with 503 and a Retry-After header.
+    Like the plain WSGIContainer the response body is collected before it's sent.
+    """
+
+    def __init__(self, wsgi_application, pool_size, queue_size):
+        WSGIContainer.__init__(self, wsgi_application)
+        self.pool_size = pool_size
+        self.queue_size = queue_size
+        self._pool = ThreadPoolExecutor(max_workers=pool_size)
+        # only modified on the IOLoop thread, no locking needed
+        self.pending = 0
+        self.rejected = 0
+        self.served = 0
+
+    def __call__(self, request):
+        IOLoop.current().spawn_callback(self._handle_request, request)
+
+    @gen.coroutine
+    def _handle_request(self, request):
+        if self.pending >= self.pool_size + self.queue_size:
+            self.rejected += 1
+            self._write_response(request, '503 Service Unavailable',
+                                 [('Content-Type', 'text/plain; charset=utf-8'),
+                                  ('Retry-After', str(RETRY_AFTER))],
+                                 b'Server is busy, please retry later')
+            return
+        environ = self.environ(request)
+        environ['wsgi.multithread'] = True
+        self.pending += 1
+        try:
+            data, body = yield self._pool.submit(self._run_application, environ)
+        except Exception as ex:
+            log.error("Error processing request %s: %s", request.uri, ex)
+            data, body = {'status': '500 Internal Server Error', 'headers': []}, b''
+        finally:
+            self.pending -= 1
+        self.served += 1
+        self._write_response(request, data['status'], data['headers'], body)
+
+    def _run_application(self, environ):
+        data = {}
+        response = []
+
+        def start_response(status, response_headers, exc_info=None):
+            data['status'] = status
+            data['headers'] = response_headers
+            return response.append
+
+        app_response = self.wsgi_application(environ, start_response)
+        try:
+            response.extend(app_response)
+        finally:
+            if hasattr(app_response, 'close'):
+                app_response.close()
+        if not data:
+            raise Exception('WSGI app did not call start_response')
+        return data, b''.join(response)
+
+    def _write_response(self, request, status, headers, body):
+        status_code, reason = status.split(' ', 1)
+        status_code = int(status_code)
+        header_set = set(k.lower() for (k, v) in headers)
+        body = escape.utf8(body)
+        if status_code != 304:
+            if 'content-length' not in header_set:
+                headers.append(('Content-Length', str(len(body))))
+            if 'content-type' not in header_set:
+                headers.append(('Content-Type', 'text/html; charset=UTF-8'))
+        if 'server' not in header_set:
+            headers.append(('Server', 'TornadoServer/%s' % tornado.version))
+
+        start_line = httputil.ResponseStartLine('HTTP/1.1', status_code, reason)
+        header_obj = httputil.HTTPHeaders()
+        for key, value in headers:
+            header_obj.add(key, value)
+        request.connection.write_headers(start_line, header_obj, chunk=body)
+        request.connection.finish()
+        self._log(status_code, request)
+
+    def get_stats(self):
+        return {'limit': self.pool_size, 'queue_size': self.queue_size,
+                'active': min(self.pending, self.pool_size),
+                'queue_depth': max(self.pending - self.pool_size, 0),
+                'rejected': self.rejected, 'served': self.served}
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Suggestions for the author, publisher, tag and series fields of the edit and search forms.
+
+The names are read once per library generation, normalized like the lower() of the searches
+(lower case, without accents) and sorted, with the number of books of each name as its weight. A
+query finds the names starting with it by bisection, and only if these are less than the limit the
+names containing it. The most used names come first.
+"""
+
+from __future__ import division, print_function, unicode_literals
+import bisect
+import threading
+
+from flask_login import current_user
+from sqlalchemy.sql.expression import select, func
+
+from . import config, db, metrics
+from .feed_snapshots import library_generation
+from .helper import lcase
+
+
+# suggestions returned for a query
+LIMIT = 20
+
+# seconds the browser may reuse the suggestions, a name added to the library shows up after that
+MAX_AGE = 60
+
+# kind -> (model, link table column of the model's id)
+_KINDS = {
+    'author': (db.Authors, db.books_authors_link.c.author),
+    'publisher': (db.Publishers, db.books_publishers_link.c.publisher),
+    'tag': (db.Tags, db.books_tags_link.c.tag),
+    'series': (db.Series, db.books_series_link.c.series),
+}
+
+
+class _Names(object):
+    __slots__ = ('keys', 'names', 'weights')
+
+    def __init__(self, rows):
+        rows = sorted((lcase(name or ''), name, count) for name, count in rows)
+        self.keys = [row[0] for row in rows]
+        self.names = [row[1] for row in rows]
+        self.weights = [row[2] for row in rows]
+
+    def find(self, query, limit, hidden):
+        start = bisect.bisect_left(self.keys, query)
+        end = bisect.bisect_left(self.keys, query + u'\uffff', start)
+        found = [i for i in range(start, end) if self.names[i] not in hidden]
+        found.sort(key=lambda i: -self.weights[i])
+        if len(found) < limit:
+            infix = [i for i, key in enumerate(self.keys)
+                     if query in key and not start <= i < end and self.names[i] not in hidden]
+            infix.sort(key=lambda i: -self.weights[i])
+            found.extend(infix)
+        return [self.names[i] for i in found[:limit]]
+
+
+class TypeaheadIndex(object):
+
+    def __init__(self):
+        # kind -> (generation, _Names)
+        self._names = {}
+        self._lock = threading.Lock()
+
+    def _get(self, kind):
+        generation = library_generation()
+        entry = self._names.get(kind)
+        hit = entry is not None and entry[0] == generation
+        metrics.cache_access('typeahead', hit)
+        if hit:
+            return entry[1]
+        model, link_column = _KINDS[kind]
+        # names without books are suggested as well, like before
+        names = _Names(db.session.execute(
+            select([model.name, func.count(link_column)])
+            .select_from(model.__table__.outerjoin(link_column.table, link_column == model.id))
+            .group_by(model.id)))
+        with self._lock:
+            self._names[kind] = (generation, names)
+        return names
+
+    def suggest(self, kind, query, limit=LIMIT):
+        '''Names of kind containing query, those starting with it first, the most used first.'''
+        query = lcase((query or '').strip())
+        # tags of mature content aren't suggested to users who don't see them
+        hidden = frozenset(config.mature_content_tags()) \
+            if kind == 'tag' and not current_user.mature_content else frozenset()
+        return self._get(kind).find(query, limit, hidden)
+
+    def get_stats(self):
+        with self._lock:
+            return dict((kind, len(entry[1].keys)) for kind, entry in self._names.items())
+
+
+typeahead = TypeaheadIndex()
@@ -32,14 +32,15 @@ try:
     oauth_support = True
 except ImportError:
     oauth_support = False
-from sqlalchemy import create_engine, exc, exists
+from sqlalchemy import exc, exists, event
 from sqlalchemy import Column, ForeignKey
-from sqlalchemy import String, Integer, SmallInteger, Boolean, DateTime
-from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy import String, Integer, SmallInteger, Boolean, DateTime, LargeBinary
+from sqlalchemy.orm import relationship, sessionmaker, scoped_session
 from sqlalchemy.ext.declarative import declarative_base
 from werkzeug.security import generate_password_hash
 
-from . import constants # , config
+from . import constants, query_monitor # , config
+from .blocking import create_sqlite_engine, session_scope
 
 
 session = None
@@ -179,6 +180,13 @@ class User(UserBase, Base):
     sidebar_view = Column(Integer, default=1)
     default_language = Column(String(3), default="all")
     mature_content = Column(Boolean, default=True)
+    # incremented with every change, cached copies of the user are compared against it
+    version = Column(Integer, default=0)
+
+
+@event.listens_for(User, 'before_update')
+def _increment_user_version(mapper, connection, target):
+    target.version = (target.version or 0) + 1
 
 
 if oauth_support:
@@ -321,6 +329,33 @@ class RemoteAuthToken(Base):
         return '<Token %r>' % self.id
 
 
+# State shared between the processes of the pre-fork server, values are stored as json
+class SharedState(Base):
+    __tablename__ = 'shared_state'
+
+    key = Column(String, primary_key=True)
+    value = Column(String)
+    last_modified = Column(DateTime)
+
+
+# Background tasks submitted by a server process, waiting to be handed to the worker thread of the main process
+class QueuedTask(Base):
+    __tablename__ = 'queued_task'
+
+    id = Column(Integer, primary_key=True)
+    task = Column(String)
+    arguments = Column(String)
+
+
+# Book ids of the last search of a user (array of unsigned ints), used while the server runs several processes
+class SearchResult(Base):
+    __tablename__ = 'search_result'
+
+    user_id = Column(Integer, primary_key=True)
+    book_ids = Column(LargeBinary)
+    last_access = Column(DateTime, index=True)
+
+
 # Migrate database to current version, has to be updated after every database change. Currently migration from
 # everywhere to curent should work. Migration is done by checking if relevant coloums are existing, and than adding
 # rows with SQL commands
@@ -384,6 +419,12 @@ def migrate_Database(session):
     except exc.OperationalError:
         conn = engine.connect()
         conn.execute("ALTER TABLE user ADD column `mature_content` INTEGER DEFAULT 1")
+    try:
+        session.query(exists().where(User.version)).scalar()
+    except exc.OperationalError:
+        conn = engine.connect()
+        conn.execute("ALTER TABLE user ADD column `version` INTEGER DEFAULT 0")
+        session.commit()
 
     if session.query(User).filter(User.role.op('&')(constants.ROLE_ANONYMOUS) == constants.ROLE_ANONYMOUS).first() is None:
         create_anonymous_user(session)
@@ -404,13 +445,14 @@ def migrate_Database(session):
                             "sidebar_view INTEGER,"
                             "default_language VARCHAR(3),"
                             "mature_content BOOLEAN,"
+                            "version INTEGER DEFAULT 0,"
                             "UNIQUE (nickname),"
                             "UNIQUE (email),"
                             "CHECK (mature_content IN (0, 1)))")
         conn.execute("INSERT INTO user_id(id, nickname, email, role, password, kindle_mail,locale,"
-                        "sidebar_view, default_language, mature_content) "
+                        "sidebar_view, default_language, mature_content, version) "
                      "SELECT id, nickname, email, role, password, kindle_mail, locale,"
-                        "sidebar_view, default_language, mature_content FROM user")
+                        "sidebar_view, default_language, mature_content, version FROM user")
         # delete old user table and rename new user_id table to user:
         conn.execute("DROP TABLE user")
         conn.execute("ALTER TABLE user_id RENAME TO user")
@@ -479,11 +521,13 @@ def init_db(app_db_path):
     # Open session for database connection
     global session
 
-    engine = create_engine(u'sqlite:///{0}'.format(app_db_path), echo=False)
+    engine = create_sqlite_engine(app_db_path, echo=False)
+    query_monitor.instrument_engine(engine, 'app', redact_parameters=True)
 
     Session = sessionmaker()
     Session.configure(bind=engine)
-    session = Session()
+    # thread (or greenlet) local sessions
+    session = scoped_session(Session, scopefunc=session_scope)
 
     if os.path.exists(app_db_path):
         Base.metadata.create_all(engine)
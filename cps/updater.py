@@ -33,7 +33,7 @@ import requests
 from babel.dates import format_datetime
 from flask_babel import gettext as _
 
-from . import constants, logger, config, web_server
+from . import constants, logger, config, web_server, shared_state
 
 
 log = logger.create()
@@ -54,9 +54,22 @@ class Updater(threading.Thread):
 
     def __init__(self):
         threading.Thread.__init__(self)
-        self.status = -1
+        self._status = -1
         self.updateIndex = None
 
+    # the update may be started by another process of the pre-fork server than the one asked for its status
+    @property
+    def status(self):
+        if shared_state.is_enabled():
+            return shared_state.get_value('updater_status', self._status)
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        self._status = value
+        if shared_state.is_enabled():
+            shared_state.set_value('updater_status', value)
+
     def get_current_version_info(self):
         if config.config_updatechannel == constants.UPDATE_STABLE:
             return self._stable_version_info()
@@ -24,71 +24,94 @@ from tempfile import gettempdir
 from flask_babel import gettext as _
 
 from . import logger, comic
+from .blocking import run_blocking
 from .constants import BookMeta
 
 
 log = logger.create()
 
 
-try:
-    from lxml.etree import LXML_VERSION as lxmlversion
-except ImportError:
-    lxmlversion = None
-
-try:
-    from wand.image import Image
-    from wand import version as ImageVersion
-    from wand.exceptions import PolicyError
-    use_generic_pdf_cover = False
-except (ImportError, RuntimeError) as e:
-    log.debug('cannot import Image, generating pdf covers for pdf uploads will not work: %s', e)
-    use_generic_pdf_cover = True
-
-try:
-    from PyPDF2 import PdfFileReader
-    from PyPDF2 import __version__ as PyPdfVersion
-    use_pdf_meta = True
-except ImportError as e:
-    log.debug('cannot import PyPDF2, extracting pdf metadata will not work: %s', e)
-    use_pdf_meta = False
-
-try:
-    from . import epub
-    use_epub_meta = True
-except ImportError as e:
-    log.debug('cannot import epub, extracting epub metadata will not work: %s', e)
-    use_epub_meta = False
-
-try:
-    from . import fb2
-    use_fb2_meta = True
-except ImportError as e:
-    log.debug('cannot import fb2, extracting fb2 metadata will not work: %s', e)
-    use_fb2_meta = False
-
-try:
-    from PIL import Image as PILImage
-    from PIL import __version__ as PILversion
-    use_PIL = True
-except ImportError as e:
-    log.debug('cannot import Pillow, using png and webp images as cover will not work: %s', e)
-    use_PIL = False
+# The metadata parsers and image libraries are expensive to import (Wand loads ImageMagick, lxml and PyPDF2 are
+# large) and only needed when a book is uploaded, so they are imported on first use instead of at startup.
+# Each loader caches its result, False means the library is not available.
+_IMAGE_MAGICK = None
+_PDF_READER = None
+_EPUB = None
+_FB2 = None
+
+
+def _image_magick():
+    global _IMAGE_MAGICK
+    if _IMAGE_MAGICK is None:
+        try:
+            from wand.image import Image
+            from wand import version as ImageVersion
+            from wand.exceptions import PolicyError
+            _IMAGE_MAGICK = (Image, ImageVersion, PolicyError)
+        except (ImportError, RuntimeError) as e:
+            log.debug('cannot import Image, generating pdf covers for pdf uploads will not work: %s', e)
+            _IMAGE_MAGICK = False
+    return _IMAGE_MAGICK
+
+
+def _pdf_reader():
+    global _PDF_READER
+    if _PDF_READER is None:
+        try:
+            from PyPDF2 import PdfFileReader
+            from PyPDF2 import __version__ as PyPdfVersion
+            _PDF_READER = (PdfFileReader, PyPdfVersion)
+        except ImportError as e:
+            log.debug('cannot import PyPDF2, extracting pdf metadata will not work: %s', e)
+            _PDF_READER = False
+    return _PDF_READER
+
+
+def _epub():
+    global _EPUB
+    if _EPUB is None:
+        try:
+            from . import epub
+            _EPUB = epub
+        except ImportError as e:
+            log.debug('cannot import epub, extracting epub metadata will not work: %s', e)
+            _EPUB = False
+    return _EPUB
+
+
+def _fb2():
+    global _FB2
+    if _FB2 is None:
+        try:
+            from . import fb2
+            _FB2 = fb2
+        except ImportError as e:
+            log.debug('cannot import fb2, extracting fb2 metadata will not work: %s', e)
+            _FB2 = False
+    return _FB2
+
 
 __author__ = 'lemmsh'
 
 
+def _parse_metadata(tmp_file_path, original_file_name, original_file_extension):
+    meta = None
+    if ".PDF" == original_file_extension.upper():
+        meta = pdf_meta(tmp_file_path, original_file_name, original_file_extension)
+    if ".EPUB" == original_file_extension.upper() and _epub():
+        meta = _epub().get_epub_info(tmp_file_path, original_file_name, original_file_extension)
+    if ".FB2" == original_file_extension.upper() and _fb2():
+        meta = _fb2().get_fb2_info(tmp_file_path, original_file_extension)
+    if original_file_extension.upper() in ['.CBZ', '.CBT']:
+        meta = comic.get_comic_info(tmp_file_path, original_file_name, original_file_extension)
+    return meta
+
+
 def process(tmp_file_path, original_file_name, original_file_extension):
     meta = None
     try:
-        if ".PDF" == original_file_extension.upper():
-            meta = pdf_meta(tmp_file_path, original_file_name, original_file_extension)
-        if ".EPUB" == original_file_extension.upper() and use_epub_meta is True:
-            meta = epub.get_epub_info(tmp_file_path, original_file_name, original_file_extension)
-        if ".FB2" == original_file_extension.upper() and use_fb2_meta is True:
-            meta = fb2.get_fb2_info(tmp_file_path, original_file_extension)
-        if original_file_extension.upper() in ['.CBZ', '.CBT']:
-            meta = comic.get_comic_info(tmp_file_path, original_file_name, original_file_extension)
-
+        # unzipping, xml parsing and rendering pdf covers takes long, keep it away from the event loop
+        meta = run_blocking(_parse_metadata, tmp_file_path, original_file_name, original_file_extension)
     except Exception as ex:
         log.warning('cannot parse metadata, using default: %s', ex)
 
@@ -116,8 +139,9 @@ def default_meta(tmp_file_path, original_file_name, original_file_extension):
 
 def pdf_meta(tmp_file_path, original_file_name, original_file_extension):
 
-    if use_pdf_meta:
-        pdf = PdfFileReader(open(tmp_file_path, 'rb'))
+    pdf_reader = _pdf_reader()
+    if pdf_reader:
+        pdf = pdf_reader[0](open(tmp_file_path, 'rb'))
         doc_info = pdf.getDocumentInfo()
     else:
         doc_info = None
@@ -145,9 +169,11 @@ def pdf_meta(tmp_file_path, original_file_name, original_file_extension):
 
 
 def pdf_preview(tmp_file_path, tmp_dir):
-    if use_generic_pdf_cover:
+    image_magick = _image_magick()
+    if not image_magick:
         return None
     else:
+        Image, __, PolicyError = image_magick
         try:
             cover_file_name = os.path.splitext(tmp_file_path)[0] + ".cover.jpg"
             with Image() as img:
@@ -165,25 +191,29 @@ def pdf_preview(tmp_file_path, tmp_dir):
 
 
 def get_versions():
-    if not use_generic_pdf_cover:
-        IVersion = ImageVersion.MAGICK_VERSION
-        WVersion = ImageVersion.VERSION
+    image_magick = _image_magick()
+    if image_magick:
+        IVersion = image_magick[1].MAGICK_VERSION
+        WVersion = image_magick[1].VERSION
     else:
         IVersion = u'not installed'
         WVersion = u'not installed'
-    if use_pdf_meta:
-        PVersion='v'+PyPdfVersion
+    pdf_reader = _pdf_reader()
+    if pdf_reader:
+        PVersion='v'+pdf_reader[1]
     else:
         PVersion=u'not installed'
-    if lxmlversion:
+    try:
+        from lxml.etree import LXML_VERSION as lxmlversion
         XVersion = 'v'+'.'.join(map(str, lxmlversion))
-    else:
+    except ImportError:
         XVersion = u'not installed'
-    if use_PIL:
+    try:
+        from PIL import __version__ as PILversion
         PILVersion = 'v' + PILversion
-    else:
+    except ImportError:
         PILVersion = u'not installed'
-    if comic.use_comic_meta:
+    if comic.comic_api():
         ComicVersion = u'installed'
     else:
         ComicVersion = u'not installed'
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Read only copies of the users, so loading the user of every request needs no query.
+
+current_user is a UserSnapshot: it has the columns, roles and visibility checks of ub.User, but can't
+be changed. Code changing the user has to load it from ub.session. Every change of a user increments
+ub.User.version. Within a process the cache is told about committed changes by session events; while
+the server runs more than one process, the version of a cached user is compared with the one in
+app.db on every use (a single indexed column instead of the whole row).
+"""
+
+from __future__ import division, print_function, unicode_literals
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import select, func
+
+from . import ub, metrics, shared_state
+
+
+# seconds a user is kept without being used
+MAX_AGE = 600
+
+_FIELDS = ('id', 'nickname', 'email', 'role', 'password', 'kindle_mail', 'locale', 'sidebar_view',
+           'default_language', 'mature_content', 'version')
+_CHANGED_KEY = 'cps.changed_users'
+_ALL_USERS = None
+
+
+class UserSnapshot(ub.UserBase, object):
+
+    def __init__(self, user):
+        for field in _FIELDS:
+            object.__setattr__(self, field, getattr(user, field))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("User %s is read only, load it from ub.session to change it" % self.nickname)
+
+    @property
+    def shelf(self):
+        return ub.session.query(ub.Shelf).filter(ub.Shelf.user_id == self.id).order_by(ub.Shelf.name)
+
+    @property
+    def downloads(self):
+        return ub.session.query(ub.Downloads).filter(ub.Downloads.user_id == self.id)
+
+    def __repr__(self):
+        return '<UserSnapshot %r version %r>' % (self.nickname, self.version)
+
+
+class UserCache(object):
+
+    def __init__(self, max_age=MAX_AGE):
+        self.max_age = max_age
+        # user id -> (last use, snapshot)
+        self._users = {}
+        # lowercase nickname -> user id
+        self._names = {}
+        # incremented by every invalidation, a user loaded before must not be stored afterwards
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        event.listen(Session, 'after_flush', self._after_flush)
+        event.listen(Session, 'after_bulk_update', self._after_bulk)
+        event.listen(Session, 'after_bulk_delete', self._after_bulk)
+        event.listen(Session, 'after_commit', self._after_transaction)
+        event.listen(Session, 'after_rollback', self._after_transaction)
+
+    def get(self, user_id):
+        '''The user with this id as UserSnapshot, None if there is none.'''
+        with self._lock:
+            entry = self._users.get(user_id)
+        user = self._check(entry)
+        if user is not None:
+            return user
+        generation = self._generation
+        return self._store(ub.session.query(ub.User).filter(ub.User.id == user_id).first(), generation)
+
+    def get_by_name(self, nickname):
+        '''Same as get for the nickname, not case sensitive like the login.'''
+        name = nickname.lower()
+        with self._lock:
+            entry = self._users.get(self._names.get(name))
+        user = self._check(entry)
+        if user is not None and user.nickname.lower() == name:
+            return user
+        generation = self._generation
+        return self._store(ub.session.query(ub.User).filter(func.lower(ub.User.nickname) == name).first(),
+                           generation)
+
+    def _check(self, entry):
+        now = time.time()
+        hit = entry is not None and entry[0] >= now - self.max_age
+        if hit and shared_state.is_enabled():
+            # another process may have changed the user
+            table = ub.User.__table__
+            with ub.session.bind.connect() as connection:
+                version = connection.execute(select([table.c.version])
+                                             .where(table.c.id == entry[1].id)).scalar()
+            hit = version == entry[1].version
+        with self._lock:
+            if hit:
+                self._hits += 1
+                self._users[entry[1].id] = (now, entry[1])
+            else:
+                self._misses += 1
+        metrics.cache_access('users', hit)
+        return entry[1] if hit else None
+
+    def _store(self, user, generation):
+        if user is None:
+            return None
+        snapshot = UserSnapshot(user)
+        with self._lock:
+            if generation == self._generation:
+                self._expire()
+                self._users[snapshot.id] = (time.time(), snapshot)
+                self._names[snapshot.nickname.lower()] = snapshot.id
+        return snapshot
+
+    def _expire(self):
+        oldest = time.time() - self.max_age
+        for user_id in [user_id for user_id, (used, __) in self._users.items() if used < oldest]:
+            self._remove(user_id)
+
+    def _remove(self, user_id):
+        entry = self._users.pop(user_id, None)
+        if entry is not None:
+            self._names.pop(entry[1].nickname.lower(), None)
+
+    def invalidate(self, user_ids=_ALL_USERS):
+        with self._lock:
+            self._generation += 1
+            if user_ids is _ALL_USERS:
+                self._users.clear()
+                self._names.clear()
+            else:
+                for user_id in user_ids:
+                    self._remove(user_id)
+
+    # Changes are collected per session and applied when the transaction ends, not before other
+    # requests can see them. Rolled back changes are applied as well, the cached user may have been
+    # loaded from the flushed but not committed state
+    def _after_flush(self, session, flush_context):
+        changed = [obj.id for obj in list(session.dirty) + list(session.deleted) if isinstance(obj, ub.User)]
+        if changed and session.info.get(_CHANGED_KEY, ()) is not _ALL_USERS:
+            session.info.setdefault(_CHANGED_KEY, set()).update(changed)
+
+    def _after_bulk(self, context):
+        if context.mapper.class_ is ub.User:
+            context.session.info[_CHANGED_KEY] = _ALL_USERS
+
+    def _after_transaction(self, session):
+        if _CHANGED_KEY in session.info:
+            self.invalidate(session.info.pop(_CHANGED_KEY))
+
+    def get_stats(self):
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {'entries': len(self._users), 'hits': self._hits, 'misses': self._misses,
+                    'hit_rate': self._hits / lookups if lookups else None}
@@ -43,15 +43,20 @@ from werkzeug.exceptions import default_exceptions
 from werkzeug.datastructures import Headers
 from werkzeug.security import generate_password_hash, check_password_hash
 
-from . import constants, config, logger, isoLanguages, services, worker
-from . import searched_ids, lm, babel, db, ub, config, get_locale, app
+from . import constants, config, logger, isoLanguages, services, worker, profiler
+from . import searched_ids, basic_auth_cache, cached_users, lm, babel, db, ub, config, get_locale, app
+from .catalog import SORTS
 from .gdriveutils import getFileFromEbooksFolder, do_gdrive_download
-from .helper import common_filters, get_search_results, fill_indexpage, speaking_language, check_valid_domain, \
-        order_authors, get_typeahead, render_task_status, json_serial, get_cc_columns, \
+from .helper import common_filters, fill_indexpage, speaking_language, check_valid_domain, \
+        order_authors, render_task_status, json_serial, get_cc_columns, \
         get_book_cover, get_download_link, send_mail, generate_random_password, send_registration_mail, \
-        check_send_to_kindle, check_read_formats, lcase, tags_filters, reset_password
+        check_send_to_kindle, check_read_formats, lcase, tags_filters, reset_password, aggregate_query, \
+        fill_catalog_page, book_list_options
 from .pagination import Pagination
+from .prefix_index import prefixes
 from .redirect import redirect_back
+from .search import search_books, advanced_search_ids, facet_counts
+from .typeahead import typeahead, MAX_AGE as TYPEAHEAD_MAX_AGE
 
 feature_support = {
         'ldap': False, # bool(services.ldap),
@@ -115,11 +120,11 @@ log = logger.create()
 
 # ################################### Login logic and rights management ###############################################
 def _fetch_user_by_name(username):
-    return ub.session.query(ub.User).filter(func.lower(ub.User.nickname) == username.lower()).first()
+    return cached_users.get_by_name(username)
 
 @lm.user_loader
 def load_user(user_id):
-    return ub.session.query(ub.User).filter(ub.User.id == int(user_id)).first()
+    return cached_users.get(int(user_id))
 
 
 @lm.request_loader
@@ -153,7 +158,7 @@ def load_user_from_auth_header(header_val):
     except TypeError:
         pass
     user = _fetch_user_by_name(basic_username)
-    if user and check_password_hash(str(user.password), basic_password):
+    if user and basic_auth_cache.check_password(user, basic_username, basic_password):
         return user
     return
 
@@ -262,6 +267,8 @@ def render_title_template(*args, **kwargs):
 
 @web.before_app_request
 def before_request():
+    if profiler.requested() and current_user.role_admin():
+        profiler.start()
     g.user = current_user
     g.allow_registration = config.config_public_reg
     g.allow_anonymous = config.config_anonbrowse
@@ -273,6 +280,16 @@ def before_request():
         return redirect(url_for('admin.basic_configuration'))
 
 
+@web.teardown_app_request
+def teardown_request(exception):
+    profiler.finish(config.config_profile_dir)
+    # sessions are local to the thread or greenlet handling the request, don't keep them afterwards
+    if db.session is not None:
+        db.session.remove()
+    if ub.session is not None:
+        ub.session.remove()
+
+
 # ################################### data provider functions #########################################################
 
 
@@ -396,32 +413,40 @@ def get_comic_book(book_id, book_format, page):
 # ################################### Typeahead ##################################################################
 
 
+def typeahead_response(kind, replace=('', '')):
+    names = typeahead.suggest(kind, request.args.get('q'))
+    response = make_response(json.dumps([dict(name=name.replace(*replace)) for name in names]))
+    response.headers['Content-Type'] = 'application/json; charset=utf-8'
+    response.headers['Cache-Control'] = 'private, max-age=%d' % TYPEAHEAD_MAX_AGE
+    return response
+
+
 @web.route("/get_authors_json")
 @login_required_if_no_ano
 def get_authors_json():
     if request.method == "GET":
-        return get_typeahead(db.Authors, request.args.get('q'), ('|', ','))
+        return typeahead_response('author', ('|', ','))
 
 
 @web.route("/get_publishers_json")
 @login_required_if_no_ano
 def get_publishers_json():
     if request.method == "GET":
-        return get_typeahead(db.Publishers, request.args.get('q'), ('|', ','))
+        return typeahead_response('publisher', ('|', ','))
 
 
 @web.route("/get_tags_json")
 @login_required_if_no_ano
 def get_tags_json():
     if request.method == "GET":
-        return get_typeahead(db.Tags, request.args.get('q'),tag_filter=tags_filters())
+        return typeahead_response('tag')
 
 
 @web.route("/get_series_json")
 @login_required_if_no_ano
 def get_series_json():
     if request.method == "GET":
-        return get_typeahead(db.Series, request.args.get('q'))
+        return typeahead_response('series')
 
 
 @web.route("/get_languages_json", methods=['GET', 'POST'])
@@ -444,32 +469,11 @@ def get_languages_json():
 def get_matching_tags():
     tag_dict = {'tags': []}
     if request.method == "GET":
-        q = db.session.query(db.Books)
-        db.session.connection().connection.connection.create_function("lower", 1, lcase)
-        author_input = request.args.get('author_name')
-        title_input = request.args.get('book_title')
-        include_tag_inputs = request.args.getlist('include_tag')
-        exclude_tag_inputs = request.args.getlist('exclude_tag')
-        include_extension_inputs = request.args.getlist('include_extension')
-        exclude_extension_inputs = request.args.getlist('exclude_extension')
-        q = q.filter(db.Books.authors.any(func.lower(db.Authors.name).ilike("%" + author_input + "%")),
-                     func.lower(db.Books.title).ilike("%" + title_input + "%"))
-        if len(include_tag_inputs) > 0:
-            for tag in include_tag_inputs:
-                q = q.filter(db.Books.tags.any(db.Tags.id == tag))
-        if len(exclude_tag_inputs) > 0:
-            for tag in exclude_tag_inputs:
-                q = q.filter(not_(db.Books.tags.any(db.Tags.id == tag)))
-        '''if len(include_extension_inputs) > 0:
-            for tag in exclude_tag_inputs:
-                q = q.filter(not_(db.Books.tags.any(db.Tags.id == tag)))
-        if len(exclude_extension_inputs) > 0:
-            for tag in exclude_tag_inputs:
-                q = q.filter(not_(db.Books.tags.any(db.Tags.id == tag)))'''
-        for book in q:
-            for tag in book.tags:
-                if tag.id not in tag_dict['tags']:
-                    tag_dict['tags'].append(tag.id)
+        facets = facet_counts(request.args, get_cc_columns())
+        tag_dict['tags'] = sorted(facets['tag'])
+        # json objects have string keys
+        tag_dict['facets'] = dict((facet, dict((str(key), count) for key, count in counts.items()))
+                                  for facet, counts in facets.items())
     json_dumps = json.dumps(tag_dict)
     return json_dumps
 
@@ -481,7 +485,7 @@ def get_matching_tags():
 @web.route('/page/<int:page>')
 @login_required_if_no_ano
 def index(page):
-    entries, random, pagination = fill_indexpage(page, db.Books, True, [db.Books.timestamp.desc()])
+    entries, random, pagination = fill_catalog_page(page, True, [db.Books.timestamp.desc()], SORTS['new'])
     return render_title_template('index.html', random=random, entries=entries, pagination=pagination,
                                  title=_(u"Recently Added Books"), page="root")
 
@@ -505,11 +509,12 @@ def books_list(data, sort, book_id, page):
         order = [db.Books.timestamp.desc()]
     if sort == 'old':
         order = [db.Books.timestamp]
+    catalog_order = SORTS.get(sort, SORTS['new'])
 
     if data == "rated":
         if current_user.check_visibility(constants.SIDEBAR_BEST_RATED):
-            entries, random, pagination = fill_indexpage(page, db.Books, db.Books.ratings.any(db.Ratings.rating > 9),
-                                                         order)
+            entries, random, pagination = fill_catalog_page(page, db.Books.ratings.any(db.Ratings.rating > 9), order,
+                                                            catalog_order, rating_above=9)
             return render_title_template('index.html', random=random, entries=entries, pagination=pagination,
                                          id=book_id, title=_(u"Best rated books"), page="rated")
         else:
@@ -535,15 +540,15 @@ def books_list(data, sort, book_id, page):
     elif data == "series":
         return render_series_books(page, book_id, order)
     elif data == "ratings":
-        return render_ratings_books(page, book_id, order)
+        return render_ratings_books(page, book_id, order, catalog_order)
     elif data == "formats":
-        return render_formats_books(page, book_id, order)
+        return render_formats_books(page, book_id, order, catalog_order)
     elif data == "category":
         return render_category_books(page, book_id, order)
     elif data == "language":
-        return render_language_books(page, book_id, order)
+        return render_language_books(page, book_id, order, catalog_order)
     else:
-        entries, random, pagination = fill_indexpage(page, db.Books, True, order)
+        entries, random, pagination = fill_catalog_page(page, True, order, catalog_order)
         return render_title_template('index.html', random=random, entries=entries, pagination=pagination,
                                  title=_(u"Books"), page="newest")
 
@@ -624,22 +629,24 @@ def render_series_books(page, book_id, order):
         abort(404)
 
 
-def render_ratings_books(page, book_id, order):
+def render_ratings_books(page, book_id, order, catalog_order):
     name = db.session.query(db.Ratings).filter(db.Ratings.id == book_id).first()
-    entries, random, pagination = fill_indexpage(page, db.Books, db.Books.ratings.any(db.Ratings.id == book_id),
-                                             [db.Books.timestamp.desc(), order[0]])
     if name and name.rating <= 10:
+        entries, random, pagination = fill_catalog_page(page, db.Books.ratings.any(db.Ratings.id == book_id),
+                                                        [db.Books.timestamp.desc(), order[0]],
+                                                        SORTS['new'] + catalog_order, rating=name.rating)
         return render_title_template('index.html', random=random, pagination=pagination, entries=entries, id=book_id,
-                                 title=_(u"Rating: %(rating)s stars", rating=int(name.rating/2)), page="ratings")
+                                     title=_(u"Rating: %(rating)s stars", rating=int(name.rating/2)), page="ratings")
     else:
         abort(404)
 
 
-def render_formats_books(page, book_id, order):
+def render_formats_books(page, book_id, order, catalog_order):
     name = db.session.query(db.Data).filter(db.Data.format == book_id.upper()).first()
     if name:
-        entries, random, pagination = fill_indexpage(page, db.Books, db.Books.data.any(db.Data.format == book_id.upper()),
-                                                 [db.Books.timestamp.desc(), order[0]])
+        entries, random, pagination = fill_catalog_page(page, db.Books.data.any(db.Data.format == book_id.upper()),
+                                                        [db.Books.timestamp.desc(), order[0]],
+                                                        SORTS['new'] + catalog_order, book_format=book_id.upper())
         return render_title_template('index.html', random=random, pagination=pagination, entries=entries, id=book_id,
                                      title=_(u"File format: %(format)s", format=name.format), page="formats")
     else:
@@ -658,7 +665,7 @@ def render_category_books(page, book_id, order):
         abort(404)
 
 
-def render_language_books(page, name, order):
+def render_language_books(page, name, order, catalog_order):
     try:
         cur_l = LC.parse(name)
         lang_name = cur_l.get_language_name(get_locale())
@@ -667,8 +674,9 @@ def render_language_books(page, name, order):
             lang_name = _(isoLanguages.get(part3=name).name)
         except KeyError:
             abort(404)
-    entries, random, pagination = fill_indexpage(page, db.Books, db.Books.languages.any(db.Languages.lang_code == name),
-                                                 [db.Books.timestamp.desc(), order[0]])
+    entries, random, pagination = fill_catalog_page(page, db.Books.languages.any(db.Languages.lang_code == name),
+                                                    [db.Books.timestamp.desc(), order[0]],
+                                                    SORTS['new'] + catalog_order, language=name)
     return render_title_template('index.html', random=random, entries=entries, pagination=pagination, id=name,
                                  title=_(u"Language: %(name)s", name=lang_name), page="language")
 
@@ -677,12 +685,10 @@ def render_language_books(page, name, order):
 @login_required_if_no_ano
 def author_list():
     if current_user.check_visibility(constants.SIDEBAR_AUTHOR):
-        entries = db.session.query(db.Authors, func.count('books_authors_link.book').label('count'))\
-            .join(db.books_authors_link).join(db.Books).filter(common_filters())\
-            .group_by(text('books_authors_link.author')).order_by(db.Authors.sort).all()
-        charlist = db.session.query(func.upper(func.substr(db.Authors.sort,1,1)).label('char')) \
-            .join(db.books_authors_link).join(db.Books).filter(common_filters()) \
-            .group_by(func.upper(func.substr(db.Authors.sort,1,1))).all()
+        entries = aggregate_query([db.Authors, func.count(db.Books.id).label('count')],
+                                  db.books_authors_link.c.author, db.books_authors_link)\
+            .order_by(db.Authors.sort).all()
+        charlist = prefixes.chars('author')
         for entry in entries:
             entry.Authors.name = entry.Authors.name.replace('|', ',')
         return render_title_template('list.html', entries=entries, folder='web.books_list', charlist=charlist,
@@ -695,12 +701,10 @@ def author_list():
 @login_required_if_no_ano
 def publisher_list():
     if current_user.check_visibility(constants.SIDEBAR_PUBLISHER):
-        entries = db.session.query(db.Publishers, func.count('books_publishers_link.book').label('count'))\
-            .join(db.books_publishers_link).join(db.Books).filter(common_filters())\
-            .group_by(text('books_publishers_link.publisher')).order_by(db.Publishers.sort).all()
-        charlist = db.session.query(func.upper(func.substr(db.Publishers.name,1,1)).label('char')) \
-            .join(db.books_publishers_link).join(db.Books).filter(common_filters()) \
-            .group_by(func.upper(func.substr(db.Publishers.name,1,1))).all()
+        entries = aggregate_query([db.Publishers, func.count(db.Books.id).label('count')],
+                                  db.books_publishers_link.c.publisher, db.books_publishers_link)\
+            .order_by(db.Publishers.sort).all()
+        charlist = prefixes.chars('publisher')
         return render_title_template('list.html', entries=entries, folder='web.books_list', charlist=charlist,
                                      title=_(u"Publisher list"), page="publisherlist", data="publisher")
     else:
@@ -711,12 +715,10 @@ def publisher_list():
 @login_required_if_no_ano
 def series_list():
     if current_user.check_visibility(constants.SIDEBAR_SERIES):
-        entries = db.session.query(db.Series, func.count('books_series_link.book').label('count'))\
-            .join(db.books_series_link).join(db.Books).filter(common_filters())\
-            .group_by(text('books_series_link.series')).order_by(db.Series.sort).all()
-        charlist = db.session.query(func.upper(func.substr(db.Series.sort,1,1)).label('char')) \
-            .join(db.books_series_link).join(db.Books).filter(common_filters()) \
-            .group_by(func.upper(func.substr(db.Series.sort,1,1))).all()
+        entries = aggregate_query([db.Series, func.count(db.Books.id).label('count')],
+                                  db.books_series_link.c.series, db.books_series_link)\
+            .order_by(db.Series.sort).all()
+        charlist = prefixes.chars('series')
         return render_title_template('list.html', entries=entries, folder='web.books_list', charlist=charlist,
                                      title=_(u"Series list"), page="serieslist", data="series")
     else:
@@ -727,10 +729,10 @@ def series_list():
 @login_required_if_no_ano
 def ratings_list():
     if current_user.check_visibility(constants.SIDEBAR_RATING):
-        entries = db.session.query(db.Ratings, func.count('books_ratings_link.book').label('count'),
-                                   (db.Ratings.rating/2).label('name'))\
-            .join(db.books_ratings_link).join(db.Books).filter(common_filters())\
-            .group_by(text('books_ratings_link.rating')).order_by(db.Ratings.rating).all()
+        entries = aggregate_query([db.Ratings, func.count(db.Books.id).label('count'),
+                                   (db.Ratings.rating/2).label('name')],
+                                  db.books_ratings_link.c.rating, db.books_ratings_link)\
+            .order_by(db.Ratings.rating).all()
         return render_title_template('list.html', entries=entries, folder='web.books_list', charlist=list(),
                                      title=_(u"Ratings list"), page="ratingslist", data="ratings")
     else:
@@ -741,9 +743,8 @@ def ratings_list():
 @login_required_if_no_ano
 def formats_list():
     if current_user.check_visibility(constants.SIDEBAR_FORMAT):
-        entries = db.session.query(db.Data, func.count('data.book').label('count'),db.Data.format.label('format'))\
-            .join(db.Books).filter(common_filters())\
-            .group_by(db.Data.format).order_by(db.Data.format).all()
+        entries = aggregate_query([db.Data, func.count(db.Books.id).label('count'), db.Data.format.label('format')],
+                                  db.Data.format).order_by(db.Data.format).all()
         return render_title_template('list.html', entries=entries, folder='web.books_list', charlist=list(),
                                      title=_(u"File formats list"), page="formatslist", data="formats")
     else:
@@ -783,12 +784,10 @@ def language_overview():
 @login_required_if_no_ano
 def category_list():
     if current_user.check_visibility(constants.SIDEBAR_CATEGORY):
-        entries = db.session.query(db.Tags, func.count('books_tags_link.book').label('count'))\
-            .join(db.books_tags_link).join(db.Books).order_by(db.Tags.name).filter(common_filters())\
-            .group_by(text('books_tags_link.tag')).all()
-        charlist = db.session.query(func.upper(func.substr(db.Tags.name,1,1)).label('char')) \
-            .join(db.books_tags_link).join(db.Books).filter(common_filters()) \
-            .group_by(func.upper(func.substr(db.Tags.name,1,1))).all()
+        entries = aggregate_query([db.Tags, func.count(db.Books.id).label('count')],
+                                  db.books_tags_link.c.tag, db.books_tags_link)\
+            .order_by(db.Tags.name).all()
+        charlist = prefixes.chars('category')
         return render_title_template('list.html', entries=entries, folder='web.books_list', charlist=charlist,
                                      title=_(u"Category list"), page="catlist", data="category")
     else:
@@ -821,12 +820,12 @@ def reconnect():
 def search():
     term = request.args.get("query").strip().lower()
     if term:
-        entries = get_search_results(term)
-        ids = list()
-        for element in entries:
-            ids.append(element.id)
-        searched_ids[current_user.id] = ids
-        return render_title_template('search.html', searchterm=term, entries=entries, title=_(u"Search"), page="search")
+        result = search_books(term, (request.args.get('page', 1, type=int) - 1) * int(config.config_books_per_page))
+        searched_ids.set(current_user.id, result.ids)
+        pagination = Pagination(result.offset // result.per_page + 1, result.per_page, result.total)
+        return render_title_template('search.html', searchterm=term, entries=result.entries, total=result.total,
+                                     capped=result.capped, pagination=pagination, title=_(u"Search"),
+                                     page="search")
     else:
         return render_title_template('search.html', searchterm="", title=_(u"Search"), page="search")
 
@@ -836,8 +835,6 @@ def search():
 def advanced_search():
     # Build custom columns names
     cc = get_cc_columns()
-    db.session.connection().connection.connection.create_function("lower", 1, lcase)
-    q = db.session.query(db.Books).filter(common_filters())
 
     include_tag_inputs = request.args.getlist('include_tag')
     exclude_tag_inputs = request.args.getlist('exclude_tag')
@@ -909,65 +906,16 @@ def advanced_search():
             if request.args.get('custom_column_' + str(c.id)):
                 searchterm.extend([(u"%s: %s" % (c.name, request.args.get('custom_column_' + str(c.id))))])
         searchterm = " + ".join(filter(None, searchterm))
-        q = q.filter()
-        if author_name:
-            q = q.filter(db.Books.authors.any(func.lower(db.Authors.name).ilike("%" + author_name + "%")))
-        if book_title:
-            q = q.filter(func.lower(db.Books.title).ilike("%" + book_title + "%"))
-        if pub_start:
-            q = q.filter(db.Books.pubdate >= pub_start)
-        if pub_end:
-            q = q.filter(db.Books.pubdate <= pub_end)
-        if publisher:
-            q = q.filter(db.Books.publishers.any(func.lower(db.Publishers.name).ilike("%" + publisher + "%")))
-        for tag in include_tag_inputs:
-            q = q.filter(db.Books.tags.any(db.Tags.id == tag))
-        for tag in exclude_tag_inputs:
-            q = q.filter(not_(db.Books.tags.any(db.Tags.id == tag)))
-        for serie in include_series_inputs:
-            q = q.filter(db.Books.series.any(db.Series.id == serie))
-        for serie in exclude_series_inputs:
-            q = q.filter(not_(db.Books.series.any(db.Series.id == serie)))
-        for extension in include_extension_inputs:
-            q = q.filter(db.Books.data.any(db.Data.format == extension))
-        for extension in exclude_extension_inputs:
-            q = q.filter(not_(db.Books.data.any(db.Data.format == extension)))
-        if current_user.filter_language() != "all":
-            q = q.filter(db.Books.languages.any(db.Languages.lang_code == current_user.filter_language()))
-        else:
-            for language in include_languages_inputs:
-                q = q.filter(db.Books.languages.any(db.Languages.id == language))
-            for language in exclude_languages_inputs:
-                q = q.filter(not_(db.Books.series.any(db.Languages.id == language)))
-        if rating_high:
-            rating_high = int(rating_high) * 2
-            q = q.filter(db.Books.ratings.any(db.Ratings.rating <= rating_high))
-        if rating_low:
-            rating_low = int(rating_low) * 2
-            q = q.filter(db.Books.ratings.any(db.Ratings.rating >= rating_low))
-        if description:
-            q = q.filter(db.Books.comments.any(func.lower(db.Comments.text).ilike("%" + description + "%")))
-
-        # search custom culumns
-        for c in cc:
-            custom_query = request.args.get('custom_column_' + str(c.id))
-            if custom_query:
-                if c.datatype == 'bool':
-                    q = q.filter(getattr(db.Books, 'custom_column_'+str(c.id)).any(
-                        db.cc_classes[c.id].value == (custom_query == "True")))
-                elif c.datatype == 'int':
-                    q = q.filter(getattr(db.Books, 'custom_column_'+str(c.id)).any(
-                        db.cc_classes[c.id].value == custom_query))
-                else:
-                    q = q.filter(getattr(db.Books, 'custom_column_'+str(c.id)).any(
-                        func.lower(db.cc_classes[c.id].value).ilike("%" + custom_query + "%")))
-        q = q.all()
-        ids = list()
-        for element in q:
-            ids.append(element.id)
-        searched_ids[current_user.id] = ids
-        return render_title_template('search.html', searchterm=searchterm,
-                                     entries=q, title=_(u"search"), page="search")
+        ids = advanced_search_ids(request.args, cc)
+        searched_ids.set(current_user.id, ids)
+        per_page = int(config.config_books_per_page)
+        page = max(request.args.get('page', 1, type=int), 1)
+        page_ids = ids[(page - 1) * per_page:page * per_page]
+        entries = db.session.query(db.Books).options(*book_list_options()).filter(db.Books.id.in_(page_ids))\
+            .order_by(db.Books.id).all() if page_ids else []
+        return render_title_template('search.html', searchterm=searchterm, entries=entries, total=len(ids),
+                                     pagination=Pagination(page, per_page, len(ids)),
+                                     title=_(u"search"), page="search")
     # prepare data for search-form
     # tags = db.session.query(db.Tags).order_by(db.Tags.name).all()
     tags = db.session.query(db.Tags).filter(tags_filters()).order_by(db.Tags.name).all()
@@ -1292,6 +1240,8 @@ def token_verified():
 @web.route("/me", methods=["GET", "POST"])
 @login_required
 def profile():
+    # current_user is a read only copy
+    user = ub.session.query(ub.User).filter(ub.User.id == current_user.id).first()
     downloads = list()
     languages = speaking_language()
     translations = babel.list_translations() + [LC('en')]
@@ -1299,7 +1249,7 @@ def profile():
         oauth_status = get_oauth_status()
     else:
         oauth_status = None
-    for book in current_user.downloads:
+    for book in user.downloads:
         downloadBook = db.session.query(db.Books).filter(db.Books.id == book.book_id).first()
         if downloadBook:
             downloads.append(db.session.query(db.Books).filter(db.Books.id == book.book_id).first())
@@ -1307,66 +1257,69 @@ def profile():
             ub.delete_download(book.book_id)
     if request.method == "POST":
         to_save = request.form.to_dict()
-        current_user.random_books = 0
-        if current_user.role_passwd() or current_user.role_admin():
+        user.random_books = 0
+        if user.role_passwd() or user.role_admin():
             if "password" in to_save and to_save["password"]:
-                current_user.password = generate_password_hash(to_save["password"])
-        if "kindle_mail" in to_save and to_save["kindle_mail"] != current_user.kindle_mail:
-            current_user.kindle_mail = to_save["kindle_mail"]
-        if to_save["email"] and to_save["email"] != current_user.email:
+                user.password = generate_password_hash(to_save["password"])
+        if "kindle_mail" in to_save and to_save["kindle_mail"] != user.kindle_mail:
+            user.kindle_mail = to_save["kindle_mail"]
+        if to_save["email"] and to_save["email"] != user.email:
             if config.config_public_reg and not check_valid_domain(to_save["email"]):
                 flash(_(u"E-mail is not from valid domain"), category="error")
-                return render_title_template("user_edit.html", content=current_user, downloads=downloads,
-                                             title=_(u"%(name)s's profile", name=current_user.nickname), page="me",
+                return render_title_template("user_edit.html", content=user, downloads=downloads,
+                                             title=_(u"%(name)s's profile", name=user.nickname), page="me",
                                              registered_oauth=oauth_check, oauth_status=oauth_status)
-        if "nickname" in to_save and to_save["nickname"] != current_user.nickname:
+        if "nickname" in to_save and to_save["nickname"] != user.nickname:
             # Query User nickname, if not existing, change
             if not ub.session.query(ub.User).filter(ub.User.nickname == to_save["nickname"]).scalar():
-                current_user.nickname = to_save["nickname"]
+                user.nickname = to_save["nickname"]
             else:
                 flash(_(u"This username is already taken"), category="error")
                 return render_title_template("user_edit.html",
                                              translations=translations,
                                              languages=languages,
-                                             new_user=0, content=current_user,
+                                             new_user=0, content=user,
                                              downloads=downloads,
                                              registered_oauth=oauth_check,
                                              title=_(u"Edit User %(nick)s",
-                                                     nick=current_user.nickname),
+                                                     nick=user.nickname),
                                              page="edituser")
-            current_user.email = to_save["email"]
+            user.email = to_save["email"]
         if "show_random" in to_save and to_save["show_random"] == "on":
-            current_user.random_books = 1
+            user.random_books = 1
         if "default_language" in to_save:
-            current_user.default_language = to_save["default_language"]
+            user.default_language = to_save["default_language"]
         if "locale" in to_save:
-            current_user.locale = to_save["locale"]
+            user.locale = to_save["locale"]
 
         val = 0
         for key, __ in to_save.items():
             if key.startswith('show'):
                 val += int(key[5:])
-        current_user.sidebar_view = val
+        user.sidebar_view = val
         if "Show_detail_random" in to_save:
-            current_user.sidebar_view += constants.DETAIL_RANDOM
+            user.sidebar_view += constants.DETAIL_RANDOM
 
-        current_user.mature_content = "Show_mature_content" in to_save
+        user.mature_content = "Show_mature_content" in to_save
 
         try:
             ub.session.commit()
+            basic_auth_cache.invalidate(user.id)
+            # the page is rendered with the new settings
+            g.user = user
         except IntegrityError:
             ub.session.rollback()
             flash(_(u"Found an existing account for this e-mail address."), category="error")
             log.debug(u"Found an existing account for this e-mail address.")
-            return render_title_template("user_edit.html", content=current_user, downloads=downloads,
+            return render_title_template("user_edit.html", content=user, downloads=downloads,
                                          translations=translations,
-                                         title=_(u"%(name)s's profile", name=current_user.nickname), page="me",
+                                         title=_(u"%(name)s's profile", name=user.nickname), page="me",
                                                  registered_oauth=oauth_check, oauth_status=oauth_status)
         flash(_(u"Profile updated"), category="success")
         log.debug(u"Profile updated")
     return render_title_template("user_edit.html", translations=translations, profile=1, languages=languages,
-                                 content=current_user, downloads=downloads,
-                                 title= _(u"%(name)s's profile", name=current_user.nickname),
+                                 content=user, downloads=downloads,
+                                 title= _(u"%(name)s's profile", name=user.nickname),
                                  page="me", registered_oauth=oauth_check, oauth_status=oauth_status)
 
 
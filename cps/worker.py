@@ -43,7 +43,7 @@ from email.utils import make_msgid
 from email.generator import Generator
 from flask_babel import gettext as _
 
-from . import logger, config, db, gdriveutils
+from . import logger, config, db, ub, gdriveutils, shared_state, metrics, reload_config
 from .subproc_wrapper import process_open
 
 
@@ -175,7 +175,7 @@ class email_SSL(emailbase, smtplib.SMTP_SSL):
         smtplib.SMTP_SSL.__init__(self, *args, **kwargs)
 
 
-#Class for all worker tasks in the background
+#Class for all worker tasks in the background, holds shared_state.fork_lock while it uses the databases
 class WorkerThread(threading.Thread):
 
     def __init__(self):
@@ -215,6 +215,10 @@ class WorkerThread(threading.Thread):
             except Exception as e:
                 log.exception(e)
                 self.doLock.release()
+            # no request teardown removes the session of this thread
+            if db.session is not None:
+                with shared_state.fork_lock:
+                    db.session.remove()
             if main_thread.is_alive():
                 time.sleep(1)
 
@@ -258,9 +262,13 @@ class WorkerThread(threading.Thread):
         self.UIqueue[index]['formStarttime'] = self.queue[index]['starttime']
         curr_task = self.queue[index]['taskType']
         filename = self._convert_ebook_format()
+        metrics.CONVERSION_DURATION.observe((datetime.now() - self.queue[index]['starttime']).total_seconds(),
+                                            format=self.queue[index]['settings']['new_book_format'].lower(),
+                                            result='success' if filename else 'error')
         if filename:
             if config.config_use_google_drive:
-                gdriveutils.updateGdriveCalibreFromLocal()
+                with shared_state.fork_lock:
+                    gdriveutils.updateGdriveCalibreFromLocal()
             if curr_task == TASK_CONVERT:
                 self.add_email(self.queue[index]['settings']['subject'], self.queue[index]['path'],
                                 filename, self.queue[index]['settings'], self.queue[index]['kindle'],
@@ -282,9 +290,10 @@ class WorkerThread(threading.Thread):
         # this will allow send to kindle workflow to continue to work
         if os.path.isfile(file_path + format_new_ext):
             log.info("Book id %d already converted to %s", bookid, format_new_ext)
-            cur_book = db.session.query(db.Books).filter(db.Books.id == bookid).first()
+            with shared_state.fork_lock:
+                cur_book = db.session.query(db.Books).filter(db.Books.id == bookid).first()
+                self.queue[index]['title'] = cur_book.title
             self.queue[index]['path'] = file_path
-            self.queue[index]['title'] = cur_book.title
             self._handleSuccess()
             return file_path + format_new_ext
         else:
@@ -374,15 +383,16 @@ class WorkerThread(threading.Thread):
         # 2 = Info(prcgen):I1038: MOBI file could not be generated because of errors!
         if (check < 2 and config.config_ebookconverter == 1) or \
             (check == 0 and config.config_ebookconverter == 2):
-            cur_book = db.session.query(db.Books).filter(db.Books.id == bookid).first()
             if os.path.isfile(file_path + format_new_ext):
-                new_format = db.Data(name=cur_book.data[0].name,
+                with shared_state.fork_lock:
+                    cur_book = db.session.query(db.Books).filter(db.Books.id == bookid).first()
+                    new_format = db.Data(name=cur_book.data[0].name,
                                          book_format=self.queue[index]['settings']['new_book_format'].upper(),
                                          book=bookid, uncompressed_size=os.path.getsize(file_path + format_new_ext))
-                cur_book.data.append(new_format)
-                db.session.commit()
-                self.queue[index]['path'] = cur_book.path
-                self.queue[index]['title'] = cur_book.title
+                    cur_book.data.append(new_format)
+                    db.session.commit()
+                    self.queue[index]['path'] = cur_book.path
+                    self.queue[index]['title'] = cur_book.title
                 if config.config_use_google_drive:
                     os.remove(file_path + format_old_ext)
                 self._handleSuccess()
@@ -465,7 +475,9 @@ class WorkerThread(threading.Thread):
         text = self.queue[index]['text']
         msg.attach(MIMEText(text.encode('UTF-8'), 'plain', 'UTF-8'))
         if obj['attachment']:
-            result = get_attachment(obj['filepath'], obj['attachment'])
+            # reads gdrive.db with Google Drive
+            with shared_state.fork_lock:
+                result = get_attachment(obj['filepath'], obj['attachment'])
             if result:
                 msg.attach(result)
             else:
@@ -546,21 +558,81 @@ class WorkerThread(threading.Thread):
         self.UIqueue[index]['formRuntime'] = datetime.now() - self.queue[index]['starttime']
 
 
+# Hands tasks queued by the other processes of the pre-fork server to the worker thread, and publishes the task list
+class _TaskDispatcher(threading.Thread):
+
+    _TASKS = ('add_email', 'add_convert', 'add_upload')
+
+    def __init__(self):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self._published = None
+
+    def run(self):
+        main_thread = _get_main_thread()
+        while main_thread.is_alive():
+            try:
+                with shared_state.fork_lock:
+                    # the worker thread uses the configuration saved in any process
+                    reload_config()
+                    for task, arguments in shared_state.pop_tasks():
+                        if task in self._TASKS:
+                            getattr(_worker, task)(*arguments)
+                    # only written when it changed, a running task changes its runtime every second
+                    status = _worker.get_taskstatus()
+                    tasks = shared_state.dumps(status)
+                    if tasks != self._published:
+                        shared_state.set_value('tasks', status)
+                        self._published = tasks
+                    # the sessions reload_config() used, no request teardown removes them
+                    ub.session.remove()
+                    if db.session is not None:
+                        db.session.remove()
+            except Exception as e:
+                log.exception(e)
+            time.sleep(1)
+
+
 _worker = WorkerThread()
 _worker.start()
 
 
+def dispatch_shared_tasks():
+    _TaskDispatcher().start()
+
+
+# With the pre-fork server only the main process runs the worker thread, the other processes queue their tasks
+def _queue_in_main_process(task, *arguments):
+    if shared_state.is_enabled() and not shared_state.is_main_process():
+        shared_state.queue_task(task, arguments)
+        return True
+    return False
+
+
+def get_queue_stats():
+    return {'queue': len(_worker.queue), 'ui_queue': len(_worker.UIqueue)}
+
+
 def get_taskstatus():
+    if shared_state.is_enabled() and not shared_state.is_main_process():
+        return shared_state.get_value('tasks', [])
     return _worker.get_taskstatus()
 
 
 def add_email(subject, filepath, attachment, settings, recipient, user_name, taskMessage, text):
+    if _queue_in_main_process('add_email', subject, filepath, attachment, settings, recipient, user_name,
+                              taskMessage, text):
+        return
     return _worker.add_email(subject, filepath, attachment, settings, recipient, user_name, taskMessage, text)
 
 
 def add_upload(user_name, taskMessage):
+    if _queue_in_main_process('add_upload', user_name, taskMessage):
+        return
     return _worker.add_upload(user_name, taskMessage)
 
 
 def add_convert(file_path, bookid, user_name, taskMessage, settings, kindle_mail=None):
+    if _queue_in_main_process('add_convert', file_path, bookid, user_name, taskMessage, settings, kindle_mail):
+        return
     return _worker.add_convert(file_path, bookid, user_name, taskMessage, settings, kindle_mail)
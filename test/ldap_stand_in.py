@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Stand-ins for python-ldap and flask_simpleldap with an LDAP server in memory.
+
+install() puts the modules ldap and flask_simpleldap into sys.modules, it has to be called before
+cps.services.simpleldap is imported. The flask_simpleldap stand-in has the parts of flask_simpleldap
+1.4 used by cps/services/simpleldap.py, the server records every bind and connection, accepts an
+empty password as anonymous bind like most servers do and can close its connections or go down.
+"""
+
+from __future__ import division, print_function, unicode_literals
+import re
+import sys
+import types
+from functools import wraps
+
+from flask import current_app, request, make_response, g
+
+
+BASE_DN = 'dc=example,dc=org'
+
+
+class Server(object):
+
+    def __init__(self):
+        # uid -> password
+        self.users = {}
+        self.down = False
+        # dns of all binds, anonymous binds as ''
+        self.binds = []
+        self.connections = []
+
+    def add_user(self, uid, password):
+        self.users[uid] = password
+
+    @staticmethod
+    def dn(uid):
+        return 'uid=%s,%s' % (uid, BASE_DN)
+
+    def open_connections(self):
+        return [conn for conn in self.connections if conn.open]
+
+    def close_connections(self):
+        '''Closes all connections on the server side, like after an idle timeout.'''
+        for conn in self.connections:
+            conn.closed_by_server = True
+
+
+server = Server()
+
+
+def reset():
+    '''A new server without users and connections.'''
+    global server
+    server = Server()
+    return server
+
+
+class LDAPError(Exception):
+    pass
+
+
+class INVALID_CREDENTIALS(LDAPError):
+    pass
+
+
+class SERVER_DOWN(LDAPError):
+    pass
+
+
+class Connection(object):
+
+    def __init__(self, uri):
+        self.uri = uri
+        self.open = True
+        self.closed_by_server = False
+        server.connections.append(self)
+
+    def set_option(self, option, value):
+        pass
+
+    def _check(self):
+        if server.down or self.closed_by_server or not self.open:
+            raise SERVER_DOWN({'desc': "Can't contact LDAP server"})
+
+    def simple_bind_s(self, who, cred):
+        self._check()
+        server.binds.append(who)
+        # anonymous bind
+        if not cred:
+            return
+        match = re.match(r'uid=([^,]+),', who)
+        if not match or server.users.get(match.group(1)) != cred:
+            raise INVALID_CREDENTIALS({'desc': 'Invalid credentials'})
+
+    def search_s(self, base, scope, filterstr, attrlist=None):
+        self._check()
+        match = re.match(r'\(uid=(.*)\)$', filterstr)
+        if match and match.group(1) in server.users:
+            return [(Server.dn(match.group(1)), {})]
+        return []
+
+    def unbind_s(self):
+        self.open = False
+
+
+def _ldap_module():
+    module = types.ModuleType(str('ldap'))
+    module.SCOPE_SUBTREE = 2
+    module.VERSION3 = 3
+    module.OPT_NETWORK_TIMEOUT = 20485
+    module.LDAPError = LDAPError
+    module.INVALID_CREDENTIALS = INVALID_CREDENTIALS
+    module.SERVER_DOWN = SERVER_DOWN
+    module.initialize = Connection
+    module.set_option = lambda option, value: None
+    return module
+
+
+class LDAPException(RuntimeError):
+    message = None
+
+    def __init__(self, message):
+        super(LDAPException, self).__init__(message)
+        self.message = message
+
+
+class LDAP(object):
+
+    def __init__(self, app=None):
+        self.app = app
+        if app is not None:
+            self.init_app(app)
+
+    @staticmethod
+    def init_app(app):
+        app.config.setdefault('LDAP_BASE_DN', BASE_DN)
+        app.config.setdefault('LDAP_USER_OBJECT_FILTER', 'uid=%s')
+        app.config.setdefault('LDAP_REALM_NAME', 'LDAP authentication')
+
+    @property
+    def initialize(self):
+        return Connection('ldap://localhost')
+
+    @property
+    def bind(self):
+        conn = self.initialize
+        try:
+            conn.simple_bind_s(current_app.config['LDAP_USERNAME'], current_app.config['LDAP_PASSWORD'])
+            return conn
+        except LDAPError as e:
+            raise LDAPException(self.error(e.args))
+
+    def get_object_details(self, user=None, group=None, query_filter=None, dn_only=False):
+        query = '(%s)' % current_app.config['LDAP_USER_OBJECT_FILTER'] % user
+        conn = self.bind
+        try:
+            records = conn.search_s(current_app.config['LDAP_BASE_DN'], 2, query, None)
+            conn.unbind_s()
+            if records and dn_only:
+                return records[0][0]
+            return records[0][1] if records else None
+        except LDAPError as e:
+            raise LDAPException(self.error(e.args))
+
+    @staticmethod
+    def error(e):
+        e = e[0]
+        return e['desc'] if 'desc' in e else e
+
+    def basic_auth_required(self, func):
+        @wraps(func)
+        def wrapped(*args, **kwargs):
+            auth = request.authorization
+            if not auth or not auth.password or not self.bind_user(auth.username, auth.password):
+                return make_response('Unauthorized', 401)
+            g.ldap_username = auth.username
+            return func(*args, **kwargs)
+        return wrapped
+
+
+def _flask_simpleldap_module():
+    module = types.ModuleType(str('flask_simpleldap'))
+    module.LDAP = LDAP
+    module.LDAPException = LDAPException
+    return module
+
+
+def install():
+    sys.modules['ldap'] = _ldap_module()
+    sys.modules['flask_simpleldap'] = _flask_simpleldap_module()
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2020 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Connection pool and bind cache of the LDAP login against the server of ldap_stand_in:
+
+    python -m unittest discover -s test
+"""
+
+from __future__ import division, print_function, unicode_literals
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from flask import Flask
+
+import ldap_stand_in
+
+
+SETTINGS_DIR = tempfile.mkdtemp(prefix='cw-test-')
+# cps reads the location of its databases from the command line when it's imported
+sys.argv = [sys.argv[0], '-p', os.path.join(SETTINGS_DIR, 'app.db'), '-g', os.path.join(SETTINGS_DIR, 'gdrive.db')]
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ldap_stand_in.install()
+from cps.services import simpleldap  # noqa: E402
+from flask_simpleldap import LDAPException  # noqa: E402
+
+
+def tearDownModule():
+    shutil.rmtree(SETTINGS_DIR, ignore_errors=True)
+
+
+class PooledLDAPTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ldap_stand_in.reset()
+        self.server.add_user('service', 'service password')
+        self.server.add_user('alice', 'alice password')
+        self.server.add_user('bob', 'bob password')
+        self.app = Flask(__name__)
+        self.app.config['LDAP_USERNAME'] = self.server.dn('service')
+        self.app.config['LDAP_PASSWORD'] = 'service password'
+        self.ldap = simpleldap._PooledLDAP(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+
+    def tearDown(self):
+        self.ldap.clear_pool()
+        self.context.pop()
+
+    def service_binds(self):
+        return self.server.binds.count(self.server.dn('service'))
+
+    def test_service_connection_is_reused(self):
+        self.assertTrue(self.ldap.bind_user('alice', 'alice password'))
+        self.assertTrue(self.ldap.bind_user('bob', 'bob password'))
+        self.assertEqual(self.service_binds(), 1)
+        # the service connection is idle in the pool, the user connections are closed
+        self.assertEqual(len(self.server.open_connections()), 1)
+
+    def test_bind_tells_if_the_connection_was_reused(self):
+        conn = self.ldap.bind
+        self.assertFalse(conn.reused)
+        conn.unbind_s()
+        conn = self.ldap.bind
+        self.assertTrue(conn.reused)
+        conn.unbind_s()
+
+    def test_search_is_retried_once_on_a_closed_pooled_connection(self):
+        self.assertTrue(self.ldap.bind_user('alice', 'alice password'))
+        self.server.close_connections()
+        self.assertTrue(self.ldap.bind_user('bob', 'bob password'))
+        self.assertEqual(self.service_binds(), 2)
+
+    def test_server_down_after_the_retry(self):
+        self.assertTrue(self.ldap.bind_user('alice', 'alice password'))
+        self.server.down = True
+        self.assertRaises(LDAPException, self.ldap.bind_user, 'bob', 'bob password')
+        self.server.down = False
+        self.assertTrue(self.ldap.bind_user('bob', 'bob password'))
+
+    def test_unknown_user(self):
+        self.assertIsNone(self.ldap.bind_user('carol', 'carol password'))
+        self.assertNotIn(self.server.dn('carol'), self.server.binds)
+
+    def test_successful_bind_is_cached(self):
+        self.assertTrue(self.ldap.bind_user('alice', 'alice password'))
+        self.assertTrue(self.ldap.bind_user('Alice', 'alice password'))
+        self.assertEqual(self.server.binds.count(self.server.dn('alice')), 1)
+
+    def test_rejected_password_is_cached_for_that_password_only(self):
+        self.assertIsNone(self.ldap.bind_user('alice', 'wrong'))
+        self.assertIsNone(self.ldap.bind_user('alice', 'wrong'))
+        self.assertEqual(self.server.binds.count(self.server.dn('alice')), 1)
+        self.assertTrue(self.ldap.bind_user('alice', 'alice password'))
+        self.assertEqual(self.server.binds.count(self.server.dn('alice')), 2)
+
+    def test_password_change_evicts_the_old_password(self):
+        self.assertTrue(self.ldap.bind_user('alice', 'alice password'))
+        self.server.add_user('alice', 'new password')
+        self.assertTrue(self.ldap.bind_user('alice', 'new password'))
+        self.assertIsNone(self.ldap.bind_user('alice', 'alice password'))
+        self.assertEqual(self.server.binds.count(self.server.dn('alice')), 3)
+
+    def test_empty_password_is_refused(self):
+        # the server accepts it as anonymous bind
+        self.assertIsNone(self.ldap.bind_user('alice', ''))
+        self.assertIsNone(self.ldap.bind_user('alice', None))
+        self.assertIsNone(self.ldap.bind_user('', 'alice password'))
+        self.assertEqual(self.server.binds, [])
+
+
+class BindCacheTest(unittest.TestCase):
+
+    def test_entries_expire(self):
+        cache = simpleldap._BindCache(bind_max_age=-1, reject_max_age=-1)
+        cache.set('alice', 'alice password', True)
+        self.assertIsNone(cache.get('alice', 'alice password'))
+
+    def test_oldest_entries_are_dropped(self):
+        cache = simpleldap._BindCache(max_entries=2)
+        for name in ('alice', 'bob', 'carol'):
+            cache.set(name, 'password', True)
+        self.assertIsNone(cache.get('alice', 'password'))
+        self.assertTrue(cache.get('carol', 'password'))
+
+
+if __name__ == '__main__':
+    unittest.main()